@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+并发批量抓取微基准
+
+对比逐个抓取与 common.batch_fetch.fetch_concurrently 的总耗时。抓取函数只按
+设定的延迟 sleep，不访问网络，测的是调度器本身：全局并发、每主机并发上限与
+单 URL 截止时间。
+
+计时前先校验一组调度回归用例（截止时间生效、超时的抓取结束前仍占用名额），
+不符时以退出码 1 结束。
+
+用法:
+    python benchmarks/bench_batch_fetch.py
+    python benchmarks/bench_batch_fetch.py --urls 64 --hosts 8 --latency 0.05 --json
+"""
+
+import argparse
+import json
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from common.batch_fetch import fetch_concurrently, url_host  # noqa: E402
+
+
+class FakeFetch:
+    """按 URL 中的 ?delay= 参数 sleep 的抓取函数，记录全局与每主机的最大并发。"""
+
+    def __init__(self, default_delay: float = 0.0):
+        self.default_delay = default_delay
+        self._lock = threading.Lock()
+        self._active: Dict[str, int] = {}
+        self.peak: Dict[str, int] = {"*": 0}
+
+    def __call__(self, url: str, **kwargs) -> Dict[str, Any]:
+        host = url_host(url)
+        delay = float(url.split("delay=", 1)[1]) if "delay=" in url else self.default_delay
+        with self._lock:
+            self._active[host] = self._active.get(host, 0) + 1
+            self.peak[host] = max(self.peak.get(host, 0), self._active[host])
+            self.peak["*"] = max(self.peak["*"], sum(self._active.values()))
+        try:
+            time.sleep(delay)
+            return {"url": url, "content": "ok"}
+        finally:
+            with self._lock:
+                self._active[host] -= 1
+
+
+def _run(urls: List[str], fetch: FakeFetch, **options) -> List[Tuple[float, Dict[str, Any]]]:
+    started = time.monotonic()
+    return [(time.monotonic() - started, result) for result in fetch_concurrently(fetch, urls, **options)]
+
+
+def _case_deadline_before_start() -> bool:
+    # 唯一的工作线程正在执行快速抓取时提交的慢速抓取，也要在截止时间产出超时
+    urls = ["https://a.test/?delay=0", "https://b.test/?delay=2", "https://c.test/?delay=2"]
+    results = _run(urls, FakeFetch(), max_workers=1, deadline=0.3)
+    slow = [(at, r) for at, r in results if "delay=2" in r["url"]]
+    return len(slow) == 2 and all(r.get("error") for _, r in slow) and slow[0][0] < 1.0
+
+
+def _case_abandoned_keeps_slots() -> bool:
+    # 超时的抓取结束前，同主机的后续 URL 不能叠加超出 per_host，全局也不能超出 max_workers
+    urls = [f"https://slow.test/{i}?delay=0.6" for i in range(2)] + [f"https://slow.test/x{i}?delay=0.05" for i in range(2)]
+    urls += [f"https://other.test/{i}?delay=0.05" for i in range(2)]
+    fetch = FakeFetch()
+    results = _run(urls, fetch, max_workers=3, per_host=2, deadline=0.2)
+    timed_out = sum(1 for _, r in results if r.get("error"))
+    return len(results) == len(urls) and timed_out == 2 and fetch.peak["*"] <= 3 and fetch.peak["slow.test"] <= 2
+
+
+# (名称, 校验函数)
+REGRESSION_CASES: List[Tuple[str, Callable[[], bool]]] = [
+    ("deadline_before_start", _case_deadline_before_start),
+    ("abandoned_keeps_slots", _case_abandoned_keeps_slots),
+]
+
+
+def check_regressions() -> List[str]:
+    """返回未通过的回归用例名称。"""
+    return [name for name, case in REGRESSION_CASES if not case()]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the concurrent batch fetch scheduler")
+    parser.add_argument("--urls", type=int, default=32, help="Number of URLs")
+    parser.add_argument("--hosts", type=int, default=4, help="Number of distinct hosts")
+    parser.add_argument("--latency", type=float, default=0.05, help="Simulated seconds per fetch")
+    parser.add_argument("--workers", type=int, default=8, help="max_workers")
+    parser.add_argument("--per-host", type=int, default=2, help="per_host")
+    parser.add_argument("--json", action="store_true", help="Emit machine-readable results")
+    args = parser.parse_args()
+
+    failures = check_regressions()
+    if failures:
+        print(f"fetch_concurrently regression cases failed: {', '.join(failures)}", file=sys.stderr)
+        return 1
+
+    urls = [f"https://host{i % args.hosts}.test/{i}" for i in range(args.urls)]
+    fetch = FakeFetch(args.latency)
+    start = time.perf_counter()
+    for url in urls:
+        fetch(url)
+    sequential = time.perf_counter() - start
+
+    fetch = FakeFetch(args.latency)
+    start = time.perf_counter()
+    results = list(fetch_concurrently(fetch, urls, max_workers=args.workers, per_host=args.per_host))
+    concurrent = time.perf_counter() - start
+
+    row = {
+        "urls": args.urls,
+        "hosts": args.hosts,
+        "sequential_s": round(sequential, 4),
+        "concurrent_s": round(concurrent, 4),
+        "speedup": round(sequential / max(concurrent, 1e-6), 1),
+        "peak_concurrency": fetch.peak["*"],
+        "peak_per_host": max(v for k, v in fetch.peak.items() if k != "*"),
+        "errors": sum(1 for r in results if r.get("error")),
+    }
+    if args.json:
+        print(json.dumps({"benchmark": "batch_fetch", "results": [row]}, indent=2))
+    else:
+        print(
+            f"{args.urls} URLs / {args.hosts} hosts  sequential {row['sequential_s']:.4f}s  "
+            f"concurrent {row['concurrent_s']:.4f}s  x{row['speedup']}  "
+            f"peak {row['peak_concurrency']} (per host {row['peak_per_host']})"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+JSON 提取微基准
+
+对比旧的逐字符 raw_decode(text[idx:]) 扫描与 common.json_extract 的线性提取，
+负载为混有大量日志噪声的多 MB stdout（模拟 `--pretty` 输出前后夹杂的进度日志）。
+
+计时前先校验一组小型回归用例（如被截断的外层括号包裹着完整结果），提取结果
+不符时以退出码 1 结束。
+
+旧实现最坏 O(n²)：超过 --legacy-max-mb 的负载不跑旧实现，其余在子进程中运行，
+超过 --budget 秒即终止并记为超时。
+
+用法:
+    python benchmarks/bench_json_extract.py
+    python benchmarks/bench_json_extract.py --sizes 1 4 16 --repeat 3 --json
+    python benchmarks/bench_json_extract.py --sizes 8 --legacy-max-mb 8 --budget 120
+"""
+
+import argparse
+import json
+import multiprocessing
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from common.json_extract import RESULT_FRAME_BEGIN, RESULT_FRAME_END, extract_json  # noqa: E402
+
+
+def legacy_extract(text: str) -> Any:
+    """旧实现：每个 `{`/`[` 处切片后尝试解码，最坏 O(n²)。"""
+    if not text:
+        raise ValueError("Empty output")
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError:
+        pass
+    decoder = json.JSONDecoder()
+    for idx, ch in enumerate(text):
+        if ch not in "[{":
+            continue
+        try:
+            obj, _ = decoder.raw_decode(text[idx:])
+            return obj
+        except json.JSONDecodeError:
+            continue
+    raise ValueError("No valid JSON found in output")
+
+
+# (名称, stdout, 期望结果)
+REGRESSION_CASES: List[Tuple[str, str, Any]] = [
+    ("plain", '{"items": [1]}', {"items": [1]}),
+    ("noise_before", '[INFO] start\n{"items": [1]}\n', {"items": [1]}),
+    # 被截断的外层括号包裹着完整结果：内部起点不能因外层失败而被跳过
+    ("truncated_outer_array", '[\n{"items": [1]}\n', {"items": [1]}),
+    ("truncated_outer_object", '{"wrapper":\n{"items": [1]}\n', {"items": [1]}),
+    ("truncated_outer_inline", 'log: [ {"items": [1]}', {"items": [1]}),
+    ("truncated_then_complete", '{"items": [1, 2\n[WARN] retry\n{"items": [3]}\n', {"items": [3]}),
+]
+
+
+def check_regressions() -> List[str]:
+    """返回提取结果与期望不符的回归用例名称。"""
+    failures = []
+    for name, text, expected in REGRESSION_CASES:
+        try:
+            result = extract_json(text)
+        except ValueError:
+            result = None
+        if result != expected:
+            failures.append(name)
+    return failures
+
+
+def _result_payload(target_bytes: int) -> Dict[str, Any]:
+    item = {
+        "title": "Example tweet about [AI] {agents} and search",
+        "url": "https://x.com/example/status/1234567890",
+        "content": "lorem ipsum " * 20,
+        "metrics": {"likes": 12, "retweets": 3},
+        "tags": ["ai", "search"],
+    }
+    per_item = len(json.dumps(item, indent=2))
+    return {"items": [dict(item, id=i) for i in range(max(1, target_bytes // per_item))]}
+
+
+def _noise(target_bytes: int) -> str:
+    lines = [
+        "[INFO] fetching page {page} ...",
+        "WARNING: retrying request [attempt 2]",
+        "progress: {'done': 3, 'total'",
+        "debug { partial [ 1, 2,",
+    ]
+    out: List[str] = []
+    size = 0
+    i = 0
+    while size < target_bytes:
+        line = lines[i % len(lines)]
+        out.append(line)
+        size += len(line) + 1
+        i += 1
+    return "\n".join(out)
+
+
+def build_payloads(size_mb: float) -> Dict[str, str]:
+    total = int(size_mb * 1024 * 1024)
+    body = json.dumps(_result_payload(total // 2), indent=2, ensure_ascii=False)
+    noise = _noise(total // 2)
+    return {
+        # 噪声在前，结果 JSON 在后
+        "noise_then_json": f"{noise}\n{body}\n",
+        # 前一次输出被截断，之后是日志与完整结果（旧实现会返回截断文档中的嵌套片段）
+        "truncated_then_json": f"{body[: len(body) // 2]}\n{noise}\n{body}\n",
+        # 外层数组未闭合，内部是完整结果
+        "truncated_wrapper": f"{noise}\n[\n{body}\n",
+        # 哨兵分帧输出
+        "framed": f"{noise}\n{RESULT_FRAME_BEGIN}\n{body}\n{RESULT_FRAME_END}\n",
+    }
+
+
+def _time(func: Callable[[str], Any], text: str, repeat: int, budget: float) -> Tuple[Dict[str, Any], Any]:
+    timings = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(text)
+        timings.append(time.perf_counter() - start)
+        if sum(timings) > budget:
+            break
+    return {"best_s": round(min(timings), 4), "runs": len(timings)}, result
+
+
+def _legacy_worker(conn, text: str, expected: Any) -> None:
+    start = time.perf_counter()
+    try:
+        result = legacy_extract(text)
+    except ValueError:
+        result = None
+    conn.send((time.perf_counter() - start, result == expected))
+    conn.close()
+
+
+def _time_legacy(text: str, expected: Any, budget: float) -> Tuple[Dict[str, Any], Optional[bool]]:
+    """在子进程中运行一次旧实现，超过 budget 秒即终止；返回计时与结果是否与新实现一致。"""
+    receiver, sender = multiprocessing.Pipe(duplex=False)
+    proc = multiprocessing.Process(target=_legacy_worker, args=(sender, text, expected), daemon=True)
+    proc.start()
+    sender.close()
+    try:
+        if receiver.poll(budget):
+            elapsed, matches = receiver.recv()
+            return {"best_s": round(elapsed, 4), "runs": 1}, matches
+        return {"best_s": None, "runs": 0, "timed_out": True}, None
+    finally:
+        if proc.is_alive():
+            proc.terminate()
+        proc.join()
+        receiver.close()
+
+
+def _legacy_label(legacy: Dict[str, Any], budget: float) -> str:
+    if legacy.get("skipped"):
+        return f"{'skipped':>9}"
+    if legacy.get("timed_out"):
+        return f"{'>' + format(budget, 'g') + 's':>9}"
+    return f"{legacy['best_s']:>8.4f}s"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark JSON extraction on polluted stdout")
+    parser.add_argument("--sizes", nargs="+", type=float, default=[0.5, 2, 8], help="Payload sizes in MB")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per case (best is reported)")
+    parser.add_argument(
+        "--budget",
+        type=float,
+        default=30.0,
+        help="Stop repeating a case after this many seconds; a legacy run is killed after it",
+    )
+    parser.add_argument(
+        "--legacy-max-mb",
+        type=float,
+        default=2.0,
+        help="Skip the quadratic legacy baseline for payloads larger than this",
+    )
+    parser.add_argument("--json", action="store_true", help="Emit machine-readable results")
+    args = parser.parse_args()
+
+    failures = check_regressions()
+    if failures:
+        print(f"extract_json regression cases failed: {', '.join(failures)}", file=sys.stderr)
+        return 1
+
+    results = []
+    for size in args.sizes:
+        for case, text in build_payloads(size).items():
+            linear, linear_result = _time(extract_json, text, args.repeat, args.budget)
+            if size > args.legacy_max_mb:
+                legacy, legacy_matches = {"best_s": None, "runs": 0, "skipped": True}, None
+            else:
+                legacy, legacy_matches = _time_legacy(text, linear_result, args.budget)
+            row = {
+                "case": case,
+                "size_mb": size,
+                "linear": linear,
+                "legacy": legacy,
+                "legacy_matches": legacy_matches,
+                "speedup": None,
+            }
+            if legacy["best_s"] is not None:
+                row["speedup"] = round(legacy["best_s"] / max(linear["best_s"], 1e-6), 1)
+            results.append(row)
+            if not args.json:
+                speedup = "" if row["speedup"] is None else f"  x{row['speedup']}"
+                print(
+                    f"{case:<22} {size:>5} MB  linear {linear['best_s']:>8.4f}s  "
+                    f"legacy {_legacy_label(legacy, args.budget)}{speedup}"
+                    f"{'  (legacy returned a fragment)' if legacy_matches is False else ''}"
+                )
+
+    if args.json:
+        print(json.dumps({"benchmark": "json_extract", "results": results}, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+结果页解析微基准
+
+对比无 API Key 引擎的旧解析方式（整页 html.fromstring 后对每个结果节点求值
+字符串 XPath）与 common.engine_runtime 的解析：
+
+- legacy:    整页解析 + 字符串 XPath，解析全部结果后截取前 max_results 条
+- compiled:  整页解析 + 预编译 XPath（parse_results）
+- streaming: 分块增量解析 + 预编译 XPath，取满 max_results 条即停止（parse_stream）
+
+负载为 benchmarks/fixtures/ 中录制的引擎结果页（见 record_fixtures.py），
+另附一个合成的 Bing 结果页，没有录制结果页时也能运行。
+
+用法:
+    python benchmarks/bench_serp_parse.py
+    python benchmarks/bench_serp_parse.py --max-results 5 --repeat 20 --json
+"""
+
+import argparse
+import base64
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+from urllib.parse import urlsplit
+
+BENCH_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(BENCH_DIR.parent / "scripts"))
+sys.path.insert(0, str(BENCH_DIR))
+
+from lxml import html  # noqa: E402
+
+import http_replay  # noqa: E402
+from common.engine_runtime import CHUNK_SIZE, parse_results, parse_stream  # noqa: E402
+from common.engine_specs import ENGINE_SPECS, EngineSpec  # noqa: E402
+
+# 合成结果页：结果条数与结果之后的页面内容（侧栏、脚本、页脚等）
+SYNTHETIC_RESULTS = 50
+SYNTHETIC_TRAILER_BYTES = 400 * 1024
+
+
+def legacy_parse(spec: EngineSpec, body: bytes, max_results: int) -> List[Dict[str, Any]]:
+    """旧实现：整页解析，每个结果节点上重新编译并求值字符串 XPath。"""
+    tree = html.fromstring(body)
+    results = []
+    for item in tree.xpath(spec.results):
+        try:
+            title_elems = item.xpath(spec.title)
+            href_elems = item.xpath(spec.href) if spec.href else []
+            body_elems = item.xpath(spec.body) if spec.body else []
+            title = ''.join(title_elems).strip()
+            href = ''.join(href_elems).strip()
+            text = ''.join(body_elems).strip()
+            if title and (href or not spec.href):
+                results.append({'title': title, 'href': href, 'body': text, 'engine': spec.name})
+        except Exception:
+            continue
+    return results[:max_results]
+
+
+def _chunks(body: bytes) -> List[bytes]:
+    return [body[i:i + CHUNK_SIZE] for i in range(0, len(body), CHUNK_SIZE)]
+
+
+def synthetic_serp() -> bytes:
+    items = "".join(
+        f'<li class="b_algo"><h2><a href="https://example.com/{i}">Result {i}</a></h2>'
+        f'<div class="b_caption"><p>Snippet text for result number {i}.</p></div></li>'
+        for i in range(SYNTHETIC_RESULTS)
+    )
+    trailer = '<div class="b_side"><p>related</p></div>' * (SYNTHETIC_TRAILER_BYTES // 40)
+    return f"<!DOCTYPE html><html><head><title>q</title></head><body><ol>{items}</ol>{trailer}</body></html>".encode()
+
+
+def build_cases() -> Dict[str, Tuple[EngineSpec, bytes]]:
+    """(引擎定义, 结果页) 按用例名返回：录制的结果页 + 合成结果页。"""
+    hosts = {urlsplit(spec.url).netloc: spec for spec in ENGINE_SPECS.values()}
+    cases: Dict[str, Tuple[EngineSpec, bytes]] = {"synthetic_bing": (ENGINE_SPECS["bing_int"], synthetic_serp())}
+    for path in sorted(http_replay.FIXTURES_DIR.glob("*/*.json")):
+        spec = hosts.get(path.parent.name)
+        if spec is None:
+            continue
+        fixture = json.loads(path.read_text(encoding="utf-8"))
+        if fixture.get("status") != 200:
+            continue
+        cases[f"{spec.name}:{path.stem[:8]}"] = (spec, base64.b64decode(fixture["body_b64"]))
+    return cases
+
+
+def _time(func: Callable[[], Any], repeat: int) -> Tuple[float, Any]:
+    timings = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
+
+
+def run_case(spec: EngineSpec, body: bytes, max_results: int, repeat: int) -> Dict[str, Any]:
+    chunks = _chunks(body)
+    legacy_s, legacy = _time(lambda: legacy_parse(spec, body, max_results), repeat)
+    compiled_s, compiled = _time(lambda: parse_results(spec, html.fromstring(body), max_results=max_results), repeat)
+    streaming_s, streaming = _time(lambda: parse_stream(spec, iter(chunks), max_results=max_results), repeat)
+    return {
+        "engine": spec.name,
+        "bytes": len(body),
+        "legacy_ms": round(legacy_s * 1000, 3),
+        "compiled_ms": round(compiled_s * 1000, 3),
+        "streaming_ms": round(streaming_s * 1000, 3),
+        "results": {"legacy": len(legacy), "compiled": len(compiled), "streaming": len(streaming)},
+        "speedup": round(legacy_s / max(streaming_s, 1e-9), 1),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark SERP parsing for the no-API engines")
+    parser.add_argument("--max-results", type=int, default=10, help="Results requested per page")
+    parser.add_argument("--repeat", type=int, default=10, help="Runs per case (best is reported)")
+    parser.add_argument("--json", action="store_true", help="Emit machine-readable results")
+    args = parser.parse_args()
+
+    rows = {}
+    for case, (spec, body) in build_cases().items():
+        row = rows[case] = run_case(spec, body, args.max_results, args.repeat)
+        if not args.json:
+            print(
+                f"{case:<28} {row['bytes'] // 1024:>5} KB  legacy {row['legacy_ms']:>8.3f}ms  "
+                f"compiled {row['compiled_ms']:>8.3f}ms  streaming {row['streaming_ms']:>8.3f}ms  x{row['speedup']}"
+            )
+
+    if args.json:
+        print(json.dumps({"benchmark": "serp_parse", "max_results": args.max_results, "results": rows}, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+对比两次基准测试结果
+
+逐项比较 run_benchmarks.py 输出中的耗时与内存指标（均为越小越好），
+变化超过阈值的指标标记为回退/改进。
+
+用法:
+    python benchmarks/compare.py benchmarks/results/abc123.json benchmarks/results/def456.json
+    python benchmarks/compare.py base.json head.json --threshold 10 --fail-on-regression
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict
+
+# 参与对比的指标字段
+METRIC_KEYS = frozenset({
+    "median_ms",
+    "inprocess",
+    "subprocess",
+    "overhead_ms",
+    "tracemalloc_peak_kb",
+    "ru_maxrss_kb",
+    "modules",
+    "compiled_ms",
+    "streaming_ms",
+})
+
+
+def flatten(node: Any, prefix: str = "") -> Dict[str, float]:
+    metrics: Dict[str, float] = {}
+    if isinstance(node, dict):
+        for key, value in node.items():
+            path = f"{prefix}.{key}" if prefix else str(key)
+            if key in METRIC_KEYS and isinstance(value, (int, float)) and not isinstance(value, bool):
+                metrics[path] = float(value)
+            else:
+                metrics.update(flatten(value, path))
+    return metrics
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compare two benchmark result files")
+    parser.add_argument("base", help="Baseline result JSON")
+    parser.add_argument("head", help="Candidate result JSON")
+    parser.add_argument("--threshold", type=float, default=5.0, help="Percent change to report as regression/improvement")
+    parser.add_argument("--fail-on-regression", action="store_true", help="Exit 1 if any metric regresses")
+    parser.add_argument("--json", action="store_true", help="Emit machine-readable comparison")
+    args = parser.parse_args()
+
+    base_report = json.loads(Path(args.base).read_text(encoding="utf-8"))
+    head_report = json.loads(Path(args.head).read_text(encoding="utf-8"))
+    base = flatten(base_report.get("sections", {}))
+    head = flatten(head_report.get("sections", {}))
+
+    rows = []
+    for name in sorted(set(base) & set(head)):
+        before, after = base[name], head[name]
+        change = (after - before) / before * 100 if before else 0.0
+        verdict = "regression" if change > args.threshold else "improvement" if change < -args.threshold else "same"
+        rows.append({"metric": name, "base": before, "head": after, "change_pct": round(change, 1), "verdict": verdict})
+
+    regressions = [row for row in rows if row["verdict"] == "regression"]
+    if args.json:
+        print(json.dumps({
+            "base": base_report.get("environment", {}).get("commit"),
+            "head": head_report.get("environment", {}).get("commit"),
+            "rows": rows,
+            "only_in_base": sorted(set(base) - set(head)),
+            "only_in_head": sorted(set(head) - set(base)),
+        }, indent=2))
+    else:
+        width = max((len(row["metric"]) for row in rows), default=10)
+        for row in rows:
+            marker = {"regression": "▲", "improvement": "▼", "same": " "}[row["verdict"]]
+            print(f"{marker} {row['metric']:<{width}} {row['base']:>12.2f} -> {row['head']:>12.2f}  {row['change_pct']:+7.1f}%")
+        print(f"\n{len(regressions)} regressions, "
+              f"{sum(1 for row in rows if row['verdict'] == 'improvement')} improvements "
+              f"(threshold {args.threshold}%)")
+
+    return 1 if args.fail_on_regression and regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+HTTP 录制与回放
+
+基准测试不访问真实平台：先用 record_fixtures.py 在联网环境下录制各平台的
+HTML/JSON 响应到 benchmarks/fixtures/，之后由本地 ReplayServer 回放。
+
+install() 替换 requests.Session.request，因此平台脚本自己的会话、共享连接池
+（scripts/common/http_client.py）以及 SDK（tavily、serpapi）发出的请求都会被：
+
+- 录制：UNION_SEARCH_BENCH_RECORD_DIR 已设置时保存每个响应
+- 回放：UNION_SEARCH_BENCH_REPLAY_URL 已设置时改写为
+  http://127.0.0.1:<port>/<scheme>/<host>/<path>?<query>，由回放服务器按原始 URL 应答
+
+子进程模式通过 PYTHONPATH 加载 benchmarks/site/sitecustomize.py 自动调用 install()。
+"""
+
+import base64
+import hashlib
+import json
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+RECORD_ENV = "UNION_SEARCH_BENCH_RECORD_DIR"
+REPLAY_ENV = "UNION_SEARCH_BENCH_REPLAY_URL"
+
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
+
+# 回放时保留的响应头（正文已由 requests 解压，不保留 Content-Encoding）
+_KEPT_HEADERS = ("Content-Type",)
+
+
+def canonical_url(url: str) -> str:
+    """规范化 URL：小写主机、查询参数排序，用作录制键。"""
+    parts = urlsplit(url)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return f"{parts.scheme}://{parts.netloc.lower()}{parts.path or '/'}" + (f"?{query}" if query else "")
+
+
+def fixture_key(method: str, url: str, body: Optional[bytes]) -> str:
+    digest = hashlib.sha1()
+    digest.update(method.upper().encode())
+    digest.update(b"\n")
+    digest.update(canonical_url(url).encode())
+    digest.update(b"\n")
+    digest.update(body or b"")
+    return digest.hexdigest()[:20]
+
+
+def _route_key(method: str, url: str) -> Tuple[str, str, str]:
+    """不含查询参数的回退匹配键（查询中常带时间戳、随机数等易变参数）。"""
+    parts = urlsplit(url)
+    return method.upper(), parts.netloc.lower(), parts.path or "/"
+
+
+# =============================================================================
+# 录制
+# =============================================================================
+
+def _body_bytes(body: Any) -> Optional[bytes]:
+    if body is None:
+        return None
+    if isinstance(body, str):
+        return body.encode("utf-8")
+    if isinstance(body, bytes):
+        return body
+    return None
+
+
+def record_response(record_dir: Path, response: Any) -> None:
+    """保存一次响应（以重定向前的原始请求为键）。"""
+    first = response.history[0] if response.history else response
+    request = first.request
+    url = request.url
+    body = _body_bytes(request.body)
+    host = urlsplit(url).netloc.lower() or "unknown"
+    fixture = {
+        "method": request.method,
+        "url": url,
+        "request_body_sha1": hashlib.sha1(body).hexdigest() if body else None,
+        "status": response.status_code,
+        "headers": {k: v for k, v in response.headers.items() if k in _KEPT_HEADERS},
+        "final_url": response.url,
+        "body_b64": base64.b64encode(response.content).decode("ascii"),
+    }
+    path = record_dir / host / f"{fixture_key(request.method, url, body)}.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(fixture, ensure_ascii=False, indent=1), encoding="utf-8")
+
+
+# =============================================================================
+# 回放
+# =============================================================================
+
+def replay_url(base: str, url: str) -> str:
+    parts = urlsplit(url)
+    target = f"{base.rstrip('/')}/{parts.scheme}/{parts.netloc}{parts.path or '/'}"
+    return target + (f"?{parts.query}" if parts.query else "")
+
+
+def install() -> None:
+    """替换 requests.Session.request，按环境变量录制或回放（重复调用无副作用）。"""
+    try:
+        import requests
+    except ImportError:
+        # 未安装 requests 时平台脚本无法发起 HTTP 请求，无需钩子
+        return
+
+    if getattr(requests.Session.request, "_bench_hooked", False):
+        return
+    original = requests.Session.request
+
+    def request(self, method, url, *args, **kwargs):
+        base = os.environ.get(REPLAY_ENV)
+        if base and not str(url).startswith(base):
+            url = replay_url(base, str(url))
+            kwargs.pop("proxies", None)
+            kwargs["allow_redirects"] = False
+        response = original(self, method, url, *args, **kwargs)
+        record_dir = os.environ.get(RECORD_ENV)
+        if record_dir and not base:
+            try:
+                record_response(Path(record_dir), response)
+            except OSError:
+                pass
+        return response
+
+    request._bench_hooked = True
+    requests.Session.request = request
+    # 回放地址是本地明文 HTTP，不应经过环境变量中的代理
+    if os.environ.get(REPLAY_ENV):
+        os.environ["NO_PROXY"] = "127.0.0.1,localhost"
+
+
+class FixtureStore:
+    """按 (方法, 规范 URL, 请求体) 精确匹配，找不到时按 (方法, 主机, 路径) 回退。"""
+
+    def __init__(self, fixtures_dir: Path = FIXTURES_DIR):
+        self.exact: Dict[str, Dict[str, Any]] = {}
+        self.routes: Dict[Tuple[str, str, str], Dict[str, Any]] = {}
+        self.hosts = set()
+        for path in sorted(Path(fixtures_dir).glob("*/*.json")):
+            try:
+                fixture = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                continue
+            self.exact[path.stem] = fixture
+            self.routes.setdefault(_route_key(fixture["method"], fixture["url"]), fixture)
+            self.hosts.add(urlsplit(fixture["url"]).netloc.lower())
+
+    def lookup(self, method: str, url: str, body: Optional[bytes]) -> Optional[Dict[str, Any]]:
+        fixture = self.exact.get(fixture_key(method, url, body))
+        if fixture is None:
+            fixture = self.routes.get(_route_key(method, url))
+        return fixture
+
+
+class _ReplayHandler(BaseHTTPRequestHandler):
+    store: FixtureStore
+    protocol_version = "HTTP/1.1"
+
+    def _serve(self) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else None
+        scheme, _, rest = self.path.lstrip("/").partition("/")
+        url = f"{scheme}://{rest}"
+        fixture = self.store.lookup(self.command, url, body)
+        if fixture is None:
+            payload = json.dumps({"error": "no fixture", "url": url}).encode()
+            self.send_response(599)
+            self.send_header("Content-Type", "application/json")
+        else:
+            payload = base64.b64decode(fixture["body_b64"])
+            self.send_response(fixture["status"])
+            for key, value in fixture.get("headers", {}).items():
+                self.send_header(key, value)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+        self.server.served += 1 if fixture else 0
+        self.server.missed += 0 if fixture else 1
+
+    do_GET = do_POST = do_HEAD = do_PUT = _serve
+
+    def log_message(self, format, *args):  # noqa: A002 - BaseHTTPRequestHandler 签名
+        pass
+
+
+class ReplayServer:
+    """在后台线程运行的本地回放服务器，用作上下文管理器。"""
+
+    def __init__(self, fixtures_dir: Path = FIXTURES_DIR, host: str = "127.0.0.1", port: int = 0):
+        self.store = FixtureStore(fixtures_dir)
+        handler = type("ReplayHandler", (_ReplayHandler,), {"store": self.store})
+        self.httpd = ThreadingHTTPServer((host, port), handler)
+        self.httpd.daemon_threads = True
+        self.httpd.served = 0
+        self.httpd.missed = 0
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        return {"served": self.httpd.served, "missed": self.httpd.missed}
+
+    def __enter__(self) -> "ReplayServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+录制基准测试使用的 HTTP 响应
+
+在联网且已配置 API Key 的环境中，对每个平台执行一次真实搜索，将全部 HTTP
+响应保存到 benchmarks/fixtures/<host>/，并在 fixtures/manifest.json 中记录
+关键词、limit 与每个平台录制成功与否。缺少 Key 的平台会被标记为未录制，
+基准测试时跳过。
+
+用法:
+    python benchmarks/record_fixtures.py --keyword "machine learning" --limit 5
+    python benchmarks/record_fixtures.py --platforms github duckduckgo --env-file .env
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Set
+
+BENCH_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(BENCH_DIR.parent / "scripts"))
+sys.path.insert(0, str(BENCH_DIR))
+
+import http_replay  # noqa: E402
+
+MANIFEST = http_replay.FIXTURES_DIR / "manifest.json"
+
+# 不经过 requests 的平台（Node.js 子进程），无法录制回放
+UNREPLAYABLE_PLATFORMS = frozenset({"defuddle"})
+
+
+def _fixture_files() -> Set[Path]:
+    return set(http_replay.FIXTURES_DIR.glob("*/*.json"))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Record platform HTTP responses for benchmarks")
+    parser.add_argument("--keyword", default="machine learning", help="Search keyword to record")
+    parser.add_argument("--limit", type=int, default=5, help="Per-platform item limit")
+    parser.add_argument("--platforms", nargs="+", help="Platforms to record (default: all)")
+    parser.add_argument("--env-file", default=".env", help="Env file path")
+    parser.add_argument("--timeout", type=int, default=60, help="Per-platform timeout seconds")
+    args = parser.parse_args()
+
+    # 录制期间不使用缓存、限速与熔断，确保每个平台都真实发出请求
+    os.environ.update({
+        "UNION_SEARCH_CACHE": "0",
+        "UNION_SEARCH_RATE_LIMIT": "0",
+        "UNION_SEARCH_CIRCUIT_BREAKER": "0",
+        "UNION_SEARCH_CACHE_DIR": tempfile.mkdtemp(prefix="union_search_record_"),
+        http_replay.RECORD_ENV: str(http_replay.FIXTURES_DIR),
+        "PYTHONPATH": os.pathsep.join(filter(None, [str(BENCH_DIR / "site"), os.environ.get("PYTHONPATH")])),
+    })
+    http_replay.install()
+
+    from union_search.union_search import PLATFORM_MODULES, load_env_file, search_platform
+
+    load_env_file(args.env_file)
+    platforms: List[str] = args.platforms or [p for p in PLATFORM_MODULES if p not in UNREPLAYABLE_PLATFORMS]
+
+    manifest: Dict = {"platforms": {}}
+    if MANIFEST.exists():
+        manifest = json.loads(MANIFEST.read_text(encoding="utf-8"))
+    manifest.update({"keyword": args.keyword, "limit": args.limit, "recorded_at": datetime.now().isoformat()})
+
+    for platform in platforms:
+        before = _fixture_files()
+        _, result = search_platform(platform, args.keyword, args.limit, timeout=args.timeout, no_cache=True)
+        recorded = sorted(str(p.relative_to(http_replay.FIXTURES_DIR)) for p in _fixture_files() - before)
+        manifest["platforms"][platform] = {
+            "recorded": bool(result.get("success") and result.get("total")),
+            "items": result.get("total", 0),
+            "error": result.get("error"),
+            "fixtures": recorded,
+        }
+        status = "ok" if manifest["platforms"][platform]["recorded"] else f"skip ({result.get('error') or 'no items'})"
+        print(f"{platform:<20} {len(recorded):>3} responses  {status}", file=sys.stderr)
+
+    MANIFEST.parent.mkdir(parents=True, exist_ok=True)
+    MANIFEST.write_text(json.dumps(manifest, ensure_ascii=False, indent=2), encoding="utf-8")
+    print(str(MANIFEST))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,363 @@
+#!/usr/bin/env python3
+"""
+union_search 基准测试
+
+通过本地回放服务器重放 benchmarks/fixtures/ 中录制的响应（见 record_fixtures.py），
+不访问真实平台，测量：
+
+- parse:    每个平台单次搜索耗时（进程内，网络为本地回放，主要是解析开销）
+- modes:    同一平台 subprocess 与 inprocess 执行方式的耗时差
+- workers:  不同 max_workers 下 union_search 端到端耗时
+- dedup:    合成条目上的去重（精确/近似）、结果合并与 RRF 融合排序耗时
+- memory:   一次完整 union_search 的 Python 分配峰值与进程 RSS 峰值
+- extract:  子进程 stdout JSON 提取（bench_json_extract.py）
+- serp:     无 API Key 引擎结果页解析（bench_serp_parse.py，录制的结果页 + 合成结果页）
+- startup:  CLI 冷启动耗时（list/doctor/--help），并记录是否导入了编排模块
+
+结果写入 benchmarks/results/<commit>.json，可用 compare.py 对比两次提交。
+
+用法:
+    python benchmarks/run_benchmarks.py
+    python benchmarks/run_benchmarks.py --sections parse workers --repeat 5
+    python benchmarks/compare.py benchmarks/results/<base>.json benchmarks/results/<head>.json
+"""
+
+import argparse
+import json
+import os
+import platform as platform_info
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+BENCH_DIR = Path(__file__).resolve().parent
+REPO_DIR = BENCH_DIR.parent
+RESULTS_DIR = BENCH_DIR / "results"
+sys.path.insert(0, str(REPO_DIR / "scripts"))
+sys.path.insert(0, str(BENCH_DIR))
+
+import http_replay  # noqa: E402
+
+SECTIONS = ("parse", "modes", "workers", "dedup", "memory", "extract", "serp", "startup")
+DEFAULT_WORKERS = (1, 2, 4, 8, 16)
+DEDUP_SIZES = (1000, 10000, 50000)
+# 冷启动测量的 CLI 命令：名称 -> 参数
+STARTUP_COMMANDS = {
+    "list": ["list", "--type", "groups"],
+    "doctor": ["doctor"],
+    "help": ["--help"],
+}
+# 在子进程内执行 CLI 命令后报告已加载模块（stdout 只输出该 JSON）
+_STARTUP_PROBE = """
+import contextlib, io, json, sys
+sys.path.insert(0, sys.argv[1])
+sys.argv = ["main", *sys.argv[2:]]
+with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+    import main
+    try:
+        main.main()
+    except SystemExit:
+        pass
+print(json.dumps({"modules": len(sys.modules), "orchestrator_imported": "union_search.union_search" in sys.modules}))
+"""
+# 合成摘要使用的词表（固定种子，结果可复现）
+_WORDS = ["".join(random.Random(i).choices("abcdefghijklmnopqrstuvwxyz", k=3 + i % 6)) for i in range(5000)]
+
+
+def _git(*args: str) -> str:
+    try:
+        return subprocess.run(["git", *args], cwd=REPO_DIR, capture_output=True, text=True, timeout=10).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return ""
+
+
+def _environment() -> Dict[str, Any]:
+    return {
+        "commit": _git("rev-parse", "--short", "HEAD") or "unknown",
+        "dirty": bool(_git("status", "--porcelain", "--untracked-files=no")),
+        "python": platform_info.python_version(),
+        "platform": platform_info.platform(),
+        "cpu_count": os.cpu_count(),
+        "timestamp": datetime.now().isoformat(),
+    }
+
+
+def _measure(func: Callable[[], Any], repeat: int) -> Dict[str, Any]:
+    """多次执行取中位数与最小值（毫秒）。"""
+    timings = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return {
+        "median_ms": round(statistics.median(timings), 2),
+        "min_ms": round(min(timings), 2),
+        "runs": repeat,
+        "result": result,
+    }
+
+
+def _peak_rss_kb() -> Optional[int]:
+    try:
+        import resource
+    except ImportError:
+        return None
+    # Linux 下单位为 KB，macOS 下为字节
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+# =============================================================================
+# 各项基准
+# =============================================================================
+
+def bench_parse(us, platforms: List[str], keyword: str, limit: int, repeat: int) -> Dict[str, Any]:
+    rows = {}
+    for name in platforms:
+        stats = _measure(
+            lambda: us.search_platform(name, keyword, limit, execution="inprocess", no_cache=True)[1],
+            repeat,
+        )
+        result = stats.pop("result")
+        rows[name] = dict(stats, success=bool(result.get("success")), items=result.get("total", 0), error=result.get("error"))
+    return rows
+
+
+def bench_modes(us, platforms: List[str], keyword: str, limit: int, repeat: int) -> Dict[str, Any]:
+    rows = {}
+    for name in platforms:
+        timings = {}
+        for mode in ("inprocess", "subprocess"):
+            stats = _measure(
+                lambda: us.search_platform(name, keyword, limit, execution=mode, no_cache=True)[1],
+                repeat,
+            )
+            stats.pop("result")
+            timings[mode] = stats["median_ms"]
+        timings["overhead_ms"] = round(timings["subprocess"] - timings["inprocess"], 2)
+        rows[name] = timings
+    return rows
+
+
+def bench_workers(us, platforms: List[str], keyword: str, limit: int, repeat: int, workers: List[int]) -> Dict[str, Any]:
+    rows = {}
+    for max_workers in workers:
+        stats = _measure(
+            lambda: us.union_search(keyword, platforms, limit, max_workers=max_workers, execution="inprocess", no_cache=True),
+            repeat,
+        )
+        result = stats.pop("result")
+        rows[str(max_workers)] = dict(stats, successful=result["summary"]["successful"])
+    return rows
+
+
+def _synthetic_results(us, count: int) -> Dict[str, Any]:
+    """按 10 个平台、约 30% 精确重复（标题或链接）、约 20% 近似重复构造合成结果。"""
+    platforms = [f"platform_{i}" for i in range(10)]
+    results = us._new_union_results("benchmark", platforms, None, True)
+    for p_index, name in enumerate(platforms):
+        items = []
+        for i in range(count // len(platforms)):
+            # 每 3 条中有 1 条在所有平台间重复；每 5 条中有 1 条为标题后缀、站点不同的转载
+            key = f"shared-{i}" if i % 3 == 0 else f"{p_index}-{i}"
+            title = f"Result title number {key} about machine learning"
+            host = "example.com"
+            if i % 5 == 1:
+                key = f"near-{i}"
+                title = f"Result title number {key} about machine learning - site {p_index}"
+                host = f"site{p_index}.example.com"
+            items.append({
+                "title": title,
+                "url": f"https://{host}/articles/{key}?utm_source=platform_{p_index}",
+                "snippet": " ".join(random.Random(key).choices(_WORDS, k=30)),
+            })
+        results["results"][name] = {"platform": name, "success": True, "items": items, "total": len(items)}
+    return results
+
+
+def _merge_synthetic(us, size: int, **options) -> Dict[str, Any]:
+    """按平台逐个增量合并合成结果（与 union_search 完成循环相同的路径）并生成 final_items。"""
+    results = _synthetic_results(us, size)
+    merger = us._new_result_merger(results, **options)
+    for name, result in results["results"].items():
+        merger.add(name, result)
+    return us._finalize_union_results(results, merger)
+
+
+def bench_dedup(us, repeat: int) -> Dict[str, Any]:
+    rows = {}
+    for size in DEDUP_SIZES:
+        flat = [dict(item) for r in _synthetic_results(us, size)["results"].values() for item in r["items"]]
+        dedup = _measure(lambda: us._deduplicate_items(flat), repeat)
+        removed = dedup.pop("result")[1]
+        # 近似去重会在代表条目上记录 _duplicates_of，每次使用新副本
+        near = _measure(lambda: us._deduplicate_items([dict(item) for item in flat], True), repeat)
+        near_removed = near.pop("result")[1]
+        finalize = _measure(lambda: _merge_synthetic(us, size), repeat)
+        finalize.pop("result")
+        fusion = {
+            stage: _measure(lambda: _merge_synthetic(us, size, fusion=True, top_k=50, fusion_dedup=stage), repeat)
+            for stage in us.FUSION_DEDUP_STAGES
+        }
+        for stats in fusion.values():
+            stats.pop("result")
+        rows[str(size)] = {
+            "dedup": dedup,
+            "near_dedup": near,
+            "finalize": finalize,
+            "fusion_top50": fusion,
+            "removed": removed,
+            "near_removed": near_removed,
+        }
+    return rows
+
+
+def bench_memory(us, platforms: List[str], keyword: str, limit: int) -> Dict[str, Any]:
+    tracemalloc.start()
+    try:
+        us.union_search(keyword, platforms, limit, max_workers=8, execution="inprocess", no_cache=True, deduplicate=True)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {"tracemalloc_peak_kb": peak // 1024, "ru_maxrss_kb": _peak_rss_kb()}
+
+
+def bench_extract(repeat: int) -> Dict[str, Any]:
+    import bench_json_extract
+    from common.json_extract import extract_json
+
+    rows = {}
+    for case, text in bench_json_extract.build_payloads(2).items():
+        stats = _measure(lambda: extract_json(text), repeat)
+        stats.pop("result")
+        rows[case] = stats
+    return rows
+
+
+def bench_serp(repeat: int) -> Dict[str, Any]:
+    import bench_serp_parse
+
+    return {
+        case: bench_serp_parse.run_case(spec, body, max_results=10, repeat=repeat)
+        for case, (spec, body) in bench_serp_parse.build_cases().items()
+    }
+
+
+def bench_startup(repeat: int) -> Dict[str, Any]:
+    # 不继承回放用的 PYTHONPATH（sitecustomize 会导入 requests，使启动耗时失真）
+    env = {k: v for k, v in os.environ.items() if k not in ("PYTHONPATH", http_replay.REPLAY_ENV)}
+    cli = str(REPO_DIR / "union_search_cli.py")
+    cli_dir = str(REPO_DIR / "scripts" / "cli")
+
+    def run(*args: str) -> str:
+        return subprocess.run([sys.executable, *args], cwd=REPO_DIR, env=env, capture_output=True, text=True).stdout
+
+    rows = {}
+    for name, args in STARTUP_COMMANDS.items():
+        stats = _measure(lambda: run(cli, *args), repeat)
+        stats.pop("result")
+        try:
+            probe = json.loads(run("-c", _STARTUP_PROBE, cli_dir, *args).strip().splitlines()[-1])
+        except (ValueError, IndexError):
+            probe = {}
+        rows[name] = dict(stats, **probe)
+    return rows
+
+
+# =============================================================================
+# 入口
+# =============================================================================
+
+def _fixture_platforms(manifest: Dict[str, Any], selected: Optional[List[str]]) -> List[str]:
+    recorded = [name for name, info in manifest.get("platforms", {}).items() if info.get("recorded")]
+    if selected:
+        return [name for name in selected if name in recorded]
+    return recorded
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark union_search against recorded fixtures")
+    parser.add_argument("--sections", nargs="+", choices=SECTIONS, default=list(SECTIONS), help="Benchmarks to run")
+    parser.add_argument("--platforms", nargs="+", help="Restrict to these platforms (must have fixtures)")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement (median is reported)")
+    parser.add_argument("--workers", nargs="+", type=int, default=list(DEFAULT_WORKERS), help="max_workers values")
+    parser.add_argument("--output", "-o", help="Result file (default: benchmarks/results/<commit>.json)")
+    args = parser.parse_args()
+
+    manifest_path = http_replay.FIXTURES_DIR / "manifest.json"
+    manifest = json.loads(manifest_path.read_text(encoding="utf-8")) if manifest_path.exists() else {}
+    platforms = _fixture_platforms(manifest, args.platforms)
+    keyword = manifest.get("keyword", "machine learning")
+    limit = manifest.get("limit", 5)
+    needs_fixtures = {"parse", "modes", "workers", "memory"} & set(args.sections)
+    if needs_fixtures and not platforms:
+        print("No recorded fixtures; run benchmarks/record_fixtures.py first "
+              f"(skipping {', '.join(sorted(needs_fixtures))})", file=sys.stderr)
+
+    report: Dict[str, Any] = {
+        "environment": _environment(),
+        "keyword": keyword,
+        "limit": limit,
+        "platforms": platforms,
+        "missing_fixtures": sorted(set(manifest.get("platforms", {})) - set(platforms)),
+        "sections": {},
+    }
+
+    with http_replay.ReplayServer() as server:
+        # 缓存、限速、熔断都会让重复测量失真，统计库写到临时目录
+        os.environ.update({
+            "UNION_SEARCH_CACHE": "0",
+            "UNION_SEARCH_RATE_LIMIT": "0",
+            "UNION_SEARCH_CIRCUIT_BREAKER": "0",
+            "UNION_SEARCH_CACHE_DIR": tempfile.mkdtemp(prefix="union_search_bench_"),
+            http_replay.REPLAY_ENV: server.url,
+            "PYTHONPATH": os.pathsep.join(filter(None, [str(BENCH_DIR / "site"), os.environ.get("PYTHONPATH")])),
+        })
+        os.environ.pop(http_replay.RECORD_ENV, None)
+        http_replay.install()
+
+        import union_search.union_search  # noqa: F401 - 包属性 union_search 可能是同名函数，模块从 sys.modules 获取
+        us = sys.modules["union_search.union_search"]
+        us.logger.setLevel("WARNING")
+
+        sections = report["sections"]
+        for section in args.sections:
+            started = time.perf_counter()
+            if section == "parse" and platforms:
+                sections["parse"] = bench_parse(us, platforms, keyword, limit, args.repeat)
+            elif section == "modes" and platforms:
+                sections["modes"] = bench_modes(us, platforms, keyword, limit, args.repeat)
+            elif section == "workers" and platforms:
+                sections["workers"] = bench_workers(us, platforms, keyword, limit, args.repeat, args.workers)
+            elif section == "memory" and platforms:
+                sections["memory"] = bench_memory(us, platforms, keyword, limit)
+            elif section == "dedup":
+                sections["dedup"] = bench_dedup(us, args.repeat)
+            elif section == "extract":
+                sections["extract"] = bench_extract(args.repeat)
+            elif section == "serp":
+                sections["serp"] = bench_serp(args.repeat)
+            elif section == "startup":
+                sections["startup"] = bench_startup(args.repeat)
+            else:
+                continue
+            print(f"{section:<8} done in {time.perf_counter() - started:.1f}s", file=sys.stderr)
+        report["replay"] = server.stats
+
+    output = Path(args.output) if args.output else RESULTS_DIR / f"{report['environment']['commit']}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+    print(str(output))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
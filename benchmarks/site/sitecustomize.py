@@ -0,0 +1,10 @@
+"""基准测试子进程启动时安装 HTTP 录制/回放钩子（通过 PYTHONPATH 加载）。"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import http_replay  # noqa: E402
+
+http_replay.install()
@@ -13,9 +13,12 @@ import os
 import re
 import sys
 from datetime import datetime, timedelta
+from pathlib import Path
 from typing import Any, Dict, List
 
-import requests
+# 共享 HTTP 客户端位于 scripts/common
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from common import http_client
 
 API_ENV_KEYS = ("BAIDU_API_KEY", "BAIDU_QIANFAN_API_KEY")
 API_URL = "https://qianfan.baidubce.com/v2/ai_search/web_search"
@@ -59,7 +62,7 @@ def baidu_search(api_key: str, request_body: Dict[str, Any]) -> List[Dict[str, A
         "Content-Type": "application/json",
     }
 
-    response = requests.post(API_URL, json=request_body, headers=headers, timeout=30)
+    response = http_client.request("POST", API_URL, json=request_body, headers=headers, timeout=30)
     response.raise_for_status()
     data = response.json()
 
@@ -9,7 +9,6 @@ Bilibili 搜索工具 - 使用 TikHub API
 """
 
 import argparse
-import http.client
 import json
 import os
 import sys
@@ -19,6 +18,8 @@ from urllib.parse import quote
 # 添加父目录到路径
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from common import http_client
+
 
 def load_env():
     """加载 .env 文件中的环境变量"""
@@ -74,21 +75,17 @@ def search_bilibili(keyword: str, limit: int = 10, order: str = "totalrank") ->
 
     encoded_keyword = quote(keyword)
 
-    conn = http.client.HTTPSConnection(base_url)
     headers = {
         "Authorization": f"Bearer {token}",
         "Content-Type": "application/json"
     }
 
     url = f"/api/v1/bilibili/web/fetch_general_search?keyword={encoded_keyword}&order={order}&page=1&page_size={limit}"
-    conn.request("GET", url, "", headers)
-
-    res = conn.getresponse()
-    if res.status != 200:
-        raise Exception(f"API 请求失败: HTTP {res.status}")
+    res = http_client.request("GET", f"https://{base_url}{url}", headers=headers)
+    if res.status_code != 200:
+        raise Exception(f"API 请求失败: HTTP {res.status_code}")
 
-    data = res.read()
-    response = json.loads(data.decode("utf-8"))
+    response = json.loads(res.content.decode("utf-8"))
 
     if response.get("code") != 200:
         raise Exception(f"API 错误: {response.get('message', 'Unknown error')}")
@@ -9,10 +9,14 @@ import os
 import sys
 import json
 import argparse
-import requests
 from typing import Optional, Dict, Any, List
 from lxml import html
 from dotenv import load_dotenv
+from pathlib import Path
+
+# 共享 HTTP 客户端位于 scripts/common
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from common.http_client import create_session
 
 # 加载环境变量
 script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -31,13 +35,11 @@ class BraveSearch:
             proxy: 代理地址 (如 http://127.0.0.1:7890)
         """
         self.proxy = proxy or os.getenv("BRAVE_PROXY")
-        self.session = requests.Session()
+        self.session = create_session(proxy=self.proxy)
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept-Encoding': 'gzip, deflate'  # 禁用 br (brotli) 压缩
         })
-        if self.proxy:
-            self.session.proxies = {'http': self.proxy, 'https': self.proxy}
 
     def search(
         self,
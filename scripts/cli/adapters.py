@@ -1,12 +1,12 @@
 #!/usr/bin/env python3
 """Execution adapters for unified CLI commands."""
 
-import json
+import os
 import subprocess
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional
 
 from errors import CliRuntimeError
 
@@ -18,27 +18,22 @@ def _ensure_scripts_on_path() -> None:
         sys.path.insert(0, scripts_path)
 
 
-def _extract_json_from_text(text: str) -> Any:
-    """Extract first JSON object/array from noisy text."""
-    if not text:
-        raise ValueError("Empty output")
+def _select_union_platforms(platforms: Optional[List[str]], group: Optional[str]) -> List[str]:
+    from union_search.union_search import PLATFORM_GROUPS, PLATFORM_MODULES
 
-    try:
-        return json.loads(text)
-    except json.JSONDecodeError:
-        pass
-
-    decoder = json.JSONDecoder()
-    for idx, ch in enumerate(text):
-        if ch not in "[{":
-            continue
-        try:
-            obj, _ = decoder.raw_decode(text[idx:])
-            return obj
-        except json.JSONDecodeError:
-            continue
+    if platforms:
+        selected = list(platforms)
+    elif group:
+        if group not in PLATFORM_GROUPS:
+            raise CliRuntimeError(f"Unknown platform group: {group}")
+        selected = list(PLATFORM_GROUPS[group])
+    else:
+        selected = list(PLATFORM_GROUPS["all"])
 
-    raise ValueError("No valid JSON found in output")
+    invalid = [p for p in selected if p not in PLATFORM_MODULES]
+    if invalid:
+        raise CliRuntimeError(f"Invalid platforms for union search: {', '.join(invalid)}")
+    return selected
 
 
 def run_search(
@@ -50,49 +45,166 @@ def run_search(
     timeout: int,
     deduplicate: bool,
     env_file: str,
+    execution: Optional[str] = None,
+    no_cache: bool = False,
+    refresh: bool = False,
+    ignore_health: bool = False,
+    on_platform_result: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+    on_new_items: Optional[Callable[[str, List[Dict[str, Any]]], None]] = None,
+    race: Optional[int] = None,
+    min_results: Optional[int] = None,
+    hedge: bool = False,
+    near_duplicates: bool = False,
+    fusion: bool = False,
+    top_k: Optional[int] = None,
+    fusion_dedup: str = "first",
+    local_first: Optional[int] = None,
 ) -> Dict[str, Any]:
-    """Run aggregated multi-platform search."""
+    """Run aggregated multi-platform search.
+
+    With ``local_first``, the local history index is queried before any network
+    call and answers the search on its own when it has at least that many items.
+    """
     _ensure_scripts_on_path()
     from downloader.yt_dlp_downloader import build_download_candidates
-    from union_search.union_search import (
-        PLATFORM_GROUPS,
-        PLATFORM_MODULES,
-        load_env_file,
-        union_search,
-    )
+    from union_search.union_search import load_env_file, union_search
 
     load_env_file(env_file)
+    selected = _select_union_platforms(platforms, group)
 
-    if platforms:
-        selected = list(platforms)
-    elif group:
-        if group not in PLATFORM_GROUPS:
-            raise CliRuntimeError(f"Unknown platform group: {group}")
-        selected = list(PLATFORM_GROUPS[group])
-    else:
-        selected = list(PLATFORM_GROUPS["all"])
+    started = datetime.now()
+    result = None
+    if local_first:
+        result = _search_local_first(query, selected, limit, local_first, deduplicate, near_duplicates, fusion, top_k, fusion_dedup)
+    if result is None:
+        result = union_search(
+            keyword=query,
+            platforms=selected,
+            limit=limit,
+            max_workers=max_workers,
+            timeout=timeout,
+            deduplicate=deduplicate,
+            execution=execution,
+            no_cache=no_cache,
+            refresh=refresh,
+            ignore_health=ignore_health,
+            on_platform_result=on_platform_result,
+            on_new_items=on_new_items,
+            race=race,
+            min_results=min_results,
+            hedge=hedge,
+            near_duplicates=near_duplicates,
+            fusion=fusion,
+            top_k=top_k,
+            fusion_dedup=fusion_dedup,
+        )
+    download_candidates = build_download_candidates(result)
+    result["download_candidates"] = download_candidates
+    summary = result.get("summary")
+    if isinstance(summary, dict):
+        summary["downloadable_items"] = len(download_candidates)
+    duration_ms = int((datetime.now() - started).total_seconds() * 1000)
+    result["adapter_timing_ms"] = duration_ms
+    return result
 
-    invalid = [p for p in selected if p not in PLATFORM_MODULES]
-    if invalid:
-        raise CliRuntimeError(f"Invalid platforms for union search: {', '.join(invalid)}")
 
-    started = datetime.now()
+def _search_local_first(
+    query: str,
+    platforms: List[str],
+    limit: Optional[int],
+    threshold: int,
+    deduplicate: bool,
+    near_duplicates: bool,
+    fusion: bool,
+    top_k: Optional[int],
+    fusion_dedup: str,
+) -> Optional[Dict[str, Any]]:
+    """Answer from the local history index; None when it has fewer than ``threshold`` items.
+
+    Only items that came from the selected ``platforms`` count, so a narrowed search is not
+    answered with history from other sources.
+    """
+    from union_search.history_index import DEFAULT_LIMIT, LOCAL_INDEX_PLATFORM
+    from union_search.union_search import union_search
+
+    sources = [p for p in platforms if p != LOCAL_INDEX_PLATFORM]
     result = union_search(
         keyword=query,
+        platforms=[LOCAL_INDEX_PLATFORM],
+        limit=max(limit or DEFAULT_LIMIT, threshold),
+        max_workers=1,
+        deduplicate=deduplicate,
+        near_duplicates=near_duplicates,
+        fusion=fusion,
+        top_k=top_k,
+        fusion_dedup=fusion_dedup,
+        source_platforms=sources or None,
+    )
+    hits = len(result.get("final_items") or [])
+    if hits < threshold:
+        return None
+    summary = result.get("summary")
+    if isinstance(summary, dict):
+        summary["local_first"] = {"threshold": threshold, "items": hits}
+    return result
+
+
+def run_search_batch(
+    queries: Iterable[Dict[str, Any]],
+    platforms: Optional[List[str]],
+    group: Optional[str],
+    limit: Optional[int],
+    max_workers: int,
+    timeout: int,
+    deduplicate: bool,
+    env_file: str,
+    on_query_result: Callable[[Dict[str, Any], Dict[str, Any]], None],
+    platform_concurrency: Optional[Dict[str, int]] = None,
+    default_platform_concurrency: Optional[int] = None,
+    execution: Optional[str] = None,
+    no_cache: bool = False,
+    refresh: bool = False,
+    ignore_health: bool = False,
+    near_duplicates: bool = False,
+    fusion: bool = False,
+    top_k: Optional[int] = None,
+    fusion_dedup: str = "first",
+) -> Dict[str, Any]:
+    """Run many aggregated searches under one scheduler; each finished query goes to `on_query_result`."""
+    _ensure_scripts_on_path()
+    from downloader.yt_dlp_downloader import build_download_candidates
+    from union_search.union_search import DEFAULT_BATCH_PLATFORM_CONCURRENCY, load_env_file, union_search_batch
+
+    load_env_file(env_file)
+    selected = _select_union_platforms(platforms, group)
+
+    def deliver(entry: Dict[str, Any], result: Dict[str, Any]) -> None:
+        download_candidates = build_download_candidates(result)
+        result["download_candidates"] = download_candidates
+        result["summary"]["downloadable_items"] = len(download_candidates)
+        on_query_result(entry, result)
+
+    summary = union_search_batch(
+        queries,
         platforms=selected,
         limit=limit,
         max_workers=max_workers,
         timeout=timeout,
         deduplicate=deduplicate,
+        platform_concurrency=platform_concurrency,
+        default_platform_concurrency=default_platform_concurrency or DEFAULT_BATCH_PLATFORM_CONCURRENCY,
+        on_query_result=deliver,
+        execution=execution,
+        no_cache=no_cache,
+        refresh=refresh,
+        ignore_health=ignore_health,
+        near_duplicates=near_duplicates,
+        fusion=fusion,
+        top_k=top_k,
+        fusion_dedup=fusion_dedup,
     )
-    download_candidates = build_download_candidates(result)
-    result["download_candidates"] = download_candidates
-    summary = result.get("summary")
-    if isinstance(summary, dict):
-        summary["downloadable_items"] = len(download_candidates)
-    duration_ms = int((datetime.now() - started).total_seconds() * 1000)
-    result["adapter_timing_ms"] = duration_ms
-    return result
+    summary["platforms"] = selected
+    return summary
 
 
 def run_platform(
@@ -102,6 +214,10 @@ def run_platform(
     timeout: int,
     env_file: str,
     params: Optional[Dict[str, Any]] = None,
+    execution: Optional[str] = None,
+    no_cache: bool = False,
+    refresh: bool = False,
+    ignore_health: bool = False,
 ) -> Dict[str, Any]:
     """Run a single platform search through union adapter."""
     _ensure_scripts_on_path()
@@ -112,6 +228,11 @@ def run_platform(
 
     load_env_file(env_file)
     extra = dict(params or {})
+    if execution:
+        extra["execution"] = execution
+    extra["no_cache"] = no_cache
+    extra["refresh"] = refresh
+    extra["ignore_health"] = ignore_health
 
     started = datetime.now()
     try:
@@ -165,13 +286,17 @@ def run_image(
     if platforms:
         cmd.extend(["--platforms", *platforms])
 
-    proc = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout)
+    _ensure_scripts_on_path()
+    from common.json_extract import RESULT_FRAME_ENV, extract_json
+
+    env = dict(os.environ, **{RESULT_FRAME_ENV: "1"})
+    proc = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout, env=env)
     if proc.returncode != 0:
         detail = (proc.stderr or proc.stdout or "").strip() or f"exit code {proc.returncode}"
         raise CliRuntimeError(f"Image command failed: {detail}")
 
     try:
-        parsed = _extract_json_from_text(proc.stdout)
+        parsed = extract_json(proc.stdout)
     except Exception as exc:
         raise CliRuntimeError(f"Failed to parse image command output: {exc}") from exc
 
@@ -181,6 +306,37 @@ def run_image(
     return parsed
 
 
+def run_history(
+    query: Optional[str],
+    limit: int,
+    platforms: Optional[List[str]] = None,
+    days: Optional[float] = None,
+    stats: bool = False,
+    prune_days: Optional[float] = None,
+) -> Dict[str, Any]:
+    """Look up, summarize or prune the local history index of past search results."""
+    _ensure_scripts_on_path()
+    import time
+
+    from union_search.history_index import get_history_index
+
+    index = get_history_index()
+    if index is None:
+        raise CliRuntimeError("History index unavailable (SQLite FTS5 not supported?)")
+
+    started = time.perf_counter()
+    data: Dict[str, Any] = {"index": str(index.path)}
+    if prune_days is not None:
+        data["pruned"] = index.prune(time.time() - prune_days * 86400)
+    if query:
+        since = time.time() - days * 86400 if days else None
+        data["items"] = index.search(query, limit=limit, platforms=platforms, since=since)
+    if stats:
+        data["stats"] = index.stats()
+    data["timing_ms"] = round((time.perf_counter() - started) * 1000, 2)
+    return data
+
+
 def run_defuddle(
     url: str,
     markdown: bool = True,
@@ -0,0 +1,594 @@
+#!/usr/bin/env python3
+"""Long-running union-search daemon and the client used to forward CLI commands to it.
+
+`serve` keeps one process warm: `.env` is loaded once, the orchestrator and platform
+modules stay imported, and the result cache, rate limiter, platform stats and HTTP
+connection pools are shared by every request. Commands run on a bounded worker pool.
+
+The daemon speaks the same small JSON-over-HTTP protocol on two transports:
+
+- a Unix socket (default `<cache dir>/daemon.sock`, where available)
+- localhost HTTP (default 127.0.0.1:8765)
+
+Endpoints:
+
+    GET  /health                  status, uptime, request counters
+    POST /run        {"argv": [...], "env": {...}}   run a CLI argument vector
+    POST /<command>  {"query": "...", "limit": 3}    options are mapped to CLI flags
+    POST /shutdown                stop accepting requests, finish in-flight ones, exit
+
+Every request must carry `Authorization: Bearer <token>`; the token is written with
+the socket path and HTTP address to `<cache dir>/daemon.json` (mode 0600), which is
+also how the CLI discovers a running daemon.
+
+Commands run with the daemon's environment. The CLI therefore sends `/run` a hash of
+its own credentials, proxies and UNION_SEARCH_* settings (process environment plus its
+`.env`); when they differ from the daemon's, the daemon answers 409 and the CLI runs
+the command locally instead.
+
+Environment:
+    UNION_SEARCH_DAEMON          set to 0 to never forward CLI commands to a daemon
+    UNION_SEARCH_DAEMON_SOCKET   Unix socket path
+    UNION_SEARCH_DAEMON_PORT     localhost HTTP port (0 disables HTTP)
+"""
+
+import functools
+import hashlib
+import json
+import os
+import re
+import secrets
+import signal
+import socket
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+SCRIPTS_DIR = Path(__file__).resolve().parents[1]
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+from common.paths import cache_dir  # noqa: E402
+from errors import CliError, CliRuntimeError, CliUsageError  # noqa: E402
+
+RUNTIME_DIR = cache_dir()
+STATE_PATH = RUNTIME_DIR / "daemon.json"
+DEFAULT_SOCKET_PATH = Path(os.environ.get("UNION_SEARCH_DAEMON_SOCKET") or RUNTIME_DIR / "daemon.sock")
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = int(os.environ.get("UNION_SEARCH_DAEMON_PORT") or 8765)
+DEFAULT_WORKERS = 8
+
+# Commands the daemon executes. Direct platform commands (`google "q"`) count as `platform`.
+DAEMON_COMMANDS = frozenset({"search", "platform", "defuddle", "list", "history"})
+
+# Extra seconds the client waits beyond the command's own --timeout.
+_CLIENT_TIMEOUT_SLACK = 30
+_CLIENT_DEFAULT_TIMEOUT = 300
+# Connecting to a daemon that is not there must not slow down the CLI.
+_CONNECT_TIMEOUT = 0.5
+
+# Environment that changes what a command does: credentials, proxies and UNION_SEARCH_* settings.
+_RELEVANT_ENV_RE = re.compile(
+    r"^UNION_SEARCH_|_(?:API_KEY|KEY|TOKEN|SECRET|COOKIE|PROXY|USER_ID|ENGINE_ID)(?:_|$)|^(?:HTTPS?|ALL|NO)_PROXY$",
+    re.IGNORECASE,
+)
+# Settings that only locate or bypass the daemon.
+_DAEMON_ENV = frozenset({"UNION_SEARCH_DAEMON", "UNION_SEARCH_DAEMON_SOCKET", "UNION_SEARCH_DAEMON_PORT"})
+
+
+def daemon_enabled() -> bool:
+    return os.environ.get("UNION_SEARCH_DAEMON", "1").strip().lower() not in ("0", "false", "no", "off")
+
+
+def unix_sockets_supported() -> bool:
+    return hasattr(socket, "AF_UNIX")
+
+
+class EnvironmentMismatch(CliRuntimeError):
+    """The client's credentials or settings differ from the daemon's; the command was not run."""
+
+
+def environment_fingerprint(environ: Mapping[str, str], extra_names: Iterable[str] = ()) -> Dict[str, str]:
+    """Hash the relevant settings so that client and daemon can compare them without sending secrets."""
+    names = {name for name in environ if _RELEVANT_ENV_RE.search(name)}
+    names.update(name for name in extra_names if name in environ)
+    return {
+        name: hashlib.sha256(environ[name].encode("utf-8")).hexdigest()[:16]
+        for name in names - _DAEMON_ENV
+    }
+
+
+def client_environment(env_file: str) -> Dict[str, str]:
+    """Fingerprint of the environment a local run would see: this process plus its `.env`."""
+    from common.env_file import read_env_file
+
+    file_values = read_env_file(env_file)
+    # load_env_file never overrides variables that are already set
+    return environment_fingerprint({**file_values, **os.environ}, file_values)
+
+
+def environment_differences(client_env: Mapping[str, str]) -> List[str]:
+    """Names whose values differ between the client's fingerprint and this process's environment."""
+    own = environment_fingerprint(os.environ, client_env)
+    return sorted(name for name in own.keys() | client_env.keys() if own.get(name) != client_env.get(name))
+
+
+# =============================================================================
+# Client
+# =============================================================================
+
+# http.client is imported only once a daemon state file exists, so that commands run
+# without a daemon do not pay for it at startup.
+
+@functools.lru_cache(maxsize=1)
+def _unix_connection_class():
+    import http.client
+
+    class UnixHTTPConnection(http.client.HTTPConnection):
+        """HTTPConnection over a Unix domain socket."""
+
+        def __init__(self, socket_path: str, timeout: Optional[float] = None):
+            super().__init__("localhost", timeout=timeout)
+            self.socket_path = socket_path
+
+        def connect(self) -> None:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.settimeout(_CONNECT_TIMEOUT)
+            try:
+                sock.connect(self.socket_path)
+            except OSError:
+                sock.close()
+                raise
+            sock.settimeout(self.timeout)
+            self.sock = sock
+
+    return UnixHTTPConnection
+
+
+def read_state(path: Path = STATE_PATH) -> Optional[Dict[str, Any]]:
+    """Return the running daemon's state file, or None when no daemon has been started."""
+    try:
+        state = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return state if isinstance(state, dict) and state.get("token") else None
+
+
+def _connect(state: Dict[str, Any], timeout: float):
+    """Open a connection to the daemon; OSError here means nothing has been sent yet."""
+    import http.client
+
+    socket_path = state.get("socket")
+    if socket_path and unix_sockets_supported() and Path(socket_path).exists():
+        conn = _unix_connection_class()(socket_path, timeout=timeout)
+        conn.connect()
+        return conn
+    http_address = state.get("http")
+    if http_address:
+        host, port = http_address
+        conn = http.client.HTTPConnection(host, int(port), timeout=_CONNECT_TIMEOUT)
+        conn.connect()
+        conn.sock.settimeout(timeout)
+        return conn
+    raise ConnectionRefusedError("daemon state has no reachable transport")
+
+
+def _exchange(conn, state: Dict[str, Any], method: str, path: str, body: Optional[Dict[str, Any]]) -> Tuple[int, Dict[str, Any]]:
+    import http.client
+
+    try:
+        payload = json.dumps(body or {}, ensure_ascii=False).encode("utf-8")
+        conn.request(method, path, body=payload if method == "POST" else None, headers={
+            "Authorization": f"Bearer {state['token']}",
+            "Content-Type": "application/json",
+        })
+        response = conn.getresponse()
+        raw = response.read()
+    finally:
+        conn.close()
+    try:
+        data = json.loads(raw.decode("utf-8")) if raw else {}
+    except ValueError as exc:
+        raise http.client.HTTPException(f"Invalid daemon response: {exc}") from exc
+    return response.status, data
+
+
+def request_daemon(
+    method: str,
+    path: str,
+    body: Optional[Dict[str, Any]] = None,
+    timeout: float = _CLIENT_DEFAULT_TIMEOUT,
+    state: Optional[Dict[str, Any]] = None,
+) -> Tuple[int, Dict[str, Any]]:
+    """Send one request to the daemon and return (HTTP status, JSON payload).
+
+    Raises OSError / http.client.HTTPException when no daemon answers.
+    """
+    state = state or read_state()
+    if state is None:
+        raise ConnectionRefusedError("no daemon state file")
+    return _exchange(_connect(state, timeout), state, method, path, body)
+
+
+_ERROR_CLASSES = {cls.__name__: cls for cls in (CliUsageError, CliRuntimeError)}
+
+
+def _daemon_error(error: Dict[str, Any], status: int) -> CliError:
+    """Rebuild the CliError subclass raised inside the daemon from the error payload."""
+    message = str(error.get("message") or f"Daemon request failed (HTTP {status})")
+    detail = error.get("detail")
+    error_class = _ERROR_CLASSES.get(str(error.get("code")))
+    if error_class is not None:
+        return error_class(message, detail=detail)
+    return CliError(message=message, exit_code=int(error.get("exit_code") or 2), detail=detail)
+
+
+def forward_command(args: Any, argv: List[str]) -> Optional[Dict[str, Any]]:
+    """Run a parsed CLI command on the daemon.
+
+    Returns the handler result (same shape as `dispatch()`), or None when the command
+    should run locally: no daemon is reachable, or its environment differs from this
+    process's. Once the request has been sent, transport failures are raised as
+    CliRuntimeError rather than retried locally, since the daemon may already be running
+    the command. Errors raised by the command inside the daemon are re-raised with
+    their original class and exit code.
+    """
+    state = read_state()
+    if state is None:
+        return None
+    import http.client
+
+    timeout = getattr(args, "timeout", None)
+    timeout = (timeout + _CLIENT_TIMEOUT_SLACK) if timeout else _CLIENT_DEFAULT_TIMEOUT
+    body = {"argv": argv, "env": client_environment(getattr(args, "env_file", None) or ".env")}
+    try:
+        conn = _connect(state, timeout)
+    except OSError:
+        return None
+    try:
+        status, payload = _exchange(conn, state, "POST", "/run", body)
+    except (OSError, http.client.HTTPException) as exc:
+        raise CliRuntimeError(f"Daemon request failed: {exc}", detail=str(STATE_PATH)) from exc
+    if "result" in payload:
+        result = payload["result"]
+        result.setdefault("meta", {})["daemon"] = state.get("pid")
+        return result
+    error = payload.get("error") or {}
+    if error.get("code") == EnvironmentMismatch.__name__:
+        return None
+    raise _daemon_error(error, status)
+
+
+# =============================================================================
+# Server
+# =============================================================================
+
+def options_to_argv(command: str, options: Dict[str, Any]) -> List[str]:
+    """Map a JSON options object to a CLI argument vector for `command`.
+
+    `{"query": "AI", "platforms": ["github"], "limit": 3, "deduplicate": true}` becomes
+    `[command, "--query", "AI", "--platforms", "github", "--limit", "3", "--deduplicate"]`.
+    The `platform` command takes its platform name positionally; `param` accepts a dict.
+    """
+    options = dict(options)
+    argv = [command]
+    if command == "platform" and options.get("platform"):
+        argv.append(str(options.pop("platform")))
+    for key, value in options.items():
+        flag = "--" + key.replace("_", "-")
+        if value is None or value is False:
+            continue
+        if value is True:
+            argv.append(flag)
+        elif isinstance(value, dict):
+            for name, item in value.items():
+                argv.extend([flag, f"{name}={item}"])
+        elif isinstance(value, (list, tuple)):
+            argv.append(flag)
+            argv.extend(str(item) for item in value)
+        else:
+            argv.extend([flag, str(value)])
+    return argv
+
+
+class SearchDaemon:
+    """Warm process that executes CLI commands on a bounded worker pool."""
+
+    def __init__(
+        self,
+        workers: int = DEFAULT_WORKERS,
+        socket_path: Optional[Path] = DEFAULT_SOCKET_PATH,
+        host: str = DEFAULT_HOST,
+        port: Optional[int] = DEFAULT_PORT,
+        env_file: str = ".env",
+    ):
+        from concurrent.futures import ThreadPoolExecutor
+
+        self.workers = max(1, workers)
+        self.socket_path = socket_path if unix_sockets_supported() else None
+        self.host = host
+        self.port = port
+        # Absolute, so that per-request handlers and platform subprocesses resolve the same file.
+        self.env_file = os.path.abspath(env_file)
+        self.token = secrets.token_urlsafe(24)
+        self.pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="daemon-worker")
+        self.started = time.time()
+        self.stopping = threading.Event()
+        self.servers: List[Any] = []
+        self._lock = threading.Lock()
+        self.counters = {"requests": 0, "active": 0, "failed": 0}
+
+    # ---- lifecycle -------------------------------------------------------
+
+    def warm_up(self) -> None:
+        """Load .env, import the orchestrator and start the Defuddle workers so the first request starts warm."""
+        from common.env_file import load_env_file
+
+        load_env_file(self.env_file)
+        import union_search.union_search  # noqa: F401 - imported for its module-level state
+
+        try:
+            from url_to_markdown.engines.defuddle_pool import get_defuddle_pool
+
+            pool = get_defuddle_pool()
+            if pool is not None:
+                pool.warm()
+        except Exception as exc:
+            # Requests still work without the pool: Defuddle falls back to one CLI run per URL.
+            print(f"union-search daemon: Defuddle worker warm-up failed: {exc}", file=sys.stderr)
+
+    def start(self) -> None:
+        import socketserver
+        from http.server import ThreadingHTTPServer
+
+        handler = _make_handler(self)
+        if self.socket_path is not None:
+            self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+            if self.socket_path.exists():
+                if _socket_alive(self.socket_path):
+                    raise CliRuntimeError(f"A daemon is already listening on {self.socket_path}")
+                self.socket_path.unlink()
+
+            class UnixHTTPServer(socketserver.ThreadingUnixStreamServer):
+                pass
+
+            old_umask = os.umask(0o177)
+            try:
+                self.servers.append(UnixHTTPServer(str(self.socket_path), handler))
+            finally:
+                os.umask(old_umask)
+        if self.port:
+            try:
+                self.servers.append(ThreadingHTTPServer((self.host, self.port), handler))
+            except OSError as exc:
+                self.close_servers()
+                raise CliRuntimeError(f"Cannot listen on {self.host}:{self.port}: {exc}") from exc
+        if not self.servers:
+            raise CliUsageError("Nothing to listen on: Unix sockets are unavailable and the HTTP port is 0")
+
+        for server in self.servers:
+            threading.Thread(target=server.serve_forever, name="daemon-listener", daemon=True).start()
+        self._write_state()
+
+    def _write_state(self) -> None:
+        state = {
+            "pid": os.getpid(),
+            "token": self.token,
+            "socket": str(self.socket_path) if self.socket_path is not None else None,
+            "http": [self.host, self.servers[-1].server_address[1]] if self.port else None,
+            "started": self.started,
+            "workers": self.workers,
+        }
+        STATE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp = STATE_PATH.with_suffix(".tmp")
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        os.replace(tmp, STATE_PATH)
+
+    def wait(self) -> None:
+        """Block until shutdown is requested (signal or POST /shutdown), then stop gracefully."""
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            try:
+                signal.signal(signum, lambda *_: self.stopping.set())
+            except (ValueError, OSError):
+                pass
+        while not self.stopping.wait(0.5):
+            pass
+        self.stop()
+
+    def close_servers(self) -> None:
+        for server in self.servers:
+            server.server_close()
+
+    def stop(self) -> None:
+        """Stop accepting requests, let in-flight commands finish, and remove the state files."""
+        self.stopping.set()
+        for server in self.servers:
+            server.shutdown()
+        self.pool.shutdown(wait=True)
+        # server_close() also joins the handler threads that are still writing responses.
+        self.close_servers()
+        state = read_state()
+        if state is not None and state.get("token") == self.token:
+            STATE_PATH.unlink(missing_ok=True)
+        if self.socket_path is not None:
+            self.socket_path.unlink(missing_ok=True)
+
+    # ---- requests --------------------------------------------------------
+
+    def health(self) -> Dict[str, Any]:
+        with self._lock:
+            counters = dict(self.counters)
+        return {
+            "status": "stopping" if self.stopping.is_set() else "ok",
+            "pid": os.getpid(),
+            "uptime_s": round(time.time() - self.started, 1),
+            "workers": self.workers,
+            **counters,
+            "defuddle_pool": self._defuddle_pool_status(),
+        }
+
+    @staticmethod
+    def _defuddle_pool_status() -> Optional[Dict[str, Any]]:
+        module = sys.modules.get("url_to_markdown.engines.defuddle_pool")
+        pool = module.current_pool() if module is not None else None
+        return pool.status() if pool is not None else None
+
+    def execute(self, argv: List[str], env: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        """Run one CLI argument vector on the worker pool and return the handler result.
+
+        `env` is the client's environment fingerprint; the command is refused with
+        EnvironmentMismatch when it differs from the daemon's own environment.
+        """
+        if self.stopping.is_set():
+            raise CliRuntimeError("Daemon is shutting down")
+        if env is not None:
+            differences = environment_differences(env)
+            if differences:
+                raise EnvironmentMismatch(
+                    "Client environment differs from the daemon's; run the command locally",
+                    detail=", ".join(differences),
+                )
+        with self._lock:
+            self.counters["requests"] += 1
+            self.counters["active"] += 1
+        try:
+            return self.pool.submit(_run_argv, argv, self.env_file).result()
+        except Exception:
+            with self._lock:
+                self.counters["failed"] += 1
+            raise
+        finally:
+            with self._lock:
+                self.counters["active"] -= 1
+
+
+def _socket_alive(path: Path) -> bool:
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(_CONNECT_TIMEOUT)
+            sock.connect(str(path))
+        return True
+    except OSError:
+        return False
+
+
+@functools.lru_cache(maxsize=1)
+def _parser():
+    from main import build_parser
+
+    return build_parser(strict=True)
+
+
+def _run_argv(argv: List[str], env_file: str) -> Dict[str, Any]:
+    from main import dispatch
+
+    args = _parser().parse_args(argv)
+    command = "platform" if hasattr(args, "platform_command") else args.command
+    if command not in DAEMON_COMMANDS:
+        raise CliUsageError(f"Command '{args.command}' is not served by the daemon. Served: {', '.join(sorted(DAEMON_COMMANDS))}")
+    if getattr(args, "stream", False):
+        raise CliUsageError("--stream is not supported through the daemon")
+    if getattr(args, "queries_file", None):
+        raise CliUsageError("--queries-file is not supported through the daemon")
+    # Always the daemon's own .env: a client .env that differs was refused by execute(), and
+    # loading it here would leak its variables into every later request.
+    if hasattr(args, "env_file"):
+        args.env_file = env_file
+    result = dispatch(args)
+    result.pop("stream", None)
+    result.setdefault("command", args.command)
+    return result
+
+
+def _make_handler(daemon: SearchDaemon):
+    from http.server import BaseHTTPRequestHandler
+
+    class Handler(BaseHTTPRequestHandler):
+        server_version = "union-search-daemon"
+
+        def log_message(self, format, *args):  # noqa: A002 - BaseHTTPRequestHandler signature
+            pass
+
+        def address_string(self) -> str:
+            return self.client_address[0] if isinstance(self.client_address, tuple) else "unix"
+
+        def _send(self, status: int, payload: Dict[str, Any]) -> None:
+            body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _authorized(self) -> bool:
+            expected = f"Bearer {daemon.token}"
+            if secrets.compare_digest(self.headers.get("Authorization", ""), expected):
+                return True
+            self._send(401, {"error": {"code": "unauthorized", "message": "Missing or invalid daemon token", "exit_code": 1}})
+            return False
+
+        def _read_json(self) -> Dict[str, Any]:
+            length = int(self.headers.get("Content-Length") or 0)
+            raw = self.rfile.read(length) if length else b""
+            try:
+                body = json.loads(raw.decode("utf-8")) if raw else {}
+            except ValueError as exc:
+                raise CliUsageError(f"Invalid JSON body: {exc}") from exc
+            if not isinstance(body, dict):
+                raise CliUsageError("Request body must be a JSON object")
+            return body
+
+        def do_GET(self) -> None:
+            if not self._authorized():
+                return
+            if self.path.rstrip("/") == "/health":
+                self._send(200, daemon.health())
+            else:
+                self._send(404, {"error": {"code": "not_found", "message": f"Unknown endpoint {self.path}", "exit_code": 1}})
+
+        def do_POST(self) -> None:
+            if not self._authorized():
+                return
+            endpoint = self.path.strip("/")
+            if endpoint == "shutdown":
+                # Drain the (ignored) body so closing the connection does not reset it mid-request.
+                self.rfile.read(int(self.headers.get("Content-Length") or 0))
+                self._send(200, daemon.health())
+                daemon.stopping.set()
+                return
+            try:
+                body = self._read_json()
+                env = None
+                if endpoint == "run":
+                    argv = body.get("argv")
+                    if not isinstance(argv, list) or not argv:
+                        raise CliUsageError("'argv' must be a non-empty list")
+                    argv = [str(arg) for arg in argv]
+                    env = body.get("env")
+                    if env is not None and not isinstance(env, dict):
+                        raise CliUsageError("'env' must be an object")
+                elif endpoint in DAEMON_COMMANDS:
+                    argv = options_to_argv(endpoint, {k: v for k, v in body.items() if k != "cwd"})
+                else:
+                    self._send(404, {"error": {"code": "not_found", "message": f"Unknown endpoint {self.path}", "exit_code": 1}})
+                    return
+                result = daemon.execute(argv, env=env)
+            except CliError as exc:
+                status = 409 if isinstance(exc, EnvironmentMismatch) else 400 if isinstance(exc, CliUsageError) else 500
+                self._send(status, {"error": {
+                    "code": exc.__class__.__name__,
+                    "message": exc.message,
+                    "detail": exc.detail,
+                    "exit_code": exc.exit_code,
+                }})
+                return
+            except Exception as exc:
+                self._send(500, {"error": {"code": exc.__class__.__name__, "message": str(exc), "exit_code": 2}})
+                return
+            self._send(200, {"result": result})
+
+    return Handler
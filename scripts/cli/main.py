@@ -15,11 +15,19 @@ CURRENT_DIR = Path(__file__).resolve().parent
 if str(CURRENT_DIR) not in sys.path:
     sys.path.insert(0, str(CURRENT_DIR))
 
-from adapters import run_defuddle, run_download, run_image, run_platform, run_search
-from errors import CliError, CliUsageError
-from output import build_envelope, render_output
-from registry import IMAGE_PLATFORMS, load_capabilities, load_groups
-from validators import parse_param_pairs, resolve_limit, resolve_query, validate_platforms
+# Subcommand adapters are imported inside their handlers so that `list`, `doctor`
+# and argument parsing only read the static platform manifest.
+from errors import CliError, CliRuntimeError, CliUsageError
+from output import NdjsonStream, build_envelope, render_output
+from registry import IMAGE_PLATFORMS, MANIFEST_PATH, load_capabilities, load_groups, manifest_status
+from validators import (
+    parse_param_pairs,
+    parse_platform_concurrency,
+    parse_query_line,
+    resolve_limit,
+    resolve_query,
+    validate_platforms,
+)
 
 __version__ = "0.1.0"
 PLATFORM_COMMAND_ALIASES: Dict[str, List[str]] = {
@@ -28,24 +36,46 @@ PLATFORM_COMMAND_ALIASES: Dict[str, List[str]] = {
 }
 
 
-def parse_args() -> argparse.Namespace:
+class StrictArgumentParser(argparse.ArgumentParser):
+    """Argument parser that raises CliUsageError instead of exiting (used inside the daemon)."""
+
+    def error(self, message: str) -> None:
+        raise CliUsageError(message)
+
+    def exit(self, status: int = 0, message: Optional[str] = None) -> None:
+        raise CliUsageError(message or "Argument parsing requested exit", detail=f"status={status}")
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
     """Create parser and parse arguments."""
-    parser = argparse.ArgumentParser(
+    return build_parser().parse_args(argv)
+
+
+def build_parser(strict: bool = False) -> argparse.ArgumentParser:
+    """Create the CLI parser; `strict` parsers raise CliUsageError instead of exiting."""
+    parser_class = StrictArgumentParser if strict else argparse.ArgumentParser
+    parser = parser_class(
         description="union-search unified CLI",
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog=(
             "Examples:\n"
             "  python scripts/cli/main.py list --format markdown\n"
             "  python scripts/cli/main.py doctor --env-file .env\n"
+            "  python scripts/cli/main.py quota --providers serper exa\n"
             "  python scripts/cli/main.py search \"AI\" --group dev --limit 3 --pretty\n"
+            "  python scripts/cli/main.py search \"AI Agent\" --group dev --local-first\n"
+            "  python scripts/cli/main.py history \"机器学习\" --days 30 --pretty\n"
+            "  python scripts/cli/main.py search --queries-file keywords.txt -g dev --max-workers 32 -o out.ndjson\n"
             "  python scripts/cli/main.py platform github \"machine learning\" --limit 5 --pretty\n"
             "  python scripts/cli/main.py google \"AI Agent\" --limit 5 --pretty\n"
             "  python scripts/cli/main.py bsearch \"AI Agent\" --limit 5 --pretty\n"
             "  python scripts/cli/main.py image \"cats\" --platforms baidu bing --limit 20 --output-dir ./image_downloads\n"
             "  python scripts/cli/main.py download \"https://www.youtube.com/watch?v=dQw4w9WgXcQ\" --output-dir ./downloads\n"
+            "  python scripts/cli/main.py serve --workers 8\n"
         ),
     )
     parser.add_argument("--version", action="version", version=f"union-search CLI v{__version__}")
+    parser.add_argument("--no-daemon", action="store_true", help="Run locally even if a `serve` daemon is running")
 
     subparsers = parser.add_subparsers(dest="command", required=True)
 
@@ -57,10 +87,26 @@ def parse_args() -> argparse.Namespace:
     search_parser.add_argument("--group", "-g", help="Platform group")
     search_parser.add_argument("--limit", "-l", type=int, default=None, help="Per-platform item limit")
     search_parser.add_argument("--preset", choices=["small", "medium", "large", "extra"], help="Predefined result limits (small=3, medium=5, large=10, extra=20)")
-    search_parser.add_argument("--max-workers", type=int, default=5, help="Concurrency")
+    search_parser.add_argument("--max-workers", type=int, default=None, help="Concurrency (default: 5, or 16 with --queries-file)")
     search_parser.add_argument("--timeout", type=int, default=60, help="Timeout seconds")
     search_parser.add_argument("--deduplicate", action="store_true", help="Cross-platform deduplicate")
+    search_parser.add_argument("--near-duplicates", action="store_true", help="Also merge near-identical items (similar title/snippet); implies --deduplicate")
+    search_parser.add_argument("--fusion", action="store_true", help="Rank final_items by reciprocal rank fusion across platforms")
+    search_parser.add_argument("--top-k", type=int, default=None, help="Keep only the top K fused items (implies --fusion)")
+    search_parser.add_argument("--fusion-dedup", choices=["first", "last"], default="first", help="Deduplicate before fusion ranking (first) or walk the ranked list until top-k unique items (last)")
+    search_parser.add_argument("--execution", choices=["inprocess", "subprocess"], default=None, help="Platform execution mode (default: inprocess)")
+    search_parser.add_argument("--no-cache", action="store_true", help="Bypass the result cache")
+    search_parser.add_argument("--refresh", action="store_true", help="Ignore cached results and refresh the cache")
+    search_parser.add_argument("--ignore-health", action="store_true", help="Call platforms even if their circuit breaker is open")
     search_parser.add_argument("--fail-on-platform-error", action="store_true", help="Exit non-zero on partial platform failures")
+    search_parser.add_argument("--race", type=int, default=None, help="Return once N platforms have answered with results; cancel the rest")
+    search_parser.add_argument("--min-results", type=int, default=None, help="Return once K (deduplicated) items have arrived; cancel the rest")
+    search_parser.add_argument("--hedge", action="store_true", help="Launch platforms in order, starting a backup only when the current one exceeds its p50 latency")
+    search_parser.add_argument("--local-first", type=int, nargs="?", const=5, default=None, metavar="N", help="Answer from the local history index when it has at least N items from the selected platforms (default 5); otherwise search the network")
+    search_parser.add_argument("--stream", action="store_true", help="Emit NDJSON records as each platform completes, then a summary record")
+    search_parser.add_argument("--stream-items", action="store_true", help="With --stream, also emit one record per result item")
+    search_parser.add_argument("--queries-file", help="Batch mode: read queries from a file ('-' for stdin), one per line as text or JSON {query, id, platforms, limit}; emits one NDJSON record per query")
+    search_parser.add_argument("--platform-concurrency", nargs="+", metavar="N|PLATFORM=N", help="Batch mode: max concurrent calls per platform across all queries (default 2)")
     search_parser.add_argument("--env-file", default=".env", help="Env file path")
     _add_output_args(search_parser)
 
@@ -72,6 +118,10 @@ def parse_args() -> argparse.Namespace:
     platform_parser.add_argument("--limit", "-l", type=int, default=None, help="Result limit")
     platform_parser.add_argument("--timeout", type=int, default=60, help="Timeout seconds")
     platform_parser.add_argument("--param", action="append", help="Adapter passthrough key=value (repeatable)")
+    platform_parser.add_argument("--execution", choices=["inprocess", "subprocess"], default=None, help="Platform execution mode (default: inprocess)")
+    platform_parser.add_argument("--no-cache", action="store_true", help="Bypass the result cache")
+    platform_parser.add_argument("--refresh", action="store_true", help="Ignore cached results and refresh the cache")
+    platform_parser.add_argument("--ignore-health", action="store_true", help="Call the platform even if its circuit breaker is open")
     platform_parser.add_argument("--fail-on-platform-error", action="store_true", help="Exit non-zero if platform fails")
     platform_parser.add_argument("--env-file", default=".env", help="Env file path")
     _add_output_args(platform_parser)
@@ -128,6 +178,23 @@ def parse_args() -> argparse.Namespace:
     doctor_parser.add_argument("--strict", action="store_true", help="Return non-zero on warnings")
     _add_output_args(doctor_parser)
 
+    # quota
+    quota_parser = subparsers.add_parser("quota", help="Show remaining rate-limit budget per provider")
+    quota_parser.add_argument("--providers", nargs="+", help="Only show selected providers")
+    quota_parser.add_argument("--env-file", default=".env", help="Env file path")
+    _add_output_args(quota_parser)
+
+    # history - offline full-text lookup over past search results
+    history_parser = subparsers.add_parser("history", help="Search the local index of past search results (offline)")
+    history_parser.add_argument("query", nargs="?", help="Full-text query (omit with --stats or --prune-days)")
+    history_parser.add_argument("--query", dest="query_opt", help="Full-text query (overrides positional)")
+    history_parser.add_argument("--limit", "-l", type=int, default=10, help="Max items")
+    history_parser.add_argument("--platforms", "-p", nargs="+", help="Only items originally found on these platforms")
+    history_parser.add_argument("--days", type=float, default=None, help="Only items seen in the last N days")
+    history_parser.add_argument("--stats", action="store_true", help="Show index size and per-platform counts")
+    history_parser.add_argument("--prune-days", type=float, default=None, help="Delete items not seen in the last N days")
+    _add_output_args(history_parser)
+
     # defuddle - URL to Markdown (special handling because it takes URL not query)
     defuddle_parser = subparsers.add_parser("defuddle", help="Extract web page content to Markdown using Defuddle")
     defuddle_parser.add_argument("url", nargs="?", help="URL to extract content from")
@@ -137,10 +204,22 @@ def parse_args() -> argparse.Namespace:
     defuddle_parser.add_argument("--debug", action="store_true", help="Enable debug mode")
     _add_output_args(defuddle_parser)
 
+    # serve - long-running daemon
+    serve_parser = subparsers.add_parser("serve", help="Run a warm daemon serving search/platform/defuddle/list/history over a Unix socket and localhost HTTP")
+    serve_parser.add_argument("--workers", type=int, default=8, help="Concurrent commands")
+    serve_parser.add_argument("--socket", default=None, help="Unix socket path (default: <cache dir>/daemon.sock)")
+    serve_parser.add_argument("--no-socket", action="store_true", help="Do not listen on a Unix socket")
+    serve_parser.add_argument("--host", default="127.0.0.1", help="HTTP listen address")
+    serve_parser.add_argument("--port", type=int, default=None, help="HTTP port (default: UNION_SEARCH_DAEMON_PORT or 8765; 0 disables HTTP)")
+    serve_parser.add_argument("--status", action="store_true", help="Show the running daemon's status and exit")
+    serve_parser.add_argument("--stop", action="store_true", help="Ask the running daemon to shut down gracefully")
+    serve_parser.add_argument("--env-file", default=".env", help="Env file path")
+    _add_output_args(serve_parser)
+
     # direct platform commands, e.g. `google "query"` / `bing "query"`
     _add_direct_platform_subcommands(subparsers)
 
-    return parser.parse_args()
+    return parser
 
 
 def _add_output_args(parser: argparse.ArgumentParser) -> None:
@@ -155,6 +234,10 @@ def _add_platform_execution_args(parser: argparse.ArgumentParser) -> None:
     parser.add_argument("--limit", "-l", type=int, default=None, help="Result limit")
     parser.add_argument("--timeout", type=int, default=60, help="Timeout seconds")
     parser.add_argument("--param", action="append", help="Adapter passthrough key=value (repeatable)")
+    parser.add_argument("--execution", choices=["inprocess", "subprocess"], default=None, help="Platform execution mode (default: inprocess)")
+    parser.add_argument("--no-cache", action="store_true", help="Bypass the result cache")
+    parser.add_argument("--refresh", action="store_true", help="Ignore cached results and refresh the cache")
+    parser.add_argument("--ignore-health", action="store_true", help="Call the platform even if its circuit breaker is open")
     parser.add_argument("--fail-on-platform-error", action="store_true", help="Exit non-zero if platform fails")
     parser.add_argument("--env-file", default=".env", help="Env file path")
     _add_output_args(parser)
@@ -193,6 +276,12 @@ def write_output(content: str, output_path: Optional[str]) -> None:
 
 
 def handle_search(args: argparse.Namespace) -> Dict[str, Any]:
+    from adapters import run_search
+
+    if args.queries_file:
+        return _handle_search_batch(args)
+    if args.platform_concurrency:
+        raise CliUsageError("--platform-concurrency requires --queries-file")
     query = resolve_query(args.query, args.query_opt)
     limit = resolve_limit(args.limit, args.preset)
     caps = load_capabilities()
@@ -203,35 +292,225 @@ def handle_search(args: argparse.Namespace) -> Dict[str, Any]:
         raise CliUsageError(f"Unknown group '{args.group}'. Available: {', '.join(sorted(groups))}")
 
     selected_platforms = validate_platforms(args.platforms, known) if args.platforms else None
+    for flag, value in (("--race", args.race), ("--min-results", args.min_results), ("--top-k", args.top_k), ("--local-first", args.local_first)):
+        if value is not None and value <= 0:
+            raise CliUsageError(f"{flag} must be a positive integer")
+    stream = NdjsonStream(args.output) if args.stream else None
+    on_platform_result, on_new_items = _build_stream_callbacks(stream, query, args.stream_items) if stream else (None, None)
     data = run_search(
         query=query,
         platforms=selected_platforms,
         group=args.group,
         limit=limit,
-        max_workers=args.max_workers,
+        max_workers=args.max_workers or 5,
         timeout=args.timeout,
         deduplicate=args.deduplicate,
         env_file=args.env_file,
+        execution=args.execution,
+        no_cache=args.no_cache,
+        refresh=args.refresh,
+        ignore_health=args.ignore_health,
+        on_platform_result=on_platform_result,
+        on_new_items=on_new_items,
+        race=args.race,
+        min_results=args.min_results,
+        hedge=args.hedge,
+        near_duplicates=args.near_duplicates,
+        fusion=args.fusion,
+        top_k=args.top_k,
+        fusion_dedup=args.fusion_dedup,
+        local_first=args.local_first,
     )
     failed = int(data.get("summary", {}).get("failed", 0))
     success = failed == 0
     errors: List[Dict[str, Any]] = []
     if failed:
         errors.append({"code": "partial_failure", "message": f"{failed} platforms failed"})
+    meta: Dict[str, Any] = {
+        "failed_platforms": failed,
+        "selected_platforms": data.get("platforms", []),
+        "downloadable_items": len(data.get("download_candidates", [])),
+    }
+    if stream is not None:
+        # Per-platform results were already streamed; the summary record omits them.
+        data = {k: v for k, v in data.items() if k != "results"}
+        meta["record"] = "summary"
     return {
         "query": query,
         "success": success,
         "data": data,
         "errors": errors,
-        "meta": {
+        "meta": meta,
+        "stream": stream,
+        "runtime_exit_code": 2 if (args.fail_on_platform_error and failed > 0) else 0,
+    }
+
+
+def _handle_search_batch(args: argparse.Namespace) -> Dict[str, Any]:
+    """Run `search --queries-file`: one scheduler for all queries, one NDJSON record per finished query."""
+    from adapters import run_search_batch
+
+    if args.query or args.query_opt:
+        raise CliUsageError("--queries-file cannot be combined with a query argument")
+    for flag, value in (("--race", args.race), ("--min-results", args.min_results), ("--hedge", args.hedge),
+                        ("--stream", args.stream), ("--stream-items", args.stream_items), ("--local-first", args.local_first)):
+        if value:
+            raise CliUsageError(f"{flag} is not supported with --queries-file")
+    if args.top_k is not None and args.top_k <= 0:
+        raise CliUsageError("--top-k must be a positive integer")
+    if args.max_workers is not None and args.max_workers <= 0:
+        raise CliUsageError("--max-workers must be a positive integer")
+    known = [c.name for c in load_capabilities()]
+    groups = load_groups()
+    if args.group and args.group not in groups:
+        raise CliUsageError(f"Unknown group '{args.group}'. Available: {', '.join(sorted(groups))}")
+    selected_platforms = validate_platforms(args.platforms, known) if args.platforms else None
+    default_concurrency, concurrency = parse_platform_concurrency(args.platform_concurrency, known)
+
+    if args.queries_file == "-":
+        source = sys.stdin
+    else:
+        path = Path(args.queries_file)
+        if not path.is_file():
+            raise CliUsageError(f"Queries file not found: {args.queries_file}")
+        source = path.open("r", encoding="utf-8")
+
+    stream = NdjsonStream(args.output)
+    counts = {"invalid": 0, "failed": 0}
+
+    def read_queries():
+        # Runs on the scheduler's reader thread; bad lines become error records instead of aborting the batch.
+        index = 0
+        with source:
+            for line_no, line in enumerate(source, 1):
+                started_at = datetime.now()
+                try:
+                    entry = parse_query_line(line, known)
+                except CliUsageError as exc:
+                    counts["invalid"] += 1
+                    stream.write(build_envelope(
+                        command="search",
+                        query=None,
+                        started_at=started_at,
+                        success=False,
+                        data={},
+                        errors=[{"code": "invalid_query", "message": exc.message}],
+                        meta={"record": "query", "line": line_no},
+                    ))
+                    continue
+                if entry is None:
+                    continue
+                index += 1
+                entry["_index"] = index
+                entry["_started_at"] = started_at
+                yield entry
+
+    def on_query_result(entry: Dict[str, Any], data: Dict[str, Any]) -> None:
+        failed = int(data.get("summary", {}).get("failed", 0))
+        if failed:
+            counts["failed"] += 1
+        meta: Dict[str, Any] = {
+            "record": "query",
+            "index": entry["_index"],
             "failed_platforms": failed,
             "selected_platforms": data.get("platforms", []),
             "downloadable_items": len(data.get("download_candidates", [])),
-        },
-        "runtime_exit_code": 2 if (args.fail_on_platform_error and failed > 0) else 0,
+        }
+        if "id" in entry:
+            meta["id"] = entry["id"]
+        stream.write(build_envelope(
+            command="search",
+            query=entry["query"],
+            started_at=entry["_started_at"],
+            success=failed == 0,
+            data=data,
+            errors=[{"code": "partial_failure", "message": f"{failed} platforms failed"}] if failed else [],
+            meta=meta,
+        ))
+
+    try:
+        summary = run_search_batch(
+            read_queries(),
+            platforms=selected_platforms,
+            group=args.group,
+            limit=resolve_limit(args.limit, args.preset),
+            max_workers=args.max_workers or 16,
+            timeout=args.timeout,
+            deduplicate=args.deduplicate,
+            env_file=args.env_file,
+            on_query_result=on_query_result,
+            platform_concurrency=concurrency,
+            default_platform_concurrency=default_concurrency,
+            execution=args.execution,
+            no_cache=args.no_cache,
+            refresh=args.refresh,
+            ignore_health=args.ignore_health,
+            near_duplicates=args.near_duplicates,
+            fusion=args.fusion,
+            top_k=args.top_k,
+            fusion_dedup=args.fusion_dedup,
+        )
+    except BaseException:
+        stream.close()
+        raise
+    summary["invalid_lines"] = counts["invalid"]
+    errors: List[Dict[str, Any]] = []
+    if counts["failed"]:
+        errors.append({"code": "partial_failure", "message": f"{counts['failed']} queries had failed platforms"})
+    if counts["invalid"]:
+        errors.append({"code": "invalid_query", "message": f"{counts['invalid']} query lines were invalid"})
+    return {
+        "query": None,
+        "success": not errors,
+        "data": summary,
+        "errors": errors,
+        "meta": {"record": "summary"},
+        "stream": stream,
+        "runtime_exit_code": 2 if (args.fail_on_platform_error and counts["failed"]) else 0,
     }
 
 
+def _build_stream_callbacks(stream: NdjsonStream, query: str, include_items: bool):
+    """Build the per-platform and per-item callbacks that write NDJSON records for `search --stream`.
+
+    Item records come from the merged view, so with --deduplicate each record is an item
+    not seen from any earlier platform and `index` counts items across all platforms.
+    """
+    started_at = datetime.now()
+    emitted = 0
+
+    def on_platform_result(platform: str, result: Dict[str, Any]) -> None:
+        success = bool(result.get("success"))
+        errors: List[Dict[str, Any]] = []
+        if not success:
+            errors.append({"code": "platform_error", "message": str(result.get("error") or "Platform failed")})
+        data = {k: v for k, v in result.items() if k != "items"} if include_items else result
+        stream.write(build_envelope(
+            command="search",
+            query=query,
+            started_at=started_at,
+            success=success,
+            data=data,
+            errors=errors,
+            meta={"record": "platform", "platform": platform},
+        ))
+
+    def on_new_items(platform: str, items: List[Dict[str, Any]]) -> None:
+        nonlocal emitted
+        for item in items:
+            emitted += 1
+            stream.write(build_envelope(
+                command="search",
+                query=query,
+                started_at=started_at,
+                success=True,
+                data=item,
+                meta={"record": "item", "platform": platform, "index": emitted},
+            ))
+
+    return on_platform_result, (on_new_items if include_items else None)
+
+
 def handle_platform(args: argparse.Namespace) -> Dict[str, Any]:
     query = resolve_query(args.query, args.query_opt)
     caps = load_capabilities()
@@ -255,6 +534,8 @@ def _handle_single_platform_run(
     args: argparse.Namespace,
     command_name: str,
 ) -> Dict[str, Any]:
+    from adapters import run_platform
+
     params = parse_param_pairs(args.param)
     data = run_platform(
         platform=platform,
@@ -263,6 +544,10 @@ def _handle_single_platform_run(
         timeout=args.timeout,
         env_file=args.env_file,
         params=params,
+        execution=args.execution,
+        no_cache=args.no_cache,
+        refresh=args.refresh,
+        ignore_health=args.ignore_health,
     )
     success = bool(data.get("success"))
     errors: List[Dict[str, Any]] = []
@@ -280,6 +565,8 @@ def _handle_single_platform_run(
 
 
 def handle_image(args: argparse.Namespace) -> Dict[str, Any]:
+    from adapters import run_image
+
     query = resolve_query(args.query, args.query_opt)
     selected_platforms = validate_platforms(args.platforms, IMAGE_PLATFORMS) if args.platforms else None
     data = run_image(
@@ -310,6 +597,8 @@ def handle_image(args: argparse.Namespace) -> Dict[str, Any]:
 
 
 def handle_download(args: argparse.Namespace) -> Dict[str, Any]:
+    from adapters import run_download
+
     if not args.urls and not args.from_file:
         raise CliUsageError("Provide at least one URL or use --from-file")
 
@@ -391,9 +680,11 @@ def handle_doctor(args: argparse.Namespace) -> Dict[str, Any]:
     scripts_dir = Path(__file__).resolve().parents[1]
     if str(scripts_dir) not in sys.path:
         sys.path.insert(0, str(scripts_dir))
-    from union_search.union_search import load_env_file
+    from union_search.platform_stats import STATE_CLOSED, STATE_OPEN, get_platform_stats
+    from common.env_file import load_env_file
 
     load_env_file(args.env_file)
+    stats = get_platform_stats()
     env_path = Path(args.env_file)
     if not env_path.is_absolute():
         env_path = Path.cwd() / env_path
@@ -407,6 +698,16 @@ def handle_doctor(args: argparse.Namespace) -> Dict[str, Any]:
         }
     )
 
+    manifest = manifest_status()
+    checks.append(
+        {
+            "name": "platform_manifest",
+            "status": "pass" if manifest == "fresh" else "warn",
+            "message": f"platform manifest is {manifest} at {MANIFEST_PATH}"
+            + ("" if manifest == "fresh" else " (run 'python scripts/cli/registry.py' to regenerate)"),
+        }
+    )
+
     try:
         import requests  # noqa: F401
 
@@ -504,6 +805,14 @@ def handle_doctor(args: argparse.Namespace) -> Dict[str, Any]:
         else:
             status = "pass"
             message = "ready"
+        # Live health from recorded calls overrides the static registry status.
+        health = stats.health(cap.name) if stats is not None else None
+        if health and health["state"] != STATE_CLOSED and status == "pass":
+            status = "warn"
+            if health["state"] == STATE_OPEN:
+                message = f"circuit open, retry in {health.get('retry_after_s', 0)}s: {health.get('last_error') or 'repeated failures'}"
+            else:
+                message = "circuit half-open, probing"
         platform_checks.append(
             {
                 "platform": cap.name,
@@ -511,6 +820,7 @@ def handle_doctor(args: argparse.Namespace) -> Dict[str, Any]:
                 "message": message,
                 "required_env": list(cap.required_env),
                 "groups": list(cap.groups),
+                "health": health,
             }
         )
 
@@ -520,6 +830,9 @@ def handle_doctor(args: argparse.Namespace) -> Dict[str, Any]:
         "checks_fail": len([c for c in checks if c["status"] == "fail"]),
         "platform_pass": len([c for c in platform_checks if c["status"] == "pass"]),
         "platform_warn": len([c for c in platform_checks if c["status"] == "warn"]),
+        "platform_unhealthy": len(
+            [c for c in platform_checks if c.get("health") and c["health"]["state"] != STATE_CLOSED]
+        ),
         "platform_total": len(platform_checks),
         "groups_available": sorted(groups.keys()),
     }
@@ -543,6 +856,74 @@ def handle_doctor(args: argparse.Namespace) -> Dict[str, Any]:
     }
 
 
+def handle_quota(args: argparse.Namespace) -> Dict[str, Any]:
+    scripts_dir = Path(__file__).resolve().parents[1]
+    if str(scripts_dir) not in sys.path:
+        sys.path.insert(0, str(scripts_dir))
+    from union_search.rate_limiter import PROVIDER_LIMITS, get_rate_limiter, rate_limit_enabled
+    from common.env_file import load_env_file
+
+    load_env_file(args.env_file)
+    providers = list(PROVIDER_LIMITS)
+    if args.providers:
+        invalid = [p for p in args.providers if p not in PROVIDER_LIMITS]
+        if invalid:
+            raise CliUsageError(f"Unknown providers: {', '.join(invalid)}. Available: {', '.join(providers)}")
+        providers = list(args.providers)
+
+    limiter = get_rate_limiter()
+    rows = [limiter.status(provider) for provider in providers]
+    exhausted = [
+        row["provider"]
+        for row in rows
+        if any(period["remaining"] == 0 for period in row["quota"].values())
+    ]
+    summary = {
+        "providers": len(rows),
+        "with_quota": len([row for row in rows if row["quota"]]),
+        "exhausted": exhausted,
+        "enabled": rate_limit_enabled(),
+    }
+    return {
+        "query": None,
+        "success": True,
+        "data": {"providers": rows, "summary": summary},
+        "errors": [],
+        "meta": {"ledger": str(limiter.ledger.path) if limiter.ledger is not None else None},
+        "runtime_exit_code": 0,
+    }
+
+
+def handle_history(args: argparse.Namespace) -> Dict[str, Any]:
+    """Query, inspect or prune the local history index; never touches the network."""
+    from adapters import run_history
+
+    query = args.query_opt or args.query
+    if not query and not args.stats and args.prune_days is None:
+        raise CliUsageError("Missing query. Provide positional query, --query, --stats or --prune-days.")
+    if args.limit <= 0:
+        raise CliUsageError("--limit must be a positive integer")
+    for flag, value in (("--days", args.days), ("--prune-days", args.prune_days)):
+        if value is not None and value <= 0:
+            raise CliUsageError(f"{flag} must be positive")
+    data = run_history(
+        query=query,
+        limit=args.limit,
+        platforms=args.platforms,
+        days=args.days,
+        stats=args.stats,
+        prune_days=args.prune_days,
+    )
+    return {
+        "query": query,
+        "success": True,
+        "data": data,
+        "errors": [],
+        "meta": {"index": data.get("index"), "total_items": len(data.get("items", []))},
+        "runtime_exit_code": 0,
+    }
+
+
 def handle_defuddle(args: argparse.Namespace) -> Dict[str, Any]:
     """Handle defuddle URL to Markdown command."""
     from url_to_markdown.engines.defuddle_engine import DefuddleEngine
@@ -582,6 +963,64 @@ def handle_defuddle(args: argparse.Namespace) -> Dict[str, Any]:
     }
 
 
+def handle_serve(args: argparse.Namespace) -> Dict[str, Any]:
+    """Run the daemon in the foreground, or query/stop a running one with --status/--stop."""
+    import daemon
+
+    if args.status or args.stop:
+        state = daemon.read_state()
+        if state is None:
+            raise CliRuntimeError("No daemon is running")
+        try:
+            _, data = daemon.request_daemon("POST" if args.stop else "GET", "/shutdown" if args.stop else "/health", state=state, timeout=10)
+        except OSError as exc:
+            raise CliRuntimeError(f"Daemon did not answer: {exc}", detail=str(daemon.STATE_PATH)) from exc
+        return {
+            "query": None,
+            "success": True,
+            "data": data,
+            "errors": [],
+            "meta": {"state_file": str(daemon.STATE_PATH), "action": "stop" if args.stop else "status"},
+            "runtime_exit_code": 0,
+        }
+
+    socket_path = None if args.no_socket else Path(args.socket) if args.socket else daemon.DEFAULT_SOCKET_PATH
+    server = daemon.SearchDaemon(
+        workers=args.workers,
+        socket_path=socket_path,
+        host=args.host,
+        port=daemon.DEFAULT_PORT if args.port is None else args.port,
+        env_file=args.env_file,
+    )
+    server.warm_up()
+    server.start()
+    listening = [str(server.socket_path)] if server.socket_path is not None else []
+    listening += [f"http://{host}:{port}" for host, port in (srv.server_address for srv in server.servers if isinstance(srv.server_address, tuple))]
+    print(f"union-search daemon {os.getpid()} listening on {', '.join(listening)}", file=sys.stderr)
+    server.wait()
+    return {
+        "query": None,
+        "success": True,
+        "data": server.health(),
+        "errors": [],
+        "meta": {"listening": listening},
+        "runtime_exit_code": 0,
+    }
+
+
+def _forward_to_daemon(args: argparse.Namespace) -> Optional[Dict[str, Any]]:
+    """Run the command on a running `serve` daemon; None means run it locally."""
+    import daemon
+
+    command = "platform" if hasattr(args, "platform_command") else args.command
+    if args.no_daemon or not daemon.daemon_enabled() or command not in daemon.DAEMON_COMMANDS:
+        return None
+    # Streaming and batch runs write records as they finish, which the request/response protocol cannot carry.
+    if getattr(args, "stream", False) or getattr(args, "queries_file", None):
+        return None
+    return daemon.forward_command(args, sys.argv[1:])
+
+
 def dispatch(args: argparse.Namespace) -> Dict[str, Any]:
     if hasattr(args, "platform_command"):
         return handle_platform_direct(args)
@@ -597,8 +1036,14 @@ def dispatch(args: argparse.Namespace) -> Dict[str, Any]:
         return handle_list(args)
     if args.command == "doctor":
         return handle_doctor(args)
+    if args.command == "quota":
+        return handle_quota(args)
+    if args.command == "history":
+        return handle_history(args)
     if args.command == "defuddle":
         return handle_defuddle(args)
+    if args.command == "serve":
+        return handle_serve(args)
     raise CliUsageError(f"Unknown command: {args.command}")
 
 
@@ -606,7 +1051,9 @@ def main() -> int:
     started_at = datetime.now()
     try:
         args = parse_args()
-        result = dispatch(args)
+        result = _forward_to_daemon(args)
+        if result is None:
+            result = dispatch(args)
         envelope = build_envelope(
             command=str(result.get("command", args.command)),
             query=result.get("query"),
@@ -616,8 +1063,13 @@ def main() -> int:
             errors=result.get("errors"),
             meta=result.get("meta"),
         )
-        rendered = render_output(envelope, fmt=args.format, pretty=bool(args.pretty))
-        write_output(rendered, args.output)
+        stream = result.get("stream")
+        if stream is not None:
+            stream.write(envelope)
+            stream.close()
+        else:
+            rendered = render_output(envelope, fmt=args.format, pretty=bool(args.pretty))
+            write_output(rendered, args.output)
         return int(result.get("runtime_exit_code", 0))
     except CliError as exc:
         envelope = build_envelope(
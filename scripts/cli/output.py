@@ -2,7 +2,10 @@
 """Output helpers for unified CLI."""
 
 import json
+import sys
+import threading
 from datetime import datetime
+from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 
@@ -41,6 +44,34 @@ def render_json(envelope: Dict[str, Any], pretty: bool = False) -> str:
     return json.dumps(envelope, ensure_ascii=False)
 
 
+class NdjsonStream:
+    """Write envelopes as newline-delimited JSON, flushing after every record.
+
+    Writes are serialized, so records from different threads never interleave.
+    """
+
+    def __init__(self, output_path: Optional[str] = None):
+        self.output_path = output_path
+        self._lock = threading.Lock()
+        if output_path:
+            target = Path(output_path)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            self._handle = target.open("w", encoding="utf-8")
+        else:
+            self._handle = sys.stdout
+
+    def write(self, envelope: Dict[str, Any]) -> None:
+        line = json.dumps(envelope, ensure_ascii=False) + "\n"
+        with self._lock:
+            self._handle.write(line)
+            self._handle.flush()
+
+    def close(self) -> None:
+        if self.output_path:
+            self._handle.close()
+            print(str(Path(self.output_path)), file=sys.stderr)
+
+
 def render_text(envelope: Dict[str, Any]) -> str:
     """Render concise text output."""
     lines = [
@@ -180,6 +211,16 @@ def render_markdown(envelope: Dict[str, Any]) -> str:
                 icon = "✓" if status == "pass" else "✗" if status == "fail" else "⚠"
                 lines.append(f"- {icon} **{platform}**: {msg}")
 
+        # Quota budget per provider
+        if "providers" in data and isinstance(data["providers"], list):
+            lines.append("")
+            lines.append("## Quota")
+            for p in data["providers"]:
+                budget = ", ".join(
+                    f"{period} {q.get('remaining')}/{q.get('limit')}" for period, q in p.get("quota", {}).items()
+                ) or "no quota"
+                lines.append(f"- **{p.get('provider', '')}** ({p.get('rate_per_min')}/min): {budget}")
+
         # Summary section
         if "summary" in data and isinstance(data["summary"], dict):
             lines.append("")
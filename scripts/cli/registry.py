@@ -1,11 +1,37 @@
 #!/usr/bin/env python3
-"""Capability registry for unified CLI."""
+"""Capability registry for unified CLI.
+
+Platform metadata is read from a generated static manifest (platform_manifest.json)
+so that `list`, `doctor` and argument validation do not import the union search
+orchestrator (or anything else outside the standard library). Regenerate it after
+changing union_search/platforms.py or the tables below:
+
+    python scripts/cli/registry.py
+
+A missing or stale manifest (detected from a digest of its source files) falls back
+to building the same data from union_search/platforms.py at runtime.
+"""
 
 from dataclasses import dataclass, asdict
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
+import argparse
+import hashlib
+import json
+import os
 import sys
 
+CLI_DIR = Path(__file__).resolve().parent
+MANIFEST_PATH = CLI_DIR / "platform_manifest.json"
+MANIFEST_VERSION = 1
+# Files whose content determines the manifest
+MANIFEST_SOURCES: Tuple[Path, ...] = (
+    CLI_DIR.parent / "union_search" / "platforms.py",
+    Path(__file__).resolve(),
+)
+
+_MANIFEST_CACHE: Dict[str, Any] = {}
+
 
 def _ensure_scripts_on_path() -> None:
     scripts_dir = Path(__file__).resolve().parents[1]
@@ -90,43 +116,112 @@ IMAGE_PLATFORMS: Tuple[str, ...] = (
 )
 
 
-def load_capabilities() -> List[PlatformCapability]:
-    """Build capabilities from union search metadata."""
+def _source_digest() -> str:
+    """Digest of the files the manifest is generated from, used to detect a stale manifest."""
+    digest = hashlib.sha1()
+    for path in MANIFEST_SOURCES:
+        try:
+            digest.update(path.read_bytes())
+        except OSError:
+            digest.update(b"missing")
+    return digest.hexdigest()
+
+
+def build_manifest() -> Dict[str, Any]:
+    """Build the manifest from union search platform metadata."""
     _ensure_scripts_on_path()
-    from union_search.union_search import PLATFORM_GROUPS, PLATFORM_MODULES
+    from union_search.platforms import PLATFORM_GROUPS, PLATFORM_MODULES
 
     group_lookup: Dict[str, List[str]] = {}
     for group_name, group_platforms in PLATFORM_GROUPS.items():
         for item in group_platforms:
             group_lookup.setdefault(item, []).append(group_name)
 
-    capabilities: List[PlatformCapability] = []
+    platforms: List[Dict[str, Any]] = []
     for name, meta in PLATFORM_MODULES.items():
-        description = str(meta.get("description", ""))
-        groups = tuple(sorted(g for g in group_lookup.get(name, []) if g != "all"))
-        required_env = _REQUIRED_ENV.get(name, ())
-        optional_env = _OPTIONAL_ENV.get(name, ())
-        status = _STATUS.get(name, "stable")
-        notes = _NOTES.get(name, "")
-        capabilities.append(
-            PlatformCapability(
-                name=name,
-                description=description,
-                groups=groups,
-                required_env=required_env,
-                optional_env=optional_env,
-                status=status,
-                notes=notes,
-            )
+        platforms.append(
+            {
+                "name": name,
+                "description": str(meta.get("description", "")),
+                "groups": sorted(g for g in group_lookup.get(name, []) if g != "all"),
+                "required_env": list(_REQUIRED_ENV.get(name, ())),
+                "optional_env": list(_OPTIONAL_ENV.get(name, ())),
+                "status": _STATUS.get(name, "stable"),
+                "notes": _NOTES.get(name, ""),
+            }
         )
+    platforms.sort(key=lambda x: x["name"])
+
+    return {
+        "version": MANIFEST_VERSION,
+        "source_digest": _source_digest(),
+        "platforms": platforms,
+        "groups": {name: list(values) for name, values in PLATFORM_GROUPS.items()},
+    }
+
+
+def write_manifest(path: Path = MANIFEST_PATH) -> Dict[str, Any]:
+    """Regenerate the manifest file and return its content."""
+    manifest = build_manifest()
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_text(json.dumps(manifest, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    os.replace(tmp, path)
+    _MANIFEST_CACHE.clear()
+    return manifest
+
+
+def manifest_status(path: Path = MANIFEST_PATH) -> str:
+    """Return "fresh", "stale" or "missing" for the manifest file."""
+    try:
+        manifest = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return "missing"
+    if manifest.get("version") != MANIFEST_VERSION or manifest.get("source_digest") != _source_digest():
+        return "stale"
+    return "fresh"
+
+
+def load_manifest() -> Dict[str, Any]:
+    """Load the static manifest, falling back to a live build when it is missing or stale."""
+    if _MANIFEST_CACHE:
+        return _MANIFEST_CACHE
+    manifest: Optional[Dict[str, Any]] = None
+    if manifest_status() == "fresh":
+        manifest = json.loads(MANIFEST_PATH.read_text(encoding="utf-8"))
+    if manifest is None:
+        manifest = build_manifest()
+    _MANIFEST_CACHE.update(manifest)
+    return _MANIFEST_CACHE
 
-    capabilities.sort(key=lambda x: x.name)
-    return capabilities
 
+def load_capabilities() -> List[PlatformCapability]:
+    """Build capabilities from the platform manifest."""
+    return [
+        PlatformCapability(
+            name=entry["name"],
+            description=entry["description"],
+            groups=tuple(entry["groups"]),
+            required_env=tuple(entry["required_env"]),
+            optional_env=tuple(entry["optional_env"]),
+            status=entry["status"],
+            notes=entry["notes"],
+        )
+        for entry in load_manifest()["platforms"]
+    ]
 
-def load_groups() -> Dict[str, List[str]]:
-    """Load platform groups from union search metadata."""
-    _ensure_scripts_on_path()
-    from union_search.union_search import PLATFORM_GROUPS
 
-    return {name: list(values) for name, values in PLATFORM_GROUPS.items()}
+def load_groups() -> Dict[str, List[str]]:
+    """Load platform groups from the platform manifest."""
+    return {name: list(values) for name, values in load_manifest()["groups"].items()}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Regenerate the static platform manifest")
+    parser.add_argument("--check", action="store_true", help="Exit 1 if the manifest is missing or stale instead of writing it")
+    args = parser.parse_args()
+    if args.check:
+        status = manifest_status()
+        print(f"{MANIFEST_PATH}: {status}")
+        sys.exit(0 if status == "fresh" else 1)
+    written = write_manifest()
+    print(f"{MANIFEST_PATH}: {len(written['platforms'])} platforms, {len(written['groups'])} groups")
@@ -1,7 +1,8 @@
 #!/usr/bin/env python3
 """Validation and argument normalization helpers."""
 
-from typing import Any, Dict, Iterable, List, Optional
+import json
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from errors import CliUsageError
 
@@ -69,6 +70,59 @@ def parse_param_pairs(param_pairs: Optional[List[str]]) -> Dict[str, Any]:
     return data
 
 
+def parse_platform_concurrency(
+    specs: Optional[List[str]],
+    known_platforms: Iterable[str],
+) -> Tuple[Optional[int], Dict[str, int]]:
+    """Parse --platform-concurrency values (`N` and/or `platform=N`) into (default, overrides)."""
+    default: Optional[int] = None
+    overrides: Dict[str, int] = {}
+    for spec in specs or []:
+        name, _, value = spec.rpartition("=")
+        try:
+            count = int(value)
+        except ValueError:
+            raise CliUsageError(f"Invalid --platform-concurrency value '{spec}', expected N or platform=N") from None
+        if count <= 0:
+            raise CliUsageError(f"--platform-concurrency must be positive: '{spec}'")
+        if name:
+            overrides[validate_platforms([name], known_platforms)[0]] = count
+        else:
+            default = count
+    return default, overrides
+
+
+def parse_query_line(line: str, known_platforms: Iterable[str]) -> Optional[Dict[str, Any]]:
+    """Parse one --queries-file line: plain query text or a JSON object with query/id/platforms/limit.
+
+    Returns None for blank lines and `#` comments.
+    """
+    text = line.strip()
+    if not text or text.startswith("#"):
+        return None
+    if not text.startswith("{"):
+        return {"query": text}
+    try:
+        entry = json.loads(text)
+    except ValueError as exc:
+        raise CliUsageError(f"Invalid JSON query line: {exc}") from exc
+    if not isinstance(entry, dict):
+        raise CliUsageError("Query line must be a JSON object")
+    query = entry.get("query")
+    if not isinstance(query, str) or not query.strip():
+        raise CliUsageError("Query line is missing a non-empty 'query'")
+    entry["query"] = query.strip()
+    platforms = entry.get("platforms")
+    if platforms is not None:
+        if not isinstance(platforms, list) or not all(isinstance(item, str) for item in platforms):
+            raise CliUsageError("'platforms' must be a list of platform names")
+        entry["platforms"] = validate_platforms(platforms, known_platforms)
+    limit = entry.get("limit")
+    if limit is not None and (not isinstance(limit, int) or isinstance(limit, bool) or limit <= 0):
+        raise CliUsageError("'limit' must be a positive integer")
+    return entry
+
+
 def _coerce_scalar(value: str) -> Any:
     """Best-effort scalar conversion for passthrough params."""
     lowered = value.lower()
@@ -0,0 +1,37 @@
+"""
+平台脚本共享的基础组件
+"""
+
+from .env_file import load_env_file, read_env_file
+from .json_extract import dump_result, extract_json
+from .paths import cache_dir
+from .url_canon import canonicalize_url, unwrap_redirect
+from .user_agents import engine_user_agent, random_user_agent
+
+# http_client 依赖 requests，按需加载，使仅需 JSON 工具的调用方无需安装 requests
+_HTTP_CLIENT_EXPORTS = ("PooledSession", "configure_http_client", "create_session", "request")
+
+
+def __getattr__(name):
+    if name in _HTTP_CLIENT_EXPORTS:
+        from . import http_client
+
+        return getattr(http_client, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = [
+    "PooledSession",
+    "cache_dir",
+    "canonicalize_url",
+    "configure_http_client",
+    "create_session",
+    "dump_result",
+    "engine_user_agent",
+    "extract_json",
+    "load_env_file",
+    "random_user_agent",
+    "read_env_file",
+    "request",
+    "unwrap_redirect",
+]
@@ -0,0 +1,333 @@
+#!/usr/bin/env python3
+"""
+归档写入器
+
+搜索日志与各平台的原始响应转储统一交给进程级归档器：调用方只把记录放入
+有界队列即返回，后台线程将记录序列化为紧凑 JSONL，追加写入按流划分的分段
+文件。分段达到大小上限或时间间隔后轮转，写入时即流式压缩（安装 zstandard
+或 Python 3.14+ 时为 .zst，否则为 .gz），不再为每次查询生成一个小文件。
+
+队列写满时调用方最多等待 UNION_SEARCH_ARCHIVE_BLOCK_TIMEOUT 秒（背压），仍
+无空位时丢弃该记录并计数，归档永远不会让请求无限期阻塞。交给归档器的记录
+在后台线程中序列化，调用方交出后不应再修改。
+
+    archive_record("github_raw", {"command": "repo", "response": data})
+
+分段路径: <归档目录>/<流名称>/<流名称>-<开始时间>-<pid>[-<序号>].jsonl.zst
+
+环境变量:
+    UNION_SEARCH_ARCHIVE_DIR            归档目录（默认 <缓存目录>/archive）
+    UNION_SEARCH_ARCHIVE_COMPRESSION    zstd / gzip / none（默认有 zstd 时用 zstd，否则 gzip）
+    UNION_SEARCH_ARCHIVE_MAX_BYTES      单个分段的压缩后大小上限（默认 64 MiB）
+    UNION_SEARCH_ARCHIVE_MAX_AGE        单个分段的最长写入时间（秒，默认 3600）
+    UNION_SEARCH_ARCHIVE_QUEUE_SIZE     待写入记录队列长度（默认 1024）
+    UNION_SEARCH_ARCHIVE_BLOCK_TIMEOUT  队列写满时调用方最长等待时间（秒，默认 1）
+"""
+
+import atexit
+import gzip
+import json
+import logging
+import os
+import queue
+import re
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Optional, Tuple
+
+from .paths import cache_dir
+
+logger = logging.getLogger(__name__)
+
+
+def _env_number(name: str, default, cast):
+    try:
+        return cast(os.environ.get(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+MAX_SEGMENT_BYTES: int = _env_number("UNION_SEARCH_ARCHIVE_MAX_BYTES", 64 * 1024 * 1024, int)
+MAX_SEGMENT_AGE: float = _env_number("UNION_SEARCH_ARCHIVE_MAX_AGE", 3600, float)
+QUEUE_SIZE: int = _env_number("UNION_SEARCH_ARCHIVE_QUEUE_SIZE", 1024, int)
+BLOCK_TIMEOUT: float = _env_number("UNION_SEARCH_ARCHIVE_BLOCK_TIMEOUT", 1.0, float)
+
+COMPRESSIONS = ("zstd", "gzip", "none")
+_SUFFIXES = {"zstd": ".jsonl.zst", "gzip": ".jsonl.gz", "none": ".jsonl"}
+# 队列空闲时后台线程检查分段时限的间隔（秒）
+_IDLE_INTERVAL = 1.0
+# 进程退出时等待队列写完的最长时间（秒）
+_CLOSE_TIMEOUT = 10.0
+
+_STREAM_NAME_RE = re.compile(r"[^A-Za-z0-9_.-]+")
+
+
+def default_archive_dir() -> Path:
+    """归档目录：UNION_SEARCH_ARCHIVE_DIR，否则为缓存目录下的 archive/。"""
+    configured = os.environ.get("UNION_SEARCH_ARCHIVE_DIR")
+    if configured:
+        return Path(configured)
+    return cache_dir() / "archive"
+
+
+def _zstd_writer(raw: BinaryIO):
+    """返回写入 raw 的 zstd 流式压缩器；没有可用实现时返回 None。"""
+    try:
+        from compression import zstd  # Python 3.14+
+
+        return zstd.ZstdFile(raw, "w")
+    except ImportError:
+        pass
+    try:
+        import zstandard
+    except ImportError:
+        return None
+    return zstandard.ZstdCompressor(level=3).stream_writer(raw, closefd=False)
+
+
+def zstd_available() -> bool:
+    try:
+        from compression import zstd  # noqa: F401
+        return True
+    except ImportError:
+        pass
+    try:
+        import zstandard  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def default_compression() -> str:
+    configured = (os.environ.get("UNION_SEARCH_ARCHIVE_COMPRESSION") or "").strip().lower()
+    if configured in COMPRESSIONS and (configured != "zstd" or zstd_available()):
+        return configured
+    return "zstd" if zstd_available() else "gzip"
+
+
+class _Segment:
+    """一个正在写入的分段文件。"""
+
+    def __init__(self, path: Path, compression: str):
+        self.path = path
+        self.opened_at = time.monotonic()
+        self.records = 0
+        self._raw = open(path, "xb")
+        if compression == "zstd":
+            self._writer = _zstd_writer(self._raw)
+        elif compression == "gzip":
+            self._writer = gzip.GzipFile(filename="", mode="wb", fileobj=self._raw, compresslevel=6)
+        else:
+            self._writer = None
+
+    def write(self, line: bytes) -> None:
+        (self._writer or self._raw).write(line)
+        self.records += 1
+
+    def flush(self) -> None:
+        # 压缩器刷新到块边界：进程异常退出时已刷新的记录仍可解压读出
+        if self._writer is not None:
+            self._writer.flush()
+        self._raw.flush()
+
+    def size(self) -> int:
+        return self._raw.tell()
+
+    def close(self) -> None:
+        try:
+            if self._writer is not None:
+                self._writer.close()
+        finally:
+            self._raw.close()
+
+
+class ArchiveSink:
+    """后台线程写入的归档器：有界队列 + 按流分段、轮转、流式压缩。"""
+
+    def __init__(
+        self,
+        directory: Optional[Path] = None,
+        compression: Optional[str] = None,
+        max_bytes: int = MAX_SEGMENT_BYTES,
+        max_age: float = MAX_SEGMENT_AGE,
+        queue_size: int = QUEUE_SIZE,
+        block_timeout: float = BLOCK_TIMEOUT,
+    ):
+        self.directory = Path(directory) if directory is not None else default_archive_dir()
+        self.compression = compression or default_compression()
+        if self.compression == "zstd" and not zstd_available():
+            self.compression = "gzip"
+        self.max_bytes = max(1, max_bytes)
+        self.max_age = max_age
+        self.block_timeout = block_timeout
+        self._queue: "queue.Queue[Optional[Tuple[str, Dict[str, Any]]]]" = queue.Queue(maxsize=max(1, queue_size))
+        self._segments: Dict[str, _Segment] = {}
+        self._lock = threading.Lock()
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+        self.stats = {"written": 0, "dropped": 0, "failed": 0, "segments": 0}
+
+    def stream_dir(self, stream: str) -> Path:
+        return self.directory / _STREAM_NAME_RE.sub("_", stream)
+
+    def write(self, stream: str, record: Dict[str, Any]) -> bool:
+        """把记录放入队列；队列写满且在 block_timeout 内仍无空位时丢弃并返回 False。"""
+        if self._closed:
+            return False
+        self._ensure_thread()
+        try:
+            self._queue.put((stream, record), timeout=self.block_timeout)
+        except queue.Full:
+            with self._lock:
+                self.stats["dropped"] += 1
+                dropped = self.stats["dropped"]
+            if dropped == 1 or dropped % 100 == 0:
+                logger.warning(f"归档队列已满，已丢弃 {dropped} 条记录")
+            return False
+        return True
+
+    def flush(self) -> None:
+        """等待已入队的记录全部写入并刷新到磁盘。"""
+        if self._thread is not None:
+            self._queue.join()
+
+    def close(self, timeout: float = _CLOSE_TIMEOUT) -> None:
+        """停止接收记录，写完队列中的记录并关闭所有分段。"""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            thread = self._thread
+        if thread is None:
+            return
+        try:
+            self._queue.put(None, timeout=timeout)
+        except queue.Full:
+            logger.warning("归档队列未能在退出前写完")
+            return
+        thread.join(timeout)
+
+    def _ensure_thread(self) -> None:
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None and not self._closed:
+                self._thread = threading.Thread(target=self._run, name="archive-writer", daemon=True)
+                self._thread.start()
+
+    # ---- 后台线程 -----------------------------------------------------------
+
+    def _run(self) -> None:
+        while True:
+            try:
+                item = self._queue.get(timeout=_IDLE_INTERVAL)
+            except queue.Empty:
+                self._rotate_expired()
+                continue
+            try:
+                if item is None:
+                    self._close_segments()
+                    return
+                self._append(*item)
+                # 队列暂时写空时统一刷新一次，连续写入时不逐条刷新
+                if self._queue.empty():
+                    self._flush_segments()
+                    self._rotate_expired()
+            except Exception as e:  # noqa: BLE001 - 归档失败不能影响调用方
+                with self._lock:
+                    self.stats["failed"] += 1
+                logger.warning(f"归档写入失败: {e}")
+            finally:
+                self._queue.task_done()
+
+    def _append(self, stream: str, record: Dict[str, Any]) -> None:
+        line = json.dumps(
+            {"ts": datetime.now().isoformat(), "stream": stream, **record},
+            ensure_ascii=False,
+            separators=(",", ":"),
+            default=str,
+        ).encode("utf-8") + b"\n"
+        segment = self._segments.get(stream)
+        if segment is not None and segment.size() >= self.max_bytes:
+            self._close_segment(stream)
+            segment = None
+        if segment is None:
+            segment = self._segments[stream] = self._open_segment(stream)
+        segment.write(line)
+        with self._lock:
+            self.stats["written"] += 1
+
+    def _open_segment(self, stream: str) -> _Segment:
+        directory = self.stream_dir(stream)
+        directory.mkdir(parents=True, exist_ok=True)
+        base = f"{directory.name}-{datetime.now().strftime('%Y%m%d-%H%M%S')}-{os.getpid()}"
+        suffix = _SUFFIXES[self.compression]
+        path = directory / f"{base}{suffix}"
+        seq = 1
+        while path.exists():
+            path = directory / f"{base}-{seq}{suffix}"
+            seq += 1
+        with self._lock:
+            self.stats["segments"] += 1
+        return _Segment(path, self.compression)
+
+    def _close_segment(self, stream: str) -> None:
+        segment = self._segments.pop(stream)
+        try:
+            segment.close()
+        except OSError as e:
+            logger.warning(f"关闭归档分段失败 {segment.path}: {e}")
+
+    def _flush_segments(self) -> None:
+        for segment in self._segments.values():
+            segment.flush()
+
+    def _rotate_expired(self) -> None:
+        if self.max_age <= 0:
+            return
+        now = time.monotonic()
+        for stream in [s for s, seg in self._segments.items() if now - seg.opened_at >= self.max_age]:
+            self._close_segment(stream)
+
+    def _close_segments(self) -> None:
+        for stream in list(self._segments):
+            self._close_segment(stream)
+
+
+_SINKS: Dict[Optional[str], ArchiveSink] = {}
+_SINKS_LOCK = threading.Lock()
+
+
+def get_archive_sink(directory: Optional[Path] = None) -> ArchiveSink:
+    """获取进程级归档器（首次写入时启动后台线程，进程退出时写完队列）。
+
+    directory 为空时使用默认归档目录；调用方显式指定的目录各自对应一个归档器。
+    """
+    key = str(Path(directory).resolve()) if directory is not None else None
+    sink = _SINKS.get(key)
+    if sink is None:
+        with _SINKS_LOCK:
+            sink = _SINKS.get(key)
+            if sink is None:
+                sink = _SINKS[key] = ArchiveSink(directory=directory)
+                atexit.register(sink.close)
+    return sink
+
+
+def archive_record(stream: str, record: Dict[str, Any], directory: Optional[Path] = None) -> str:
+    """
+    异步归档一条记录
+
+    Args:
+        stream: 流名称（决定分段目录，如 search_logs、github_raw）
+        record: 可 JSON 序列化的记录，交出后不应再修改
+        directory: 归档目录，为空时使用默认归档目录
+
+    Returns:
+        该流的分段目录
+    """
+    sink = get_archive_sink(directory)
+    sink.write(stream, record)
+    return str(sink.stream_dir(stream))
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+并发批量抓取
+
+网页转 Markdown 各引擎的 fetch_batch 共用的调度器：按全局并发数在线程池中
+执行单 URL 的 fetch，同时限制每个目标主机的并发数与相邻两次请求的最小间隔，
+避免对同一站点突发大量请求。结果按完成顺序逐条产出（生成器），每条结果带
+_index（在输入中的位置），调用方需要输入顺序时可据此重排。
+
+单个 URL 超过截止时间（deadline，从工作线程开始抓取计时，含引擎降级的全部
+尝试）仍未返回时立即产出超时错误；工作线程无法中断，在其实际结束前仍占用
+全局与主机名额，避免超时的请求与新请求叠加超出并发限制。失败的 URL 产出
+{"url", "error", "content": None, "_index"}，不会中断其余 URL。
+
+    for result in fetch_concurrently(client.fetch, urls, deadline=45):
+        ...
+
+环境变量:
+    UNION_SEARCH_FETCH_WORKERS     全局并发抓取数（默认 8）
+    UNION_SEARCH_FETCH_PER_HOST    每个主机的并发抓取数（默认 2）
+    UNION_SEARCH_FETCH_HOST_DELAY  同一主机相邻两次请求开始的最小间隔（秒，默认 0）
+"""
+
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from urllib.parse import urlparse
+
+
+def _env_number(name: str, default, cast):
+    try:
+        return cast(os.environ.get(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+DEFAULT_WORKERS: int = _env_number("UNION_SEARCH_FETCH_WORKERS", 8, int)
+DEFAULT_PER_HOST: int = _env_number("UNION_SEARCH_FETCH_PER_HOST", 2, int)
+DEFAULT_HOST_DELAY: float = _env_number("UNION_SEARCH_FETCH_HOST_DELAY", 0.0, float)
+
+# 有已提交但尚未开始（截止时间未知）的抓取时，调度循环醒来检查的间隔（秒）
+_START_POLL_INTERVAL = 0.05
+
+
+def url_host(url: str) -> str:
+    """目标主机（小写，无 scheme 时按 https 解析），用于按主机限流。"""
+    url = (url or "").strip()
+    parsed = urlparse(url if "://" in url else f"https://{url}")
+    return (parsed.hostname or url).lower()
+
+
+def _failure(url: str, index: int, error: str) -> Dict[str, Any]:
+    return {"url": url, "error": error, "content": None, "_index": index}
+
+
+def fetch_concurrently(
+    fetch: Callable[..., Dict[str, Any]],
+    urls: Iterable[str],
+    max_workers: Optional[int] = None,
+    per_host: Optional[int] = None,
+    host_delay: Optional[float] = None,
+    deadline: Optional[float] = None,
+    **kwargs,
+) -> Iterator[Dict[str, Any]]:
+    """
+    并发抓取多个 URL，按完成顺序产出结果
+
+    Args:
+        fetch: 单 URL 抓取函数，调用方式为 fetch(url, **kwargs)
+        urls: URL 列表
+        max_workers: 全局并发数（默认 UNION_SEARCH_FETCH_WORKERS）
+        per_host: 每个主机的并发数（默认 UNION_SEARCH_FETCH_PER_HOST）
+        host_delay: 同一主机相邻两次请求开始的最小间隔秒数（默认 UNION_SEARCH_FETCH_HOST_DELAY）
+        deadline: 单个 URL 的截止时间（秒，从该 URL 开始抓取计时），为空时只受 fetch 自身的超时限制
+        **kwargs: 透传给 fetch 的参数（如 timeout）
+
+    Yields:
+        fetch 的返回结果（带 _index，即在 urls 中的位置）；失败或超时时为
+        {"url", "error", "content": None, "_index"}
+    """
+    max_workers = max(1, max_workers or DEFAULT_WORKERS)
+    per_host = max(1, per_host or DEFAULT_PER_HOST)
+    host_delay = max(0.0, DEFAULT_HOST_DELAY if host_delay is None else host_delay)
+
+    waiting: List[Tuple[int, str, str]] = [(i, url, url_host(url)) for i, url in enumerate(urls)]
+    if not waiting:
+        return
+    running: Dict[str, int] = {}
+    next_start: Dict[str, float] = {}
+    futures: Dict[Future, Tuple[int, str, str]] = {}
+    # 已按超时产出、但工作线程仍在执行的抓取（future -> 主机）
+    abandoned: Dict[Future, str] = {}
+    # 各 URL 实际开始抓取的时间，由工作线程写入
+    started: Dict[int, float] = {}
+
+    def timed_fetch(index: int, url: str) -> Dict[str, Any]:
+        started[index] = time.monotonic()
+        return fetch(url, **kwargs)
+
+    def expires_at(index: int) -> Optional[float]:
+        begun = started.get(index)
+        return begun + deadline if deadline and begun is not None else None
+
+    def dispatch() -> Optional[float]:
+        """按输入顺序提交主机有空闲名额且已过间隔的 URL，返回最近一个间隔到期的时间。"""
+        now = time.monotonic()
+        earliest = None
+        for entry in list(waiting):
+            if len(futures) + len(abandoned) >= max_workers:
+                break
+            index, url, host = entry
+            if running.get(host, 0) >= per_host:
+                continue
+            ready_at = next_start.get(host, 0.0)
+            if ready_at > now:
+                earliest = ready_at if earliest is None else min(earliest, ready_at)
+                continue
+            waiting.remove(entry)
+            running[host] = running.get(host, 0) + 1
+            next_start[host] = now + host_delay
+            futures[executor.submit(timed_fetch, index, url)] = (index, url, host)
+        return earliest
+
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="fetch-batch")
+    try:
+        while waiting or futures:
+            ready_at = dispatch()
+            expiries = [expires_at(index) for index, _, _ in futures.values()]
+            wakeups = [at for at in expiries if at is not None]
+            if ready_at is not None:
+                wakeups.append(ready_at)
+            if deadline and None in expiries:
+                # 工作线程尚未写入开始时间，稍后再计算其截止时间
+                wakeups.append(time.monotonic() + _START_POLL_INTERVAL)
+            wait_timeout = max(0.0, min(wakeups) - time.monotonic()) if wakeups else None
+            pending = [*futures, *abandoned]
+            if not pending:
+                time.sleep(wait_timeout or 0)
+                continue
+
+            done, _ = wait(pending, timeout=wait_timeout, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future in abandoned:
+                    running[abandoned.pop(future)] -= 1
+                    continue
+                index, url, host = futures.pop(future)
+                running[host] -= 1
+                try:
+                    result = future.result()
+                except Exception as e:
+                    yield _failure(url, index, str(e))
+                    continue
+                if isinstance(result, dict):
+                    result["_index"] = index
+                yield result
+
+            # 超过截止时间仍未返回的 URL 先按超时产出；工作线程结束前仍占用名额
+            now = time.monotonic()
+            for future, (index, url, host) in list(futures.items()):
+                url_deadline = expires_at(index)
+                if url_deadline is None or now < url_deadline or future.done():
+                    continue
+                del futures[future]
+                abandoned[future] = host
+                yield _failure(url, index, f"Timed out after {deadline}s")
+    finally:
+        # 调用方提前停止迭代时不再提交新的抓取
+        executor.shutdown(wait=False, cancel_futures=True)
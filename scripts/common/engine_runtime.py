@@ -0,0 +1,483 @@
+#!/usr/bin/env python3
+"""
+无需 API Key 搜索引擎的共享运行时
+
+按 common/engine_specs.py 中的声明式定义抓取并解析搜索结果页，所有直连引擎
+共用同一套实现：
+
+- XPath 按引擎编译一次（lxml.etree.XPath）并缓存，解析时不再重复编译表达式
+- 结果页边下载边增量解析（HTMLPullParser），已闭合的结果节点即时提取，
+  取满 max_results 条后立即停止读取；单页读取字节数有上限
+- 每个 (引擎, 代理) 复用一个会话，连接由 common/http_client 的共享连接池提供；
+  User-Agent 按请求轮换
+- 链接统一补全为绝对地址，并按 common/url_canon 解开引擎跳转链接
+- 同一页内链接（无链接时按标题）相同的结果只保留第一条
+- 第 1 页结果不足 max_results 条时，并发抓取后续页（复用同一会话），按页序
+  合并并跨页去重，取满即停止
+
+    search_engine("baidu", "关键词", max_results=10)
+    search_engine("google", "keyword", page=2, proxy="http://127.0.0.1:7890")
+    search_engine("bing_int", "keyword", max_results=40)   # 并发抓取第 2~4 页
+
+各 scripts/*/*_no_api.py 只是调用本模块的薄封装，保留原有的 search_xxx()
+函数与命令行入口。
+
+环境变量:
+    NO_API_KEY_PROXY                未显式指定代理时使用的代理地址
+    UNION_SEARCH_ENGINE_MAX_BYTES   单个结果页最多读取的字节数（默认 2 MiB）
+    UNION_SEARCH_ENGINE_MAX_PAGES   单次搜索最多抓取的页数（默认 5）
+"""
+
+import argparse
+import functools
+import logging
+import math
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import quote, urljoin
+
+from lxml import etree
+
+from .engine_specs import DEFAULT_HEADERS, EngineSpec, get_engine_spec
+from .env_file import load_env_file
+from .http_client import PooledSession, create_session
+from .json_extract import dump_result
+from .url_canon import is_url, unwrap_redirect
+from .user_agents import engine_user_agent
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TIMEOUT = 15
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.environ.get(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+# 单个结果页最多读取的字节数，超出部分不再下载，按已读取内容解析
+MAX_RESPONSE_BYTES: int = _env_int("UNION_SEARCH_ENGINE_MAX_BYTES", 2 * 1024 * 1024)
+# 每次送入解析器的字节数；每送入一块检查一次已闭合的结果节点
+CHUNK_SIZE = 32 * 1024
+# 单次搜索最多抓取的页数（含第 1 页）
+MAX_PAGES: int = _env_int("UNION_SEARCH_ENGINE_MAX_PAGES", 5)
+
+_CHARSET_RE = re.compile(r"charset=[\"']?([\w.:-]+)", re.IGNORECASE)
+
+_SESSIONS: Dict[Tuple[str, Optional[str]], PooledSession] = {}
+_SESSIONS_LOCK = threading.Lock()
+
+
+@dataclass(frozen=True)
+class CompiledSpec:
+    """编译后的引擎 XPath。"""
+
+    results: etree.XPath
+    title: etree.XPath
+    href: Optional[etree.XPath]
+    body: Optional[etree.XPath]
+    target: Optional[etree.XPath]
+
+
+def _xpath(expression: str) -> Optional[etree.XPath]:
+    return etree.XPath(expression) if expression else None
+
+
+@functools.lru_cache(maxsize=None)
+def compile_spec(spec: EngineSpec) -> CompiledSpec:
+    """编译引擎定义中的 XPath（每个定义只编译一次）。"""
+    return CompiledSpec(
+        results=etree.XPath(spec.results),
+        title=etree.XPath(spec.title),
+        href=_xpath(spec.href),
+        body=_xpath(spec.body),
+        target=_xpath(spec.target),
+    )
+
+
+def _session(spec: EngineSpec, proxy: Optional[str]) -> PooledSession:
+    key = (spec.name, proxy)
+    session = _SESSIONS.get(key)
+    if session is None:
+        with _SESSIONS_LOCK:
+            session = _SESSIONS.get(key)
+            if session is None:
+                session = create_session(headers=dict(DEFAULT_HEADERS + spec.headers), proxy=proxy)
+                _SESSIONS[key] = session
+    return session
+
+
+def build_url(spec: EngineSpec, query: str, page: int = 1) -> str:
+    """构建搜索 URL；引擎不支持翻页时忽略 page。"""
+    url = spec.url.replace("{keyword}", quote(query))
+    if spec.page_param and page > 1:
+        value = spec.page_base + (page - 1) * spec.page_step
+        url += ("&" if "?" in url else "?") + f"{spec.page_param}={value}"
+    return url
+
+
+def _join_text(nodes: List[Any]) -> str:
+    return "".join(str(node) for node in nodes).strip()
+
+
+def _first_link(nodes: List[Any]) -> str:
+    """第一个可用链接（跳过页内锚点与 javascript: 链接）。"""
+    for node in nodes:
+        value = str(node).strip()
+        if value and not value.startswith("#") and not value.lower().startswith("javascript:"):
+            return value
+    return ""
+
+
+def _open_path(root: etree._Element) -> List[etree._Element]:
+    """
+    增量解析中尚未闭合的元素
+
+    文档按顺序构建，只有从根节点沿最后一个子节点向下的这条路径仍可能追加
+    内容，其余元素（及其子树）都已完整。
+    """
+    path = []
+    node = root
+    while node is not None:
+        path.append(node)
+        node = node[-1] if len(node) else None
+    return path
+
+
+class ResultCollector:
+    """
+    按引擎定义从（可能仍在构建中的）结果页树提取结果
+
+    collect() 可在增量解析过程中反复调用：结果节点按文档顺序处理，遇到未闭合
+    的节点即停止，下次从该节点继续；取满 max_results 条后不再提取。
+    """
+
+    def __init__(self, spec: EngineSpec, base_url: str = "", max_results: Optional[int] = None):
+        self.spec = spec
+        self.compiled = compile_spec(spec)
+        self.base_url = base_url
+        self.max_results = max_results
+        self.results: List[Dict[str, Any]] = []
+        self._seen = set()
+        self._done = 0
+
+    @property
+    def full(self) -> bool:
+        return self.max_results is not None and len(self.results) >= self.max_results
+
+    def collect(self, root: etree._Element, open_nodes: Iterable[etree._Element] = ()) -> bool:
+        """处理 root 中已闭合的结果节点，返回是否已取满。"""
+        open_nodes = list(open_nodes)
+        nodes = self.compiled.results(root)
+        while self._done < len(nodes) and not self.full:
+            node = nodes[self._done]
+            if any(node is open_node for open_node in open_nodes):
+                break
+            self._done += 1
+            item = self._extract(node)
+            if item is not None:
+                self.results.append(item)
+        return self.full
+
+    def _extract(self, node: etree._Element) -> Optional[Dict[str, Any]]:
+        spec = self.spec
+        compiled = self.compiled
+        try:
+            title = _join_text(compiled.title(node)) or spec.default_title
+            body = _join_text(compiled.body(node)) if compiled.body is not None else ""
+            href = ""
+            if compiled.target is not None:
+                href = _first_link(compiled.target(node))
+            if not href and compiled.href is not None:
+                href = _first_link(compiled.href(node))
+        except (etree.XPathError, ValueError):
+            return None
+
+        if href:
+            if self.base_url:
+                href = urljoin(self.base_url, href)
+            if spec.decode_redirect:
+                href = unwrap_redirect(href)
+
+        if not title:
+            return None
+        if compiled.href is not None and not href:
+            return None
+        if spec.http_only and not is_url(href):
+            return None
+        if spec.require_body and not body:
+            return None
+
+        key = href or title
+        if key in self._seen:
+            return None
+        self._seen.add(key)
+
+        return {
+            'title': title,
+            'href': href,
+            'body': body,
+            'engine': spec.name,
+        }
+
+
+def parse_results(
+    spec: EngineSpec,
+    tree: etree._Element,
+    base_url: str = "",
+    max_results: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """
+    按引擎定义解析完整的结果页树
+
+    Args:
+        spec: 引擎定义
+        tree: 结果页 HTML 树
+        base_url: 结果页地址，用于补全相对链接
+        max_results: 最大结果数（为空时不限）
+
+    Returns:
+        结果列表，每项包含 title, href, body, engine
+    """
+    collector = ResultCollector(spec, base_url=base_url, max_results=max_results)
+    collector.collect(tree)
+    return collector.results
+
+
+def parse_stream(
+    spec: EngineSpec,
+    chunks: Iterable[bytes],
+    base_url: str = "",
+    max_results: Optional[int] = None,
+    max_bytes: int = MAX_RESPONSE_BYTES,
+    encoding: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """
+    边读取边解析结果页
+
+    每送入一块数据就提取已闭合的结果节点，取满 max_results 条或读满 max_bytes
+    字节后停止读取，剩余数据不再下载与解析。
+
+    Args:
+        spec: 引擎定义
+        chunks: 响应内容块（如 response.iter_content()）
+        base_url: 结果页地址，用于补全相对链接
+        max_results: 最大结果数（为空时解析整页）
+        max_bytes: 最多读取的字节数
+        encoding: 响应头声明的字符集（为空时由解析器按页面 meta 判断）
+
+    Returns:
+        结果列表，每项包含 title, href, body, engine
+    """
+    collector = ResultCollector(spec, base_url=base_url, max_results=max_results)
+    parser = etree.HTMLPullParser(events=("start",), tag="html", encoding=encoding)
+    root = None
+    received = 0
+
+    for chunk in chunks:
+        if not chunk:
+            continue
+        if received + len(chunk) > max_bytes:
+            chunk = chunk[:max_bytes - received]
+        received += len(chunk)
+        parser.feed(chunk)
+        for _, element in parser.read_events():
+            if root is None:
+                root = element.getroottree().getroot()
+        if root is not None and collector.collect(root, _open_path(root)):
+            return collector.results
+        if received >= max_bytes:
+            break
+
+    try:
+        root = parser.close()
+    except etree.XMLSyntaxError:
+        # 没有任何可解析的内容（空响应）
+        return collector.results
+    if root is not None:
+        collector.collect(root)
+    return collector.results
+
+
+def _response_encoding(response: Any) -> Optional[str]:
+    """响应头 Content-Type 中显式声明的字符集。"""
+    match = _CHARSET_RE.search(response.headers.get("Content-Type", ""))
+    return match.group(1) if match else None
+
+
+def _fetch_page(
+    spec: EngineSpec,
+    session: PooledSession,
+    query: str,
+    page: int,
+    max_results: int,
+    timeout: float,
+    user_agent: str,
+) -> List[Dict[str, Any]]:
+    """抓取并解析一页结果。"""
+    search_url = build_url(spec, query, page=page)
+    response = session.get(
+        search_url,
+        headers={'User-Agent': user_agent},
+        timeout=timeout,
+        stream=True,
+    )
+    try:
+        response.raise_for_status()
+        return parse_stream(
+            spec,
+            response.iter_content(CHUNK_SIZE),
+            base_url=response.url or search_url,
+            max_results=max_results,
+            encoding=_response_encoding(response),
+        )
+    finally:
+        # 提前停止读取时丢弃剩余内容（该连接不再复用）
+        response.close()
+
+
+def _result_key(item: Dict[str, Any]) -> str:
+    return item['href'] or item['title']
+
+
+def _fetch_more_pages(
+    spec: EngineSpec,
+    session: PooledSession,
+    query: str,
+    first_page: int,
+    results: List[Dict[str, Any]],
+    max_results: int,
+    timeout: float,
+    user_agent: str,
+) -> List[Dict[str, Any]]:
+    """
+    第 1 页结果不足时并发抓取后续页
+
+    页数按第 1 页的结果条数估算（不超过 MAX_PAGES）。各页同时请求，按页序
+    合并：跨页重复的结果只保留第一条，取满 max_results 条即停止；某页失败、
+    为空或没有新结果（引擎忽略了翻页参数）时不再合并其后的页。
+    """
+    extra = min(MAX_PAGES - 1, math.ceil((max_results - len(results)) / len(results)))
+    if extra <= 0:
+        return results
+
+    merged = list(results)
+    seen = {_result_key(item) for item in merged}
+    pages = range(first_page + 1, first_page + 1 + extra)
+    pool = ThreadPoolExecutor(max_workers=extra, thread_name_prefix=f"engine-{spec.name}")
+    try:
+        futures = [
+            pool.submit(_fetch_page, spec, session, query, page, max_results, timeout, user_agent)
+            for page in pages
+        ]
+        for page, future in zip(pages, futures):
+            try:
+                items = future.result()
+            except Exception as e:
+                logger.debug(f"{spec.display_name} 第 {page} 页抓取失败：{e}")
+                break
+            added = 0
+            for item in items:
+                key = _result_key(item)
+                if key in seen:
+                    continue
+                seen.add(key)
+                merged.append(item)
+                added += 1
+                if len(merged) >= max_results:
+                    return merged
+            if not added:
+                break
+    finally:
+        # 已取满或提前结束时取消尚未开始的请求，不等待进行中的请求
+        pool.shutdown(wait=False, cancel_futures=True)
+    return merged
+
+
+def search_engine(
+    name: str,
+    query: str,
+    max_results: int = 10,
+    proxy: Optional[str] = None,
+    timeout: float = DEFAULT_TIMEOUT,
+    page: int = 1,
+    **kwargs
+) -> List[Dict[str, Any]]:
+    """
+    执行搜索
+
+    Args:
+        name: 引擎名（ENGINE_SPECS 的键）
+        query: 搜索关键词
+        max_results: 最大结果数；第 1 页不足时并发抓取后续页（引擎支持翻页时）
+        proxy: 代理地址，为空时使用 NO_API_KEY_PROXY
+        timeout: 请求超时时间 (秒)
+        page: 起始页码（从 1 开始，引擎不支持翻页时忽略）
+
+    Returns:
+        搜索结果列表，每项包含：title, href, body, engine
+    """
+    spec = get_engine_spec(name)
+    proxy = proxy or os.getenv("NO_API_KEY_PROXY")
+    session = _session(spec, proxy)
+    # 同一次搜索的各页使用相同的 User-Agent
+    user_agent = engine_user_agent()
+
+    try:
+        results = _fetch_page(spec, session, query, page, max_results, timeout, user_agent)
+    except Exception as e:
+        raise Exception(f"{spec.display_name} 搜索失败：{str(e)}")
+
+    if results and spec.page_param and len(results) < max_results:
+        results = _fetch_more_pages(spec, session, query, page, results, max_results, timeout, user_agent)
+    return results[:max_results]
+
+
+def format_results(results: List[Dict[str, Any]], query: str, display_name: str) -> str:
+    """格式化搜索结果用于终端输出"""
+    output = []
+    output.append(f"🔍 {display_name}: {query}")
+    output.append(f"📊 找到 {len(results)} 条结果")
+    output.append("")
+
+    for i, item in enumerate(results, 1):
+        title = item.get('title', '')
+        href = item.get('href', '')
+        body = item.get('body', '')
+
+        output.append(f"[{i}] {title}")
+        output.append(f"    🔗 {href}")
+        if body:
+            output.append(f"    📝 {body}")
+        output.append("")
+
+    return "\n".join(output)
+
+
+def run_cli(name: str, description: str) -> None:
+    """引擎脚本的命令行入口。"""
+    spec = get_engine_spec(name)
+    load_env_file()
+
+    parser = argparse.ArgumentParser(description=description)
+    parser.add_argument("query", help="搜索关键词")
+    parser.add_argument("-m", "--max-results", type=int, default=10)
+    parser.add_argument("--page", type=int, default=1, help="页码（从 1 开始）")
+    parser.add_argument("--proxy", help="代理地址")
+    parser.add_argument("--json", action="store_true", help="JSON 输出")
+
+    args = parser.parse_args()
+
+    results = search_engine(name, args.query, args.max_results, args.proxy, page=args.page)
+
+    if args.json:
+        dump_result({'results': results}, indent=2)
+    else:
+        print(format_results(results, args.query, spec.display_name))
+
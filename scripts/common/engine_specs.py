@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""
+无需 API Key 搜索引擎的声明式定义
+
+每个引擎只描述 "怎么请求、从哪里取字段"：URL 模板、翻页参数、结果容器与
+标题/链接/摘要的 XPath（相对结果容器）以及额外请求头。抓取、解析、链接
+解码与错误处理统一由 common/engine_runtime.py 完成，新增引擎只需在
+ENGINE_SPECS 中添加一项（并在 union_search/platforms.py 中登记平台）。
+
+本模块只包含数据，不依赖 lxml / requests。
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+# 所有引擎共用的默认请求头（User-Agent 由运行时按请求轮换）
+DEFAULT_HEADERS: Tuple[Tuple[str, str], ...] = (
+    ("Accept", "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8"),
+    ("Accept-Language", "zh-CN,zh;q=0.9,en;q=0.8"),
+)
+
+# 模拟浏览器导航请求的附加请求头（Google 系）
+_NAVIGATION_HEADERS: Tuple[Tuple[str, str], ...] = (
+    ("Sec-Fetch-Dest", "document"),
+    ("Sec-Fetch-Mode", "navigate"),
+    ("Sec-Fetch-Site", "none"),
+    ("Sec-Fetch-User", "?1"),
+    ("Upgrade-Insecure-Requests", "1"),
+)
+
+
+@dataclass(frozen=True)
+class EngineSpec:
+    """单个搜索引擎的抓取定义。"""
+
+    name: str                       # 引擎名，写入结果的 engine 字段
+    display_name: str               # 显示名称（终端输出与错误信息）
+    url: str                        # URL 模板，{keyword} 替换为编码后的关键词
+    results: str                    # 结果容器 XPath
+    title: str                      # 标题文本 XPath
+    href: str = ""                  # 链接 XPath；为空表示结果没有链接
+    body: str = ""                  # 摘要文本 XPath
+    target: str = ""                # 真实目标地址 XPath（如百度结果容器的 mu 属性），取到时优先于 href
+    page_param: str = ""            # 翻页参数名；为空表示不支持翻页
+    page_base: int = 0              # 第 1 页的参数值
+    page_step: int = 10             # 每翻一页参数值的增量（偏移量型为每页条数，页码型为 1）
+    headers: Tuple[Tuple[str, str], ...] = ()  # 覆盖/追加到 DEFAULT_HEADERS 的请求头
+    requires_proxy: bool = False    # 大陆网络环境下通常需要代理
+    decode_redirect: bool = True    # 解开引擎跳转链接（common/url_canon.unwrap_redirect）
+    http_only: bool = False         # 只保留 http(s) 链接（过滤站内锚点、javascript: 等）
+    require_body: bool = False      # 摘要为空的结果丢弃
+    default_title: str = ""         # 标题为空时使用的标题；为空表示标题必填
+
+
+ENGINE_SPECS: Dict[str, EngineSpec] = {
+    # === 国内引擎 ===
+    "baidu": EngineSpec(
+        name="baidu",
+        display_name="百度搜索",
+        url="https://www.baidu.com/s?wd={keyword}",
+        results="//div[contains(@class, 'result')] | //div[contains(@class, 'c-container')]",
+        title=".//h3//a//text() | .//a[@class='c-title']//text()",
+        href=".//h3//a/@href | .//a[@class='c-title']/@href",
+        body=".//div[contains(@class, 'c-abstract')]//text() | .//div[contains(@class, 'abstract')]//text()",
+        target="@mu",
+        page_param="pn",
+    ),
+    "bing_cn": EngineSpec(
+        name="bing_cn",
+        display_name="Bing 中国",
+        url="https://cn.bing.com/search?q={keyword}&ensearch=0",
+        results="//li[contains(@class, 'b_algo')] | //div[contains(@class, 'b_ans')]",
+        title=".//h2//a//text() | .//a[@class='b_title']//text()",
+        href=".//h2//a/@href | .//a[@class='b_title']/@href",
+        body=".//div[contains(@class, 'b_caption')]//text() | .//p//text()",
+        page_param="first",
+        page_base=1,
+    ),
+    "so360": EngineSpec(
+        name="so360",
+        display_name="360 搜索",
+        url="https://www.so.com/s?q={keyword}",
+        results="//div[contains(@class, 'result')] | //li[contains(@class, 'res-list')]",
+        title=".//h3//a//text() | .//a[contains(@class, 'title')]//text()",
+        href=".//h3//a/@href | .//a[contains(@class, 'title')]/@href",
+        body=".//div[contains(@class, 'abstract')]//text() | .//p[contains(@class, 'cnt')]//text()",
+        page_param="pn",
+        page_base=1,
+        page_step=1,
+    ),
+    "sogou": EngineSpec(
+        name="sogou",
+        display_name="搜狗搜索",
+        url="https://www.sogou.com/web?query={keyword}",
+        results="//div[contains(@class, 'fb-hy')] | //div[contains(@class, 'res-list')] | //div[@class='vrwrap']",
+        title=".//h3//a//text() | .//a[contains(@class, 'vr-title')]//text() | .//div[@class='vr-title']//text()",
+        href=".//h3//a/@href | .//a[contains(@class, 'vr-title')]/@href",
+        body=".//div[contains(@class, 'abstract')]//text() | .//p[@class='vr-info']//text()",
+        page_param="page",
+        page_base=1,
+        page_step=1,
+    ),
+    "toutiao": EngineSpec(
+        name="toutiao",
+        display_name="今日头条",
+        url="https://www.toutiao.com/search/?keyword={keyword}",
+        results="//div[contains(@class, 'article')] | //div[contains(@class, 'result')]",
+        title=".//h3//text() | .//a[contains(@class, 'title')]//text()",
+        href=".//h3//a/@href | .//a[contains(@class, 'title')]/@href",
+        body=".//p[contains(@class, 'abstract')]//text() | .//div[contains(@class, 'desc')]//text()",
+    ),
+    "jisilu": EngineSpec(
+        name="jisilu",
+        display_name="基Silver",
+        url="https://app.jisilu.cn/search/?q={keyword}",
+        results="//div[contains(@class, 'search-result')] | //tr[contains(@class, 'row')]",
+        title=".//td[1]//text() | .//a[contains(@class, 'name')]//text()",
+        href=".//td[1]//a/@href | .//a[contains(@class, 'name')]/@href",
+        body=".//td[2]//text() | .//td[contains(@class, 'info')]//text()",
+    ),
+    "wechat": EngineSpec(
+        name="wechat",
+        display_name="微信搜索",
+        url="https://weixin.sogou.com/weixin?type=1&query={keyword}",
+        results="//div[contains(@class, 'wx-rb')] | //li[contains(@class, 'wx-item')]",
+        title=".//h3//text() | .//a[contains(@class, 'name')]//text()",
+        href=".//h3//a/@href | .//a[contains(@class, 'name')]/@href",
+        body=".//p[contains(@class, 'info')]//text() | .//div[contains(@class, 's-pb')]//text()",
+        page_param="page",
+        page_base=1,
+        page_step=1,
+    ),
+
+    # === 国际引擎 ===
+    "google": EngineSpec(
+        name="google",
+        display_name="Google 搜索",
+        url="https://www.google.com/search?q={keyword}",
+        results="//div[contains(@class, 'g')] | //div[contains(@class, 'tF2Cxc')]",
+        title=".//h3//text() | .//div[@class='vvjwJb']//text()",
+        href=".//a/@href",
+        body=".//div[contains(@class, 'IsZvec')]//text() | .//div[contains(@class, 'VwiK3b')]//text()",
+        page_param="start",
+        headers=(
+            ("Accept", "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8"),
+            ("Accept-Language", "en-US,en;q=0.9"),
+        ) + _NAVIGATION_HEADERS,
+        requires_proxy=True,
+        http_only=True,
+    ),
+    "google_hk": EngineSpec(
+        name="google_hk",
+        display_name="Google 香港",
+        url="https://www.google.com.hk/search?q={keyword}",
+        results="//div[contains(@class, 'g')] | //div[contains(@class, 'tF2Cxc')]",
+        title=".//h3//text()",
+        href=".//a/@href",
+        body=".//div[contains(@class, 'IsZvec')]//text() | .//div[contains(@class, 'VwiK3b')]//text()",
+        page_param="start",
+        headers=(
+            ("Accept", "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8"),
+            ("Accept-Language", "zh-HK,zh;q=0.9,zh-CN;q=0.8,en;q=0.7"),
+        ) + _NAVIGATION_HEADERS,
+        requires_proxy=True,
+        http_only=True,
+    ),
+    "bing_int": EngineSpec(
+        name="bing_int",
+        display_name="Bing 国际",
+        url="https://www.bing.com/search?q={keyword}",
+        results="//li[contains(@class, 'b_algo')]",
+        title=".//h2//a//text()",
+        href=".//h2//a/@href",
+        body=".//div[contains(@class, 'b_caption')]//p//text()",
+        page_param="first",
+        page_base=1,
+        requires_proxy=True,
+    ),
+    "duckduckgo_html": EngineSpec(
+        name="duckduckgo_html",
+        display_name="DuckDuckGo HTML",
+        url="https://html.duckduckgo.com/html/?q={keyword}",
+        results="//div[contains(@class, 'result')]",
+        title=".//h2//a//text()",
+        href=".//h2//a/@href",
+        body=".//a[@class='result__snippet']//text()",
+        page_param="s",
+    ),
+    "startpage": EngineSpec(
+        name="startpage",
+        display_name="Startpage",
+        url="https://www.startpage.com/do/search?q={keyword}",
+        results="//li[contains(@class, 'result')] | //div[contains(@class, 'search-result')]",
+        title=".//h3//text() | .//a[contains(@class, 'title')]//text()",
+        href=".//h3//a/@href | .//a[contains(@class, 'title')]/@href",
+        body=".//p[contains(@class, 'desc')]//text() | .//div[contains(@class, 'snippet')]//text()",
+        page_param="page",
+        page_base=1,
+        page_step=1,
+    ),
+    "brave": EngineSpec(
+        name="brave",
+        display_name="Brave 搜索",
+        url="https://search.brave.com/search?q={keyword}",
+        results="//div[contains(@class, 'result')] | //div[contains(@class, 'snippet')]",
+        title=".//h3//text() | .//a[contains(@class, 'title')]//text()",
+        href=".//h3//a/@href | .//a[contains(@class, 'title')]/@href",
+        body=".//div[contains(@class, 'description')]//text() | .//p//text()",
+        page_param="offset",
+        page_step=1,
+        # 避免部分环境下 br 内容解码失败导致 requests 抛 ContentDecodingError
+        headers=(("Accept-Encoding", "gzip, deflate"),),
+        requires_proxy=True,
+    ),
+    "yahoo": EngineSpec(
+        name="yahoo",
+        display_name="Yahoo 搜索",
+        url="https://search.yahoo.com/search?p={keyword}",
+        results="//div[contains(@class, 'algo')] | //li[contains(@class, 'res')]",
+        title=".//h3//a//text() | .//a[@class='title']//text()",
+        href=".//h3//a/@href | .//a[@class='title']/@href",
+        body=".//div[contains(@class, 'compText')]//text() | .//p//text()",
+        page_param="b",
+        page_base=1,
+        requires_proxy=True,
+    ),
+    "ecosia": EngineSpec(
+        name="ecosia",
+        display_name="Ecosia",
+        url="https://www.ecosia.org/search?q={keyword}",
+        results="//article[contains(@class, 'result')] | //div[contains(@class, 'result-web')]",
+        title=".//h3//text() | .//a[contains(@class, 'result-title')]//text()",
+        href=".//h3//a/@href | .//a[contains(@class, 'result-title')]/@href",
+        body=".//p[contains(@class, 'result-snippet')]//text() | .//div[contains(@class, 'result-abstract')]//text()",
+        page_param="p",
+        page_step=1,
+        headers=(
+            ("Accept", "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8"),
+            ("Accept-Language", "en-US,en;q=0.9"),
+        ),
+        requires_proxy=True,
+    ),
+    "qwant": EngineSpec(
+        name="qwant",
+        display_name="Qwant",
+        url="https://www.qwant.com/?q={keyword}",
+        results="//div[contains(@class, 'result')] | //article[contains(@class, 'result-web')]",
+        title=".//h3//text() | .//a[contains(@class, 'title')]//text()",
+        href=".//h3//a/@href | .//a[contains(@class, 'title')]/@href",
+        body=".//p[contains(@class, 'description')]//text() | .//div[contains(@class, 'result-desc')]//text()",
+        headers=(
+            ("Accept", "text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8"),
+            ("Accept-Language", "en-US,en;q=0.9,fr;q=0.8"),
+        ),
+        requires_proxy=True,
+    ),
+    "wolfram": EngineSpec(
+        name="wolfram",
+        display_name="Wolfram Alpha",
+        url="https://www.wolframalpha.com/input?i={keyword}",
+        results="//div[contains(@class, 'result')] | //div[contains(@class, 'pod')]",
+        title=".//h2//text() | .//div[contains(@class, 'pod-title')]//text()",
+        body=".//div[contains(@class, 'result-content')]//text() | .//div[contains(@class, 'pod-content')]//text()",
+        headers=(
+            ("Accept", "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8"),
+            ("Accept-Language", "en-US,en;q=0.9"),
+        ),
+        requires_proxy=True,
+        require_body=True,
+        default_title="Wolfram Alpha 结果",
+    ),
+    "mojeek": EngineSpec(
+        name="mojeek",
+        display_name="Mojeek 搜索",
+        url="https://www.mojeek.com/search?q={keyword}",
+        results="//ul[contains(@class, 'results-standard')]//li",
+        title=".//h2//a[@class='title']//text() | .//h2//a[contains(@class, 'title')]//text()",
+        href=".//h2//a[@class='title']/@href | .//h2//a[contains(@class, 'title')]/@href",
+        body=".//p[contains(@class, 's')]//text() | .//p[@class='s']//text()",
+        page_param="s",
+        page_base=1,
+        headers=(("Accept-Language", "en-US,en;q=0.9"),),
+    ),
+}
+
+
+def get_engine_spec(name: str) -> EngineSpec:
+    """按引擎名获取定义，未登记时抛出 KeyError。"""
+    spec: Optional[EngineSpec] = ENGINE_SPECS.get(name)
+    if spec is None:
+        raise KeyError(f"Unknown search engine: {name}")
+    return spec
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+.env 文件加载
+
+只依赖标准库，供 CLI 的 doctor/quota 等轻量命令与聚合搜索共用，
+加载环境变量时无需导入聚合搜索模块。已存在的环境变量不会被覆盖。
+"""
+
+import logging
+import os
+from pathlib import Path
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def _resolve_env_file(env_path: str) -> Optional[Path]:
+    env_file = Path(env_path)
+    if env_file.exists():
+        return env_file
+    # 尝试从项目根目录加载
+    root_env = Path(__file__).parent.parent.parent / ".env"
+    return root_env if root_env.exists() else None
+
+
+def read_env_file(env_path: str = ".env") -> Dict[str, str]:
+    """读取 .env 文件中的键值（不修改环境变量），文件不存在时返回空字典"""
+    env_file = _resolve_env_file(env_path)
+    if env_file is None:
+        return {}
+    values: Dict[str, str] = {}
+    with open(env_file, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#") or "=" not in line:
+                continue
+            key, value = line.split("=", 1)
+            key = key.strip()
+            # 与 load_env_file 一致：同名键以首次出现为准
+            if key and key not in values:
+                values[key] = value.strip()
+    return values
+
+
+def load_env_file(env_path: str = ".env"):
+    """加载 .env 文件"""
+    env_file = _resolve_env_file(env_path)
+    if env_file is None:
+        logger.debug(f"未找到 .env 文件: {env_path}")
+        return
+
+    logger.info(f"加载环境变量文件: {env_file}")
+    loaded_count = 0
+
+    for key, value in read_env_file(str(env_file)).items():
+        if key not in os.environ:
+            os.environ[key] = value
+            loaded_count += 1
+
+    logger.info(f"成功加载 {loaded_count} 个环境变量")
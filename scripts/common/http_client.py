@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+共享 HTTP 客户端
+
+所有平台脚本通过本模块发起 HTTP 请求，在进程内共用同一组按主机划分的
+keep-alive 连接池（同一进程内多次调用复用已建立的 TCP/TLS 连接），
+并统一超时、代理与重试退避策略。
+
+环境变量:
+    UNION_SEARCH_HTTP_TIMEOUT           默认请求超时（秒，默认 30）
+    UNION_SEARCH_HTTP_POOL_CONNECTIONS  缓存的主机连接池数量（默认 32）
+    UNION_SEARCH_HTTP_POOL_MAXSIZE      每个主机保持的最大连接数（默认 10）
+    UNION_SEARCH_HTTP_RETRIES           连接错误与幂等请求 5xx 的重试次数（默认 2）
+    UNION_SEARCH_HTTP_BACKOFF           重试退避系数（秒，默认 0.5）
+"""
+
+import os
+import threading
+from typing import Any, Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+def _env_number(name: str, default, cast):
+    try:
+        return cast(os.environ.get(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+DEFAULT_TIMEOUT: float = _env_number("UNION_SEARCH_HTTP_TIMEOUT", 30, float)
+POOL_CONNECTIONS: int = _env_number("UNION_SEARCH_HTTP_POOL_CONNECTIONS", 32, int)
+POOL_MAXSIZE: int = _env_number("UNION_SEARCH_HTTP_POOL_MAXSIZE", 10, int)
+RETRIES: int = _env_number("UNION_SEARCH_HTTP_RETRIES", 2, int)
+BACKOFF_FACTOR: float = _env_number("UNION_SEARCH_HTTP_BACKOFF", 0.5, float)
+
+# 只重试未发出的连接错误与幂等请求的服务端临时故障：
+# - POST 多为计费搜索接口，读超时或 5xx 时请求可能已被计费，不自动重发
+# - 读超时不重试（read=0），退避等待不会越过平台截止时间
+# - 429 直接交给调用方，由限速器（rate_limiter）暂停对应令牌桶
+RETRY_STATUS_CODES = (500, 502, 503, 504)
+RETRY_METHODS = frozenset({"GET", "HEAD"})
+
+_ADAPTER: Optional[HTTPAdapter] = None
+_ADAPTER_LOCK = threading.Lock()
+_DEFAULT_SESSION: Optional["PooledSession"] = None
+
+
+def _build_adapter() -> HTTPAdapter:
+    retry = Retry(
+        total=RETRIES,
+        connect=RETRIES,
+        read=0,
+        status=RETRIES,
+        backoff_factor=BACKOFF_FACTOR,
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=RETRY_METHODS,
+        raise_on_status=False,
+    )
+    return HTTPAdapter(
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=POOL_MAXSIZE,
+        max_retries=retry,
+    )
+
+
+def _shared_adapter() -> HTTPAdapter:
+    global _ADAPTER
+    if _ADAPTER is None:
+        with _ADAPTER_LOCK:
+            if _ADAPTER is None:
+                _ADAPTER = _build_adapter()
+    return _ADAPTER
+
+
+def configure_http_client(
+    pool_connections: Optional[int] = None,
+    pool_maxsize: Optional[int] = None,
+    retries: Optional[int] = None,
+    backoff_factor: Optional[float] = None,
+    timeout: Optional[float] = None,
+) -> None:
+    """
+    调整共享连接池参数（仅影响之后创建的会话）
+
+    Args:
+        pool_connections: 缓存的主机连接池数量
+        pool_maxsize: 每个主机保持的最大连接数
+        retries: 重试次数
+        backoff_factor: 重试退避系数
+        timeout: 默认请求超时（秒）
+    """
+    global _ADAPTER, _DEFAULT_SESSION
+    global POOL_CONNECTIONS, POOL_MAXSIZE, RETRIES, BACKOFF_FACTOR, DEFAULT_TIMEOUT
+    with _ADAPTER_LOCK:
+        if pool_connections is not None:
+            POOL_CONNECTIONS = pool_connections
+        if pool_maxsize is not None:
+            POOL_MAXSIZE = pool_maxsize
+        if retries is not None:
+            RETRIES = retries
+        if backoff_factor is not None:
+            BACKOFF_FACTOR = backoff_factor
+        if timeout is not None:
+            DEFAULT_TIMEOUT = timeout
+        _ADAPTER = _build_adapter()
+        _DEFAULT_SESSION = None
+
+
+class PooledSession(requests.Session):
+    """
+    挂载共享连接池的 requests 会话
+
+    会话本身只保存请求头、代理等轻量状态，可按客户端各自创建；
+    底层连接由进程级连接池统一管理，因此 close() 不会关闭共享连接。
+    """
+
+    def __init__(
+        self,
+        headers: Optional[Dict[str, str]] = None,
+        proxy: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ):
+        super().__init__()
+        adapter = _shared_adapter()
+        self.mount("https://", adapter)
+        self.mount("http://", adapter)
+        if headers:
+            self.headers.update(headers)
+        if proxy:
+            self.proxies = {"http": proxy, "https": proxy}
+        self.timeout = timeout
+
+    def request(self, method, url, **kwargs):
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = self.timeout or DEFAULT_TIMEOUT
+        return super().request(method, url, **kwargs)
+
+    def close(self) -> None:
+        # 连接池为进程共享，会话关闭时不释放底层连接
+        self.adapters.clear()
+
+
+def create_session(
+    headers: Optional[Dict[str, str]] = None,
+    proxy: Optional[str] = None,
+    timeout: Optional[float] = None,
+) -> PooledSession:
+    """
+    创建使用共享连接池的会话
+
+    Args:
+        headers: 会话默认请求头
+        proxy: 代理地址（同时用于 http/https）；为空时沿用环境变量中的代理设置
+        timeout: 会话默认超时（秒），为空时使用 DEFAULT_TIMEOUT
+
+    Returns:
+        PooledSession 实例
+    """
+    return PooledSession(headers=headers, proxy=proxy, timeout=timeout)
+
+
+def request(method: str, url: str, proxy: Optional[str] = None, **kwargs: Any) -> requests.Response:
+    """
+    通过共享连接池发送单次请求（参数同 requests.request）
+
+    Args:
+        method: HTTP 方法
+        url: 请求地址
+        proxy: 代理地址（可选）
+        **kwargs: 透传给 requests 的参数（headers、params、json、data、timeout 等）
+
+    Returns:
+        requests.Response
+    """
+    global _DEFAULT_SESSION
+    if proxy:
+        kwargs.setdefault("proxies", {"http": proxy, "https": proxy})
+    session = _DEFAULT_SESSION
+    if session is None:
+        session = _DEFAULT_SESSION = PooledSession()
+    return session.request(method, url, **kwargs)
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+子进程 JSON 输出的提取与分帧
+
+平台脚本的 stdout 常混有进度日志、警告或第三方库输出，编排器需要从中找出
+结果 JSON。提取过程是线性的：
+
+1. 结果帧：脚本通过 dump_result() 输出、由哨兵行包围的 JSON，直接定位后解析，
+   无需扫描（仅当编排器设置 UNION_SEARCH_RESULT_FRAME=1 时输出帧，
+   单独运行脚本时输出保持为普通 JSON）
+2. 整段解析：stdout 本身就是合法 JSON
+3. 候选扫描：用正则定位可能的 JSON 起点，优先行首的 `{` / `[`；每个候选先在
+   小窗口内解码，窗口不足以判定时按倍数扩大，失败的候选只消耗与其已解析
+   长度成比例的时间。已失败候选内部的起点仍会尝试：被截断的外层 `[`/`{`
+   可能包裹着完整的结果 JSON
+
+注意 json.JSONDecodeError 会从文档开头统计行号，直接对整段文本按偏移调用
+raw_decode 时每次失败都是 O(偏移量)，因此这里总是在窗口切片上解码。
+"""
+
+import json
+import os
+import re
+import sys
+from typing import Any, Iterator, Optional, TextIO, Tuple
+
+RESULT_FRAME_ENV = "UNION_SEARCH_RESULT_FRAME"
+RESULT_FRAME_BEGIN = "\x1eUNION_SEARCH_RESULT_BEGIN\x1e"
+RESULT_FRAME_END = "\x1eUNION_SEARCH_RESULT_END\x1e"
+
+# JSON 起点要求 `{`/`[` 后紧跟合法的 JSON 值起始或闭合符，排除 "[INFO]"、"{name}" 这类日志文本
+_VALUE_AHEAD = r"(?=\s*[\"\[{\]}\-0-9tfn])"
+# 行首起点优先（json.dumps 输出的顶层对象/数组总是从行首开始），其次是任意位置
+_LINE_START_RE = re.compile(r"^[\[{]" + _VALUE_AHEAD, re.MULTILINE)
+_INLINE_START_RE = re.compile(r"[\[{]" + _VALUE_AHEAD)
+
+_DECODER = json.JSONDecoder()
+
+# 候选解码的初始窗口（字符），不足以判定时每次扩大 4 倍
+_INITIAL_WINDOW = 512
+# 错误位置距窗口末尾小于该值时，可能是窗口截断了数字/字面量/转义，需要扩大窗口
+_WINDOW_MARGIN = 8
+
+
+def result_frame_enabled() -> bool:
+    return os.environ.get(RESULT_FRAME_ENV, "").strip() == "1"
+
+
+def dump_result(data: Any, indent: Optional[int] = None, stream: Optional[TextIO] = None) -> None:
+    """
+    输出平台结果 JSON
+
+    由编排器调用时（UNION_SEARCH_RESULT_FRAME=1）用哨兵行包围，
+    否则与 print(json.dumps(...)) 等价。
+
+    Args:
+        data: 结果数据
+        indent: JSON 缩进
+        stream: 输出流，默认 sys.stdout
+    """
+    stream = stream or sys.stdout
+    payload = json.dumps(data, indent=indent, ensure_ascii=False)
+    if result_frame_enabled():
+        stream.write(f"\n{RESULT_FRAME_BEGIN}\n{payload}\n{RESULT_FRAME_END}\n")
+    else:
+        stream.write(payload + "\n")
+    stream.flush()
+
+
+def _framed_payload(text: str) -> Optional[Any]:
+    begin = text.rfind(RESULT_FRAME_BEGIN)
+    if begin < 0:
+        return None
+    start = begin + len(RESULT_FRAME_BEGIN)
+    end = text.find(RESULT_FRAME_END, start)
+    if end < 0:
+        return None
+    return json.loads(text[start:end])
+
+
+def _candidates(text: str) -> Iterator[int]:
+    """先产出行首候选，再产出其余行内候选。"""
+    tried = set()
+    for pattern in (_LINE_START_RE, _INLINE_START_RE):
+        for match in pattern.finditer(text):
+            idx = match.start()
+            if idx not in tried:
+                tried.add(idx)
+                yield idx
+
+
+def _decode_at(text: str, idx: int) -> Tuple[bool, Any]:
+    """
+    从 idx 处解码一个 JSON 值
+
+    Returns:
+        (True, obj)，或 (False, None)
+    """
+    total = len(text)
+    window = _INITIAL_WINDOW
+    while True:
+        end = idx + window
+        chunk = text[idx:end]
+        try:
+            obj, _ = _DECODER.raw_decode(chunk)
+            # 候选以 `{`/`[` 开头，值在窗口内闭合即与完整解码结果一致
+            return True, obj
+        except json.JSONDecodeError as e:
+            truncated = end < total and (
+                e.pos >= len(chunk) - _WINDOW_MARGIN or e.msg.startswith("Unterminated string")
+            )
+            if not truncated:
+                return False, None
+        window *= 4
+
+
+def extract_json(text: str) -> Any:
+    """
+    从包含噪声文本的 stdout 中提取 JSON
+
+    Raises:
+        ValueError: 输出为空或未找到合法 JSON
+    """
+    if not text:
+        raise ValueError("Empty output")
+
+    try:
+        framed = _framed_payload(text)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Invalid JSON in result frame: {e}") from e
+    if framed is not None:
+        return framed
+
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError:
+        pass
+
+    for idx in _candidates(text):
+        ok, value = _decode_at(text, idx)
+        if ok:
+            return value
+
+    raise ValueError("No valid JSON found in output")
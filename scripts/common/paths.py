@@ -0,0 +1,19 @@
+#!/usr/bin/env python3
+"""
+共享目录路径
+
+结果缓存、配额账本、健康统计、历史索引、原始响应归档与守护进程状态文件都放在
+同一缓存目录下，由 UNION_SEARCH_CACHE_DIR 指定，默认 scripts/union_search/search_cache。
+只依赖标准库，CLI 的轻量命令也可直接导入。
+"""
+
+import os
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parents[1]
+DEFAULT_CACHE_DIR = SCRIPTS_DIR / "union_search" / "search_cache"
+
+
+def cache_dir() -> Path:
+    """缓存目录：UNION_SEARCH_CACHE_DIR，否则为 DEFAULT_CACHE_DIR（每次调用时读取环境变量）。"""
+    return Path(os.environ.get("UNION_SEARCH_CACHE_DIR") or DEFAULT_CACHE_DIR)
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+URL 规范化与搜索引擎跳转链接解析
+
+聚合去重、下载候选与结果缓存键都需要判断 "两个链接是否指向同一页面"。
+各搜索引擎返回的链接常被包装成跳转地址，真实目标藏在查询参数或路径中：
+
+- Yahoo:      r.search.yahoo.com/.../RU=<目标>/RK=.../RS=...
+- DuckDuckGo: duckduckgo.com/l/?uddg=<目标>&rut=...（常为 // 开头的协议相对地址）
+- Bing:       bing.com/ck/a?...&u=a1<base64url(目标)>
+- Google:     google.com/url?q=<目标> 或 ?url=<目标>
+- Baidu:      baidu.com/link?url=<目标>
+- Sogou:      sogou.com/link?url=<目标>（常为 /link?url= 开头的相对地址）
+- 360:        so.com/link?m=...&url=<目标>
+
+Baidu / Sogou 的 url 参数多数情况下是加密令牌而非真实地址，只能在明文时解开，
+令牌形式保持原样（仍可与同一引擎的相同结果匹配）。
+
+unwrap_redirect() 返回真实目标地址（保留大小写，可直接访问），canonicalize_url()
+在此基础上去除跟踪参数、片段与末尾斜杠并统一大小写，用作比较键。两者均带
+有界 LRU 缓存，同一批结果中重复出现的链接几乎没有额外开销。
+"""
+
+import base64
+import binascii
+import functools
+import re
+from typing import Callable, Optional, Tuple
+from urllib.parse import SplitResult, parse_qs, unquote, urlsplit, urlunsplit
+
+# 规范化结果缓存条数
+CACHE_SIZE = 8192
+
+# 跳转最多解析的层数（跳转目标本身也可能是另一个引擎的跳转链接）
+MAX_UNWRAP_DEPTH = 3
+
+# 需要去除的跟踪参数（utm_* 前缀另外处理）
+TRACKING_PARAMS = frozenset({
+    "gclid", "fbclid", "msclkid", "yclid", "igshid", "mc_cid", "mc_eid",
+    "spm", "spm_id_from", "share_source", "vd_source",
+})
+
+# 相对地址对应的引擎主机（Sogou 结果页里的跳转链接不带主机）
+_RELATIVE_HOSTS = {
+    "/link": "www.sogou.com",
+}
+
+_YAHOO_RU_RE = re.compile(r"/RU=([^/]+)/")
+_HTTP_URL_RE = re.compile(r"^https?://", re.IGNORECASE)
+
+
+def _query_value(parts: SplitResult, *names: str) -> Optional[str]:
+    """返回第一个存在的查询参数值（已解码）。"""
+    values = parse_qs(parts.query)
+    for name in names:
+        if values.get(name):
+            return values[name][0]
+    return None
+
+
+def _plain_target(value: Optional[str]) -> Optional[str]:
+    """参数值是明文 http(s) 地址时返回该地址，否则（加密令牌等）返回 None。"""
+    if value and _HTTP_URL_RE.match(value):
+        return value
+    return None
+
+
+def _decode_yahoo(parts: SplitResult) -> Optional[str]:
+    value = _query_value(parts, "RU")
+    if value is None:
+        match = _YAHOO_RU_RE.search(parts.path)
+        if match:
+            value = unquote(match.group(1))
+    return _plain_target(value)
+
+
+def _decode_duckduckgo(parts: SplitResult) -> Optional[str]:
+    if not parts.path.startswith("/l"):
+        return None
+    return _plain_target(_query_value(parts, "uddg"))
+
+
+def _decode_bing(parts: SplitResult) -> Optional[str]:
+    if not parts.path.startswith("/ck/"):
+        return None
+    value = _query_value(parts, "u")
+    if not value or not value.startswith("a1"):
+        return None
+    encoded = value[2:]
+    try:
+        decoded = base64.urlsafe_b64decode(encoded + "=" * (-len(encoded) % 4)).decode("utf-8")
+    except (binascii.Error, UnicodeDecodeError):
+        return None
+    return _plain_target(decoded)
+
+
+def _decode_google(parts: SplitResult) -> Optional[str]:
+    if parts.path != "/url":
+        return None
+    return _plain_target(_query_value(parts, "q", "url"))
+
+
+def _decode_link_param(parts: SplitResult) -> Optional[str]:
+    if not parts.path.startswith("/link"):
+        return None
+    return _plain_target(_query_value(parts, "url"))
+
+
+# 跳转链接解码表：(主机或主机后缀, 解码函数)；解码函数返回目标地址，无法解析时返回 None
+REDIRECT_DECODERS: Tuple[Tuple[str, Callable[[SplitResult], Optional[str]]], ...] = (
+    ("search.yahoo.com", _decode_yahoo),
+    ("duckduckgo.com", _decode_duckduckgo),
+    ("bing.com", _decode_bing),
+    ("google.com", _decode_google),
+    ("baidu.com", _decode_link_param),
+    ("sogou.com", _decode_link_param),
+    ("so.com", _decode_link_param),
+)
+
+
+def _decoder_for(host: str) -> Optional[Callable[[SplitResult], Optional[str]]]:
+    for suffix, decoder in REDIRECT_DECODERS:
+        if host == suffix or host.endswith("." + suffix):
+            return decoder
+    return None
+
+
+def _absolute(link: str) -> str:
+    """补全协议相对地址与已知引擎的相对跳转地址。"""
+    if link.startswith("//"):
+        return "https:" + link
+    if link.startswith("/"):
+        for prefix, host in _RELATIVE_HOSTS.items():
+            if link.startswith(prefix):
+                return f"https://{host}{link}"
+    return link
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def unwrap_redirect(url: str) -> str:
+    """解析搜索引擎跳转链接，返回真实目标地址；不是跳转链接时原样返回。"""
+    link = _absolute(url.strip())
+    for _ in range(MAX_UNWRAP_DEPTH):
+        parts = urlsplit(link)
+        decoder = _decoder_for(parts.hostname or "")
+        target = decoder(parts) if decoder is not None else None
+        if not target:
+            break
+        link = target.strip()
+    return link
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def canonicalize_url(url: str) -> str:
+    """
+    返回用于比较的规范链接
+
+    解析跳转后统一协议与主机大小写，去除跟踪参数、片段与路径末尾斜杠；
+    不是绝对地址时返回小写原文。
+    """
+    if not url:
+        return ""
+    link = unwrap_redirect(url)
+    if not link:
+        return ""
+
+    parts = urlsplit(link)
+    if not parts.scheme or not parts.netloc:
+        return link.casefold()
+
+    kept_pairs = []
+    for pair in parts.query.split("&"):
+        if not pair:
+            continue
+        key = pair.split("=", 1)[0].casefold()
+        if key in TRACKING_PARAMS or key.startswith("utm_"):
+            continue
+        kept_pairs.append(pair)
+
+    return urlunsplit((
+        parts.scheme.casefold(),
+        parts.netloc.casefold(),
+        parts.path.rstrip("/"),
+        "&".join(kept_pairs),
+        "",
+    ))
+
+
+def is_url(value: str) -> bool:
+    """是否为 http(s) 绝对地址。"""
+    return bool(value) and bool(_HTTP_URL_RE.match(value.strip()))
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+User-Agent 池
+
+数据保存在 data/user_agents.txt（每行一个，按 [浏览器 平台 年代] 分节），首次
+取用时才打开：普通文本通过 mmap 只读映射，不把全部字符串载入内存；只有
+user_agents.txt.gz 时解压到内存。分节的行偏移在首次用到该节时才建立。
+
+取样按浏览器市场份额与平台份额加权（BROWSER_SHARE / PLATFORM_SHARE）：先按
+权重选定一个分节，再在节内均匀选一行，因此某个浏览器收录条目多并不会提高它
+被选中的概率。
+
+    random_user_agent()                                  # 全部条目
+    random_user_agent(platform="mobile")                 # 仅移动端
+    random_user_agent(browsers=("chrome", "firefox"))    # 指定浏览器
+    engine_user_agent()                                  # 无 API Key 引擎使用的近期桌面版本
+"""
+
+import mmap
+import random
+import threading
+from array import array
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+DATA_DIR = Path(__file__).resolve().parent / "data"
+DATA_FILES = (DATA_DIR / "user_agents.txt", DATA_DIR / "user_agents.txt.gz")
+
+# 浏览器份额（近似全球占比，仅用于相对权重）
+BROWSER_SHARE: Dict[str, float] = {
+    "chrome": 0.65,
+    "safari": 0.18,
+    "edge": 0.05,
+    "firefox": 0.03,
+    "opera": 0.02,
+    "other": 0.07,
+}
+PLATFORM_SHARE: Dict[str, float] = {
+    "desktop": 0.45,
+    "mobile": 0.55,
+}
+PLATFORMS = tuple(PLATFORM_SHARE)
+ERAS = ("current", "legacy")
+
+# 无 API Key 引擎的结果解析依赖桌面版页面结构，只使用近期桌面浏览器
+ENGINE_BROWSERS = ("chrome", "edge", "firefox")
+
+# 数据文件缺失或没有符合条件的条目时使用
+DEFAULT_USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+)
+
+SectionKey = Tuple[str, str, str]  # (浏览器, 平台, 年代)
+Buffer = Union[mmap.mmap, bytes]
+
+
+def _next_header(buffer: Buffer, pos: int) -> int:
+    """返回 pos 之后下一个分节标题行（以 [ 开头）的起始位置，没有时返回 -1。"""
+    found = buffer.find(b"\n[", pos)
+    return -1 if found == -1 else found + 1
+
+
+class UserAgentStore:
+    """按分节索引的只读 User-Agent 数据，首次取样时加载。"""
+
+    def __init__(self, paths: Iterable[Path] = DATA_FILES):
+        self.paths = tuple(paths)
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._buffer: Buffer = b""
+        self._sections: Dict[SectionKey, Tuple[int, int]] = {}
+        self._offsets: Dict[SectionKey, array] = {}
+
+    def _open(self) -> Buffer:
+        for path in self.paths:
+            try:
+                if path.suffix == ".gz":
+                    import gzip
+
+                    return gzip.decompress(path.read_bytes())
+                with open(path, "rb") as f:
+                    return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                # 文件不存在、为空（无法映射）或压缩数据损坏时尝试下一个
+                continue
+        return b""
+
+    def _load(self) -> None:
+        with self._lock:
+            if self._loaded:
+                return
+            buffer = self._open()
+            sections: Dict[SectionKey, Tuple[int, int]] = {}
+            pos = 0 if buffer[:1] == b"[" else _next_header(buffer, 0)
+            while pos != -1:
+                header_end = buffer.find(b"\n", pos)
+                if header_end == -1:
+                    header_end = len(buffer)
+                next_pos = _next_header(buffer, header_end)
+                parts = buffer[pos + 1:header_end].decode("utf-8").strip().rstrip("]").split()
+                if len(parts) == 3:
+                    sections[tuple(parts)] = (header_end + 1, len(buffer) if next_pos == -1 else next_pos)
+                pos = next_pos
+            self._buffer = buffer
+            self._sections = sections
+            self._loaded = True
+
+    def _section_offsets(self, key: SectionKey) -> array:
+        offsets = self._offsets.get(key)
+        if offsets is not None:
+            return offsets
+        start, end = self._sections[key]
+        buffer = self._buffer
+        offsets = array("I")
+        pos = start
+        while pos < end:
+            line_end = buffer.find(b"\n", pos, end)
+            if line_end == -1:
+                line_end = end
+            if line_end > pos and buffer[pos:pos + 1] != b"#":
+                offsets.append(pos)
+            pos = line_end + 1
+        self._offsets[key] = offsets
+        return offsets
+
+    def sections(
+        self,
+        platform: Optional[str] = None,
+        browsers: Optional[Iterable[str]] = None,
+        era: Optional[str] = None,
+    ) -> List[SectionKey]:
+        """返回符合条件的分节。"""
+        if not self._loaded:
+            self._load()
+        wanted = set(browsers) if browsers else None
+        return [
+            key for key in self._sections
+            if (wanted is None or key[0] in wanted)
+            and (platform is None or key[1] == platform)
+            and (era is None or key[2] == era)
+        ]
+
+    def count(self, **filters) -> int:
+        """符合条件的条目数。"""
+        return sum(len(self._section_offsets(key)) for key in self.sections(**filters))
+
+    def sample(
+        self,
+        platform: Optional[str] = None,
+        browsers: Optional[Iterable[str]] = None,
+        era: Optional[str] = None,
+        rng: Optional[random.Random] = None,
+    ) -> Optional[str]:
+        """按份额加权随机取一条；没有符合条件的条目时返回 None。"""
+        rng = rng or random
+        keys = []
+        weights = []
+        for key in self.sections(platform=platform, browsers=browsers, era=era):
+            if not self._section_offsets(key):
+                continue
+            keys.append(key)
+            weights.append(BROWSER_SHARE.get(key[0], BROWSER_SHARE["other"]) * PLATFORM_SHARE.get(key[1], 1.0))
+        if not keys:
+            return None
+        offsets = self._section_offsets(rng.choices(keys, weights)[0])
+        start = offsets[rng.randrange(len(offsets))]
+        end = self._buffer.find(b"\n", start)
+        if end == -1:
+            end = len(self._buffer)
+        return self._buffer[start:end].decode("utf-8").strip()
+
+
+_STORE: Optional[UserAgentStore] = None
+
+
+def get_user_agent_store() -> UserAgentStore:
+    """获取进程级 User-Agent 池（数据在首次取样时加载）。"""
+    global _STORE
+    if _STORE is None:
+        _STORE = UserAgentStore()
+    return _STORE
+
+
+def random_user_agent(
+    platform: Optional[str] = None,
+    browsers: Optional[Iterable[str]] = None,
+    era: Optional[str] = None,
+) -> str:
+    """
+    按浏览器份额加权随机返回一个 User-Agent
+
+    Args:
+        platform: desktop / mobile，为空时不限
+        browsers: 浏览器列表（chrome/edge/firefox/safari/opera/other），为空时不限
+        era: current（近期版本）/ legacy（旧版本），为空时不限
+
+    Returns:
+        User-Agent 字符串；没有符合条件的条目时返回 DEFAULT_USER_AGENT
+    """
+    return get_user_agent_store().sample(platform=platform, browsers=browsers, era=era) or DEFAULT_USER_AGENT
+
+
+def engine_user_agent() -> str:
+    """无 API Key 搜索引擎使用的 User-Agent：近期版本的桌面 Chrome / Edge / Firefox。"""
+    return random_user_agent(platform="desktop", browsers=ENGINE_BROWSERS, era="current")
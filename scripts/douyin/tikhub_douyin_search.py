@@ -1,11 +1,16 @@
 #!/usr/bin/env python3
 import argparse
-import http.client
 import json
 import os
 import re
 import sys
 from datetime import datetime
+from pathlib import Path
+
+# 共享 HTTP 客户端位于 scripts/common
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from common import http_client
+from common.json_extract import dump_result
 
 DEFAULT_HOST = "api.tikhub.io"
 DEFAULT_PATH = "/api/v1/douyin/search/fetch_general_search_v3"
@@ -13,25 +18,22 @@ DEFAULT_SAVE_SUFFIX = "douyin_search_v3"
 
 
 def fetch_general_search_v3(token, payload, host=DEFAULT_HOST, path=DEFAULT_PATH, timeout=30):
-    conn = http.client.HTTPSConnection(host, timeout=timeout)
     headers = {
         "Authorization": f"Bearer {token}",
         "Content-Type": "application/json",
         "Accept": "application/json",
     }
     body = json.dumps(payload).encode("utf-8")
-    conn.request("POST", path, body=body, headers=headers)
-    res = conn.getresponse()
-    raw = res.read()
-    conn.close()
+    res = http_client.request("POST", f"https://{host}{path}", data=body, headers=headers, timeout=timeout)
+    raw = res.content
 
     text = raw.decode("utf-8", errors="replace")
     try:
         data = json.loads(text)
     except json.JSONDecodeError:
-        return {"_http_status": res.status, "_http_reason": res.reason, "_raw": text}
+        return {"_http_status": res.status_code, "_http_reason": res.reason, "_raw": text}
 
-    data["_http_status"] = res.status
+    data["_http_status"] = res.status_code
     return data
 
 
@@ -296,10 +298,7 @@ def main():
         "items": filtered_items,
     }
 
-    if args.pretty:
-        print(json.dumps(output, indent=2, ensure_ascii=False))
-    else:
-        print(json.dumps(output, ensure_ascii=False))
+    dump_result(output, indent=2 if args.pretty else None)
     return 0
 
 
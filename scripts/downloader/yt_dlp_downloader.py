@@ -9,6 +9,8 @@ import subprocess
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
+from common.url_canon import canonicalize_url, unwrap_redirect
+
 
 _URL_KEYS: Tuple[str, ...] = ("url", "href", "link", "permalink", "source_url", "arcurl")
 _YOUTUBE_HOST_MARKERS: Tuple[str, ...] = ("youtube.com", "youtu.be")
@@ -35,7 +37,8 @@ def _extract_url_from_item(item: Dict[str, Any], platform: str) -> str:
     for key in _URL_KEYS:
         value = item.get(key)
         if value:
-            return str(value).strip()
+            # Search engines wrap results in redirect links; yt-dlp needs the target.
+            return unwrap_redirect(str(value))
 
     # Platform-specific fallback URL construction.
     if platform == "youtube":
@@ -150,10 +153,11 @@ def _normalize_download_candidates(
             continue
 
         url = str(item.get("url") or "").strip()
-        if not url or url in seen_urls:
+        url_key = canonicalize_url(url)
+        if not url or url_key in seen_urls:
             continue
 
-        seen_urls.add(url)
+        seen_urls.add(url_key)
         normalized.append(
             {
                 "index": len(normalized) + 1,
@@ -188,9 +192,10 @@ def build_download_candidates(
         if allowed and platform not in allowed:
             continue
         url = _extract_url_from_item(item, platform)
-        if not url or url in seen_urls:
+        url_key = canonicalize_url(url)
+        if not url or url_key in seen_urls:
             continue
-        seen_urls.add(url)
+        seen_urls.add(url_key)
         generated.append(
             {
                 "index": len(generated) + 1,
@@ -14,6 +14,10 @@ from typing import Dict, Any, List
 import requests
 from urllib.parse import quote
 
+# 共享 HTTP 客户端位于 scripts/common
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from common.http_client import create_session
+
 
 class DuckDuckGoInstantSearch:
     """DuckDuckGo Instant Answer 搜索 (无需 API Key)"""
@@ -25,14 +29,12 @@ class DuckDuckGoInstantSearch:
 
     def __init__(self, proxy=None):
         self.proxy = proxy
-        self.session = requests.Session()
+        self.session = create_session(proxy=self.proxy)
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'application/json,text/javascript,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.9',
         })
-        if self.proxy:
-            self.session.proxies = {'http': self.proxy, 'https': self.proxy}
 
     def build_search_url(self, query: str, **kwargs) -> str:
         """构建搜索 URL"""
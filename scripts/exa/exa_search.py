@@ -17,6 +17,10 @@ from typing import Dict, Any, List, Optional
 import requests
 from dotenv import load_dotenv
 
+# 共享 HTTP 客户端位于 scripts/common
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from common.http_client import create_session
+
 # 加载环境变量
 script_dir = Path(__file__).parent.parent.parent
 load_dotenv(script_dir / '.env')
@@ -41,7 +45,7 @@ class ExaSearchClient:
         if not self.api_key:
             raise ValueError("Exa API Key 未配置，请设置 EXA_API_KEY 环境变量")
 
-        self.session = requests.Session()
+        self.session = create_session()
         self.session.headers.update({
             'x-api-key': self.api_key,
             'Content-Type': 'application/json',
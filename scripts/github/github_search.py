@@ -14,6 +14,11 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional
 import requests
 
+# 共享 HTTP 客户端位于 scripts/common
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from common.archive import archive_record
+from common.http_client import create_session
+
 
 # =============================================================================
 # Exceptions
@@ -57,7 +62,7 @@ class GitHubSearchClient:
             token: GitHub Personal Access Token (optional but recommended)
         """
         self.token = token
-        self.session = requests.Session()
+        self.session = create_session()
 
         headers = {
             "Accept": "application/vnd.github+json",
@@ -439,17 +444,9 @@ def format_rate_limit(rate_limit_data: Dict[str, Any]) -> str:
 # Response Archiving
 # =============================================================================
 
-def save_raw_response(data: Dict[str, Any], response_type: str, responses_dir: Path) -> str:
-    """Save raw API response to file"""
-    responses_dir.mkdir(parents=True, exist_ok=True)
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    filename = f"{timestamp}_{response_type}.json"
-    filepath = responses_dir / filename
-
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
-
-    return str(filepath)
+def save_raw_response(data: Dict[str, Any], response_type: str, responses_dir: Optional[Path] = None) -> str:
+    """Archive raw API response (async, rotated JSONL segments); returns the segment directory"""
+    return archive_record("github_raw", {"type": response_type, "response": data}, directory=responses_dir)
 
 
 # =============================================================================
@@ -637,11 +634,9 @@ def _execute_search_command(client: GitHubSearchClient, args) -> tuple[Dict[str,
 
 
 def _save_response(results: Dict[str, Any], command: str):
-    """Save raw API response to file"""
-    script_dir = Path(__file__).parent.parent
-    responses_dir = script_dir / 'responses'
-    filepath = save_raw_response(results, f'github_{command}', responses_dir)
-    print(f"[原始响应已保存到: {filepath}]\n", file=sys.stderr)
+    """Archive raw API response"""
+    filepath = save_raw_response(results, f'github_{command}')
+    print(f"[原始响应已归档到: {filepath}]\n", file=sys.stderr)
 
 
 def _format_output(results: Dict[str, Any], resource_type: str, format_type: str) -> str:
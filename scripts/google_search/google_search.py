@@ -9,9 +9,13 @@ import os
 import sys
 import json
 import argparse
-import requests
 from typing import Optional, Dict, Any, List
 from dotenv import load_dotenv
+from pathlib import Path
+
+# 共享 HTTP 客户端位于 scripts/common
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from common import http_client
 
 # 加载环境变量 - 从 union-search-skill 根目录
 script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -78,7 +82,7 @@ class GoogleCustomSearch:
         if img_size and search_type == "image":
             params["imgSize"] = img_size
 
-        response = requests.get(self.BASE_URL, params=params, timeout=10)
+        response = http_client.request("GET", self.BASE_URL, params=params, timeout=10)
         response.raise_for_status()
         return response.json()
 
@@ -9,13 +9,16 @@ import os
 import sys
 import json
 import argparse
-from datetime import datetime
 from pathlib import Path
 from typing import Optional, Dict, Any, List
 
-import requests
 from dotenv import load_dotenv
 
+# 共享 HTTP 客户端位于 scripts/common
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from common import http_client
+from common.archive import archive_record
+
 # 加载环境变量
 script_dir = os.path.dirname(os.path.abspath(__file__))
 skill_root = os.path.dirname(os.path.dirname(script_dir))
@@ -39,7 +42,7 @@ class JinaSearch:
         }
         params = {"q": query}
 
-        response = requests.get(self.base_url, headers=headers, params=params, timeout=30)
+        response = http_client.request("GET", self.base_url, headers=headers, params=params, timeout=30)
         response.raise_for_status()
         data = response.json()
 
@@ -60,16 +63,7 @@ class JinaSearch:
         return results
 
     def save_response(self, query: str, output_data: Dict[str, Any]) -> str:
-        responses_dir = Path(__file__).parent / "responses"
-        responses_dir.mkdir(parents=True, exist_ok=True)
-
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        safe_query = "".join(c if c.isalnum() else "_" for c in query)[:50]
-        filename = responses_dir / f"{timestamp}_{safe_query}.json"
-
-        with open(filename, "w", encoding="utf-8") as f:
-            json.dump(output_data, f, ensure_ascii=False, indent=2)
-        return str(filename)
+        return archive_record("jina_responses", {"query": query, **output_data})
 
     def format_results(self, results: List[Dict[str, Any]], query: str) -> str:
         output = []
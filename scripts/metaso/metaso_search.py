@@ -10,7 +10,6 @@
     METASO_API_KEY: 秘塔搜索 API 密钥 (必需)
 """
 
-import http.client
 import json
 import os
 import sys
@@ -18,6 +17,13 @@ import argparse
 from typing import Optional, Dict, Any, List
 from dataclasses import dataclass
 from datetime import datetime
+from pathlib import Path
+
+import requests
+
+# 共享 HTTP 客户端位于 scripts/common
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from common import http_client
 
 
 @dataclass
@@ -109,29 +115,30 @@ class MetasoClient:
         last_exception = None
         
         for attempt in range(max_retries):
-            conn = http.client.HTTPSConnection(self.API_HOST)
             try:
-                conn.request("POST", self.API_ENDPOINT, json.dumps(payload), headers)
-                response = conn.getresponse()
-                raw_data = response.read().decode("utf-8")
+                response = http_client.request(
+                    "POST",
+                    f"https://{self.API_HOST}{self.API_ENDPOINT}",
+                    data=json.dumps(payload),
+                    headers=headers
+                )
+                raw_data = response.content.decode("utf-8")
                 
-                if response.status == 200:
+                if response.status_code == 200:
                     data = json.loads(raw_data)
                     return self._parse_response(data)
                 
                 # If 429 (Too Many Requests) or 5xx, retry
-                if response.status == 429 or response.status >= 500:
-                    last_exception = Exception(f"API 请求重试 {attempt+1}/{max_retries}: {response.status}")
+                if response.status_code == 429 or response.status_code >= 500:
+                    last_exception = Exception(f"API 请求重试 {attempt+1}/{max_retries}: {response.status_code}")
                     time.sleep(2 ** attempt) # Exponential backoff
                     continue
                 
                 data = json.loads(raw_data)
-                raise Exception(f"API 请求失败: {response.status} - {data}")
-            except (http.client.HTTPException, ConnectionError) as e:
+                raise Exception(f"API 请求失败: {response.status_code} - {data}")
+            except (requests.RequestException, ConnectionError) as e:
                 last_exception = e
                 time.sleep(2 ** attempt)
-            finally:
-                conn.close()
         
         raise last_exception or Exception("Max retries exceeded")
 
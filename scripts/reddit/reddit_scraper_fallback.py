@@ -7,6 +7,7 @@ import argparse
 import json
 import sys
 from datetime import datetime
+from pathlib import Path
 import time
 
 try:
@@ -16,12 +17,16 @@ except ImportError:
     print("Install with: apt-get install python3-requests")
     sys.exit(1)
 
+# 共享 HTTP 客户端位于 scripts/common
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from common.http_client import create_session
+
 
 class RedditScraper:
     BASE_URL = "https://www.reddit.com"
 
     def __init__(self):
-        self.session = requests.Session()
+        self.session = create_session()
         self.session.headers.update({
             'User-Agent': 'Clawdbot/1.0 (Reddit Reader; +https://github.com/clawdbot)'
         })
@@ -16,6 +16,10 @@ from typing import Dict, Any, List, Optional
 import requests
 from dotenv import load_dotenv
 
+# 共享 HTTP 客户端位于 scripts/common
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from common.http_client import create_session
+
 # 加载环境变量
 script_dir = Path(__file__).parent.parent.parent
 load_dotenv(script_dir / '.env')
@@ -40,7 +44,7 @@ class SerperSearchClient:
         if not self.api_key:
             raise ValueError("Serper API Key 未配置，请设置 SERPER_API_KEY 环境变量")
 
-        self.session = requests.Session()
+        self.session = create_session()
         self.session.headers.update({
             'X-API-KEY': self.api_key,
             'Content-Type': 'application/json',
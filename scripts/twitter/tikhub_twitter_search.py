@@ -1,6 +1,5 @@
 #!/usr/bin/env python3
 import argparse
-import http.client
 import json
 import os
 import sys
@@ -8,6 +7,11 @@ from datetime import datetime
 from pathlib import Path
 from urllib.parse import urlencode
 
+# 共享 HTTP 客户端位于 scripts/common
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from common import http_client
+from common.json_extract import dump_result
+
 DEFAULT_HOST = "api.tikhub.io"
 DEFAULT_PATH = "/api/v1/twitter/web/fetch_search_timeline"
 
@@ -94,23 +98,20 @@ def apply_env_defaults(args):
 def fetch_search_timeline(token, params, host=DEFAULT_HOST, path=DEFAULT_PATH, timeout=30):
     query = urlencode(params, doseq=True)
     full_path = f"{path}?{query}" if query else path
-    conn = http.client.HTTPSConnection(host, timeout=timeout)
     headers = {
         "Authorization": f"Bearer {token}",
         "Accept": "application/json",
     }
-    conn.request("GET", full_path, headers=headers)
-    res = conn.getresponse()
-    raw = res.read()
-    conn.close()
+    res = http_client.request("GET", f"https://{host}{full_path}", headers=headers, timeout=timeout)
+    raw = res.content
 
     text = raw.decode("utf-8", errors="replace")
     try:
         data = json.loads(text)
     except json.JSONDecodeError:
-        return {"_http_status": res.status, "_http_reason": res.reason, "_raw": text}
+        return {"_http_status": res.status_code, "_http_reason": res.reason, "_raw": text}
 
-    data["_http_status"] = res.status
+    data["_http_status"] = res.status_code
     return data
 
 
@@ -275,10 +276,7 @@ def main():
     # 保存响应文件
     save_responses(result, args)
 
-    if args.pretty:
-        print(json.dumps(result, indent=2, ensure_ascii=False))
-    else:
-        print(json.dumps(result, ensure_ascii=False))
+    dump_result(result, indent=2 if args.pretty else None)
     return 0
 
 
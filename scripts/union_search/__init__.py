@@ -8,23 +8,26 @@ Status: Production Ready
 License: MIT
 """
 
-from .union_search import (
-    PLATFORM_MODULES,
-    PLATFORM_GROUPS,
-    search_platform,
-    union_search,
-    format_markdown,
-    format_json,
-    list_platforms,
-    __version__,
-    __author__,
-)
+import importlib
+
+# 编排模块导入较重（日志配置、可选的 URL 转 Markdown 等），按需加载，
+# 使 platform_stats、result_cache 等子模块可单独导入而不触发编排模块
+def __getattr__(name):
+    if name in __all__:
+        _module = importlib.import_module(f"{__name__}.union_search")
+        # 与同名函数一致：包属性 union_search 指向函数而非子模块
+        globals().update({key: getattr(_module, key) for key in __all__})
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "PLATFORM_MODULES",
     "PLATFORM_GROUPS",
     "search_platform",
     "union_search",
+    "union_search_async",
+    "union_search_batch",
     "format_markdown",
     "format_json",
     "list_platforms",
@@ -0,0 +1,417 @@
+"""
+搜索历史全文索引
+
+union_search 每次生成 final_items 时把条目增量写入本地 SQLite FTS5 索引
+（标题、摘要、规范链接、来源平台、检索关键词与首次/最近出现时间），同一
+规范链接只保留一条并累计出现次数。重复调研的主题可以直接从本地数据检索
+（history 子命令或 local_index 伪平台），无需任何网络请求。
+
+FTS5 的 unicode61 分词器把连续的中日韩文字当作一个词，无法按词检索；写入
+与查询时都先把 CJK 连续文字切分为重叠的二元组（"机器学习" -> "机器 器学 学习"），
+查询中的 CJK 片段按短语匹配相邻二元组，因此任意两个字以上的片段都能命中。
+
+写入不在请求路径上：record_final_items 只把条目放入有界队列即返回，由后台
+线程打开索引并提交（与 common.archive 的归档器相同）；队列写满时丢弃该次
+写入并计数，进程退出时写完队列。
+
+环境变量:
+    UNION_SEARCH_HISTORY             设为 0 关闭历史索引写入
+    UNION_SEARCH_HISTORY_QUEUE_SIZE  待写入批次队列长度（默认 256）
+"""
+
+import atexit
+import logging
+import os
+import queue
+import re
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from common.paths import cache_dir
+from common.url_canon import canonicalize_url
+
+from .near_dedup import item_text
+
+logger = logging.getLogger(__name__)
+
+
+def _env_number(name: str, default, cast):
+    try:
+        return cast(os.environ.get(name, default))
+    except (TypeError, ValueError):
+        return default
+
+LOCAL_INDEX_PLATFORM = "local_index"
+DEFAULT_LIMIT = 10
+# 单条摘要写入索引的最大长度，避免长正文撑大索引
+MAX_BODY_CHARS = 2000
+QUEUE_SIZE: int = _env_number("UNION_SEARCH_HISTORY_QUEUE_SIZE", 256, int)
+# 进程退出时等待队列写完的最长时间（秒）
+_CLOSE_TIMEOUT = 10.0
+
+_CJK_RUN_RE = re.compile(r"[\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff\uac00-\ud7af]+")
+_QUERY_TOKEN_RE = re.compile(r"[\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff\uac00-\ud7af]+|\w+")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# bm25 列权重：标题 > 关键词 > 摘要 > 链接
+_BM25_WEIGHTS = (10.0, 2.0, 4.0, 1.0)
+
+
+def _bigrams(run: str) -> List[str]:
+    if len(run) < 2:
+        return [run]
+    return [run[i:i + 2] for i in range(len(run) - 1)]
+
+
+def segment(text: str) -> str:
+    """把文本中的 CJK 连续文字切分为空格分隔的二元组，其余文本保持不变。"""
+    if not text:
+        return ""
+    return _CJK_RUN_RE.sub(lambda m: " " + " ".join(_bigrams(m.group())) + " ", text)
+
+
+def build_match_query(query: str) -> str:
+    """把用户查询转换为 FTS5 MATCH 表达式：各词取交集，CJK 片段按二元组短语匹配。
+
+    每个词都加引号，用户输入中的 FTS5 语法字符不会引发语法错误。
+    """
+    terms = []
+    for token in _QUERY_TOKEN_RE.findall(query or ""):
+        if _CJK_RUN_RE.fullmatch(token):
+            terms.append('"' + " ".join(_bigrams(token)) + '"')
+        else:
+            terms.append(f'"{token}"')
+    return " AND ".join(terms)
+
+
+def _item_link(item: Dict[str, Any]) -> str:
+    for key in ("href", "url", "link", "permalink", "source_url"):
+        value = item.get(key)
+        if value:
+            return str(value).strip()
+    return ""
+
+
+class HistoryIndex:
+    """SQLite FTS5 历史条目索引，线程安全。"""
+
+    def __init__(self, path: Optional[Path] = None):
+        if path is None:
+            path = cache_dir() / "history.sqlite3"
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), timeout=10, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS items (
+                id INTEGER PRIMARY KEY,
+                key TEXT NOT NULL UNIQUE,
+                url TEXT NOT NULL,
+                title TEXT NOT NULL,
+                body TEXT NOT NULL,
+                platform TEXT NOT NULL,
+                keyword TEXT NOT NULL,
+                first_seen REAL NOT NULL,
+                last_seen REAL NOT NULL,
+                seen_count INTEGER NOT NULL DEFAULT 1
+            );
+            CREATE INDEX IF NOT EXISTS idx_items_last_seen ON items(last_seen);
+            CREATE VIRTUAL TABLE IF NOT EXISTS items_fts USING fts5(
+                title, keyword, body, url,
+                tokenize = 'unicode61 remove_diacritics 2'
+            );
+            """
+        )
+        self._conn.commit()
+
+    def add_items(self, items: Iterable[Dict[str, Any]], keyword: str = "", platform: Optional[str] = None) -> int:
+        """
+        写入或更新条目（按规范链接合并，无链接时按平台 + 标题），返回处理的条目数
+
+        Raises:
+            sqlite3.Error: 写入失败（已回滚）
+        """
+        now = time.time()
+        rows = []
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            source = item.get("_source_platform") or platform or ""
+            if source == LOCAL_INDEX_PLATFORM:
+                continue
+            title, body = item_text(item)
+            link = _item_link(item)
+            if not title and not link:
+                continue
+            url = canonicalize_url(link) if link else ""
+            key = url or f"{source}:{_WHITESPACE_RE.sub(' ', title).casefold()}"
+            rows.append((key, url or link, title, body[:MAX_BODY_CHARS], source, keyword))
+        if not rows:
+            return 0
+
+        with self._lock:
+            try:
+                for key, url, title, body, source, kw in rows:
+                    existing = self._conn.execute("SELECT id FROM items WHERE key = ?", (key,)).fetchone()
+                    if existing is None:
+                        rowid = self._conn.execute(
+                            "INSERT INTO items (key, url, title, body, platform, keyword, first_seen, last_seen) "
+                            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                            (key, url, title, body, source, kw, now, now),
+                        ).lastrowid
+                    else:
+                        rowid = existing[0]
+                        # 保留较完整的标题/摘要，记录最近一次命中的平台与关键词
+                        self._conn.execute(
+                            "UPDATE items SET title = CASE WHEN ? != '' THEN ? ELSE title END, "
+                            "body = CASE WHEN length(?) > length(body) THEN ? ELSE body END, "
+                            "platform = ?, keyword = ?, last_seen = ?, seen_count = seen_count + 1 WHERE id = ?",
+                            (title, title, body, body, source, kw, now, rowid),
+                        )
+                        self._conn.execute("DELETE FROM items_fts WHERE rowid = ?", (rowid,))
+                        title, body, url, kw = self._conn.execute(
+                            "SELECT title, body, url, keyword FROM items WHERE id = ?", (rowid,)
+                        ).fetchone()
+                    self._conn.execute(
+                        "INSERT INTO items_fts (rowid, title, keyword, body, url) VALUES (?, ?, ?, ?, ?)",
+                        (rowid, segment(title), segment(kw), segment(body), url),
+                    )
+                self._conn.commit()
+            except sqlite3.Error:
+                self._conn.rollback()
+                raise
+        return len(rows)
+
+    def search(
+        self,
+        query: str,
+        limit: int = DEFAULT_LIMIT,
+        platforms: Optional[Sequence[str]] = None,
+        since: Optional[float] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        全文检索历史条目
+
+        Args:
+            query: 检索词（空格分隔的词取交集，中文按片段匹配）
+            limit: 返回条数
+            platforms: 只返回来自这些平台的条目
+            since: 只返回最近出现时间不早于该时间戳（秒）的条目
+
+        Returns:
+            按相关度（bm25）排序的条目，相关度相同时较新的在前
+        """
+        match = build_match_query(query)
+        if not match:
+            return []
+        sql = (
+            "SELECT items.id, items.url, items.title, items.body, items.platform, items.keyword, "
+            "items.first_seen, items.last_seen, items.seen_count, bm25(items_fts, ?, ?, ?, ?) AS score "
+            "FROM items_fts JOIN items ON items.id = items_fts.rowid WHERE items_fts MATCH ?"
+        )
+        params: List[Any] = [*_BM25_WEIGHTS, match]
+        if platforms:
+            sql += f" AND items.platform IN ({', '.join('?' * len(platforms))})"
+            params.extend(platforms)
+        if since is not None:
+            sql += " AND items.last_seen >= ?"
+            params.append(since)
+        sql += " ORDER BY score, items.last_seen DESC LIMIT ?"
+        params.append(max(1, limit))
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [
+            {
+                "title": title,
+                "href": url,
+                "body": body,
+                "platform": platform,
+                "keyword": keyword,
+                "first_seen": datetime.fromtimestamp(first_seen).isoformat(),
+                "last_seen": datetime.fromtimestamp(last_seen).isoformat(),
+                "seen_count": seen_count,
+                "score": round(-score, 4),
+            }
+            for _, url, title, body, platform, keyword, first_seen, last_seen, seen_count, score in rows
+        ]
+
+    def stats(self) -> Dict[str, Any]:
+        """条目总数、按平台计数、时间范围与索引文件大小。"""
+        with self._lock:
+            total, oldest, newest = self._conn.execute(
+                "SELECT COUNT(*), MIN(first_seen), MAX(last_seen) FROM items"
+            ).fetchone()
+            by_platform = dict(self._conn.execute(
+                "SELECT platform, COUNT(*) FROM items GROUP BY platform ORDER BY COUNT(*) DESC"
+            ).fetchall())
+        size = sum(p.stat().st_size for p in self.path.parent.glob(self.path.name + "*") if p.is_file())
+        return {
+            "path": str(self.path),
+            "items": total,
+            "platforms": by_platform,
+            "oldest": datetime.fromtimestamp(oldest).isoformat() if oldest else None,
+            "newest": datetime.fromtimestamp(newest).isoformat() if newest else None,
+            "size_bytes": size,
+        }
+
+    def prune(self, before: float) -> int:
+        """删除最近出现时间早于 before 的条目，返回删除条数。"""
+        with self._lock:
+            ids = [row[0] for row in self._conn.execute("SELECT id FROM items WHERE last_seen < ?", (before,))]
+            self._conn.executemany("DELETE FROM items_fts WHERE rowid = ?", [(i,) for i in ids])
+            self._conn.executemany("DELETE FROM items WHERE id = ?", [(i,) for i in ids])
+            self._conn.commit()
+        return len(ids)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM items_fts")
+            self._conn.execute("DELETE FROM items")
+            self._conn.commit()
+
+
+_DEFAULT_INDEX: Optional[HistoryIndex] = None
+_DEFAULT_INDEX_LOCK = threading.Lock()
+
+
+def history_enabled() -> bool:
+    """是否写入历史索引（可通过 UNION_SEARCH_HISTORY=0 关闭）。"""
+    return os.environ.get("UNION_SEARCH_HISTORY", "1").strip().lower() not in ("0", "false", "no", "off")
+
+
+def get_history_index() -> Optional[HistoryIndex]:
+    """返回进程级共享索引实例；无法打开（如 SQLite 未编译 FTS5）时返回 None。"""
+    global _DEFAULT_INDEX
+    if _DEFAULT_INDEX is None:
+        with _DEFAULT_INDEX_LOCK:
+            if _DEFAULT_INDEX is None:
+                try:
+                    _DEFAULT_INDEX = HistoryIndex()
+                except (OSError, sqlite3.Error):
+                    return None
+    return _DEFAULT_INDEX
+
+
+class HistoryWriter:
+    """后台线程写入历史索引：调用方只把条目放入有界队列，写满时丢弃并计数。"""
+
+    def __init__(self, queue_size: int = QUEUE_SIZE):
+        self._queue: "queue.Queue[Optional[Tuple[str, List[Dict[str, Any]]]]]" = queue.Queue(maxsize=max(1, queue_size))
+        self._lock = threading.Lock()
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+        self.stats = {"written": 0, "dropped": 0, "failed": 0}
+
+    def submit(self, keyword: str, items: List[Dict[str, Any]]) -> bool:
+        """放入一批条目，不等待；队列已满时丢弃并返回 False。"""
+        if self._closed:
+            return False
+        self._ensure_thread()
+        try:
+            self._queue.put_nowait((keyword, items))
+        except queue.Full:
+            with self._lock:
+                self.stats["dropped"] += 1
+                dropped = self.stats["dropped"]
+            if dropped == 1 or dropped % 100 == 0:
+                logger.warning(f"历史索引写入队列已满，已丢弃 {dropped} 批条目")
+            return False
+        return True
+
+    def flush(self) -> None:
+        """等待已入队的条目全部写入。"""
+        if self._thread is not None:
+            self._queue.join()
+
+    def close(self, timeout: float = _CLOSE_TIMEOUT) -> None:
+        """停止接收条目并写完队列。"""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            thread = self._thread
+        if thread is None:
+            return
+        try:
+            self._queue.put(None, timeout=timeout)
+        except queue.Full:
+            logger.warning("历史索引队列未能在退出前写完")
+            return
+        thread.join(timeout)
+
+    def _ensure_thread(self) -> None:
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None and not self._closed:
+                self._thread = threading.Thread(target=self._run, name="history-writer", daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                index = get_history_index()
+                if index is None:
+                    continue
+                written = index.add_items(item[1], keyword=item[0])
+                with self._lock:
+                    self.stats["written"] += written
+            except Exception as e:  # noqa: BLE001 - 索引写入失败不能影响搜索
+                with self._lock:
+                    self.stats["failed"] += 1
+                logger.warning(f"历史索引写入失败: {e}")
+            finally:
+                self._queue.task_done()
+
+
+_WRITER: Optional[HistoryWriter] = None
+
+
+def get_history_writer() -> HistoryWriter:
+    """获取进程级历史索引写入器（首次写入时启动后台线程，进程退出时写完队列）。"""
+    global _WRITER
+    if _WRITER is None:
+        with _DEFAULT_INDEX_LOCK:
+            if _WRITER is None:
+                _WRITER = HistoryWriter()
+                atexit.register(_WRITER.close)
+    return _WRITER
+
+
+def record_final_items(keyword: str, items: Iterable[Dict[str, Any]]) -> bool:
+    """把一次聚合搜索的 final_items 交给后台写入器；关闭写入或队列已满时返回 False。"""
+    if not history_enabled():
+        return False
+    # 浅拷贝：调用方随后可能修改返回给用户的条目
+    snapshot = [dict(item) for item in items if isinstance(item, dict)]
+    if not snapshot:
+        return False
+    return get_history_writer().submit(keyword, snapshot)
+
+
+def search_local_index(keyword: str, limit: Optional[int] = None, **kwargs) -> List[Dict[str, Any]]:
+    """
+    local_index 伪平台：从历史索引检索
+
+    kwargs 支持 source_platforms（按来源平台过滤；不用 platforms，以免与 union_search
+    的参数同名）与 days（只看最近 N 天）。
+    """
+    index = get_history_index()
+    if index is None:
+        raise RuntimeError("History index unavailable (SQLite FTS5 not supported?)")
+    platforms = kwargs.get("source_platforms")
+    if isinstance(platforms, str):
+        platforms = [p for p in platforms.split(",") if p]
+    days = kwargs.get("days")
+    since = time.time() - float(days) * 86400 if days else None
+    return index.search(keyword, limit=limit or DEFAULT_LIMIT, platforms=platforms, since=since)
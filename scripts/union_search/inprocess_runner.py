@@ -0,0 +1,299 @@
+"""
+进程内平台执行器
+
+按 PLATFORM_MODULES 中登记的模块路径加载平台脚本（每个模块只加载一次），
+在当前工作线程中直接调用其搜索入口，返回与脚本 JSON 输出结构一致的数据。
+登记了 engine 的无 API Key 引擎不加载脚本，直接调用 common/engine_runtime。
+加载失败（缺少依赖、脚本在导入期退出等）时抛出 PlatformLoadError，
+由编排器回退到子进程执行。
+"""
+
+import importlib.util
+import json
+import os
+import sys
+import threading
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, Dict, Optional
+
+from .platforms import PLATFORM_MODULES
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent
+
+_MODULE_CACHE: Dict[str, ModuleType] = {}
+_LOAD_LOCK = threading.Lock()
+
+
+class PlatformLoadError(ImportError):
+    """平台模块无法在进程内加载。"""
+
+
+def _added_by_script(entry: str) -> bool:
+    """平台脚本只会插入 scripts/ 下的目录（自身目录、scripts 根或同级平台目录）。"""
+    try:
+        path = Path(entry).resolve()
+    except (OSError, RuntimeError, ValueError):
+        return False
+    return path == SCRIPTS_DIR or SCRIPTS_DIR in path.parents
+
+
+def _remove_added_paths(saved_entries: set) -> None:
+    for entry in [p for p in sys.path if p not in saved_entries and _added_by_script(p)]:
+        try:
+            sys.path.remove(entry)
+        except ValueError:
+            pass
+
+
+def load_platform_module(module_path: str) -> ModuleType:
+    """
+    按点分路径（相对 scripts/ 目录）加载平台模块，结果按路径缓存。
+
+    Args:
+        module_path: 模块路径，如 "baidu.baidu_no_api"
+
+    Returns:
+        已加载的模块对象
+    """
+    cached = _MODULE_CACHE.get(module_path)
+    if cached is not None:
+        return cached
+
+    with _LOAD_LOCK:
+        cached = _MODULE_CACHE.get(module_path)
+        if cached is not None:
+            return cached
+
+        script_path = SCRIPTS_DIR.joinpath(*module_path.split(".")).with_suffix(".py")
+        if not script_path.exists():
+            raise PlatformLoadError(f"Platform module not found: {script_path}")
+
+        module_name = "_union_platform_" + module_path.replace(".", "_")
+        spec = importlib.util.spec_from_file_location(module_name, script_path)
+        if spec is None or spec.loader is None:
+            raise PlatformLoadError(f"Cannot create import spec for {script_path}")
+        module = importlib.util.module_from_spec(spec)
+
+        saved_entries = set(sys.path)
+        sys.modules[module_name] = module
+        try:
+            spec.loader.exec_module(module)
+        except (Exception, SystemExit) as exc:
+            # 部分脚本在缺少依赖时会于导入期直接 sys.exit()
+            sys.modules.pop(module_name, None)
+            raise PlatformLoadError(f"Failed to load {module_path}: {exc!r}") from exc
+        finally:
+            # 脚本会把自身目录插入 sys.path，加载完成后只移除脚本新增的 scripts/ 下目录，
+            # 不回滚其他线程在此期间对 sys.path 的其他修改
+            _remove_added_paths(saved_entries)
+
+        _MODULE_CACHE[module_path] = module
+        return module
+
+
+# =============================================================================
+# 平台调用适配（输出结构与各脚本 --json 输出保持一致）
+# =============================================================================
+
+def _limit_or(limit: Optional[int], default: int) -> int:
+    return limit if limit is not None else default
+
+
+def _env_value(env: Optional[Dict[str, str]], name: str) -> Optional[str]:
+    """优先取编排器显式传入的变量，其次取进程环境变量。"""
+    if env and env.get(name):
+        return env[name]
+    return os.environ.get(name)
+
+
+def _call_engine_spec(engine: str, keyword: str, limit: Optional[int], options: Dict[str, Any]) -> Any:
+    """无 API Key 引擎：按引擎定义调用共享运行时，不加载平台脚本。"""
+    try:
+        from common.engine_runtime import search_engine
+    except ImportError as exc:
+        raise PlatformLoadError(f"Engine runtime unavailable: {exc!r}") from exc
+
+    results = search_engine(
+        engine,
+        keyword,
+        max_results=_limit_or(limit, 10),
+        proxy=options.get("proxy"),
+        page=options.get("page", 1),
+    )
+    return {"results": results}
+
+
+def _call_github(module, function, keyword, limit, env, options):
+    client = getattr(module, function)(os.environ.get("GITHUB_TOKEN"))
+    return client.search_repositories(query=keyword, max_results=_limit_or(limit, 30))
+
+
+def _call_youtube(module, function, keyword, limit, env, options):
+    api_key = _env_value(env, "YOUTUBE_API_KEY")
+    if not api_key:
+        raise Exception("缺少 YouTube API 密钥 (YOUTUBE_API_KEY)")
+    video_ids = getattr(module, function)(api_key=api_key, keyword=keyword, limit=_limit_or(limit, 10))
+    if not video_ids:
+        raise Exception(f"未找到关键词 '{keyword}' 的相关视频")
+    return module.get_video_details(api_key=api_key, video_ids=video_ids)
+
+
+def _call_google(module, function, keyword, limit, env, options):
+    return getattr(module, function)().search(query=keyword, num=_limit_or(limit, 10))
+
+
+def _call_tavily(module, function, keyword, limit, env, options):
+    return getattr(module, function)().search(query=keyword, max_results=_limit_or(limit, 5))
+
+
+def _call_jina(module, function, keyword, limit, env, options):
+    results = getattr(module, function)().search(query=keyword, max_results=_limit_or(limit, 10))
+    return {"query": keyword, "total_results": len(results), "results": results}
+
+
+def _call_client_results(module, function, keyword, limit, env, options):
+    """XxxSearch().search(query, max_results) 形式的客户端。"""
+    results = getattr(module, function)().search(query=keyword, max_results=_limit_or(limit, 10))
+    return {"query": keyword, "total_results": len(results), "results": results}
+
+
+def _call_wikipedia(module, function, keyword, limit, env, options):
+    # 与子进程路径一致：中文关键词优先使用中文 Wikipedia
+    lang = "zh" if any('\u4e00' <= ch <= '\u9fff' for ch in keyword) else "en"
+    results = getattr(module, function)(lang=lang).search(query=keyword, max_results=_limit_or(limit, 10))
+    return {"query": keyword, "lang": lang, "total_results": len(results), "results": results}
+
+
+def _call_metaso(module, function, keyword, limit, env, options):
+    result = getattr(module, function)().search(query=keyword, size=_limit_or(limit, 10), include_summary=True)
+    return json.loads(module.format_json(result))
+
+
+def _call_volcengine(module, function, keyword, limit, env, options):
+    api_key = module.load_api_key()
+    if not api_key:
+        raise Exception("API Key not found. Please set VOLCENGINE_API_KEY environment variable or create .env file.")
+    return getattr(module, function)(api_key).web_search_summary(query=keyword, count=_limit_or(limit, 10))
+
+
+def _call_baidu(module, function, keyword, limit, env, options):
+    count = _limit_or(limit, 10)
+    if count <= 0:
+        count = 10
+    elif count > 50:
+        count = 50
+
+    search_filter: Dict[str, Any] = {}
+    freshness = options.get("freshness")
+    if freshness:
+        search_filter = module._build_search_filter(str(freshness))
+
+    api_key = _env_value(env, "BAIDU_API_KEY") or module._resolve_api_key()
+    if not api_key:
+        raise Exception("BAIDU_API_KEY (or BAIDU_QIANFAN_API_KEY) must be set.")
+
+    request_body = {
+        "messages": [{"content": keyword, "role": "user"}],
+        "search_source": "baidu_search_v2",
+        "resource_type_filter": [{"type": "web", "top_k": count}],
+        "search_filter": search_filter,
+    }
+    return getattr(module, function)(api_key, request_body)
+
+
+def _call_xiaoyuzhoufm(module, function, keyword, limit, env, options):
+    return getattr(module, function)(query=keyword, size=_limit_or(limit, 10))
+
+
+def _call_exa(module, function, keyword, limit, env, options):
+    results = getattr(module, function)(
+        keyword,
+        _limit_or(limit, 10),
+        api_key=_env_value(env, "EXA_API_KEY"),
+        search_type=options.get("search_type", "auto"),
+    )
+    return {"results": results}
+
+
+def _call_serper(module, function, keyword, limit, env, options):
+    results = getattr(module, function)(
+        keyword,
+        _limit_or(limit, 10),
+        api_key=_env_value(env, "SERPER_API_KEY"),
+        page=options.get("page", 1),
+        gl=options.get("gl", "us"),
+        hl=options.get("hl", "en"),
+        location=options.get("location"),
+    )
+    return {"results": results}
+
+
+PlatformCall = Callable[[ModuleType, str, str, Optional[int], Optional[Dict[str, str]], Dict[str, Any]], Any]
+
+# 支持进程内执行的平台。未登记的平台（TikHub 系列、Reddit 等依赖脚本 CLI 行为
+# 及响应落盘的实现）继续走子进程。
+INPROCESS_CALLS: Dict[str, PlatformCall] = {
+    "github": _call_github,
+    "youtube": _call_youtube,
+    "google": _call_google,
+    "tavily": _call_tavily,
+    "jina": _call_jina,
+    "duckduckgo": _call_client_results,
+    "brave": _call_client_results,
+    "yahoo": _call_client_results,
+    "yandex": _call_client_results,
+    "bing": _call_client_results,
+    "wikipedia": _call_wikipedia,
+    "metaso": _call_metaso,
+    "volcengine": _call_volcengine,
+    "baidu": _call_baidu,
+    "xiaoyuzhoufm": _call_xiaoyuzhoufm,
+    "exa": _call_exa,
+    "serper": _call_serper,
+}
+
+
+def supports_inprocess(platform: str) -> bool:
+    """平台是否登记了进程内调用适配（或由共享引擎运行时执行）。"""
+    return platform in INPROCESS_CALLS or bool(PLATFORM_MODULES.get(platform, {}).get("engine"))
+
+
+def run_platform_inprocess(
+    platform: str,
+    meta: Dict[str, Any],
+    keyword: str,
+    limit: Optional[int],
+    env: Optional[Dict[str, str]] = None,
+    **options
+) -> Any:
+    """
+    在当前线程执行平台搜索
+
+    Args:
+        platform: 平台名称
+        meta: PLATFORM_MODULES 中的平台元数据（module / function / engine）
+        keyword: 搜索关键词
+        limit: 返回数量 (None 表示使用平台默认值)
+        env: 编排器显式传入的环境变量（优先于进程环境变量）
+        **options: 平台特定参数
+
+    Returns:
+        与平台脚本 JSON 输出结构一致的数据
+
+    Raises:
+        PlatformLoadError: 模块无法在进程内加载（调用方应回退到子进程）
+    """
+    engine = meta.get("engine")
+    if engine:
+        return _call_engine_spec(str(engine), keyword, limit, options)
+
+    call = INPROCESS_CALLS.get(platform)
+    if call is None:
+        raise PlatformLoadError(f"{platform} has no in-process adapter")
+
+    module = load_platform_module(str(meta["module"]))
+    function = str(meta["function"])
+    if not hasattr(module, function):
+        raise PlatformLoadError(f"{meta['module']} has no attribute {function}")
+    return call(module, function, keyword, limit, env, options)
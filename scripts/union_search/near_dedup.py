@@ -0,0 +1,166 @@
+"""
+近似重复检测
+
+跨平台聚合时，同一篇内容常被多个平台以略有差异的标题/摘要收录（转载站、
+搜索引擎摘要截断、标题后缀不同等），精确的标题/链接去重无法识别。
+
+本模块对 "标题 + 摘要" 的词二元组计算 MinHash 签名，并用 LSH 分桶索引查找
+候选，只与同桶条目比较签名，整体开销随条目数近似线性：
+
+- 分词：拉丁文字按单词、中日韩文字按单字切分，相邻两个词组成一个 shingle
+- 签名：单次哈希 MinHash（one permutation hashing），每个 shingle 只哈希一次，
+  按哈希值分到 SIGNATURE_SIZE 个桶并保留桶内最小值，空桶按旋转规则补齐
+- 索引：签名按 LSH_BANDS 段切分，任一段完全相同即为候选
+- 判定：候选与簇代表的 shingle 集合精确计算 Jaccard 相似度，不低于阈值即为近似重复
+  （摘要通常很短，签名估计误差较大，只用于筛选候选）
+
+纯 Python 实现，不依赖 numpy。
+"""
+
+import re
+import zlib
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+# 签名长度（桶数），LSH 分段数 × 每段行数
+SIGNATURE_SIZE = 32
+LSH_BANDS = 16
+LSH_ROWS = SIGNATURE_SIZE // LSH_BANDS
+
+# 默认相似度阈值（Jaccard 估计值）
+DEFAULT_THRESHOLD = 0.7
+
+# 参与签名的正文最大字符数，限制长正文的哈希开销
+MAX_BODY_CHARS = 240
+
+# 摘要/正文字段，按优先级取第一个非空值
+BODY_KEYS = ("snippet", "description", "content", "body", "text", "summary", "abstract", "desc")
+
+# 单个 LSH 桶最多登记的簇数。大量条目共享模板化摘要（如 "No description"）时
+# 同一桶会无限增长，比较退化为平方级；桶满后不再登记，新簇仍可通过其他段命中
+MAX_BUCKET_SIZE = 32
+
+_BUCKET_BITS = 5  # 2 ** 5 == SIGNATURE_SIZE
+_BUCKET_MASK = SIGNATURE_SIZE - 1
+_EMPTY = 1 << 32
+_CJK = "\u3040-\u30ff\u3400-\u9fff\uac00-\ud7af"
+_TOKEN_RE = re.compile(rf"[{_CJK}]|[^\W_{_CJK}]+")
+
+Signature = Tuple[int, ...]
+Fingerprint = Tuple[Signature, FrozenSet[int]]
+
+
+def item_text(item: Dict[str, Any]) -> Tuple[str, str]:
+    """返回条目的 (标题, 摘要)。"""
+    title = str(item.get("title") or item.get("name") or "").strip()
+    body = ""
+    for key in BODY_KEYS:
+        value = item.get(key)
+        if isinstance(value, str) and value.strip():
+            body = value.strip()
+            break
+    return title, body
+
+
+def _shingles(text: str) -> Iterable[str]:
+    tokens = _TOKEN_RE.findall(text.casefold())
+    if len(tokens) < 2:
+        return tokens
+    return {f"{a} {b}" for a, b in zip(tokens, tokens[1:])}
+
+
+def fingerprint(title: str, body: str = "") -> Optional[Fingerprint]:
+    """计算 (MinHash 签名, shingle 哈希集合)；没有可用文本时返回 None。"""
+    hashes = frozenset(map(zlib.crc32, map(str.encode, _shingles(f"{title} {body[:MAX_BODY_CHARS]}"))))
+    if not hashes:
+        return None
+
+    bins = [_EMPTY] * SIGNATURE_SIZE
+    for value in hashes:
+        bucket = value & _BUCKET_MASK
+        value >>= _BUCKET_BITS
+        if value < bins[bucket]:
+            bins[bucket] = value
+
+    # 旋转补齐：空桶取右侧最近的非空桶，并按距离偏移以区分来源
+    if _EMPTY in bins:
+        for i in range(SIGNATURE_SIZE):
+            if bins[i] != _EMPTY:
+                continue
+            for step in range(1, SIGNATURE_SIZE):
+                source = bins[(i + step) % SIGNATURE_SIZE]
+                if source < _EMPTY:
+                    bins[i] = source + step * _EMPTY
+                    break
+    return tuple(bins), hashes
+
+
+def similarity(left: FrozenSet[int], right: FrozenSet[int]) -> float:
+    """两个 shingle 集合的 Jaccard 相似度。"""
+    if not left or not right:
+        return 0.0
+    shared = len(left & right)
+    return shared / (len(left) + len(right) - shared)
+
+
+class NearDuplicateIndex:
+    """
+    增量式 LSH 索引
+
+    每个簇以首个条目的 shingle 集合为代表；match() 查找相似度达到阈值的簇，
+    add() 新建簇或把指纹并入已有簇。
+    """
+
+    def __init__(self, threshold: float = DEFAULT_THRESHOLD):
+        self.threshold = threshold
+        self._bands: List[Dict[Signature, List[int]]] = [{} for _ in range(LSH_BANDS)]
+        self._shingles: List[FrozenSet[int]] = []
+
+    def __len__(self) -> int:
+        return len(self._shingles)
+
+    def _band_keys(self, sig: Signature) -> List[Signature]:
+        return [sig[b * LSH_ROWS:(b + 1) * LSH_ROWS] for b in range(LSH_BANDS)]
+
+    def match(self, fp: Fingerprint) -> Tuple[Optional[int], float]:
+        """查找最相似的已有簇，返回 (簇编号, 相似度)；无匹配时簇编号为 None。"""
+        sig, hashes = fp
+        best, best_score = None, 0.0
+        checked = set()
+        for band, key in zip(self._bands, self._band_keys(sig)):
+            for cluster in band.get(key, ()):
+                if cluster in checked:
+                    continue
+                checked.add(cluster)
+                score = similarity(hashes, self._shingles[cluster])
+                if score >= self.threshold and score > best_score:
+                    best, best_score = cluster, score
+        return best, best_score
+
+    def add(self, fp: Fingerprint, cluster: Optional[int] = None) -> int:
+        """登记指纹；cluster 为 None 时新建簇，否则并入该簇（增加其分桶覆盖）。"""
+        sig, hashes = fp
+        if cluster is None:
+            cluster = len(self._shingles)
+            self._shingles.append(hashes)
+        for band, key in zip(self._bands, self._band_keys(sig)):
+            members = band.setdefault(key, [])
+            if len(members) < MAX_BUCKET_SIZE and cluster not in members:
+                members.append(cluster)
+        return cluster
+
+
+def item_quality(item: Dict[str, Any]) -> Tuple[int, int]:
+    """代表条目的优先级：有链接优先，其次摘要更完整。"""
+    _, body = item_text(item)
+    has_link = any(item.get(key) for key in ("href", "url", "link", "permalink", "source_url"))
+    return int(has_link), len(body)
+
+
+def provenance(item: Dict[str, Any], title: str, link: str, score: float) -> Dict[str, Any]:
+    """被合并条目的来源记录。"""
+    return {
+        "platform": item.get("_source_platform"),
+        "title": title,
+        "link": link,
+        "similarity": round(score, 2),
+    }
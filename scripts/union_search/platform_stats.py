@@ -0,0 +1,307 @@
+"""
+平台健康统计与熔断
+
+以 SQLite 持久化记录每个平台最近的调用耗时、成败与错误类别，供编排器估算
+平台延迟（如对冲请求使用的 p50 延迟），并维护每个平台的熔断状态：
+
+- closed: 正常调用；连续失败达到阈值后转为 open
+- open: 直接跳过该平台，冷却时间结束后转为 half_open
+- half_open: 放行一次探测调用，成功则恢复 closed，失败则重新 open 并延长冷却时间
+
+与结果缓存共用缓存目录；设置 UNION_SEARCH_CIRCUIT_BREAKER=0 可关闭熔断。
+"""
+
+import os
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from common.paths import cache_dir
+
+# 每个平台保留的最近样本数
+MAX_SAMPLES_PER_PLATFORM = 200
+# 计算健康度使用的最近样本数
+HEALTH_WINDOW = 50
+
+# 连续失败多少次后熔断
+FAILURE_THRESHOLD = 3
+# 首次熔断冷却时间（秒），每次探测失败翻倍，不超过上限
+BASE_COOLDOWN_SECONDS = 120
+MAX_COOLDOWN_SECONDS = 3600
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+# 配置类错误（缺少密钥或依赖）调用成本低且与平台可用性无关，不计入熔断
+NON_TRIPPING_ERRORS = frozenset({"config", "dependency"})
+
+_ERROR_PATTERNS = (
+    ("timeout", re.compile(r"timed? ?out|timeout|deadline exceeded", re.I)),
+    ("rate_limited", re.compile(r"\b429\b|rate ?limit|too many requests|quota", re.I)),
+    ("dependency", re.compile(r"ModuleNotFoundError|No module named|ImportError", re.I)),
+    # 鉴权失败（Key 无效、过期）需先于 config 判断，否则提到 Key 的错误都会被当作缺少配置而不计入熔断
+    ("auth", re.compile(
+        r"\b40[13]\b|unauthori[sz]ed|forbidden|authentication failed|鉴权失败|认证失败"
+        r"|(?:invalid|expired|revoked|wrong|incorrect)\W+(?:\w+\W+)?(?:api[ _-]?key|token)"
+        r"|(?:api[ _-]?key|token)\W+(?:\w+\W+)?(?:invalid|expired|revoked)"
+        r"|(?:key|token|密钥|令牌)\W*(?:无效|已?过期)",
+        re.I,
+    )),
+    # 仅限缺少配置（未设置密钥等）的提示
+    ("config", re.compile(
+        r"(?:未找到|缺少)[^，,。\n]{0,40}?(?:key|token|密钥|环境变量)|(?:key|token|密钥)\W*(?:未配置|未设置)"
+        r"|(?:api[ _-]?key|token)\b[^.\n]{0,40}?(?:must be set|not set|is required|not found)"
+        r"|missing\W+(?:\w+\W+)?(?:api[ _-]?key|token|credentials?)",
+        re.I,
+    )),
+    ("server_error", re.compile(r"\b5\d\d\b", re.I)),
+    ("network", re.compile(r"connection|resolve|network|ssl|网络错误", re.I)),
+    ("parse_error", re.compile(r"json|parse|decode", re.I)),
+)
+
+
+def classify_error(error: Optional[str]) -> Optional[str]:
+    """将错误信息归类为 timeout / rate_limited / auth / network 等类别。"""
+    if not error:
+        return None
+    for name, pattern in _ERROR_PATTERNS:
+        if pattern.search(error):
+            return name
+    return "error"
+
+
+def circuit_breaker_enabled() -> bool:
+    """是否启用熔断（可通过 UNION_SEARCH_CIRCUIT_BREAKER=0 全局关闭）。"""
+    return os.environ.get("UNION_SEARCH_CIRCUIT_BREAKER", "1").strip().lower() not in ("0", "false", "no", "off")
+
+
+class PlatformStats:
+    """平台调用统计与熔断状态，线程安全，可跨进程共享。"""
+
+    def __init__(self, path: Optional[Path] = None):
+        if path is None:
+            path = cache_dir() / "platform_stats.sqlite3"
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), timeout=10, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS calls (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                platform TEXT NOT NULL,
+                ts REAL NOT NULL,
+                timing_ms INTEGER NOT NULL,
+                success INTEGER NOT NULL,
+                error_class TEXT
+            )
+            """
+        )
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(calls)")}
+        if "error_class" not in columns:
+            # 兼容早期仅记录耗时的统计库
+            self._conn.execute("ALTER TABLE calls ADD COLUMN error_class TEXT")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_calls_platform ON calls(platform, id)")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS breakers (
+                platform TEXT PRIMARY KEY,
+                state TEXT NOT NULL,
+                consecutive_failures INTEGER NOT NULL DEFAULT 0,
+                trips INTEGER NOT NULL DEFAULT 0,
+                opened_at REAL,
+                probe_started_at REAL,
+                last_error TEXT
+            )
+            """
+        )
+        self._conn.commit()
+
+    # ------------------------------------------------------------------
+    # 调用记录
+    # ------------------------------------------------------------------
+
+    def record(self, platform: str, timing_ms: int, success: bool, error: Optional[str] = None) -> None:
+        """记录一次真实调用（缓存命中不应记录），并推进熔断状态。"""
+        error_class = None if success else classify_error(error)
+        now = time.time()
+        with self._lock:
+            try:
+                self._conn.execute(
+                    "INSERT INTO calls (platform, ts, timing_ms, success, error_class) VALUES (?, ?, ?, ?, ?)",
+                    (platform, now, int(timing_ms), 1 if success else 0, error_class),
+                )
+                self._conn.execute(
+                    "DELETE FROM calls WHERE platform = ? AND id <= "
+                    "(SELECT id FROM calls WHERE platform = ? ORDER BY id DESC LIMIT 1 OFFSET ?)",
+                    (platform, platform, MAX_SAMPLES_PER_PLATFORM),
+                )
+                self._update_breaker(platform, success, error_class, error, now)
+                self._conn.commit()
+            except sqlite3.Error:
+                self._conn.rollback()
+
+    def _update_breaker(
+        self,
+        platform: str,
+        success: bool,
+        error_class: Optional[str],
+        error: Optional[str],
+        now: float
+    ) -> None:
+        row = self._conn.execute(
+            "SELECT state, consecutive_failures, trips FROM breakers WHERE platform = ?", (platform,)
+        ).fetchone()
+        state, failures, trips = row if row else (STATE_CLOSED, 0, 0)
+
+        if success:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO breakers "
+                "(platform, state, consecutive_failures, trips, opened_at, probe_started_at, last_error) "
+                "VALUES (?, ?, 0, 0, NULL, NULL, NULL)",
+                (platform, STATE_CLOSED),
+            )
+            return
+        if error_class in NON_TRIPPING_ERRORS:
+            return
+
+        failures += 1
+        if state == STATE_HALF_OPEN or failures >= FAILURE_THRESHOLD:
+            state, trips, opened_at = STATE_OPEN, trips + 1, now
+        else:
+            opened_at = None
+        self._conn.execute(
+            "INSERT OR REPLACE INTO breakers "
+            "(platform, state, consecutive_failures, trips, opened_at, probe_started_at, last_error) "
+            "VALUES (?, ?, ?, ?, ?, NULL, ?)",
+            (platform, state, failures, trips, opened_at, (error or "")[:500]),
+        )
+
+    # ------------------------------------------------------------------
+    # 熔断
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _cooldown(trips: int) -> float:
+        return min(MAX_COOLDOWN_SECONDS, BASE_COOLDOWN_SECONDS * (2 ** max(0, trips - 1)))
+
+    def allow(self, platform: str) -> bool:
+        """
+        判断平台是否允许调用
+
+        open 状态冷却结束后转为 half_open 并放行一次探测调用；
+        探测进行中（未超过冷却时间）的并发调用仍被跳过。
+        """
+        if not circuit_breaker_enabled():
+            return True
+        now = time.time()
+        with self._lock:
+            try:
+                row = self._conn.execute(
+                    "SELECT state, trips, opened_at, probe_started_at FROM breakers WHERE platform = ?", (platform,)
+                ).fetchone()
+                if row is None or row[0] == STATE_CLOSED:
+                    return True
+                state, trips, opened_at, probe_started_at = row
+                cooldown = self._cooldown(trips)
+                if state == STATE_OPEN and now < (opened_at or 0) + cooldown:
+                    return False
+                if state == STATE_HALF_OPEN and probe_started_at and now < probe_started_at + cooldown:
+                    return False
+                self._conn.execute(
+                    "UPDATE breakers SET state = ?, probe_started_at = ? WHERE platform = ?",
+                    (STATE_HALF_OPEN, now, platform),
+                )
+                self._conn.commit()
+                return True
+            except sqlite3.Error:
+                return True
+
+    # ------------------------------------------------------------------
+    # 查询
+    # ------------------------------------------------------------------
+
+    def latency_quantile(self, platform: str, quantile: float = 0.5) -> Optional[float]:
+        """
+        返回平台成功调用耗时的分位数（秒）
+
+        Args:
+            platform: 平台名称
+            quantile: 分位数 (0-1)
+
+        Returns:
+            耗时秒数；无历史样本时返回 None
+        """
+        with self._lock:
+            try:
+                rows = self._conn.execute(
+                    "SELECT timing_ms FROM calls WHERE platform = ? AND success = 1 ORDER BY id DESC LIMIT ?",
+                    (platform, MAX_SAMPLES_PER_PLATFORM),
+                ).fetchall()
+            except sqlite3.Error:
+                return None
+        if not rows:
+            return None
+        samples = sorted(row[0] for row in rows)
+        index = min(len(samples) - 1, int(quantile * len(samples)))
+        return samples[index] / 1000.0
+
+    def health(self, platform: str) -> Dict[str, Any]:
+        """返回平台实时健康信息：熔断状态、成功率、延迟与最近错误类别。"""
+        with self._lock:
+            try:
+                calls = self._conn.execute(
+                    "SELECT timing_ms, success, error_class, ts FROM calls WHERE platform = ? ORDER BY id DESC LIMIT ?",
+                    (platform, HEALTH_WINDOW),
+                ).fetchall()
+                breaker = self._conn.execute(
+                    "SELECT state, consecutive_failures, trips, opened_at, last_error FROM breakers WHERE platform = ?",
+                    (platform,),
+                ).fetchone()
+            except sqlite3.Error:
+                calls, breaker = [], None
+
+        state, failures, trips, opened_at, last_error = breaker or (STATE_CLOSED, 0, 0, None, None)
+        latencies = sorted(c[0] for c in calls if c[1])
+        error_classes: Dict[str, int] = {}
+        for call in calls:
+            if not call[1] and call[2]:
+                error_classes[call[2]] = error_classes.get(call[2], 0) + 1
+
+        health: Dict[str, Any] = {
+            "state": state,
+            "samples": len(calls),
+            "success_rate": round(sum(1 for c in calls if c[1]) / len(calls), 3) if calls else None,
+            "latency_p50_ms": latencies[len(latencies) // 2] if latencies else None,
+            "latency_p95_ms": latencies[min(len(latencies) - 1, int(0.95 * len(latencies)))] if latencies else None,
+            "consecutive_failures": failures,
+            "error_classes": error_classes,
+            "last_error": last_error,
+            "last_call_at": calls[0][3] if calls else None,
+        }
+        if state != STATE_CLOSED and opened_at:
+            health["retry_after_s"] = max(0, int(opened_at + self._cooldown(trips) - time.time()))
+        return health
+
+
+_DEFAULT_STATS: Optional[PlatformStats] = None
+_DEFAULT_STATS_LOCK = threading.Lock()
+
+
+def get_platform_stats() -> Optional[PlatformStats]:
+    """返回进程级共享统计实例；无法打开时返回 None。"""
+    global _DEFAULT_STATS
+    if _DEFAULT_STATS is None:
+        with _DEFAULT_STATS_LOCK:
+            if _DEFAULT_STATS is None:
+                try:
+                    _DEFAULT_STATS = PlatformStats()
+                except (OSError, sqlite3.Error):
+                    return None
+    return _DEFAULT_STATS
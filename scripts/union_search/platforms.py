@@ -0,0 +1,419 @@
+"""
+平台元数据
+
+平台模块映射、平台分组与无 API Key 直连脚本映射。本模块只包含数据、不导入
+其他模块，CLI 的平台清单（scripts/cli/platform_manifest.json）由此生成；
+修改后运行 python scripts/cli/registry.py 重新生成清单。
+"""
+
+from typing import Dict, Tuple
+
+# =============================================================================
+# 平台搜索器映射
+# =============================================================================
+
+PLATFORM_MODULES = {
+    # 开发者与社区
+    "github": {
+        "module": "github.github_search",
+        "function": "GitHubSearchClient",
+        "description": "GitHub 仓库、代码、问题搜索",
+        "default_limit": None
+    },
+    "reddit": {
+        "module": "reddit.reddit_search",
+        "function": "search_reddit",
+        "description": "Reddit 帖子、子版块搜索",
+        "default_limit": None
+    },
+
+    # 社交媒体
+    "xiaohongshu": {
+        "module": "xiaohongshu.tikhub_xhs_search",
+        "function": "search_xiaohongshu",
+        "description": "小红书笔记搜索",
+        "default_limit": None
+    },
+    "douyin": {
+        "module": "douyin.tikhub_douyin_search",
+        "function": "search_douyin",
+        "description": "抖音视频搜索",
+        "default_limit": None
+    },
+    "bilibili": {
+        "module": "bilibili.video_search",
+        "function": "search_bilibili",
+        "description": "Bilibili 视频搜索",
+        "default_limit": None
+    },
+    "youtube": {
+        "module": "youtube.youtube_search",
+        "function": "search_videos",
+        "description": "YouTube 视频搜索",
+        "default_limit": None
+    },
+    "twitter": {
+        "module": "twitter.tikhub_twitter_search",
+        "function": "search_twitter",
+        "description": "Twitter/X 帖子搜索",
+        "default_limit": None
+    },
+    "weibo": {
+        "module": "weibo.weibo_search",
+        "function": "search_weibo",
+        "description": "微博搜索 (需要配置)",
+        "default_limit": None
+    },
+    "zhihu": {
+        "module": "zhihu.zhihu_search",
+        "function": "search_zhihu",
+        "description": "知乎问答搜索",
+        "default_limit": None
+    },
+    "xiaoyuzhoufm": {
+        "module": "xiaoyuzhoufm.xiaoyuzhou_search",
+        "function": "search_podcasts",
+        "description": "小宇宙FM播客搜索",
+        "default_limit": None
+    },
+
+    # 搜索引擎
+    "google": {
+        "module": "google_search.google_search",
+        "function": "GoogleCustomSearch",
+        "description": "Google 搜索",
+        "default_limit": None
+    },
+    "tavily": {
+        "module": "tavily_search.tavily_search",
+        "function": "TavilySearchClient",
+        "description": "Tavily AI 搜索",
+        "default_limit": None
+    },
+    "jina": {
+        "module": "jina.jina_search",
+        "function": "JinaSearch",
+        "description": "Jina AI 搜索",
+        "default_limit": None
+    },
+    "duckduckgo": {
+        "module": "duckduckgo.duckduckgo_search",
+        "function": "DuckDuckGoSearch",
+        "description": "DuckDuckGo 搜索",
+        "default_limit": None
+    },
+    "brave": {
+        "module": "brave.brave_search",
+        "function": "BraveSearch",
+        "description": "Brave 搜索",
+        "default_limit": None
+    },
+    "yahoo": {
+        "module": "yahoo.yahoo_search",
+        "function": "YahooSearch",
+        "description": "Yahoo 搜索",
+        "default_limit": None
+    },
+    "yandex": {
+        "module": "yandex.yandex_search",
+        "function": "YandexSerpApiSearch",
+        "description": "Yandex 搜索 (SerpAPI)",
+        "default_limit": None
+    },
+    "bing": {
+        "module": "bing.bing_serpapi_search",
+        "function": "BingSerpApiSearch",
+        "description": "Bing 搜索 (SerpAPI)",
+        "default_limit": None
+    },
+    "wikipedia": {
+        "module": "wikipedia.wikipedia_search",
+        "function": "WikipediaSearch",
+        "description": "Wikipedia 搜索",
+        "default_limit": None
+    },
+    "metaso": {
+        "module": "metaso.metaso_search",
+        "function": "MetasoClient",
+        "description": "秘塔搜索 AI 搜索",
+        "default_limit": None
+    },
+    "volcengine": {
+        "module": "volcengine.volcengine_search",
+        "function": "VolcengineSearchClient",
+        "description": "火山引擎融合信息搜索",
+        "default_limit": None
+    },
+    "baidu": {
+        "module": "baidu.baidu_search",
+        "function": "baidu_search",
+        "description": "百度千帆搜索",
+        "default_limit": None
+    },
+
+    # === 无需 API Key 搜索引擎 ===
+    # engine 为 common/engine_specs.py 中的引擎名，进程内执行时直接调用共享引擎运行时
+    "baidu_direct": {
+        "module": "baidu.baidu_no_api",
+        "function": "search_baidu",
+        "engine": "baidu",
+        "description": "百度搜索（无需 API Key）",
+        "default_limit": 10,
+        "requires_api_key": False,
+        "group": "no_api_key"
+    },
+    "bing_cn_direct": {
+        "module": "bing.bing_cn_no_api",
+        "function": "search_bing_cn",
+        "engine": "bing_cn",
+        "description": "Bing 中国（无需 API Key）",
+        "default_limit": 10,
+        "requires_api_key": False,
+        "group": "no_api_key"
+    },
+    "bing_int_direct": {
+        "module": "bing.bing_int_no_api",
+        "function": "search_bing_int",
+        "engine": "bing_int",
+        "description": "Bing 国际（无需 API Key）",
+        "default_limit": 10,
+        "requires_api_key": False,
+        "group": "no_api_key"
+    },
+    "so360_direct": {
+        "module": "so360.so360_no_api",
+        "function": "search_so360",
+        "engine": "so360",
+        "description": "360 搜索（无需 API Key）",
+        "default_limit": 10,
+        "requires_api_key": False,
+        "group": "no_api_key"
+    },
+    "sogou_direct": {
+        "module": "sogou.sogou_no_api",
+        "function": "search_sogou",
+        "engine": "sogou",
+        "description": "搜狗搜索（无需 API Key）",
+        "default_limit": 10,
+        "requires_api_key": False,
+        "group": "no_api_key"
+    },
+    "toutiao_direct": {
+        "module": "toutiao.toutiao_no_api",
+        "function": "search_toutiao",
+        "engine": "toutiao",
+        "description": "头条搜索（无需 API Key）",
+        "default_limit": 10,
+        "requires_api_key": False,
+        "group": "no_api_key"
+    },
+    "jisilu_direct": {
+        "module": "jisilu.jisilu_no_api",
+        "function": "search_jisilu",
+        "engine": "jisilu",
+        "description": "集思录搜索（无需 API Key）",
+        "default_limit": 10,
+        "requires_api_key": False,
+        "group": "no_api_key"
+    },
+    "google_direct": {
+        "module": "google_search.google_no_api",
+        "function": "search_google",
+        "engine": "google",
+        "description": "Google 搜索（无需 API Key）",
+        "default_limit": 10,
+        "requires_api_key": False,
+        "group": "no_api_key"
+    },
+    "google_hk_direct": {
+        "module": "google_search.google_hk_no_api",
+        "function": "search_google_hk",
+        "engine": "google_hk",
+        "description": "Google 香港（无需 API Key）",
+        "default_limit": 10,
+        "requires_api_key": False,
+        "group": "no_api_key"
+    },
+    "duckduckgo_html": {
+        "module": "duckduckgo.duckduckgo_no_api",
+        "function": "search_duckduckgo_html",
+        "engine": "duckduckgo_html",
+        "description": "DuckDuckGo HTML（无需 API Key）",
+        "default_limit": 10,
+        "requires_api_key": False,
+        "group": "no_api_key"
+    },
+    "startpage_direct": {
+        "module": "startpage.startpage_no_api",
+        "function": "search_startpage",
+        "engine": "startpage",
+        "description": "Startpage 隐私搜索（无需 API Key）",
+        "default_limit": 10,
+        "requires_api_key": False,
+        "group": "no_api_key"
+    },
+    "brave_direct": {
+        "module": "brave.brave_no_api",
+        "function": "search_brave",
+        "engine": "brave",
+        "description": "Brave 搜索（无需 API Key）",
+        "default_limit": 10,
+        "requires_api_key": False,
+        "group": "no_api_key"
+    },
+    "yahoo_direct": {
+        "module": "yahoo.yahoo_no_api",
+        "function": "search_yahoo",
+        "engine": "yahoo",
+        "description": "Yahoo 搜索（无需 API Key）",
+        "default_limit": 10,
+        "requires_api_key": False,
+        "group": "no_api_key"
+    },
+    "ecosia_direct": {
+        "module": "ecosia.ecosia_no_api",
+        "function": "search_ecosia",
+        "engine": "ecosia",
+        "description": "Ecosia 环保搜索（无需 API Key）",
+        "default_limit": 10,
+        "requires_api_key": False,
+        "group": "no_api_key"
+    },
+    "qwant_direct": {
+        "module": "qwant.qwant_no_api",
+        "function": "search_qwant",
+        "engine": "qwant",
+        "description": "Qwant 欧洲搜索（无需 API Key）",
+        "default_limit": 10,
+        "requires_api_key": False,
+        "group": "no_api_key"
+    },
+    "wolfram_direct": {
+        "module": "wolfram.wolfram_no_api",
+        "function": "search_wolfram",
+        "engine": "wolfram",
+        "description": "WolframAlpha 知识计算（无需 API Key）",
+        "default_limit": 1,
+        "requires_api_key": False,
+        "group": "no_api_key"
+    },
+
+    # === 新增：从 free-search-aggregator 集成的搜索引擎 ===
+    "mojeek": {
+        "module": "mojeek.mojeek_no_api",
+        "function": "search_mojeek",
+        "engine": "mojeek",
+        "description": "Mojeek 独立索引搜索（无需 API Key）",
+        "default_limit": 10,
+        "requires_api_key": False,
+        "group": "no_api_key"
+    },
+    "duckduckgo_instant": {
+        "module": "duckduckgo_instant.duckduckgo_instant",
+        "function": "search_duckduckgo_instant",
+        "description": "DuckDuckGo 即时答案（无需 API Key）",
+        "default_limit": 10,
+        "requires_api_key": False,
+        "group": "no_api_key"
+    },
+    "exa": {
+        "module": "exa.exa_search",
+        "function": "search_exa",
+        "description": "Exa AI 神经语义搜索（需 API Key，1000 次/月）",
+        "default_limit": 10,
+        "requires_api_key": True,
+        "group": "api_key"
+    },
+    "serper": {
+        "module": "serper.serper_search",
+        "function": "search_serper",
+        "description": "Serper Google 搜索 API（需 API Key，2500 次/天）",
+        "default_limit": 10,
+        "requires_api_key": True,
+        "group": "api_key"
+    },
+
+    "defuddle": {
+        "module": "defuddle.defuddle_cli",
+        "function": "url_to_markdown",
+        "description": "Defuddle 网页内容提取（免费无限制）",
+        "default_limit": 1
+    },
+
+    # 本地历史索引（伪平台，不发网络请求；需显式指定，不在 all 分组中）
+    "local_index": {
+        "module": "union_search.history_index",
+        "function": "search_local_index",
+        "description": "本地搜索历史全文检索（SQLite FTS5，离线）",
+        "default_limit": 10,
+        "requires_api_key": False,
+        "local": True
+    },
+}
+
+# 平台分组
+PLATFORM_GROUPS = {
+    "dev": ["github", "reddit"],
+    "social": ["douyin", "bilibili", "youtube", "twitter", "weibo", "zhihu", "xiaoyuzhoufm"],
+    "search": ["google", "tavily", "jina", "duckduckgo", "brave", "yahoo", "yandex", "bing", "wikipedia", "metaso", "volcengine", "baidu", "exa", "serper"],
+    "tools": ["defuddle"],
+
+    # === 无需 API Key 搜索引擎组 ===
+    "no_api_key": [
+        # 国内引擎
+        "baidu_direct",
+        "bing_cn_direct",
+        "bing_int_direct",
+        "so360_direct",
+        "sogou_direct",
+        "toutiao_direct",
+        "jisilu_direct",
+        # 国际引擎
+        "google_direct",
+        "google_hk_direct",
+        "duckduckgo_html",
+        "startpage_direct",
+        "brave_direct",
+        "yahoo_direct",
+        "ecosia_direct",
+        "qwant_direct",
+        "wolfram_direct",
+        # 新增：从 free-search-aggregator 集成
+        "mojeek",
+        "duckduckgo_instant",
+    ],
+
+    # 首选搜索渠道（优先使用无需 API Key 的引擎）
+    "preferred": [
+        "baidu_direct",
+        "so360_direct",
+        "sogou_direct",
+        "duckduckgo_html",
+        "startpage_direct",
+        "brave_direct",
+    ],
+
+    "local": ["local_index"],
+
+    "all": [name for name, meta in PLATFORM_MODULES.items() if not meta.get("local")]
+}
+
+# 无 API Key 直连平台脚本映射（与 scripts/*/*_no_api.py 对齐）
+DIRECT_NO_API_SCRIPT_MAP: Dict[str, Tuple[str, str]] = {
+    "baidu_direct": ("baidu", "baidu_no_api.py"),
+    "bing_cn_direct": ("bing", "bing_cn_no_api.py"),
+    "bing_int_direct": ("bing", "bing_int_no_api.py"),
+    "so360_direct": ("so360", "so360_no_api.py"),
+    "sogou_direct": ("sogou", "sogou_no_api.py"),
+    "toutiao_direct": ("toutiao", "toutiao_no_api.py"),
+    "jisilu_direct": ("jisilu", "jisilu_no_api.py"),
+    "google_direct": ("google_search", "google_no_api.py"),
+    "google_hk_direct": ("google_search", "google_hk_no_api.py"),
+    "duckduckgo_html": ("duckduckgo", "duckduckgo_no_api.py"),
+    "startpage_direct": ("startpage", "startpage_no_api.py"),
+    "brave_direct": ("brave", "brave_no_api.py"),
+    "yahoo_direct": ("yahoo", "yahoo_no_api.py"),
+    "ecosia_direct": ("ecosia", "ecosia_no_api.py"),
+    "qwant_direct": ("qwant", "qwant_no_api.py"),
+    "wolfram_direct": ("wolfram", "wolfram_no_api.py"),
+}
@@ -0,0 +1,406 @@
+"""
+平台速率限制与配额记账
+
+按 (服务商, API Key) 维护令牌桶，在同一进程内的并发调用间共享：令牌不足时
+调用方排队等待（不超过平台截止时间），而不是直接打出请求换回 429。
+每日/每月配额以 SQLite 持久化记账（UTC 自然日/自然月），配额用尽的平台
+被延后（deferred）而不是调用失败，直到下一个周期重置。
+
+配额取自 references/rate_limits.md 与各平台脚本说明的免费额度，可通过
+UNION_SEARCH_QUOTA_<PROVIDER>_DAILY / UNION_SEARCH_QUOTA_<PROVIDER>_MONTHLY
+覆盖（如付费套餐）；设置 UNION_SEARCH_RATE_LIMIT=0 可关闭限速与配额检查。
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from common.paths import cache_dir
+
+# 服务商限额：
+#   rate/burst: 令牌桶补充速率（次/秒）与容量
+#   daily/monthly: 周期配额（单位与 cost 一致），None 表示不限
+#   cost: 单次搜索消耗的配额单位
+#   env: 标识 API Key 的环境变量（前缀匹配时为 key 池，配额按 key 数量放大）
+PROVIDER_LIMITS: Dict[str, Dict[str, Any]] = {
+    "github": {"rate": 30 / 60, "burst": 5, "env": "GITHUB_TOKEN"},
+    "youtube": {"rate": 1.0, "burst": 3, "daily": 10000, "cost": 100, "env": "YOUTUBE_API_KEY"},
+    "google": {"rate": 1.0, "burst": 3, "daily": 100, "env": "GOOGLE_API_KEY"},
+    "tavily": {"rate": 1.0, "burst": 3, "monthly": 1000, "env": "TAVILY_API_KEY"},
+    "serper": {"rate": 2.0, "burst": 5, "daily": 2500, "env": "SERPER_API_KEY"},
+    "exa": {"rate": 1.0, "burst": 3, "monthly": 1000, "env": "EXA_API_KEY"},
+    "serpapi": {"rate": 1.0, "burst": 2, "monthly": 250, "env": "SERPAPI_API_KEY", "key_pool": True},
+    "tikhub": {"rate": 2.0, "burst": 4, "env": "TIKHUB_TOKEN"},
+    "metaso": {"rate": 1.0, "burst": 2, "env": "METASO_API_KEY"},
+    # 无官方限额的网页抓取平台，按文档建议的请求间隔限速
+    "reddit": {"rate": 0.4, "burst": 1},
+    "duckduckgo": {"rate": 0.7, "burst": 2},
+    "brave": {"rate": 0.7, "burst": 2},
+    "yahoo": {"rate": 0.7, "burst": 2},
+    "wikipedia": {"rate": 1.0, "burst": 2},
+}
+
+# 平台到服务商的映射（多个平台可能共用同一服务商的 Key 与配额）
+PLATFORM_PROVIDERS: Dict[str, str] = {
+    "github": "github",
+    "youtube": "youtube",
+    "google": "google",
+    "tavily": "tavily",
+    "serper": "serper",
+    "exa": "exa",
+    "bing": "serpapi",
+    "yandex": "serpapi",
+    "xiaohongshu": "tikhub",
+    "douyin": "tikhub",
+    "bilibili": "tikhub",
+    "twitter": "tikhub",
+    "zhihu": "tikhub",
+    "weibo": "tikhub",
+    "metaso": "metaso",
+    "xiaoyuzhoufm": "metaso",
+    "reddit": "reddit",
+    "duckduckgo": "duckduckgo",
+    "brave": "brave",
+    "yahoo": "yahoo",
+    "wikipedia": "wikipedia",
+}
+
+# 收到 429 后暂停该服务商的默认时长（秒）
+RATE_LIMITED_BACKOFF_SECONDS = 30
+
+
+class QuotaExhausted(Exception):
+    """服务商当前周期配额已用尽。"""
+
+    def __init__(self, provider: str, period: str, limit: int, reset_at: datetime):
+        self.provider = provider
+        self.period = period
+        self.limit = limit
+        self.reset_at = reset_at
+        super().__init__(
+            f"{provider} {period} quota exhausted ({limit}), deferred until {reset_at.isoformat()}"
+        )
+
+
+def rate_limit_enabled() -> bool:
+    """是否启用限速与配额（可通过 UNION_SEARCH_RATE_LIMIT=0 全局关闭）。"""
+    return os.environ.get("UNION_SEARCH_RATE_LIMIT", "1").strip().lower() not in ("0", "false", "no", "off")
+
+
+def provider_for(platform: str) -> Optional[str]:
+    return PLATFORM_PROVIDERS.get(platform)
+
+
+def _api_keys(limits: Dict[str, Any]) -> List[str]:
+    env = limits.get("env")
+    if not env:
+        return []
+    if limits.get("key_pool"):
+        return [v for k, v in sorted(os.environ.items()) if k.startswith(env) and v]
+    value = os.environ.get(env)
+    return [value] if value else []
+
+
+def key_id(provider: str) -> str:
+    """API Key 的短指纹（账本不保存密钥本身）；未配置 Key 时为 "anonymous"。"""
+    keys = _api_keys(PROVIDER_LIMITS.get(provider, {}))
+    if not keys:
+        return "anonymous"
+    return hashlib.sha256("\n".join(keys).encode("utf-8")).hexdigest()[:12]
+
+
+def quota_limits(provider: str) -> Dict[str, Optional[int]]:
+    """返回服务商每日/每月配额（已应用环境变量覆盖与 key 池放大）。"""
+    limits = PROVIDER_LIMITS.get(provider, {})
+    scale = max(1, len(_api_keys(limits))) if limits.get("key_pool") else 1
+    result: Dict[str, Optional[int]] = {}
+    for period in ("daily", "monthly"):
+        override = os.environ.get(f"UNION_SEARCH_QUOTA_{provider.upper()}_{period.upper()}")
+        value = limits.get(period)
+        if override:
+            try:
+                value = int(override)
+            except ValueError:
+                pass
+        result[period] = value * scale if value is not None else None
+    return result
+
+
+def _period_keys(now: datetime) -> Dict[str, Tuple[str, datetime]]:
+    """当前 UTC 周期标识及其重置时间。"""
+    day_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    month_start = day_start.replace(day=1)
+    next_month = (month_start + timedelta(days=32)).replace(day=1)
+    return {
+        "daily": (day_start.strftime("%Y-%m-%d"), day_start + timedelta(days=1)),
+        "monthly": (month_start.strftime("%Y-%m"), next_month),
+    }
+
+
+# =============================================================================
+# 令牌桶
+# =============================================================================
+
+class TokenBucket:
+    """线程安全令牌桶；acquire 会阻塞至有可用令牌或超过 max_wait。"""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self, max_wait: Optional[float] = None) -> float:
+        """
+        获取一个令牌
+
+        Returns:
+            实际等待的秒数
+
+        Raises:
+            TimeoutError: 在 max_wait 内无法获得令牌
+        """
+        started = time.monotonic()
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if now >= self._paused_until and self._tokens >= 1:
+                    self._tokens -= 1
+                    return now - started
+                wait = max(self._paused_until - now, (1 - self._tokens) / self.rate)
+            if max_wait is not None and now - started + wait > max_wait:
+                raise TimeoutError(f"rate limit wait exceeds {max_wait:.1f}s")
+            time.sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        """暂停发放令牌（如收到 429 后）。"""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            self._tokens = 0.0
+
+    def available(self) -> float:
+        with self._lock:
+            self._refill(time.monotonic())
+            return round(self._tokens, 2)
+
+
+# =============================================================================
+# 配额账本
+# =============================================================================
+
+class QuotaLedger:
+    """SQLite 持久化的每日/每月配额账本，跨进程共享。"""
+
+    def __init__(self, path: Optional[Path] = None):
+        if path is None:
+            path = cache_dir() / "quota.sqlite3"
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        # 显式事务：扣减配额需要跨进程的 check-and-increment
+        self._conn = sqlite3.connect(str(self.path), timeout=10, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS usage (
+                provider TEXT NOT NULL,
+                key_id TEXT NOT NULL,
+                period TEXT NOT NULL,
+                period_key TEXT NOT NULL,
+                used INTEGER NOT NULL,
+                updated_at REAL NOT NULL,
+                PRIMARY KEY (provider, key_id, period, period_key)
+            )
+            """
+        )
+
+    def consume(self, provider: str, cost: int = 1) -> None:
+        """
+        扣减配额
+
+        Raises:
+            QuotaExhausted: 任一周期剩余配额不足
+        """
+        limits = quota_limits(provider)
+        if not any(limits.values()):
+            return
+        kid = key_id(provider)
+        periods = _period_keys(datetime.now(timezone.utc))
+        with self._lock:
+            try:
+                self._conn.execute("BEGIN IMMEDIATE")
+                try:
+                    for period, limit in limits.items():
+                        if limit is None:
+                            continue
+                        period_key, reset_at = periods[period]
+                        used = self._used(provider, kid, period, period_key)
+                        if used + cost > limit:
+                            raise QuotaExhausted(provider, period, limit, reset_at)
+                    for period, limit in limits.items():
+                        if limit is not None:
+                            self._add(provider, kid, period, periods[period][0], cost)
+                    self._conn.execute("COMMIT")
+                except BaseException:
+                    self._conn.execute("ROLLBACK")
+                    raise
+            except sqlite3.Error:
+                # 账本不可用时不阻塞搜索
+                return
+
+    def refund(self, provider: str, cost: int = 1) -> None:
+        """退还配额（请求未真正发出，如缺少 Key）。"""
+        limits = quota_limits(provider)
+        kid = key_id(provider)
+        periods = _period_keys(datetime.now(timezone.utc))
+        with self._lock:
+            try:
+                for period, limit in limits.items():
+                    if limit is not None:
+                        self._add(provider, kid, period, periods[period][0], -cost)
+            except sqlite3.Error:
+                return
+
+    def _used(self, provider: str, kid: str, period: str, period_key: str) -> int:
+        row = self._conn.execute(
+            "SELECT used FROM usage WHERE provider = ? AND key_id = ? AND period = ? AND period_key = ?",
+            (provider, kid, period, period_key),
+        ).fetchone()
+        return row[0] if row else 0
+
+    def _add(self, provider: str, kid: str, period: str, period_key: str, delta: int) -> None:
+        self._conn.execute(
+            "INSERT INTO usage (provider, key_id, period, period_key, used, updated_at) VALUES (?, ?, ?, ?, MAX(?, 0), ?) "
+            "ON CONFLICT (provider, key_id, period, period_key) "
+            "DO UPDATE SET used = MAX(used + ?, 0), updated_at = excluded.updated_at",
+            (provider, kid, period, period_key, delta, time.time(), delta),
+        )
+
+    def usage(self, provider: str) -> Dict[str, Dict[str, Any]]:
+        """返回服务商当前 Key 在各周期的用量、剩余与重置时间。"""
+        limits = quota_limits(provider)
+        kid = key_id(provider)
+        periods = _period_keys(datetime.now(timezone.utc))
+        report: Dict[str, Dict[str, Any]] = {}
+        with self._lock:
+            for period, limit in limits.items():
+                if limit is None:
+                    continue
+                period_key, reset_at = periods[period]
+                try:
+                    used = self._used(provider, kid, period, period_key)
+                except sqlite3.Error:
+                    used = 0
+                report[period] = {
+                    "limit": limit,
+                    "used": used,
+                    "remaining": max(0, limit - used),
+                    "resets_at": reset_at.isoformat(),
+                }
+        return report
+
+
+# =============================================================================
+# 对外接口
+# =============================================================================
+
+class RateLimiter:
+    """按 (服务商, Key) 共享的令牌桶与配额账本。"""
+
+    def __init__(self, ledger: Optional[QuotaLedger] = None):
+        self.ledger = ledger
+        self._buckets: Dict[Tuple[str, str], TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def _bucket(self, provider: str) -> TokenBucket:
+        key = (provider, key_id(provider))
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                limits = PROVIDER_LIMITS[provider]
+                bucket = self._buckets[key] = TokenBucket(limits["rate"], limits["burst"])
+            return bucket
+
+    def acquire(self, platform: str, max_wait: Optional[float] = None) -> float:
+        """
+        为一次平台调用申请额度：先检查并扣减周期配额，再按令牌桶排队
+
+        Args:
+            platform: 平台名称
+            max_wait: 最长排队时间（秒），通常为平台剩余截止时间
+
+        Returns:
+            排队等待的秒数
+
+        Raises:
+            QuotaExhausted: 配额用尽，调用应被延后
+            TimeoutError: 排队时间超过 max_wait
+        """
+        provider = provider_for(platform)
+        if provider is None or not rate_limit_enabled():
+            return 0.0
+        if self.ledger is not None:
+            self.ledger.consume(provider, PROVIDER_LIMITS[provider].get("cost", 1))
+        try:
+            return self._bucket(provider).acquire(max_wait)
+        except TimeoutError:
+            self.release(platform)
+            raise
+
+    def release(self, platform: str) -> None:
+        """退还一次未真正发出的调用所扣减的配额。"""
+        provider = provider_for(platform)
+        if provider is None or self.ledger is None or not rate_limit_enabled():
+            return
+        self.ledger.refund(provider, PROVIDER_LIMITS[provider].get("cost", 1))
+
+    def note_rate_limited(self, platform: str, retry_after: Optional[float] = None) -> None:
+        """平台返回 429 时暂停该服务商的令牌发放。"""
+        provider = provider_for(platform)
+        if provider is None:
+            return
+        self._bucket(provider).pause(retry_after or RATE_LIMITED_BACKOFF_SECONDS)
+
+    def status(self, provider: str) -> Dict[str, Any]:
+        """返回服务商限速参数、当前可用令牌与配额用量。"""
+        limits = PROVIDER_LIMITS[provider]
+        return {
+            "provider": provider,
+            "key_id": key_id(provider),
+            "platforms": sorted(p for p, prov in PLATFORM_PROVIDERS.items() if prov == provider),
+            "rate_per_min": round(limits["rate"] * 60, 2),
+            "burst": limits["burst"],
+            "tokens_available": self._bucket(provider).available(),
+            "quota": self.ledger.usage(provider) if self.ledger is not None else {},
+        }
+
+
+_DEFAULT_LIMITER: Optional[RateLimiter] = None
+_DEFAULT_LIMITER_LOCK = threading.Lock()
+
+
+def get_rate_limiter() -> RateLimiter:
+    """返回进程级共享限速器；账本无法打开时仅做令牌桶限速。"""
+    global _DEFAULT_LIMITER
+    if _DEFAULT_LIMITER is None:
+        with _DEFAULT_LIMITER_LOCK:
+            if _DEFAULT_LIMITER is None:
+                try:
+                    ledger: Optional[QuotaLedger] = QuotaLedger()
+                except (OSError, sqlite3.Error):
+                    ledger = None
+                _DEFAULT_LIMITER = RateLimiter(ledger)
+    return _DEFAULT_LIMITER
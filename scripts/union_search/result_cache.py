@@ -0,0 +1,191 @@
+"""
+搜索结果缓存
+
+基于 SQLite 的持久化结果缓存，键为 (平台, 规范化关键词, limit, 平台参数)。
+每个平台按内容时效设置独立的 TTL（社交/资讯较短，百科/代码仓库较长），
+总体积超过上限时按最近访问时间进行 LRU 淘汰。
+"""
+
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from common.paths import cache_dir
+from common.url_canon import canonicalize_url, is_url
+
+DEFAULT_TTL_SECONDS = 3600
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# 按平台内容时效划分的 TTL（秒），未列出的平台使用 DEFAULT_TTL_SECONDS
+PLATFORM_TTL_SECONDS: Dict[str, int] = {
+    # 社交媒体与资讯：内容更新快
+    "twitter": 600,
+    "weibo": 600,
+    "xiaohongshu": 900,
+    "douyin": 900,
+    "reddit": 900,
+    "bilibili": 1800,
+    "zhihu": 1800,
+    "toutiao_direct": 600,
+    "jisilu_direct": 600,
+    # 百科、代码仓库与播客：内容相对稳定
+    "wikipedia": 7 * 86400,
+    "github": 86400,
+    "xiaoyuzhoufm": 86400,
+    "wolfram_direct": 7 * 86400,
+}
+
+# 不影响结果内容、不参与缓存键计算的参数
+_NON_KEY_OPTIONS = frozenset({"timeout", "execution", "no_cache", "refresh"})
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_keyword(keyword: str) -> str:
+    """规范化关键词：合并空白并忽略大小写；URL 关键词（如 defuddle）按规范链接处理。"""
+    if is_url(keyword):
+        return canonicalize_url(keyword.strip())
+    return _WHITESPACE_RE.sub(" ", keyword or "").strip().casefold()
+
+
+def ttl_for(platform: str) -> int:
+    """返回平台的缓存有效期（秒）。"""
+    return PLATFORM_TTL_SECONDS.get(platform, DEFAULT_TTL_SECONDS)
+
+
+def make_cache_key(platform: str, keyword: str, limit: Optional[int], options: Dict[str, Any]) -> str:
+    """生成缓存键（稳定的 JSON 序列化后取 SHA-256）。"""
+    key_options = {k: v for k, v in options.items() if k not in _NON_KEY_OPTIONS and v is not None}
+    payload = json.dumps(
+        [platform, normalize_keyword(keyword), limit, key_options],
+        ensure_ascii=False,
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResultCache:
+    """SQLite 持久化缓存，线程安全，体积超限时按 LRU 淘汰。"""
+
+    def __init__(self, path: Optional[Path] = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        if path is None:
+            path = cache_dir() / "results.sqlite3"
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), timeout=10, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS results (
+                key TEXT PRIMARY KEY,
+                platform TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                expires_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_results_accessed ON results(accessed_at)")
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """读取未过期的缓存项，命中时刷新访问时间。返回 {"value", "created_at"} 或 None。"""
+        now = time.time()
+        with self._lock:
+            try:
+                row = self._conn.execute(
+                    "SELECT payload, created_at, expires_at FROM results WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    return None
+                payload, created_at, expires_at = row
+                if expires_at <= now:
+                    self._conn.execute("DELETE FROM results WHERE key = ?", (key,))
+                    self._conn.commit()
+                    return None
+                self._conn.execute("UPDATE results SET accessed_at = ? WHERE key = ?", (now, key))
+                self._conn.commit()
+            except sqlite3.Error:
+                # 缓存读写失败（如被其他进程长时间锁定）按未命中处理
+                return None
+        try:
+            return {"value": json.loads(payload), "created_at": created_at}
+        except ValueError:
+            return None
+
+    def put(self, key: str, platform: str, value: Any, ttl: Optional[int] = None) -> None:
+        """写入缓存项并按需淘汰。"""
+        payload = json.dumps(value, ensure_ascii=False, default=str)
+        size = len(payload.encode("utf-8"))
+        if size > self.max_bytes:
+            return
+        now = time.time()
+        ttl = ttl_for(platform) if ttl is None else ttl
+        with self._lock:
+            try:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO results (key, platform, payload, size, created_at, expires_at, accessed_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (key, platform, payload, size, now, now + ttl, now),
+                )
+                self._evict(now)
+                self._conn.commit()
+            except sqlite3.Error:
+                self._conn.rollback()
+
+    def _evict(self, now: float) -> None:
+        """清理过期项，再按最近访问时间淘汰直至体积不超过上限。"""
+        self._conn.execute("DELETE FROM results WHERE expires_at <= ?", (now,))
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        excess = total - self.max_bytes
+        freed = 0
+        stale = []
+        for key, size in self._conn.execute("SELECT key, size FROM results ORDER BY accessed_at ASC"):
+            stale.append((key,))
+            freed += size
+            if freed >= excess:
+                break
+        self._conn.executemany("DELETE FROM results WHERE key = ?", stale)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM results")
+            self._conn.commit()
+
+
+_DEFAULT_CACHE: Optional[ResultCache] = None
+_DEFAULT_CACHE_LOCK = threading.Lock()
+
+
+def cache_enabled() -> bool:
+    """是否启用缓存（可通过 UNION_SEARCH_CACHE=0 全局关闭）。"""
+    return os.environ.get("UNION_SEARCH_CACHE", "1").strip().lower() not in ("0", "false", "no", "off")
+
+
+def get_result_cache() -> Optional[ResultCache]:
+    """返回进程级共享缓存实例；缓存被关闭或无法打开时返回 None。"""
+    global _DEFAULT_CACHE
+    if not cache_enabled():
+        return None
+    if _DEFAULT_CACHE is None:
+        with _DEFAULT_CACHE_LOCK:
+            if _DEFAULT_CACHE is None:
+                try:
+                    _DEFAULT_CACHE = ResultCache()
+                except (OSError, sqlite3.Error):
+                    return None
+    return _DEFAULT_CACHE
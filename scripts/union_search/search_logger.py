@@ -1,13 +1,18 @@
 """
 搜索日志记录器模块
 用于记录统一搜索的详细日志信息
+
+日志以 JSONL 记录交给 common.archive 的归档器，在后台线程中追加写入
+<归档目录>/search_logs/ 下按大小和时间轮转的压缩分段，不在请求路径上写文件。
 """
-import json
-import os
 from datetime import datetime
-from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from common.archive import archive_record, get_archive_sink
+
+# 搜索日志在归档目录中的流名称
+SEARCH_LOG_STREAM = "search_logs"
+
 
 class SearchLogger:
     """搜索日志记录器"""
@@ -20,8 +25,7 @@ class SearchLogger:
             verbose: 是否启用详细日志模式
         """
         self.verbose = verbose
-        self.log_dir = Path(__file__).parent / "search_logs"
-        self.log_dir.mkdir(exist_ok=True)
+        self.log_dir = get_archive_sink().stream_dir(SEARCH_LOG_STREAM)
 
     def log_union_search(
         self,
@@ -38,14 +42,8 @@ class SearchLogger:
             metadata: 额外的元数据信息
 
         Returns:
-            日志文件路径
+            日志分段目录（记录由后台线程异步写入）
         """
-        # 生成文件名
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        safe_query = "".join(c for c in query if c.isalnum() or c in (" ", "-", "_")).strip()[:20].replace(" ", "_")
-        filename = f"search_{safe_query}_{timestamp}.json"
-        filepath = self.log_dir / filename
-
         # 构建日志数据
         log_data = {
             "keyword": query,
@@ -64,8 +62,4 @@ class SearchLogger:
                 "response_times": metadata.get("response_times", {}) if metadata else {},
             }
 
-        # 写入文件
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(log_data, f, ensure_ascii=False, indent=2)
-
-        return str(filepath)
+        return archive_record(SEARCH_LOG_STREAM, log_data)
@@ -10,19 +10,26 @@ License: MIT
 """
 
 import argparse
+import asyncio
+import functools
+import heapq
 import io
+import itertools
 import contextlib
 import json
 import logging
 import os
+import queue
 import re
 import subprocess
 import sys
-from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeoutError
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, as_completed, wait, TimeoutError as FuturesTimeoutError
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
-from urllib.parse import parse_qs, unquote, urlparse, urlunparse
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 # 版本信息
 __version__ = "1.0.0"
@@ -31,8 +38,26 @@ __author__ = "Claude"
 # 添加父目录到路径以便导入其他模块
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from common.env_file import load_env_file
+from common.json_extract import RESULT_FRAME_ENV, extract_json
+from common.url_canon import canonicalize_url
+
 # 导入搜索日志记录器
 from .search_logger import SearchLogger
+from .platforms import DIRECT_NO_API_SCRIPT_MAP, PLATFORM_GROUPS, PLATFORM_MODULES
+from .inprocess_runner import PlatformLoadError, run_platform_inprocess, supports_inprocess
+from .result_cache import get_result_cache, make_cache_key
+from .history_index import LOCAL_INDEX_PLATFORM, record_final_items, search_local_index
+from .platform_stats import NON_TRIPPING_ERRORS, classify_error, get_platform_stats
+from .rate_limiter import QuotaExhausted, get_rate_limiter
+from .near_dedup import (
+    DEFAULT_THRESHOLD as NEAR_DUPLICATE_THRESHOLD,
+    NearDuplicateIndex,
+    fingerprint,
+    item_quality,
+    item_text,
+    provenance,
+)
 
 # URL转Markdown模块（可选导入）
 try:
@@ -61,49 +86,8 @@ def _normalize_title(value: str) -> str:
 
 
 def _normalize_link(value: str) -> str:
-    """规范化链接用于去重，尽量去除跳转和常见跟踪参数。"""
-    if not value:
-        return ""
-    link = value.strip()
-    if not link:
-        return ""
-
-    parsed = urlparse(link)
-
-    # 处理 Yahoo 跳转链接，优先取真实目标 RU 参数。
-    if parsed.netloc.casefold().endswith("search.yahoo.com"):
-        ru_values = parse_qs(parsed.query).get("RU")
-        if not ru_values:
-            match = re.search(r"/RU=([^/]+)/", parsed.path)
-            if match:
-                ru_values = [match.group(1)]
-        if ru_values:
-            link = unquote(ru_values[0])
-            parsed = urlparse(link)
-
-    if not parsed.scheme or not parsed.netloc:
-        return link.casefold()
-
-    filtered_query_pairs = []
-    tracking_keys = {"utm_source", "utm_medium", "utm_campaign", "utm_term", "utm_content", "gclid", "fbclid"}
-    for pair in parsed.query.split("&"):
-        if not pair:
-            continue
-        key = pair.split("=", 1)[0].casefold()
-        if key in tracking_keys or key.startswith("utm_"):
-            continue
-        filtered_query_pairs.append(pair)
-
-    normalized_path = parsed.path.rstrip("/")
-    normalized = urlunparse((
-        parsed.scheme.casefold(),
-        parsed.netloc.casefold(),
-        normalized_path,
-        "",
-        "&".join(filtered_query_pairs),
-        ""
-    ))
-    return normalized
+    """规范化链接用于去重：解析搜索引擎跳转链接并去除常见跟踪参数。"""
+    return canonicalize_url(value.strip()) if value else ""
 
 
 def _extract_title_and_link(item: Dict[str, Any]) -> Tuple[str, str]:
@@ -118,56 +102,342 @@ def _extract_title_and_link(item: Dict[str, Any]) -> Tuple[str, str]:
     return title, link
 
 
-def _deduplicate_items(items: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], int]:
-    """按标题或链接去重，返回去重后结果及去重条数。"""
-    deduped: List[Dict[str, Any]] = []
-    seen_titles = set()
-    seen_links = set()
-    removed = 0
+def _item_dedup_keys(item: Dict[str, Any]) -> Tuple[str, str]:
+    """返回条目的 (标题键, 链接键)。"""
+    title, link = _extract_title_and_link(item)
+    return _normalize_title(title), _normalize_link(link)
 
-    for item in items:
-        title, link = _extract_title_and_link(item)
-        title_key = _normalize_title(title)
-        link_key = _normalize_link(link)
 
-        duplicated_by_title = bool(title_key) and title_key in seen_titles
-        duplicated_by_link = bool(link_key) and link_key in seen_links
+class _IncrementalDeduplicator:
+    """
+    逐条去重，条目到达时立即判定，随时可读取当前去重结果 items
 
-        if duplicated_by_title or duplicated_by_link:
-            removed += 1
-            continue
+    标题或规范链接相同视为重复，保留先到达的条目。near_duplicates 为 True 时，
+    还会通过 MinHash/LSH 合并标题+摘要近似的条目：每簇保留信息最完整的条目
+    （位置为簇内首个条目的位置），被合并条目的来源记录在代表条目的
+    _duplicates_of 中。条目带有 _fusion_score 时，被去除条目的得分累加到保留条目上。
+    """
 
+    def __init__(self, near_duplicates: bool = False, near_threshold: float = NEAR_DUPLICATE_THRESHOLD):
+        self.items: List[Dict[str, Any]] = []
+        self.removed = 0
+        # 键 -> 代表条目在 items 中的位置
+        self._seen_titles: Dict[str, int] = {}
+        self._seen_links: Dict[str, int] = {}
+        self._index = NearDuplicateIndex(near_threshold) if near_duplicates else None
+        self._cluster_slots: Dict[int, int] = {}
+
+    def add(self, item: Dict[str, Any]) -> bool:
+        """登记一个条目，作为新条目保留时返回 True，并入已有条目时返回 False。"""
+        title_key, link_key = _item_dedup_keys(item)
+
+        slot = self._seen_titles.get(title_key) if title_key else None
+        if slot is None and link_key:
+            slot = self._seen_links.get(link_key)
+        score = 1.0
+        fp = None
+        if slot is None and self._index is not None:
+            fp = fingerprint(*item_text(item))
+            if fp is not None:
+                cluster, score = self._index.match(fp)
+                if cluster is not None:
+                    slot = self._cluster_slots[cluster]
+                    self._index.add(fp, cluster)
+
+        if slot is not None:
+            self.removed += 1
+            if self._index is None:
+                if "_fusion_score" in item:
+                    self.items[slot]["_fusion_score"] += item["_fusion_score"]
+            else:
+                # 近似重复条目的标题/链接也指向该簇，后续精确重复直接命中
+                if title_key:
+                    self._seen_titles.setdefault(title_key, slot)
+                if link_key:
+                    self._seen_links.setdefault(link_key, slot)
+                self._merge_near_duplicate(slot, item, score)
+            return False
+
+        slot = len(self.items)
         if title_key:
-            seen_titles.add(title_key)
+            self._seen_titles[title_key] = slot
         if link_key:
-            seen_links.add(link_key)
-        deduped.append(item)
+            self._seen_links[link_key] = slot
+        if fp is not None:
+            self._cluster_slots[self._index.add(fp)] = slot
+        self.items.append(item)
+        return True
+
+    def _merge_near_duplicate(self, slot: int, item: Dict[str, Any], score: float) -> None:
+        """将重复条目并入 slot 处的代表条目，信息更完整的一方成为新代表。"""
+        representative = self.items[slot]
+        if "_fusion_score" in representative:
+            item["_fusion_score"] = representative["_fusion_score"] = (
+                representative["_fusion_score"] + item.get("_fusion_score", 0.0)
+            )
+        if item_quality(item) > item_quality(representative):
+            merged = representative.pop("_duplicates_of", [])
+            merged.append(provenance(representative, *_extract_title_and_link(representative), score))
+            item["_duplicates_of"] = merged
+            self.items[slot] = item
+        else:
+            representative.setdefault("_duplicates_of", []).append(
+                provenance(item, *_extract_title_and_link(item), score)
+            )
 
-    return deduped, removed
 
+def _deduplicate_items(
+    items: List[Dict[str, Any]],
+    near_duplicates: bool = False,
+    near_threshold: float = NEAR_DUPLICATE_THRESHOLD,
+    max_items: Optional[int] = None
+) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    按标题或链接去重，返回去重后结果及去重条数（规则见 _IncrementalDeduplicator）
 
-def _extract_json_from_text(text: str) -> Any:
-    """从包含噪声文本的 stdout 中提取 JSON."""
-    if not text:
-        raise ValueError("Empty output")
+    max_items 为保留条数上限，达到后不再处理剩余条目。
+    """
+    deduplicator = _IncrementalDeduplicator(near_duplicates, near_threshold)
+    for item in items:
+        if deduplicator.add(item) and max_items is not None and len(deduplicator.items) >= max_items:
+            break
+    return deduplicator.items, deduplicator.removed
+
+
+# =============================================================================
+# 排名融合
+# =============================================================================
+
+# 倒数排名融合（Reciprocal Rank Fusion）常数：score = Σ 1 / (RRF_K + 平台内名次)
+RRF_K = 60
 
-    # 优先尝试整段解析
+# 融合排序时去重所处的阶段：
+# first: 先对全部条目去重（可含近似去重），重复条目的得分累加到保留条目后排序
+# last:  先按规范链接合并得分并排序，再按名次顺序去重，保留满 top_k 条即停止
+FUSION_DEDUP_STAGES = ("first", "last")
+
+
+def _rrf_scores(ranks: List[int], k: int = RRF_K) -> List[float]:
+    """按平台内名次（从 1 开始）计算每个条目的 RRF 得分。"""
+    return [1.0 / (k + rank) for rank in ranks]
+
+
+def _top_indices(scores: List[float], top_k: Optional[int] = None) -> List[int]:
+    """按得分从高到低返回下标（同分保持原顺序）；指定 top_k 时只做部分排序。"""
+    order = range(len(scores))
+    if top_k is not None and top_k < len(scores):
+        return heapq.nlargest(top_k, order, key=scores.__getitem__)
+    return sorted(order, key=scores.__getitem__, reverse=True)
+
+
+def _fuse_items(
+    items: List[Dict[str, Any]],
+    ranks: List[int],
+    deduplicate: bool,
+    near_duplicates: bool = False,
+    top_k: Optional[int] = None,
+    dedup_stage: str = "first",
+    k: int = RRF_K
+) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    RRF 融合排序，返回 (排序后条目, 去重条数)
+
+    items 与 ranks 一一对应，ranks 为条目在来源平台结果中的名次。被多个平台
+    收录的条目得分累加，因而排在只被单个平台收录的条目之前；最终得分写入
+    条目的 _fusion_score。
+    """
+    scores = _rrf_scores(ranks, k)
+
+    if not deduplicate:
+        for item, score in zip(items, scores):
+            item["_fusion_score"] = score
+        return [items[i] for i in _top_indices(scores, top_k)], 0
+
+    if dedup_stage == "first":
+        for item, score in zip(items, scores):
+            item["_fusion_score"] = score
+        deduped, removed = _deduplicate_items(items, near_duplicates)
+        fused = [item["_fusion_score"] for item in deduped]
+        return [deduped[i] for i in _top_indices(fused, top_k)], removed
+
+    # last: 链接相同的条目先合并得分用于排序，去重时再按各自得分累加
+    totals: Dict[Any, float] = {}
+    keys: List[Any] = []
+    for position, (item, score) in enumerate(zip(items, scores)):
+        key = _item_dedup_keys(item)[1] or position
+        keys.append(key)
+        totals[key] = totals.get(key, 0.0) + score
+    fused = [totals[key] for key in keys]
+    ordered = []
+    for i in _top_indices(fused):
+        items[i]["_fusion_score"] = scores[i]
+        ordered.append(items[i])
+    deduped, removed = _deduplicate_items(ordered, near_duplicates, max_items=top_k)
+    fused = [item["_fusion_score"] for item in deduped]
+    return [deduped[i] for i in _top_indices(fused)], removed
+
+
+class _ResultMerger:
+    """
+    增量合并平台结果
+
+    编排器每收到一个平台结果即调用 add()：条目直接标注 _source_platform（不复制），
+    开启去重时立即去重，kept 始终是当前已去重的条目，可用于流式输出、竞速计数
+    与提前结束。finalize() 生成最终的 final_items（融合排序在此时进行）。
+    """
+
+    def __init__(
+        self,
+        deduplicate: bool,
+        near_duplicates: bool = False,
+        fusion: bool = False,
+        top_k: Optional[int] = None,
+        fusion_dedup: str = "first"
+    ):
+        self.fusion = fusion
+        self.top_k = top_k
+        self.near_duplicates = near_duplicates
+        self.raw_total = 0
+        # fusion_dedup=last 需要先排序再去重，条目原样收集，去重推迟到 finalize()
+        self._deferred = deduplicate and fusion and fusion_dedup == "last"
+        self._deduplicator = (
+            _IncrementalDeduplicator(near_duplicates) if deduplicate and not self._deferred else None
+        )
+        self._items: List[Dict[str, Any]] = []
+        self._ranks: List[int] = []
+
+    @property
+    def kept(self) -> List[Dict[str, Any]]:
+        """当前已合并（开启去重时为已去重）的条目。"""
+        return self._deduplicator.items if self._deduplicator is not None else self._items
+
+    @property
+    def removed(self) -> int:
+        return self._deduplicator.removed if self._deduplicator is not None else 0
+
+    def add(self, platform: str, result: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """合并一个平台的结果，返回其中作为新条目保留的条目。"""
+        if not result.get("success"):
+            return []
+        added = []
+        for rank, item in enumerate(result.get("items", []), 1):
+            if not isinstance(item, dict):
+                continue
+            item["_source_platform"] = platform
+            if self.fusion:
+                item["_fusion_score"] = 1.0 / (RRF_K + rank)
+            self.raw_total += 1
+            if self._deduplicator is None:
+                self._items.append(item)
+                self._ranks.append(rank)
+                added.append(item)
+            elif self._deduplicator.add(item):
+                added.append(item)
+        return added
+
+    def finalize(self) -> Tuple[List[Dict[str, Any]], int]:
+        """返回 (final_items, 去重条数)。"""
+        if self._deferred:
+            return _fuse_items(
+                self._items, self._ranks, True, self.near_duplicates, top_k=self.top_k, dedup_stage="last"
+            )
+        kept = self.kept
+        if not self.fusion:
+            return list(kept), self.removed
+        scores = [item["_fusion_score"] for item in kept]
+        return [kept[i] for i in _top_indices(scores, self.top_k)], self.removed
+
+
+# 平台执行方式：inprocess（默认，进程内直接调用）或 subprocess（每个平台独立子进程，隔离性更好）
+EXECUTION_MODES = ("inprocess", "subprocess")
+DEFAULT_EXECUTION_MODE = os.environ.get("UNION_SEARCH_EXECUTION", "inprocess")
+
+# 无平台截止时间时，限速排队的最长等待（秒）
+DEFAULT_RATE_LIMIT_WAIT = 30
+
+
+# 当前工作线程所执行平台的截止时间（time.monotonic()），由编排器设置
+_PLATFORM_DEADLINE = threading.local()
+
+
+def _call_with_deadline(deadline: float, func, *args, **kwargs):
+    """在当前线程设置平台截止时间后执行 func，子进程超时会被收紧到截止时间。"""
+    _PLATFORM_DEADLINE.value = deadline
     try:
-        return json.loads(text)
-    except json.JSONDecodeError:
-        pass
+        return func(*args, **kwargs)
+    finally:
+        _PLATFORM_DEADLINE.value = None
 
-    decoder = json.JSONDecoder()
-    for idx, ch in enumerate(text):
-        if ch not in "[{":
-            continue
-        try:
-            obj, _ = decoder.raw_decode(text[idx:])
-            return obj
-        except json.JSONDecodeError:
-            continue
 
-    raise ValueError("No valid JSON found in output")
+def _call_with_timeout(budget: float, started: List[float], func, /, *args, **kwargs):
+    """工作线程开始执行时才计算截止时间（写入 started，供调度线程判断超时），再按截止时间执行 func。"""
+    deadline = time.monotonic() + budget
+    started.append(deadline)
+    return _call_with_deadline(deadline, func, *args, **kwargs)
+
+
+class _DaemonThreadExecutor(Executor):
+    """
+    平台调用执行器：每个调用一个守护线程，同时运行的调用数不超过 max_workers
+
+    进程内平台无法被强制中断，超过截止时间的调用被放弃后仍会在后台运行到结束。
+    与 ThreadPoolExecutor 不同，这些线程是守护线程，编排器在截止时间返回后，
+    进程退出时也不会等待它们（子进程平台在截止时间已被终止）。
+    """
+
+    def __init__(self, max_workers: int, thread_name_prefix: str = "union-search"):
+        self._slots = threading.Semaphore(max(1, max_workers))
+        self._thread_name_prefix = thread_name_prefix
+        self._ids = itertools.count()
+        self._futures: List[Future] = []
+        self._lock = threading.Lock()
+        self._shutdown = False
+
+    def submit(self, fn, /, *args, **kwargs) -> Future:
+        future: Future = Future()
+
+        def run() -> None:
+            with self._slots:
+                if not future.set_running_or_notify_cancel():
+                    return
+                try:
+                    result = fn(*args, **kwargs)
+                except BaseException as exc:  # noqa: BLE001 - 平台脚本可能在导入期 sys.exit()
+                    future.set_exception(exc)
+                else:
+                    future.set_result(result)
+
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError("cannot schedule new futures after shutdown")
+            self._futures.append(future)
+        name = f"{self._thread_name_prefix}_{next(self._ids)}"
+        threading.Thread(target=run, name=name, daemon=True).start()
+        return future
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        with self._lock:
+            self._shutdown = True
+            futures = list(self._futures)
+        if cancel_futures:
+            # 只能取消尚未开始的调用
+            for future in futures:
+                future.cancel()
+        if wait:
+            for future in futures:
+                if not future.cancelled():
+                    future.exception()
+
+
+def _remaining_timeout(timeout: float) -> float:
+    """返回不超过平台截止时间的超时值；已过截止时间时直接抛出超时。"""
+    deadline = getattr(_PLATFORM_DEADLINE, "value", None)
+    if deadline is None:
+        return timeout
+    remaining = deadline - time.monotonic()
+    if remaining <= 0:
+        raise TimeoutError("platform deadline exceeded")
+    return min(timeout, remaining)
 
 
 def _run_platform_json_command(cmd: List[str], timeout: int, platform: str, env: Optional[Dict[str, str]] = None) -> Any:
@@ -176,8 +446,11 @@ def _run_platform_json_command(cmd: List[str], timeout: int, platform: str, env:
     run_env = os.environ.copy()
     if env:
         run_env.update(env)
+    # 支持结果帧的脚本用哨兵行包围输出，免去对日志污染的 stdout 做扫描
+    run_env[RESULT_FRAME_ENV] = "1"
 
-    result = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout, env=run_env)
+    # subprocess.run 超时会终止子进程，超过截止时间的平台不会遗留后台进程
+    result = subprocess.run(cmd, capture_output=True, text=True, timeout=_remaining_timeout(timeout), env=run_env)
 
     if result.returncode != 0:
         stderr = (result.stderr or "").strip()
@@ -186,426 +459,41 @@ def _run_platform_json_command(cmd: List[str], timeout: int, platform: str, env:
         raise Exception(f"{platform} search failed: {detail}")
 
     try:
-        return _extract_json_from_text(result.stdout)
+        return extract_json(result.stdout)
     except ValueError as e:
         stderr = (result.stderr or "").strip()
         detail = f"{e}; stderr={stderr}" if stderr else str(e)
         raise Exception(f"{platform} JSON parse failed: {detail}")
 
 
-# =============================================================================
-# 平台搜索器映射
-# =============================================================================
-
-PLATFORM_MODULES = {
-    # 开发者与社区
-    "github": {
-        "module": "github.github_search",
-        "function": "search_github",
-        "description": "GitHub 仓库、代码、问题搜索",
-        "default_limit": None
-    },
-    "reddit": {
-        "module": "reddit.reddit_search",
-        "function": "search_reddit",
-        "description": "Reddit 帖子、子版块搜索",
-        "default_limit": None
-    },
-
-    # 社交媒体
-    "xiaohongshu": {
-        "module": "xiaohongshu.tikhub_xhs_search",
-        "function": "search_xiaohongshu",
-        "description": "小红书笔记搜索",
-        "default_limit": None
-    },
-    "douyin": {
-        "module": "douyin.tikhub_douyin_search",
-        "function": "search_douyin",
-        "description": "抖音视频搜索",
-        "default_limit": None
-    },
-    "bilibili": {
-        "module": "bilibili.video_search",
-        "function": "search_bilibili",
-        "description": "Bilibili 视频搜索",
-        "default_limit": None
-    },
-    "youtube": {
-        "module": "youtube.youtube_search",
-        "function": "search_youtube",
-        "description": "YouTube 视频搜索",
-        "default_limit": None
-    },
-    "twitter": {
-        "module": "twitter.tikhub_twitter_search",
-        "function": "search_twitter",
-        "description": "Twitter/X 帖子搜索",
-        "default_limit": None
-    },
-    "weibo": {
-        "module": "weibo.weibo_search",
-        "function": "search_weibo",
-        "description": "微博搜索 (需要配置)",
-        "default_limit": None
-    },
-    "zhihu": {
-        "module": "zhihu.zhihu_search",
-        "function": "search_zhihu",
-        "description": "知乎问答搜索",
-        "default_limit": None
-    },
-    "xiaoyuzhoufm": {
-        "module": "xiaoyuzhoufm.xiaoyuzhou_search",
-        "function": "search_xiaoyuzhoufm",
-        "description": "小宇宙FM播客搜索",
-        "default_limit": None
-    },
-
-    # 搜索引擎
-    "google": {
-        "module": "google_search.google_search",
-        "function": "search_google",
-        "description": "Google 搜索",
-        "default_limit": None
-    },
-    "tavily": {
-        "module": "tavily_search.tavily_search",
-        "function": "search_tavily",
-        "description": "Tavily AI 搜索",
-        "default_limit": None
-    },
-    "jina": {
-        "module": "jina.jina_search",
-        "function": "search_jina",
-        "description": "Jina AI 搜索",
-        "default_limit": None
-    },
-    "duckduckgo": {
-        "module": "duckduckgo.duckduckgo_search",
-        "function": "search_duckduckgo",
-        "description": "DuckDuckGo 搜索",
-        "default_limit": None
-    },
-    "brave": {
-        "module": "brave.brave_search",
-        "function": "search_brave",
-        "description": "Brave 搜索",
-        "default_limit": None
-    },
-    "yahoo": {
-        "module": "yahoo.yahoo_search",
-        "function": "search_yahoo",
-        "description": "Yahoo 搜索",
-        "default_limit": None
-    },
-    "yandex": {
-        "module": "yandex.yandex_search",
-        "function": "search_yandex",
-        "description": "Yandex 搜索 (SerpAPI)",
-        "default_limit": None
-    },
-    "bing": {
-        "module": "bing.bing_serpapi_search",
-        "function": "search_bing",
-        "description": "Bing 搜索 (SerpAPI)",
-        "default_limit": None
-    },
-    "wikipedia": {
-        "module": "wikipedia.wikipedia_search",
-        "function": "search_wikipedia",
-        "description": "Wikipedia 搜索",
-        "default_limit": None
-    },
-    "metaso": {
-        "module": "metaso.metaso_search",
-        "function": "search_metaso",
-        "description": "秘塔搜索 AI 搜索",
-        "default_limit": None
-    },
-    "volcengine": {
-        "module": "volcengine.volcengine_search",
-        "function": "search_volcengine",
-        "description": "火山引擎融合信息搜索",
-        "default_limit": None
-    },
-    "baidu": {
-        "module": "baidu.baidu_search",
-        "function": "search_baidu",
-        "description": "百度千帆搜索",
-        "default_limit": None
-    },
-
-    # === 无需 API Key 搜索引擎 ===
-    "baidu_direct": {
-        "module": "no_api_key_search.engines.baidu_engine",
-        "function": "search_baidu",
-        "description": "百度搜索（无需 API Key）",
-        "default_limit": 10,
-        "requires_api_key": False,
-        "group": "no_api_key"
-    },
-    "bing_cn_direct": {
-        "module": "no_api_key_search.engines.bing_cn_engine",
-        "function": "search_bing_cn",
-        "description": "Bing 中国（无需 API Key）",
-        "default_limit": 10,
-        "requires_api_key": False,
-        "group": "no_api_key"
-    },
-    "bing_int_direct": {
-        "module": "no_api_key_search.engines.bing_int_engine",
-        "function": "search_bing_int",
-        "description": "Bing 国际（无需 API Key）",
-        "default_limit": 10,
-        "requires_api_key": False,
-        "group": "no_api_key"
-    },
-    "so360_direct": {
-        "module": "no_api_key_search.engines.so360_engine",
-        "function": "search_so360",
-        "description": "360 搜索（无需 API Key）",
-        "default_limit": 10,
-        "requires_api_key": False,
-        "group": "no_api_key"
-    },
-    "sogou_direct": {
-        "module": "no_api_key_search.engines.sogou_engine",
-        "function": "search_sogou",
-        "description": "搜狗搜索（无需 API Key）",
-        "default_limit": 10,
-        "requires_api_key": False,
-        "group": "no_api_key"
-    },
-    "toutiao_direct": {
-        "module": "no_api_key_search.engines.toutiao_engine",
-        "function": "search_toutiao",
-        "description": "头条搜索（无需 API Key）",
-        "default_limit": 10,
-        "requires_api_key": False,
-        "group": "no_api_key"
-    },
-    "jisilu_direct": {
-        "module": "no_api_key_search.engines.jisilu_engine",
-        "function": "search_jisilu",
-        "description": "集思录搜索（无需 API Key）",
-        "default_limit": 10,
-        "requires_api_key": False,
-        "group": "no_api_key"
-    },
-    "google_direct": {
-        "module": "no_api_key_search.engines.google_engine",
-        "function": "search_google",
-        "description": "Google 搜索（无需 API Key）",
-        "default_limit": 10,
-        "requires_api_key": False,
-        "group": "no_api_key"
-    },
-    "google_hk_direct": {
-        "module": "no_api_key_search.engines.google_hk_engine",
-        "function": "search_google_hk",
-        "description": "Google 香港（无需 API Key）",
-        "default_limit": 10,
-        "requires_api_key": False,
-        "group": "no_api_key"
-    },
-    "duckduckgo_html": {
-        "module": "no_api_key_search.engines.duckduckgo_html_engine",
-        "function": "search_duckduckgo_html",
-        "description": "DuckDuckGo HTML（无需 API Key）",
-        "default_limit": 10,
-        "requires_api_key": False,
-        "group": "no_api_key"
-    },
-    "startpage_direct": {
-        "module": "no_api_key_search.engines.startpage_engine",
-        "function": "search_startpage",
-        "description": "Startpage 隐私搜索（无需 API Key）",
-        "default_limit": 10,
-        "requires_api_key": False,
-        "group": "no_api_key"
-    },
-    "brave_direct": {
-        "module": "no_api_key_search.engines.brave_engine",
-        "function": "search_brave",
-        "description": "Brave 搜索（无需 API Key）",
-        "default_limit": 10,
-        "requires_api_key": False,
-        "group": "no_api_key"
-    },
-    "yahoo_direct": {
-        "module": "no_api_key_search.engines.yahoo_engine",
-        "function": "search_yahoo",
-        "description": "Yahoo 搜索（无需 API Key）",
-        "default_limit": 10,
-        "requires_api_key": False,
-        "group": "no_api_key"
-    },
-    "ecosia_direct": {
-        "module": "no_api_key_search.engines.ecosia_engine",
-        "function": "search_ecosia",
-        "description": "Ecosia 环保搜索（无需 API Key）",
-        "default_limit": 10,
-        "requires_api_key": False,
-        "group": "no_api_key"
-    },
-    "qwant_direct": {
-        "module": "no_api_key_search.engines.qwant_engine",
-        "function": "search_qwant",
-        "description": "Qwant 欧洲搜索（无需 API Key）",
-        "default_limit": 10,
-        "requires_api_key": False,
-        "group": "no_api_key"
-    },
-    "wolfram_direct": {
-        "module": "no_api_key_search.engines.wolfram_engine",
-        "function": "search_wolfram",
-        "description": "WolframAlpha 知识计算（无需 API Key）",
-        "default_limit": 1,
-        "requires_api_key": False,
-        "group": "no_api_key"
-    },
-
-    # === 新增：从 free-search-aggregator 集成的搜索引擎 ===
-    "mojeek": {
-        "module": "mojeek.mojeek_no_api",
-        "function": "search_mojeek",
-        "description": "Mojeek 独立索引搜索（无需 API Key）",
-        "default_limit": 10,
-        "requires_api_key": False,
-        "group": "no_api_key"
-    },
-    "duckduckgo_instant": {
-        "module": "duckduckgo_instant.duckduckgo_instant",
-        "function": "search_duckduckgo_instant",
-        "description": "DuckDuckGo 即时答案（无需 API Key）",
-        "default_limit": 10,
-        "requires_api_key": False,
-        "group": "no_api_key"
-    },
-    "exa": {
-        "module": "exa.exa_search",
-        "function": "search_exa",
-        "description": "Exa AI 神经语义搜索（需 API Key，1000 次/月）",
-        "default_limit": 10,
-        "requires_api_key": True,
-        "group": "api_key"
-    },
-    "serper": {
-        "module": "serper.serper_search",
-        "function": "search_serper",
-        "description": "Serper Google 搜索 API（需 API Key，2500 次/天）",
-        "default_limit": 10,
-        "requires_api_key": True,
-        "group": "api_key"
-    },
-
-    "defuddle": {
-        "module": "defuddle.defuddle_cli",
-        "function": "url_to_markdown",
-        "description": "Defuddle 网页内容提取（免费无限制）",
-        "default_limit": 1
-    },
-}
-
-# 平台分组
-PLATFORM_GROUPS = {
-    "dev": ["github", "reddit"],
-    "social": ["douyin", "bilibili", "youtube", "twitter", "weibo", "zhihu", "xiaoyuzhoufm"],
-    "search": ["google", "tavily", "jina", "duckduckgo", "brave", "yahoo", "yandex", "bing", "wikipedia", "metaso", "volcengine", "baidu", "exa", "serper"],
-    "tools": ["defuddle"],
-
-    # === 无需 API Key 搜索引擎组 ===
-    "no_api_key": [
-        # 国内引擎
-        "baidu_direct",
-        "bing_cn_direct",
-        "bing_int_direct",
-        "so360_direct",
-        "sogou_direct",
-        "toutiao_direct",
-        "jisilu_direct",
-        # 国际引擎
-        "google_direct",
-        "google_hk_direct",
-        "duckduckgo_html",
-        "startpage_direct",
-        "brave_direct",
-        "yahoo_direct",
-        "ecosia_direct",
-        "qwant_direct",
-        "wolfram_direct",
-        # 新增：从 free-search-aggregator 集成
-        "mojeek",
-        "duckduckgo_instant",
-    ],
-
-    # 首选搜索渠道（优先使用无需 API Key 的引擎）
-    "preferred": [
-        "baidu_direct",
-        "so360_direct",
-        "sogou_direct",
-        "duckduckgo_html",
-        "startpage_direct",
-        "brave_direct",
-    ],
-
-    "all": list(PLATFORM_MODULES.keys())
-}
-
-# 无 API Key 直连平台脚本映射（与 scripts/*/*_no_api.py 对齐）
-DIRECT_NO_API_SCRIPT_MAP: Dict[str, Tuple[str, str]] = {
-    "baidu_direct": ("baidu", "baidu_no_api.py"),
-    "bing_cn_direct": ("bing", "bing_cn_no_api.py"),
-    "bing_int_direct": ("bing", "bing_int_no_api.py"),
-    "so360_direct": ("so360", "so360_no_api.py"),
-    "sogou_direct": ("sogou", "sogou_no_api.py"),
-    "toutiao_direct": ("toutiao", "toutiao_no_api.py"),
-    "jisilu_direct": ("jisilu", "jisilu_no_api.py"),
-    "google_direct": ("google_search", "google_no_api.py"),
-    "google_hk_direct": ("google_search", "google_hk_no_api.py"),
-    "duckduckgo_html": ("duckduckgo", "duckduckgo_no_api.py"),
-    "startpage_direct": ("startpage", "startpage_no_api.py"),
-    "brave_direct": ("brave", "brave_no_api.py"),
-    "yahoo_direct": ("yahoo", "yahoo_no_api.py"),
-    "ecosia_direct": ("ecosia", "ecosia_no_api.py"),
-    "qwant_direct": ("qwant", "qwant_no_api.py"),
-    "wolfram_direct": ("wolfram", "wolfram_no_api.py"),
-}
-
-
-# =============================================================================
-# 环境变量加载
-# =============================================================================
-
-def load_env_file(env_path: str = ".env"):
-    """加载 .env 文件"""
-    env_file = Path(env_path)
-    if not env_file.exists():
-        # 尝试从项目根目录加载
-        root_env = Path(__file__).parent.parent.parent / ".env"
-        if root_env.exists():
-            env_file = root_env
-        else:
-            logger.debug(f"未找到 .env 文件: {env_path}")
-            return
-
-    logger.info(f"加载环境变量文件: {env_file}")
-    loaded_count = 0
-
-    with open(env_file, "r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line or line.startswith("#") or "=" not in line:
-                continue
-            key, value = line.split("=", 1)
-            key = key.strip()
-            value = value.strip()
-            if key and key not in os.environ:
-                os.environ[key] = value
-                loaded_count += 1
+def _run_platform(
+    platform: str,
+    cmd: List[str],
+    timeout: int,
+    keyword: str,
+    limit: Optional[int],
+    options: Dict[str, Any],
+    env: Optional[Dict[str, str]] = None
+) -> Any:
+    """执行平台搜索：优先进程内调用，模块无法加载或显式要求隔离时回退到子进程。"""
+    execution = options.get("execution") or DEFAULT_EXECUTION_MODE
+    if execution != "subprocess" and supports_inprocess(platform):
+        platform_options = {k: v for k, v in options.items() if k not in ("execution", "timeout")}
+        try:
+            return run_platform_inprocess(
+                platform,
+                PLATFORM_MODULES[platform],
+                keyword,
+                limit,
+                env=env,
+                **platform_options
+            )
+        except PlatformLoadError as e:
+            logger.warning(f"{platform} 无法进程内执行，回退到子进程: {e}")
+        except Exception as e:
+            raise Exception(f"{platform} search failed: {e}") from e
 
-    logger.info(f"成功加载 {loaded_count} 个环境变量")
+    return _run_platform_json_command(cmd, timeout=timeout, platform=platform, env=env)
 
 
 # =============================================================================
@@ -625,7 +513,8 @@ def search_platform(
         platform: 平台名称
         keyword: 搜索关键词
         limit: 返回结果数量 (如果为 None, 使用平台默认值)
-        **kwargs: 平台特定参数
+        **kwargs: 平台特定参数（no_cache=True 跳过缓存，refresh=True 忽略已有缓存并重新写入，
+            ignore_health=True 忽略熔断状态强制调用）
 
     Returns:
         (platform_name, result_dict)
@@ -642,6 +531,58 @@ def search_platform(
         "timing_ms": 0
     }
 
+    no_cache = bool(kwargs.pop("no_cache", False))
+    refresh = bool(kwargs.pop("refresh", False))
+    ignore_health = bool(kwargs.pop("ignore_health", False))
+    # 本地历史索引本身就是离线数据，不经过结果缓存
+    cache = None if no_cache or platform not in PLATFORM_MODULES or platform == LOCAL_INDEX_PLATFORM else get_result_cache()
+    cache_key = None
+    result["cache"] = "off"
+    if cache is not None:
+        cache_key = make_cache_key(platform, keyword, limit, kwargs)
+        result["cache"] = "refresh" if refresh else "miss"
+        cached = None if refresh else cache.get(cache_key)
+        if cached is not None:
+            items = cached["value"].get("items", [])
+            result.update({
+                "success": True,
+                "items": items,
+                "total": len(items),
+                "has_results": bool(items),
+                "cache": "hit",
+                "cache_age_s": int(time.time() - cached["created_at"]),
+                "timing_ms": int((datetime.now() - start_time).total_seconds() * 1000),
+            })
+            logger.info(f"平台 {platform} 命中缓存: {result['total']} 条结果")
+            return platform, result
+
+    # 熔断中的平台直接跳过，不计入调用统计
+    stats = get_platform_stats() if platform in PLATFORM_MODULES else None
+    if stats is not None and not ignore_health and not stats.allow(platform):
+        health = stats.health(platform)
+        result.update({
+            "error": f"Circuit open: {platform} skipped after repeated failures ({health.get('last_error') or 'unknown error'})",
+            "skipped_unhealthy": True,
+            "health": health,
+        })
+        logger.warning(f"平台 {platform} 熔断中，跳过 (约 {health.get('retry_after_s', 0)}s 后重试)")
+        return platform, result
+
+    # 按服务商令牌桶排队；周期配额用尽时延后而不是发出注定失败的请求
+    limiter = get_rate_limiter()
+    try:
+        waited = limiter.acquire(platform, max_wait=_remaining_timeout(DEFAULT_RATE_LIMIT_WAIT))
+    except QuotaExhausted as e:
+        result.update({"error": str(e), "deferred": True, "retry_at": e.reset_at.isoformat()})
+        logger.warning(f"平台 {platform} 配额已用尽，延后至 {e.reset_at.isoformat()}")
+        return platform, result
+    except TimeoutError as e:
+        result["error"] = f"Rate limit queue timeout: {e}"
+        logger.warning(f"平台 {platform} 限速排队超时")
+        return platform, result
+    if waited > 0:
+        result["rate_limit_wait_ms"] = int(waited * 1000)
+
     try:
         logger.info(f"开始搜索平台: {platform}, 关键词: {keyword}")
 
@@ -702,6 +643,8 @@ def search_platform(
             result["items"] = _search_no_api_direct(platform, keyword, limit, **kwargs)
         elif platform == "defuddle":
             result["items"] = _search_defuddle(keyword, limit, **kwargs)
+        elif platform == LOCAL_INDEX_PLATFORM:
+            result["items"] = search_local_index(keyword, limit, **kwargs)
         else:
             result["error"] = f"Unknown platform: {platform}"
             logger.error(result["error"])
@@ -724,6 +667,9 @@ def search_platform(
 
         if result["total"] > 0:
             logger.info(f"平台 {platform} 搜索完成: {result['total']} 条结果, 耗时 {elapsed:.2f}s")
+            # 空结果可能源于限流，不写入缓存
+            if cache is not None:
+                cache.put(cache_key, platform, {"items": result["items"]})
         else:
             logger.warning(f"平台 {platform} 搜索完成: 0 条结果, 耗时 {elapsed:.2f}s")
 
@@ -733,6 +679,16 @@ def search_platform(
         result["timing_ms"] = int(elapsed * 1000)
         logger.error(f"平台 {platform} 搜索失败: {e}")
 
+    error_class = classify_error(result["error"])
+    if error_class == "rate_limited":
+        limiter.note_rate_limited(platform)
+    elif error_class in NON_TRIPPING_ERRORS:
+        # 缺少 Key 或依赖时请求并未发出，退还配额
+        limiter.release(platform)
+
+    if stats is not None:
+        stats.record(platform, result["timing_ms"], result["success"], result["error"])
+
     return platform, result
 
 
@@ -746,7 +702,7 @@ def _search_github(keyword: str, limit: Optional[int], **kwargs) -> List[Dict]:
     cmd = [sys.executable, str(script_path), "repo", keyword, "--format", "json"]
     if limit is not None:
         cmd.extend(["--limit", str(limit)])
-    data = _run_platform_json_command(cmd, timeout=30, platform="github")
+    data = _run_platform("github", cmd, 30, keyword, limit, kwargs)
     items = data.get("items", [])
     return items[:limit] if isinstance(items, list) and limit is not None else (items if isinstance(items, list) else [])
 
@@ -758,7 +714,7 @@ def _search_reddit(keyword: str, limit: Optional[int], **kwargs) -> List[Dict]:
     cmd = [sys.executable, str(script_path), "search", keyword, "--format", "json"]
     if limit is not None:
         cmd.extend(["--limit", str(limit)])
-    result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+    result = subprocess.run(cmd, capture_output=True, text=True, timeout=_remaining_timeout(30))
     if result.returncode != 0:
         detail = (result.stderr or result.stdout or "").strip() or f"exit code {result.returncode}"
         raise Exception(f"reddit search failed: {detail}")
@@ -769,7 +725,7 @@ def _search_reddit(keyword: str, limit: Optional[int], **kwargs) -> List[Dict]:
     if any(marker in merged for marker in failure_markers):
         raise Exception(merged.strip())
 
-    data = _extract_json_from_text(result.stdout)
+    data = extract_json(result.stdout)
     if not isinstance(data, list):
         return []
     return data[:limit] if limit is not None else data
@@ -804,23 +760,13 @@ def _search_douyin(keyword: str, limit: Optional[int], **kwargs) -> List[Dict]:
 
 def _search_bilibili(keyword: str, limit: Optional[int], **kwargs) -> List[Dict]:
     """Bilibili 搜索 - 使用 TikHub API"""
-    import http.client
     import json
     from urllib.parse import quote
 
-    # 自动加载 .env 文件
-    env_file = Path(__file__).parent.parent.parent / ".env"
-    if env_file.exists():
-        with open(env_file, "r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if not line or line.startswith("#") or "=" not in line:
-                    continue
-                key, value = line.split("=", 1)
-                key = key.strip()
-                value = value.strip()
-                if key and key not in os.environ:
-                    os.environ[key] = value
+    from common import http_client
+
+    # 自动加载项目根目录的 .env 文件（不覆盖已有环境变量）
+    load_env_file(str(Path(__file__).parent.parent.parent / ".env"))
 
     token = os.environ.get("TIKHUB_TOKEN")
     if not token:
@@ -837,21 +783,17 @@ def _search_bilibili(keyword: str, limit: Optional[int], **kwargs) -> List[Dict]
     encoded_keyword = quote(keyword)
     page_size = limit if limit is not None else 10
 
-    conn = http.client.HTTPSConnection(base_url)
     headers = {
         "Authorization": f"Bearer {token}",
         "Content-Type": "application/json"
     }
 
     url = f"/api/v1/bilibili/web/fetch_general_search?keyword={encoded_keyword}&order=totalrank&page=1&page_size={page_size}"
-    conn.request("GET", url, "", headers)
-
-    res = conn.getresponse()
-    if res.status != 200:
-        raise Exception(f"Bilibili API 请求失败: HTTP {res.status}")
+    res = http_client.request("GET", f"https://{base_url}{url}", headers=headers)
+    if res.status_code != 200:
+        raise Exception(f"Bilibili API 请求失败: HTTP {res.status_code}")
 
-    data = res.read()
-    response = json.loads(data.decode("utf-8"))
+    response = json.loads(res.content.decode("utf-8"))
 
     if response.get("code") != 200:
         raise Exception(f"Bilibili API 错误: {response.get('message', 'Unknown error')}")
@@ -887,7 +829,7 @@ def _search_youtube(keyword: str, limit: Optional[int], **kwargs) -> List[Dict]:
     cmd = [sys.executable, str(script_path), keyword, "--json"]
     if limit is not None:
         cmd.extend(["--limit", str(limit)])
-    data = _run_platform_json_command(cmd, timeout=60, platform="youtube")
+    data = _run_platform("youtube", cmd, 60, keyword, limit, kwargs)
     if not isinstance(data, list):
         return []
     return data[:limit] if limit is not None else data
@@ -956,7 +898,7 @@ def _search_google(keyword: str, limit: Optional[int], **kwargs) -> List[Dict]:
     cmd = [sys.executable, str(script_path), keyword, "--json"]
     if limit is not None:
         cmd.extend(["-n", str(limit)])
-    data = _run_platform_json_command(cmd, timeout=30, platform="google")
+    data = _run_platform("google", cmd, 30, keyword, limit, kwargs)
     items = data.get("items", [])
     return items[:limit] if isinstance(items, list) and limit is not None else (items if isinstance(items, list) else [])
 
@@ -967,7 +909,7 @@ def _search_tavily(keyword: str, limit: Optional[int], **kwargs) -> List[Dict]:
     cmd = [sys.executable, str(script_path), keyword, "--json"]
     if limit is not None:
         cmd.extend(["--max-results", str(limit)])
-    data = _run_platform_json_command(cmd, timeout=60, platform="tavily")
+    data = _run_platform("tavily", cmd, 60, keyword, limit, kwargs)
     items = data.get("results", [])
     return items[:limit] if isinstance(items, list) and limit is not None else (items if isinstance(items, list) else [])
 
@@ -978,7 +920,7 @@ def _search_jina(keyword: str, limit: Optional[int], **kwargs) -> List[Dict]:
     cmd = [sys.executable, str(script_path), keyword, "--json"]
     if limit is not None:
         cmd.extend(["-m", str(limit)])
-    data = _run_platform_json_command(cmd, timeout=60, platform="jina")
+    data = _run_platform("jina", cmd, 60, keyword, limit, kwargs)
     items = data.get("results", [])
     return items[:limit] if isinstance(items, list) and limit is not None else (items if isinstance(items, list) else [])
 
@@ -989,7 +931,7 @@ def _search_duckduckgo(keyword: str, limit: Optional[int], **kwargs) -> List[Dic
     cmd = [sys.executable, str(script_path), keyword, "--json"]
     if limit is not None:
         cmd.extend(["-m", str(limit)])
-    data = _run_platform_json_command(cmd, timeout=30, platform="duckduckgo")
+    data = _run_platform("duckduckgo", cmd, 30, keyword, limit, kwargs)
     items = data.get("results", [])
     return items[:limit] if isinstance(items, list) and limit is not None else (items if isinstance(items, list) else [])
 
@@ -1000,7 +942,7 @@ def _search_brave(keyword: str, limit: Optional[int], **kwargs) -> List[Dict]:
     cmd = [sys.executable, str(script_path), keyword, "--json"]
     if limit is not None:
         cmd.extend(["-m", str(limit)])
-    data = _run_platform_json_command(cmd, timeout=30, platform="brave")
+    data = _run_platform("brave", cmd, 30, keyword, limit, kwargs)
     items = data.get("results", [])
     return items[:limit] if isinstance(items, list) and limit is not None else (items if isinstance(items, list) else [])
 
@@ -1011,7 +953,7 @@ def _search_yahoo(keyword: str, limit: Optional[int], **kwargs) -> List[Dict]:
     cmd = [sys.executable, str(script_path), keyword, "--json"]
     if limit is not None:
         cmd.extend(["-m", str(limit)])
-    data = _run_platform_json_command(cmd, timeout=30, platform="yahoo")
+    data = _run_platform("yahoo", cmd, 30, keyword, limit, kwargs)
     items = data.get("results", [])
     return items[:limit] if isinstance(items, list) and limit is not None else (items if isinstance(items, list) else [])
 
@@ -1023,7 +965,7 @@ def _search_yandex(keyword: str, limit: Optional[int], **kwargs) -> List[Dict]:
     if limit is not None:
         cmd.extend(["-m", str(limit)])
     # 不在这里手动固定单个 key，交由 yandex_search.py 内部做多 key 轮换
-    data = _run_platform_json_command(cmd, timeout=30, platform="yandex")
+    data = _run_platform("yandex", cmd, 30, keyword, limit, kwargs)
     items = data.get("results", [])
     return items[:limit] if isinstance(items, list) and limit is not None else (items if isinstance(items, list) else [])
 
@@ -1037,7 +979,7 @@ def _search_bing(keyword: str, limit: Optional[int], **kwargs) -> List[Dict]:
     cmd = [sys.executable, str(script_path), keyword, "--json"]
     if limit is not None:
         cmd.extend(["-m", str(limit)])
-    data = _run_platform_json_command(cmd, timeout=30, platform="bing", env=serpapi_env if serpapi_env else None)
+    data = _run_platform("bing", cmd, 30, keyword, limit, kwargs, env=serpapi_env if serpapi_env else None)
     items = data.get("results", [])
     return items[:limit] if isinstance(items, list) and limit is not None else (items if isinstance(items, list) else [])
 
@@ -1051,7 +993,7 @@ def _search_wikipedia(keyword: str, limit: Optional[int], **kwargs) -> List[Dict
         cmd.extend(["-l", "zh"])
     if limit is not None:
         cmd.extend(["-m", str(limit)])
-    data = _run_platform_json_command(cmd, timeout=30, platform="wikipedia")
+    data = _run_platform("wikipedia", cmd, 30, keyword, limit, kwargs)
     items = data.get("results", [])
     return items[:limit] if isinstance(items, list) and limit is not None else (items if isinstance(items, list) else [])
 
@@ -1062,7 +1004,7 @@ def _search_metaso(keyword: str, limit: Optional[int], **kwargs) -> List[Dict]:
     cmd = [sys.executable, str(script_path), keyword, "--format", "json", "--summary"]
     if limit is not None:
         cmd.extend(["--size", str(limit)])
-    data = _run_platform_json_command(cmd, timeout=60, platform="metaso")
+    data = _run_platform("metaso", cmd, 60, keyword, limit, kwargs)
     items = data.get("webpages", [])
     return items[:limit] if isinstance(items, list) and limit is not None else (items if isinstance(items, list) else [])
 
@@ -1073,7 +1015,7 @@ def _search_volcengine(keyword: str, limit: Optional[int], **kwargs) -> List[Dic
     cmd = [sys.executable, str(script_path), "summary", keyword]
     if limit is not None:
         cmd.extend(["--count", str(limit)])
-    data = _run_platform_json_command(cmd, timeout=60, platform="volcengine")
+    data = _run_platform("volcengine", cmd, 60, keyword, limit, kwargs)
     if isinstance(data, dict) and data.get("error"):
         raise Exception(str(data.get("error")))
     # 兼容不同版本返回结构：
@@ -1119,12 +1061,7 @@ def _search_baidu(keyword: str, limit: Optional[int], **kwargs) -> List[Dict]:
         # 兼容旧配置，自动映射到新脚本读取的变量名。
         env["BAIDU_API_KEY"] = os.getenv("BAIDU_QIANFAN_API_KEY", "")
 
-    data = _run_platform_json_command(
-        cmd,
-        timeout=30,
-        platform="baidu",
-        env=env or None,
-    )
+    data = _run_platform("baidu", cmd, 30, keyword, limit, kwargs, env=env or None)
 
     if isinstance(data, list):
         items = data
@@ -1151,7 +1088,7 @@ def _search_no_api_direct(platform: str, keyword: str, limit: Optional[int], **k
         cmd.extend(["--proxy", str(proxy)])
 
     timeout = int(kwargs.get("timeout", 45))
-    data = _run_platform_json_command(cmd, timeout=timeout, platform=platform)
+    data = _run_platform(platform, cmd, timeout, keyword, limit, kwargs)
     items = data.get("results", []) if isinstance(data, dict) else []
     return items[:limit] if isinstance(items, list) and limit is not None else (items if isinstance(items, list) else [])
 
@@ -1183,7 +1120,7 @@ def _search_xiaoyuzhoufm(keyword: str, limit: Optional[int], **kwargs) -> List[D
     cmd = [sys.executable, str(script_path), keyword, "--json"]
     if limit is not None:
         cmd.extend(["--size", str(limit)])
-    data = _run_platform_json_command(cmd, timeout=60, platform="xiaoyuzhoufm")
+    data = _run_platform("xiaoyuzhoufm", cmd, 60, keyword, limit, kwargs)
     items = data.get("podcasts", []) if isinstance(data, dict) else []
     return items[:limit] if isinstance(items, list) and limit is not None else (items if isinstance(items, list) else [])
 
@@ -1200,7 +1137,7 @@ def _search_mojeek(keyword: str, limit: Optional[int], **kwargs) -> List[Dict]:
         cmd.extend(["--proxy", str(proxy)])
 
     timeout = int(kwargs.get("timeout", 30))
-    data = _run_platform_json_command(cmd, timeout=timeout, platform="mojeek")
+    data = _run_platform("mojeek", cmd, timeout, keyword, limit, kwargs)
     items = data.get("results", []) if isinstance(data, dict) else []
     return items[:limit] if isinstance(items, list) and limit is not None else (items if isinstance(items, list) else [])
 
@@ -1217,7 +1154,7 @@ def _search_duckduckgo_instant(keyword: str, limit: Optional[int], **kwargs) ->
         cmd.extend(["--proxy", str(proxy)])
 
     timeout = int(kwargs.get("timeout", 30))
-    data = _run_platform_json_command(cmd, timeout=timeout, platform="duckduckgo_instant")
+    data = _run_platform("duckduckgo_instant", cmd, timeout, keyword, limit, kwargs)
     items = data.get("results", []) if isinstance(data, dict) else []
     return items[:limit] if isinstance(items, list) and limit is not None else (items if isinstance(items, list) else [])
 
@@ -1239,7 +1176,7 @@ def _search_exa(keyword: str, limit: Optional[int], **kwargs) -> List[Dict]:
     cmd.extend(["--type", search_type])
 
     timeout = int(kwargs.get("timeout", 30))
-    data = _run_platform_json_command(cmd, timeout=timeout, platform="exa", env=env or None)
+    data = _run_platform("exa", cmd, timeout, keyword, limit, kwargs, env=env or None)
     items = data.get("results", []) if isinstance(data, dict) else []
     return items[:limit] if isinstance(items, list) and limit is not None else (items if isinstance(items, list) else [])
 
@@ -1270,7 +1207,7 @@ def _search_serper(keyword: str, limit: Optional[int], **kwargs) -> List[Dict]:
         cmd.extend(["--location", location])
 
     timeout = int(kwargs.get("timeout", 30))
-    data = _run_platform_json_command(cmd, timeout=timeout, platform="serper", env=env or None)
+    data = _run_platform("serper", cmd, timeout, keyword, limit, kwargs, env=env or None)
     items = data.get("results", []) if isinstance(data, dict) else []
     return items[:limit] if isinstance(items, list) and limit is not None else (items if isinstance(items, list) else [])
 
@@ -1279,6 +1216,119 @@ def _search_serper(keyword: str, limit: Optional[int], **kwargs) -> List[Dict]:
 # 并发搜索
 # =============================================================================
 
+def _new_union_results(
+    keyword: str,
+    platforms: List[str],
+    limit: Optional[int],
+    deduplicate: bool,
+    near_duplicates: bool = False
+) -> Dict[str, Any]:
+    """构建聚合结果骨架。"""
+    return {
+        "keyword": keyword,
+        "platforms": platforms,
+        "limit_per_platform": limit,
+        "timestamp": datetime.now().isoformat(),
+        "results": {},
+        "summary": {
+            "total_platforms": len(platforms),
+            "successful": 0,
+            "failed": 0,
+            "total_items": 0,
+            "raw_total_items": 0,
+            "deduplicated_total_items": 0,
+            "deduplicated_removed": 0,
+            "deduplicate_enabled": deduplicate,
+            "near_duplicates_enabled": near_duplicates,
+            "ranking": "completion",
+            "cache_hits": 0,
+            "cache_misses": 0,
+            "skipped_unhealthy": 0,
+            "deferred": 0
+        },
+        "final_items": []
+    }
+
+
+def _platform_failure(platform: str, error: str, timing_ms: int = 0) -> Dict[str, Any]:
+    """构建失败平台的结果。"""
+    return {
+        "platform": platform,
+        "success": False,
+        "error": error,
+        "items": [],
+        "total": 0,
+        "timing_ms": timing_ms,
+    }
+
+
+# 单个平台完成时的回调：on_platform_result(platform, result)
+PlatformResultCallback = Callable[[str, Dict[str, Any]], None]
+# 平台结果合并后的回调：on_new_items(platform, 该平台新增的（去重后）条目)
+NewItemsCallback = Callable[[str, List[Dict[str, Any]]], None]
+
+
+def _new_result_merger(results: Dict[str, Any], **options) -> _ResultMerger:
+    """创建增量合并器，并让 results["final_items"] 在执行过程中实时反映已合并条目。"""
+    merger = _ResultMerger(results["summary"]["deduplicate_enabled"], **options)
+    results["final_items"] = merger.kept
+    return merger
+
+
+def _record_platform_result(
+    results: Dict[str, Any],
+    platform_name: str,
+    result: Dict[str, Any],
+    completed: int,
+    merger: Optional[_ResultMerger] = None
+) -> List[Dict[str, Any]]:
+    """登记单个平台结果、更新汇总计数并增量合并条目，返回新增的（去重后）条目。"""
+    results["results"][platform_name] = result
+    summary = results["summary"]
+    total_platforms = len(results["platforms"])
+    if result.get("cache") == "hit":
+        summary["cache_hits"] += 1
+    elif result.get("cache") in ("miss", "refresh"):
+        summary["cache_misses"] += 1
+
+    if result["success"]:
+        summary["successful"] += 1
+        summary["total_items"] += result["total"]
+        logger.info(f"[{completed}/{total_platforms}] {platform_name}: 成功 ({result['total']} 条)")
+    elif result.get("deferred"):
+        summary["deferred"] += 1
+        logger.warning(f"[{completed}/{total_platforms}] {platform_name}: 配额用尽，已延后")
+    elif result.get("skipped_unhealthy"):
+        summary["skipped_unhealthy"] += 1
+        logger.warning(f"[{completed}/{total_platforms}] {platform_name}: 熔断跳过")
+    else:
+        summary["failed"] += 1
+        logger.warning(f"[{completed}/{total_platforms}] {platform_name}: 失败 - {result['error']}")
+
+    if merger is None:
+        return []
+    added = merger.add(platform_name, result)
+    summary["raw_total_items"] = merger.raw_total
+    summary["deduplicated_removed"] = merger.removed
+    return added
+
+
+def _finalize_union_results(results: Dict[str, Any], merger: _ResultMerger) -> Dict[str, Any]:
+    """生成统一结果视图 final_items（按平台完成顺序，可选去重；融合排序时按 RRF 得分），并交给历史索引后台写入。"""
+    final_items, removed = merger.finalize()
+    record_final_items(results["keyword"], final_items)
+    summary = results["summary"]
+    summary["raw_total_items"] = merger.raw_total
+    summary["deduplicated_total_items"] = len(final_items)
+    summary["deduplicated_removed"] = removed
+    summary["total_items"] = len(final_items)
+    if merger.fusion:
+        summary["ranking"] = "fusion"
+        summary["fusion_top_k"] = merger.top_k
+    results["final_items"] = final_items
+    return results
+
+
 def union_search(
     keyword: str,
     platforms: List[str],
@@ -1286,6 +1336,15 @@ def union_search(
     max_workers: int = 5,
     timeout: int = 60,
     deduplicate: bool = False,
+    on_platform_result: Optional[PlatformResultCallback] = None,
+    on_new_items: Optional[NewItemsCallback] = None,
+    race: Optional[int] = None,
+    min_results: Optional[int] = None,
+    hedge: bool = False,
+    near_duplicates: bool = False,
+    fusion: bool = False,
+    top_k: Optional[int] = None,
+    fusion_dedup: str = "first",
     **kwargs
 ) -> Dict[str, Any]:
     """
@@ -1297,33 +1356,44 @@ def union_search(
         limit: 每个平台返回结果数量 (如果为 None, 使用各平台默认值)
         max_workers: 最大并发数
         timeout: 超时时间（秒）
-        **kwargs: 平台特定参数
+        deduplicate: 是否跨平台去重
+        on_platform_result: 每个平台完成（含失败、超时）时立即调用的回调，用于流式输出
+        on_new_items: 每个平台结果合并后调用，参数为该平台新增的条目（开启去重时已去重），
+            执行过程中 results["final_items"] 也始终是已合并的条目
+        race: 竞速模式，N 个平台返回有效结果后立即结束并取消其余平台
+        min_results: 竞速模式，累计 K 条（去重后）结果后立即结束
+        hedge: 对冲模式，按顺序启动平台，前一个平台超过其 p50 延迟仍未返回时才启动下一个
+        near_duplicates: 去重时合并标题/摘要近似的条目（隐含 deduplicate）
+        fusion: 按 RRF（倒数排名融合）得分全局排序 final_items，多个平台收录的条目靠前
+        top_k: 融合排序后只保留前 K 条（隐含 fusion）
+        fusion_dedup: 融合排序时去重的阶段，first（先去重再排序）或 last（先排序再去重）
+        **kwargs: 平台特定参数（no_cache / refresh 控制结果缓存）
 
     Returns:
         搜索结果字典
     """
-    results = {
-        "keyword": keyword,
-        "platforms": platforms,
-        "limit_per_platform": limit,
-        "timestamp": datetime.now().isoformat(),
-        "results": {},
-        "summary": {
-            "total_platforms": len(platforms),
-            "successful": 0,
-            "failed": 0,
-            "total_items": 0,
-            "raw_total_items": 0,
-            "deduplicated_total_items": 0,
-            "deduplicated_removed": 0,
-            "deduplicate_enabled": deduplicate
-        },
-        "final_items": []
-    }
+    deduplicate = deduplicate or near_duplicates
+    fusion = fusion or top_k is not None
+    if race or min_results or hedge:
+        return _union_search_race(
+            keyword, platforms, limit, timeout, deduplicate, on_platform_result,
+            race=race, min_results=min_results, hedge=hedge, near_duplicates=near_duplicates,
+            fusion=fusion, top_k=top_k, fusion_dedup=fusion_dedup, on_new_items=on_new_items, **kwargs
+        )
+
+    results = _new_union_results(keyword, platforms, limit, deduplicate, near_duplicates)
+    merger = _new_result_merger(
+        results, near_duplicates=near_duplicates, fusion=fusion, top_k=top_k, fusion_dedup=fusion_dedup
+    )
+    deadline = time.monotonic() + timeout
 
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+    # 截止时间一到即返回：未完成的平台标记为超时，不等待其工作线程结束
+    executor = _DaemonThreadExecutor(max_workers, thread_name_prefix="union-search")
+    try:
         futures = {
-            executor.submit(search_platform, platform, keyword, limit, timeout=timeout, **kwargs): platform
+            executor.submit(
+                _call_with_deadline, deadline, search_platform, platform, keyword, limit, timeout=timeout, **kwargs
+            ): platform
             for platform in platforms
         }
 
@@ -1335,29 +1405,19 @@ def union_search(
                 completed += 1
                 completed_futures.add(future)
 
+                added = []
                 try:
                     platform_name, result = future.result()
-                    results["results"][platform_name] = result
-
-                    if result["success"]:
-                        results["summary"]["successful"] += 1
-                        results["summary"]["total_items"] += result["total"]
-                        logger.info(f"[{completed}/{len(platforms)}] {platform_name}: 成功 ({result['total']} 条)")
-                    else:
-                        results["summary"]["failed"] += 1
-                        logger.warning(f"[{completed}/{len(platforms)}] {platform_name}: 失败 - {result['error']}")
-
+                    added = _record_platform_result(results, platform_name, result, completed, merger)
                 except Exception as e:
-                    results["results"][platform] = {
-                        "platform": platform,
-                        "success": False,
-                        "error": str(e),
-                        "items": [],
-                        "total": 0,
-                        "timing_ms": 0
-                    }
+                    platform_name = platform
+                    results["results"][platform] = _platform_failure(platform, str(e))
                     results["summary"]["failed"] += 1
                     logger.error(f"[{completed}/{len(platforms)}] {platform}: 异常 - {e}")
+                if on_platform_result is not None:
+                    on_platform_result(platform_name, results["results"][platform_name])
+                if on_new_items is not None and added:
+                    on_new_items(platform_name, added)
         except FuturesTimeoutError:
             logger.error(f"并发搜索达到超时时间 {timeout}s，部分平台未完成")
 
@@ -1368,45 +1428,492 @@ def union_search(
             future.cancel()
             if platform in results["results"]:
                 continue
-            results["results"][platform] = {
-                "platform": platform,
-                "success": False,
-                "error": f"Timed out after {timeout}s",
-                "items": [],
-                "total": 0,
-                "timing_ms": timeout * 1000,
-            }
+            results["results"][platform] = _platform_failure(platform, f"Timed out after {timeout}s", timeout * 1000)
             results["summary"]["failed"] += 1
             logger.warning(f"[timeout] {platform}: 未在 {timeout}s 内完成")
+            if on_platform_result is not None:
+                on_platform_result(platform, results["results"][platform])
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    return _finalize_union_results(results, merger)
+
+
+# 对冲模式下平台无历史延迟样本时的默认等待时间（秒）
+DEFAULT_HEDGE_DELAY = 2.0
+
 
-    # 聚合成功平台条目，输出统一结果视图（可选去重）
-    merged_items: List[Dict[str, Any]] = []
-    for platform, platform_result in results["results"].items():
-        if not platform_result.get("success"):
+def _union_search_race(
+    keyword: str,
+    platforms: List[str],
+    limit: Optional[int],
+    timeout: int,
+    deduplicate: bool,
+    on_platform_result: Optional[PlatformResultCallback],
+    race: Optional[int] = None,
+    min_results: Optional[int] = None,
+    hedge: bool = False,
+    near_duplicates: bool = False,
+    fusion: bool = False,
+    top_k: Optional[int] = None,
+    fusion_dedup: str = "first",
+    on_new_items: Optional[NewItemsCallback] = None,
+    **kwargs
+) -> Dict[str, Any]:
+    """
+    竞速/对冲搜索：满足 race 或 min_results 条件即返回，其余平台标记为已取消
+
+    平台按列表顺序视为优先级。对冲模式下先只启动第一个平台，当前平台超过
+    其历史 p50 延迟仍未返回（或已失败）时再启动下一个备用平台。
+    """
+    if hedge and not race and not min_results:
+        race = 1
+
+    results = _new_union_results(keyword, platforms, limit, deduplicate, near_duplicates)
+    merger = _new_result_merger(
+        results, near_duplicates=near_duplicates, fusion=fusion, top_k=top_k, fusion_dedup=fusion_dedup
+    )
+    summary = results["summary"]
+    summary["cancelled"] = 0
+    summary["race"] = {"race": race, "min_results": min_results, "hedge": hedge, "satisfied": False, "launched": []}
+
+    stats = get_platform_stats() if hedge else None
+    deadline = time.monotonic() + timeout
+    waiting = list(platforms)
+    futures: Dict[Any, str] = {}
+    launched_at: Dict[str, float] = {}
+    successful_platforms = 0
+    completed = 0
+
+    executor = _DaemonThreadExecutor(max(1, len(platforms)), thread_name_prefix="union-race")
+
+    def launch_next() -> None:
+        platform = waiting.pop(0)
+        future = executor.submit(
+            _call_with_deadline, deadline, search_platform, platform, keyword, limit, timeout=timeout, **kwargs
+        )
+        futures[future] = platform
+        launched_at[platform] = time.monotonic()
+        summary["race"]["launched"].append(platform)
+
+    def hedge_delay(platform: str) -> float:
+        p50 = stats.latency_quantile(platform, 0.5) if stats is not None else None
+        return p50 if p50 is not None else DEFAULT_HEDGE_DELAY
+
+    def satisfied() -> bool:
+        if race and successful_platforms >= race:
+            return True
+        # fusion_dedup=last 时去重推迟到最后，此处按未去重条目计数
+        return bool(min_results) and len(merger.kept) >= min_results
+
+    try:
+        if hedge:
+            launch_next()
+        else:
+            while waiting:
+                launch_next()
+
+        while futures and not satisfied():
+            now = time.monotonic()
+            if now >= deadline:
+                break
+            wait_timeout = deadline - now
+            if hedge and waiting:
+                # 等待最近启动的平台到达其 p50 延迟，超时则启动备用平台
+                newest = list(futures.values())[-1]
+                wait_timeout = min(wait_timeout, max(0.0, launched_at[newest] + hedge_delay(newest) - now))
+
+            done, _ = wait(list(futures), timeout=wait_timeout, return_when=FIRST_COMPLETED)
+            if not done:
+                if hedge and waiting:
+                    logger.info(f"[hedge] {list(futures.values())[-1]} 超过 p50 延迟，启动备用平台 {waiting[0]}")
+                    launch_next()
+                continue
+
+            for future in done:
+                platform = futures.pop(future)
+                completed += 1
+                try:
+                    platform_name, result = future.result()
+                except Exception as e:
+                    platform_name, result = platform, _platform_failure(platform, str(e))
+                added = _record_platform_result(results, platform_name, result, completed, merger)
+                if on_platform_result is not None:
+                    on_platform_result(platform_name, result)
+                if on_new_items is not None and added:
+                    on_new_items(platform_name, added)
+
+                if result.get("success") and result.get("total", 0) > 0:
+                    successful_platforms += 1
+                elif hedge and waiting:
+                    # 当前平台失败或无结果，立即启动下一个备用平台
+                    launch_next()
+
+            if hedge and waiting and not futures and not satisfied():
+                launch_next()
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    summary["race"]["satisfied"] = satisfied()
+    reason = "Cancelled: race satisfied" if satisfied() else f"Timed out after {timeout}s"
+    for platform in list(futures.values()) + waiting:
+        if platform in results["results"]:
             continue
-        for item in platform_result.get("items", []):
-            if isinstance(item, dict):
-                merged_item = dict(item)
-                merged_item["_source_platform"] = platform
-                merged_items.append(merged_item)
-
-    raw_total = len(merged_items)
-    results["summary"]["raw_total_items"] = raw_total
-
-    if deduplicate:
-        final_items, removed = _deduplicate_items(merged_items)
-        dedup_total = len(final_items)
-        results["summary"]["deduplicated_total_items"] = dedup_total
-        results["summary"]["deduplicated_removed"] = removed
-        results["summary"]["total_items"] = dedup_total
-        results["final_items"] = final_items
-    else:
-        results["summary"]["deduplicated_total_items"] = raw_total
-        results["summary"]["deduplicated_removed"] = 0
-        results["summary"]["total_items"] = raw_total
-        results["final_items"] = merged_items
+        skipped = _platform_failure(platform, reason)
+        if satisfied():
+            skipped["cancelled"] = True
+            summary["cancelled"] += 1
+        else:
+            summary["failed"] += 1
+        results["results"][platform] = skipped
+        if on_platform_result is not None:
+            on_platform_result(platform, skipped)
 
-    return results
+    return _finalize_union_results(results, merger)
+
+
+async def union_search_async(
+    keyword: str,
+    platforms: List[str],
+    limit: Optional[int] = None,
+    max_workers: Optional[int] = None,
+    timeout: int = 60,
+    deduplicate: bool = False,
+    platform_timeouts: Optional[Dict[str, float]] = None,
+    on_platform_result: Optional[PlatformResultCallback] = None,
+    on_new_items: Optional[NewItemsCallback] = None,
+    race: Optional[int] = None,
+    min_results: Optional[int] = None,
+    hedge: bool = False,
+    near_duplicates: bool = False,
+    fusion: bool = False,
+    top_k: Optional[int] = None,
+    fusion_dedup: str = "first",
+    **kwargs
+) -> Dict[str, Any]:
+    """
+    基于 asyncio 的并发搜索，每个平台独立截止时间
+
+    所有平台同时启动（不设并发上限），单个平台超过自身截止时间即被放弃：
+    子进程平台的子进程会在截止时间被终止，进程内平台的结果直接丢弃，
+    总耗时取决于最慢的按时完成的平台，而不是最慢的平台。
+
+    Args:
+        keyword: 搜索关键词
+        platforms: 平台列表
+        limit: 每个平台返回结果数量 (如果为 None, 使用各平台默认值)
+        max_workers: 最大并发数（None 表示所有平台同时执行）
+        timeout: 每个平台的默认超时时间（秒）
+        deduplicate: 是否跨平台去重
+        platform_timeouts: 按平台覆盖超时时间，如 {"serper": 5}
+        on_platform_result: 每个平台完成时立即调用的回调，用于流式输出
+        on_new_items: 每个平台结果合并后调用，参数为该平台新增的条目（与 union_search 一致）
+        race / min_results / hedge: 竞速与对冲模式（与 union_search 一致），在工作线程中
+            执行，回调也在该线程中调用；不支持 platform_timeouts
+        near_duplicates: 去重时合并标题/摘要近似的条目（隐含 deduplicate）
+        fusion / top_k / fusion_dedup: 融合排序参数（与 union_search 一致）
+        **kwargs: 平台特定参数（与 union_search 一致）
+
+    Returns:
+        搜索结果字典（结构与 union_search 一致）
+
+    Raises:
+        ValueError: 竞速/对冲模式与 platform_timeouts 同时指定
+    """
+    deduplicate = deduplicate or near_duplicates
+    fusion = fusion or top_k is not None
+    if race or min_results or hedge:
+        if platform_timeouts:
+            raise ValueError("platform_timeouts is not supported with race / min_results / hedge")
+        return await asyncio.to_thread(
+            _union_search_race, keyword, platforms, limit, timeout, deduplicate, on_platform_result,
+            race=race, min_results=min_results, hedge=hedge, near_duplicates=near_duplicates,
+            fusion=fusion, top_k=top_k, fusion_dedup=fusion_dedup, on_new_items=on_new_items, **kwargs
+        )
+    results = _new_union_results(keyword, platforms, limit, deduplicate, near_duplicates)
+    merger = _new_result_merger(
+        results, near_duplicates=near_duplicates, fusion=fusion, top_k=top_k, fusion_dedup=fusion_dedup
+    )
+    if not platforms:
+        return _finalize_union_results(results, merger)
+
+    loop = asyncio.get_running_loop()
+    executor = _DaemonThreadExecutor(max_workers or len(platforms), thread_name_prefix="union-search")
+    started = time.monotonic()
+
+    async def run_platform(platform: str) -> Tuple[str, Dict[str, Any]]:
+        platform_timeout = (platform_timeouts or {}).get(platform, timeout)
+        call = functools.partial(
+            _call_with_deadline,
+            started + platform_timeout,
+            search_platform,
+            platform,
+            keyword,
+            limit,
+            timeout=platform_timeout,
+            **kwargs
+        )
+        try:
+            return await asyncio.wait_for(loop.run_in_executor(executor, call), timeout=platform_timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"[timeout] {platform}: 未在 {platform_timeout}s 内完成")
+            return platform, _platform_failure(
+                platform, f"Timed out after {platform_timeout}s", int(platform_timeout * 1000)
+            )
+        except Exception as e:
+            logger.error(f"{platform}: 异常 - {e}")
+            return platform, _platform_failure(platform, str(e))
+
+    try:
+        completed = 0
+        for next_done in asyncio.as_completed([run_platform(platform) for platform in platforms]):
+            platform_name, result = await next_done
+            completed += 1
+            added = _record_platform_result(results, platform_name, result, completed, merger)
+            if on_platform_result is not None:
+                on_platform_result(platform_name, result)
+            if on_new_items is not None and added:
+                on_new_items(platform_name, added)
+    finally:
+        # 不等待超时平台的工作线程，避免拖慢整体返回
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    return _finalize_union_results(results, merger)
+
+
+# 批量模式：每个平台跨所有查询的默认并发上限
+DEFAULT_BATCH_PLATFORM_CONCURRENCY = int(os.environ.get("UNION_SEARCH_BATCH_PLATFORM_CONCURRENCY") or 2)
+# 批量模式的默认全局并发调用数
+DEFAULT_BATCH_WORKERS = 16
+# 查询来源尚未读完时，调度循环等待已提交调用的最长时间（秒），以便及时接收新查询
+_BATCH_POLL_INTERVAL = 0.2
+
+# 批量模式中单个查询完成时的回调：on_query_result(查询条目, 该查询的聚合结果)
+QueryResultCallback = Callable[[Dict[str, Any], Dict[str, Any]], None]
+
+
+class _BatchQuery:
+    """批量模式中一个查询的执行状态，查询完成并交付后即释放。"""
+
+    def __init__(
+        self,
+        seq: int,
+        entry: Dict[str, Any],
+        platforms: List[str],
+        limit: Optional[int],
+        deduplicate: bool,
+        near_duplicates: bool,
+        merger_options: Dict[str, Any]
+    ):
+        self.seq = seq
+        self.entry = entry
+        self.keyword = entry["query"]
+        self.limit = limit
+        self.results = _new_union_results(self.keyword, platforms, limit, deduplicate, near_duplicates)
+        self.merger = _new_result_merger(self.results, near_duplicates=near_duplicates, **merger_options)
+        self.remaining = len(platforms)
+        self.completed = 0
+
+
+def _read_queries_ahead(queries: Iterable[Dict[str, Any]], buffer: "queue.Queue") -> None:
+    """在后台线程中读取查询来源，读完时放入 None；读取出错时放入异常。"""
+    try:
+        for entry in queries:
+            buffer.put(entry)
+    except BaseException as e:  # noqa: BLE001 - 交给调度线程重新抛出
+        buffer.put(e)
+        return
+    buffer.put(None)
+
+
+def union_search_batch(
+    queries: Iterable[Dict[str, Any]],
+    platforms: List[str],
+    limit: Optional[int] = None,
+    max_workers: int = DEFAULT_BATCH_WORKERS,
+    timeout: int = 60,
+    deduplicate: bool = False,
+    platform_concurrency: Optional[Dict[str, int]] = None,
+    default_platform_concurrency: int = DEFAULT_BATCH_PLATFORM_CONCURRENCY,
+    on_query_result: Optional[QueryResultCallback] = None,
+    max_pending_queries: Optional[int] = None,
+    near_duplicates: bool = False,
+    fusion: bool = False,
+    top_k: Optional[int] = None,
+    fusion_dedup: str = "first",
+    **kwargs
+) -> Dict[str, Any]:
+    """
+    批量搜索：多个查询共用一个全局调度器
+
+    每个 (查询, 平台) 调用进入该平台的等待队列。全局最多 max_workers 个调用同时
+    执行，且每个平台同时执行的调用数（跨所有查询）不超过其并发上限；某个平台
+    排队不会占用其他平台的执行名额。有空闲名额时优先调度较早读入的查询，查询的
+    所有平台完成后立即合并并交给 on_query_result，随后释放该查询的状态。
+
+    单个调用的 timeout 从工作线程开始执行时计时。超时的调用立即记为失败，但其
+    工作线程无法中断，运行结束前仍占用全局与平台名额。
+
+    queries 在后台线程中逐条读取，最多预读 max_pending_queries 个未完成查询，
+    因此可以直接传入逐行读取的大文件或 stdin。结果缓存、HTTP 会话、限速器与
+    健康统计都是进程级的，所有查询共享。
+
+    Args:
+        queries: 查询条目 {"query": 关键词, "platforms": 可选平台列表, "limit": 可选数量, ...}，
+            其余字段原样交给回调
+        platforms: 条目未指定 platforms 时使用的平台列表
+        limit: 条目未指定 limit 时每个平台返回结果数量
+        max_workers: 全局最大并发调用数
+        timeout: 单个平台调用的超时时间（秒）
+        deduplicate: 是否跨平台去重（在每个查询内部）
+        platform_concurrency: 按平台覆盖并发上限，如 {"google": 4}
+        default_platform_concurrency: 其余平台的并发上限
+        on_query_result: 每个查询完成时在调度线程中调用，参数为 (查询条目, 聚合结果)
+        max_pending_queries: 同时持有的未完成查询数上限（默认 max_workers 的 4 倍）
+        near_duplicates / fusion / top_k / fusion_dedup: 与 union_search 一致
+        **kwargs: 平台特定参数（与 union_search 一致）
+
+    Returns:
+        批量汇总：查询数、平台调用数、成功/失败/超时计数、缓存命中数与总耗时
+    """
+    deduplicate = deduplicate or near_duplicates
+    merger_options = {"fusion": fusion or top_k is not None, "top_k": top_k, "fusion_dedup": fusion_dedup}
+    max_workers = max(1, max_workers)
+    max_pending_queries = max(1, max_pending_queries or max_workers * 4)
+    limits = platform_concurrency or {}
+    started = time.monotonic()
+    summary = {
+        "queries": 0,
+        "failed_queries": 0,
+        "calls": 0,
+        "successful_calls": 0,
+        "failed_calls": 0,
+        "timed_out_calls": 0,
+        "cache_hits": 0,
+        "max_workers": max_workers,
+        "platform_concurrency": {"default": max(1, default_platform_concurrency), **limits},
+    }
+
+    # 各平台等待执行的查询（按读入顺序）与正在执行的调用数
+    waiting: Dict[str, deque] = {}
+    running: Dict[str, int] = {}
+    # 调用 -> (查询, 平台, 截止时间)；截止时间由工作线程开始执行时写入，未开始时为空列表
+    futures: Dict[Any, Tuple[_BatchQuery, str, List[float]]] = {}
+    # 已按超时记录、但工作线程仍在运行的调用（future -> 平台），结束前继续占用全局与平台名额
+    abandoned: Dict[Any, str] = {}
+    pending = 0
+    source_done = False
+    buffer: "queue.Queue" = queue.Queue(maxsize=max_pending_queries)
+    threading.Thread(target=_read_queries_ahead, args=(queries, buffer), name="union-batch-reader", daemon=True).start()
+
+    def capacity(platform: str) -> int:
+        return max(1, limits.get(platform, default_platform_concurrency))
+
+    def finish(state: _BatchQuery) -> None:
+        nonlocal pending
+        pending -= 1
+        results = _finalize_union_results(state.results, state.merger)
+        if results["summary"]["failed"]:
+            summary["failed_queries"] += 1
+        if on_query_result is not None:
+            on_query_result(state.entry, results)
+
+    def record(state: _BatchQuery, platform: str, result: Dict[str, Any]) -> None:
+        state.completed += 1
+        state.remaining -= 1
+        _record_platform_result(state.results, platform, result, state.completed, state.merger)
+        summary["calls"] += 1
+        summary["successful_calls" if result.get("success") else "failed_calls"] += 1
+        if result.get("cache") == "hit":
+            summary["cache_hits"] += 1
+        if state.remaining == 0:
+            finish(state)
+
+    def admit(block: bool) -> None:
+        nonlocal pending, source_done
+        while not source_done and pending < max_pending_queries:
+            try:
+                entry = buffer.get(timeout=_BATCH_POLL_INTERVAL) if block else buffer.get_nowait()
+            except queue.Empty:
+                return
+            block = False
+            if entry is None:
+                source_done = True
+                return
+            if isinstance(entry, BaseException):
+                raise entry
+            query_platforms = list(entry.get("platforms") or platforms)
+            query_limit = entry.get("limit") if entry.get("limit") is not None else limit
+            state = _BatchQuery(
+                summary["queries"], entry, query_platforms, query_limit, deduplicate, near_duplicates, merger_options
+            )
+            summary["queries"] += 1
+            pending += 1
+            if not query_platforms:
+                finish(state)
+            for platform in query_platforms:
+                waiting.setdefault(platform, deque()).append(state)
+
+    def dispatch() -> None:
+        while len(futures) + len(abandoned) < max_workers:
+            ready = [p for p, states in waiting.items() if states and running.get(p, 0) < capacity(p)]
+            if not ready:
+                return
+            platform = min(ready, key=lambda p: waiting[p][0].seq)
+            state = waiting[platform].popleft()
+            running[platform] = running.get(platform, 0) + 1
+            began: List[float] = []
+            future = executor.submit(
+                _call_with_timeout, timeout, began, search_platform, platform, state.keyword, state.limit,
+                timeout=timeout, **kwargs
+            )
+            futures[future] = (state, platform, began)
+
+    executor = _DaemonThreadExecutor(max_workers, thread_name_prefix="union-batch")
+    try:
+        while True:
+            # 没有在运行的调用时阻塞等待新查询，否则只取已读入的查询
+            admit(block=not futures and not abandoned)
+            dispatch()
+            if not futures:
+                if source_done and pending == 0:
+                    break
+                if not abandoned:
+                    continue
+
+            deadlines = [began[0] for _, _, began in futures.values() if began]
+            wait_timeout = max(0.0, min(deadlines) - time.monotonic()) if deadlines else None
+            # 查询未读完，或有调用尚未开始计时（截止时间未知）时定期醒来
+            if not source_done or len(deadlines) < len(futures):
+                wait_timeout = _BATCH_POLL_INTERVAL if wait_timeout is None else min(wait_timeout, _BATCH_POLL_INTERVAL)
+            done, _ = wait([*futures, *abandoned], timeout=wait_timeout, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future in abandoned:
+                    running[abandoned.pop(future)] -= 1
+                    continue
+                state, platform, _ = futures.pop(future)
+                running[platform] -= 1
+                try:
+                    platform_name, result = future.result()
+                except Exception as e:
+                    platform_name, result = platform, _platform_failure(platform, str(e))
+                record(state, platform_name, result)
+
+            # 超过截止时间仍未返回的调用按超时记录；工作线程结束前仍占用名额
+            now = time.monotonic()
+            for future, (state, platform, began) in list(futures.items()):
+                if not began or now < began[0] or future.done():
+                    continue
+                del futures[future]
+                abandoned[future] = platform
+                summary["timed_out_calls"] += 1
+                logger.warning(f"[timeout] {platform} ({state.keyword}): 未在 {timeout}s 内完成")
+                record(state, platform, _platform_failure(platform, f"Timed out after {timeout}s", timeout * 1000))
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    summary["duration_ms"] = int((time.monotonic() - started) * 1000)
+    return summary
 
 
 # =============================================================================
@@ -1577,6 +2084,61 @@ def parse_args():
         action="store_true",
         help="启用跨平台结果去重（按标题或链接）"
     )
+    parser.add_argument(
+        "--near-duplicates",
+        action="store_true",
+        help="去重时合并标题/摘要近似的条目（MinHash，隐含 --deduplicate）"
+    )
+    parser.add_argument(
+        "--fusion",
+        action="store_true",
+        help="按倒数排名融合（RRF）得分全局排序结果，多个平台收录的条目靠前"
+    )
+    parser.add_argument(
+        "--top-k",
+        type=int,
+        metavar="K",
+        help="融合排序后只保留前 K 条（隐含 --fusion）"
+    )
+    parser.add_argument(
+        "--fusion-dedup",
+        choices=FUSION_DEDUP_STAGES,
+        default="first",
+        help="融合排序时去重的阶段：first 先去重再排序（默认），last 先排序再去重，凑满 top-k 即停止"
+    )
+    parser.add_argument(
+        "--race",
+        type=int,
+        metavar="N",
+        help="竞速模式：N 个平台返回有效结果后立即结束并取消其余平台"
+    )
+    parser.add_argument(
+        "--min-results",
+        type=int,
+        metavar="K",
+        help="竞速模式：累计 K 条（去重后）结果后立即结束"
+    )
+    parser.add_argument(
+        "--hedge",
+        action="store_true",
+        help="对冲模式：按顺序启动平台，当前平台超过其 p50 延迟仍未返回时才启动备用平台"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="不读取也不写入结果缓存"
+    )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="忽略已有缓存，重新搜索并更新缓存"
+    )
+    parser.add_argument(
+        "--execution",
+        choices=EXECUTION_MODES,
+        default=DEFAULT_EXECUTION_MODE,
+        help=f"平台执行方式（默认: {DEFAULT_EXECUTION_MODE}；subprocess 为逐平台启动子进程）"
+    )
     parser.add_argument(
         "--read-url",
         metavar="URL",
@@ -1715,7 +2277,17 @@ def main():
         limit=args.limit,
         max_workers=args.max_workers,
         timeout=args.timeout,
-        deduplicate=args.deduplicate
+        deduplicate=args.deduplicate,
+        execution=args.execution,
+        no_cache=args.no_cache,
+        refresh=args.refresh,
+        race=args.race,
+        min_results=args.min_results,
+        hedge=args.hedge,
+        near_duplicates=args.near_duplicates,
+        fusion=args.fusion,
+        top_k=args.top_k,
+        fusion_dedup=args.fusion_dedup
     )
     elapsed = (datetime.now() - start_time).total_seconds()
 
@@ -1747,7 +2319,7 @@ def main():
         results=results["final_items"],
         metadata=metadata
     )
-    logger.info(f"搜索日志已保存到: {log_filepath}")
+    logger.info(f"搜索日志已归档到: {log_filepath}")
 
     # 格式化输出
     if args.json or (args.output and args.output.endswith(".json")):
@@ -8,7 +8,9 @@ URL to Markdown 引擎模块
 from .jina_engine import JinaEngine
 from .defuddle_engine import DefuddleEngine
 from .firecrawl_engine import FirecrawlEngine
-from typing import Dict, Any, Optional, Tuple, List
+from typing import Dict, Any, Iterator, Optional, Tuple, List
+
+from common.batch_fetch import fetch_concurrently
 
 __version__ = "2.1.0"
 __author__ = "Claude"
@@ -153,30 +155,22 @@ class UrlToMarkdown:
     def fetch_batch(
         self,
         urls: List[str],
+        max_workers: Optional[int] = None,
+        per_host: Optional[int] = None,
+        host_delay: Optional[float] = None,
+        deadline: Optional[float] = None,
         **kwargs
-    ) -> List[Dict[str, Any]]:
-        """
-        批量获取多个 URL 的 Markdown 内容
-
-        Args:
-            urls: URL 列表
-            **kwargs: fetch() 方法的其他参数
-
-        Returns:
-            结果列表
-        """
-        results = []
-        for url in urls:
-            try:
-                result = self.fetch(url, **kwargs)
-                results.append(result)
-            except Exception as e:
-                results.append({
-                    "url": url,
-                    "error": str(e),
-                    "content": None,
-                })
-        return results
+    ) -> Iterator[Dict[str, Any]]:
+        """并发批量获取多个 URL 的 Markdown 内容，按完成顺序逐条产出（每个 URL 仍按引擎顺序降级）；参数与结果见 common.batch_fetch.fetch_concurrently"""
+        return fetch_concurrently(
+            self.fetch,
+            urls,
+            max_workers=max_workers,
+            per_host=per_host,
+            host_delay=host_delay,
+            deadline=deadline,
+            **kwargs,
+        )
 
 
 def fetch_url_as_markdown(
@@ -0,0 +1,104 @@
+#!/usr/bin/env node
+/**
+ * Defuddle worker - long-lived process for defuddle_pool.py
+ *
+ * Speaks line-delimited JSON-RPC 2.0 over stdin/stdout, one JSON object per line:
+ *
+ *   -> {"jsonrpc": "2.0", "id": 1, "method": "parse", "params": {"url": "...", "markdown": true, "timeoutMs": 60000}}
+ *   <- {"jsonrpc": "2.0", "id": 1, "result": {"title": "...", "content": "...", "description": "...", ...}}
+ *   -> {"jsonrpc": "2.0", "id": 2, "method": "ping"}
+ *   <- {"jsonrpc": "2.0", "id": 2, "result": {"pid": 1234, "jobs": 1, "rss": 73400320}}
+ *
+ * A single parse returns the Markdown content together with all metadata, so callers
+ * no longer need a second `cli.js parse --json` run. The process exits once stdin closes
+ * and in-flight requests have answered.
+ */
+
+import { createInterface } from 'node:readline';
+import { JSDOM, VirtualConsole } from 'jsdom';
+import { Defuddle } from './dist/node.js';
+
+const USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36';
+const DEFAULT_TIMEOUT_MS = 60000;
+
+// stdout carries the protocol only; route any library logging to stderr.
+for (const method of ['log', 'info', 'debug', 'warn']) {
+  console[method] = (...args) => console.error(...args);
+}
+
+let jobs = 0;
+let inFlight = 0;
+let closing = false;
+
+function send(message) {
+  process.stdout.write(JSON.stringify({ jsonrpc: '2.0', ...message }) + '\n');
+}
+
+async function parse({ url, markdown = true, debug = false, timeoutMs = DEFAULT_TIMEOUT_MS }) {
+  if (!/^https?:\/\//i.test(url || '')) {
+    throw new Error(`Invalid URL: ${url}`);
+  }
+  const response = await fetch(url, {
+    headers: { 'User-Agent': USER_AGENT, 'Accept': 'text/html,application/xhtml+xml' },
+    redirect: 'follow',
+    signal: AbortSignal.timeout(timeoutMs),
+  });
+  if (!response.ok) {
+    throw new Error(`HTTP ${response.status} fetching ${url}`);
+  }
+  const html = await response.text();
+  const dom = new JSDOM(html, { url: response.url || url, virtualConsole: new VirtualConsole() });
+  try {
+    return await Defuddle(dom, response.url || url, { markdown, debug });
+  } finally {
+    dom.window.close();
+  }
+}
+
+const handlers = {
+  parse,
+  ping: async () => ({ pid: process.pid, jobs, rss: process.memoryUsage().rss }),
+};
+
+async function handle(line) {
+  let request;
+  try {
+    request = JSON.parse(line);
+  } catch (err) {
+    send({ id: null, error: { code: -32700, message: `Parse error: ${err.message}` } });
+    return;
+  }
+  const handler = handlers[request.method];
+  if (!handler) {
+    send({ id: request.id ?? null, error: { code: -32601, message: `Unknown method: ${request.method}` } });
+    return;
+  }
+  if (request.method === 'parse') {
+    jobs += 1;
+  }
+  inFlight += 1;
+  try {
+    send({ id: request.id ?? null, result: await handler(request.params || {}) });
+  } catch (err) {
+    send({ id: request.id ?? null, error: { code: -32000, message: err && err.message ? err.message : String(err) } });
+  } finally {
+    inFlight -= 1;
+    if (closing && inFlight === 0) {
+      process.exit(0);
+    }
+  }
+}
+
+const lines = createInterface({ input: process.stdin, crlfDelay: Infinity });
+lines.on('line', (line) => {
+  if (line.trim()) {
+    handle(line);
+  }
+});
+// stdin closed: finish in-flight requests, then exit (idle keep-alive sockets would otherwise linger)
+lines.on('close', () => {
+  closing = true;
+  if (inFlight === 0) {
+    process.exit(0);
+  }
+});
@@ -10,14 +10,20 @@ import json
 import subprocess
 import sys
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, Iterator, List
+
+# 批量调度器位于 scripts/common
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from common.batch_fetch import fetch_concurrently
+
+from .defuddle_pool import get_defuddle_pool
 
 
 class DefuddleEngine:
     """
-    Defuddle CLI 引擎
+    Defuddle 引擎
 
-    通过子进程调用 Node.js Defuddle CLI 进行网页内容提取。
+    通过常驻 Node.js 工作进程（或 Defuddle CLI 子进程）进行网页内容提取。
     作为 Jina AI 的备选引擎使用。
     """
 
@@ -50,6 +56,9 @@ class DefuddleEngine:
         """
         使用 Defuddle 提取网页内容
 
+        优先交给常驻的 Node 工作进程池（见 defuddle_pool），进程池不可用时启动一次
+        CLI；两种方式都只解析一次页面，同时得到正文与元数据。
+
         Args:
             url: 要提取的网页 URL
             markdown: 是否输出 Markdown 格式
@@ -61,106 +70,82 @@ class DefuddleEngine:
         """
         request_timeout = timeout or self.timeout
 
-        # 构建命令
-        cmd = ["node", self.cli_path, "parse", url]
+        pool = get_defuddle_pool()
+        if pool is not None:
+            data = pool.parse(url, markdown=markdown, timeout=request_timeout)
+        else:
+            data = self._parse_with_cli(url, markdown, request_timeout)
 
+        if json_output:
+            return {
+                "url": url,
+                "title": data.get("title", ""),
+                "content": data.get("content", ""),
+                "description": data.get("description", ""),
+                "domain": data.get("domain", ""),
+                "favicon": data.get("favicon", ""),
+                "image": data.get("image", ""),
+                "author": data.get("author", ""),
+                "published": data.get("published", ""),
+                "meta_tags": data.get("metaTags", []),
+                "markdown": data.get("content", ""),
+            }
+
+        content = (data.get("content") or "").strip()
+        return {
+            "url": url,
+            "title": data.get("title", ""),
+            "content": content,
+            "markdown": content,
+            "description": data.get("description", ""),
+            "domain": data.get("domain", ""),
+        }
+
+    def _parse_with_cli(self, url: str, markdown: bool, timeout: int) -> Dict[str, Any]:
+        """启动一次 Defuddle CLI（--json），返回解析结果"""
+        cmd = ["node", self.cli_path, "parse", url, "--json"]
         if markdown:
             cmd.append("--markdown")
-        if json_output:
-            cmd.append("--json")
 
         try:
             result = subprocess.run(
                 cmd,
                 capture_output=True,
                 text=True,
-                timeout=request_timeout,
+                timeout=timeout,
             )
-
-            if result.returncode != 0:
-                error_msg = result.stderr.strip() or f"Exit code: {result.returncode}"
-                raise RuntimeError(f"Defuddle failed: {error_msg}")
-
-            # 解析输出
-            if json_output:
-                # JSON 输出
-                try:
-                    data = json.loads(result.stdout)
-                    return {
-                        "url": url,
-                        "title": data.get("title", ""),
-                        "content": data.get("content", ""),
-                        "description": data.get("description", ""),
-                        "domain": data.get("domain", ""),
-                        "favicon": data.get("favicon", ""),
-                        "image": data.get("image", ""),
-                        "author": data.get("author", ""),
-                        "published": data.get("published", ""),
-                        "meta_tags": data.get("metaTags", []),
-                        "markdown": data.get("content", ""),
-                    }
-                except json.JSONDecodeError as e:
-                    raise RuntimeError(f"Failed to parse JSON output: {e}")
-            else:
-                # Markdown 输出 - 同时也获取 JSON 来提取元数据
-                cmd_with_json = ["node", self.cli_path, "parse", url, "--json"]
-                json_result = subprocess.run(
-                    cmd_with_json,
-                    capture_output=True,
-                    text=True,
-                    timeout=request_timeout,
-                )
-
-                metadata = {}
-                if json_result.returncode == 0:
-                    try:
-                        metadata = json.loads(json_result.stdout)
-                    except json.JSONDecodeError:
-                        pass
-
-                content = result.stdout.strip()
-                title = metadata.get("title", "")
-
-                return {
-                    "url": url,
-                    "title": title,
-                    "content": content,
-                    "markdown": content,
-                    "description": metadata.get("description", ""),
-                    "domain": metadata.get("domain", ""),
-                }
-
         except subprocess.TimeoutExpired:
-            raise RuntimeError(f"Defuddle request timed out after {request_timeout} seconds")
+            raise RuntimeError(f"Defuddle request timed out after {timeout} seconds")
         except FileNotFoundError:
             raise RuntimeError(
                 "Node.js not found. Please install Node.js to use Defuddle."
             )
 
+        if result.returncode != 0:
+            error_msg = result.stderr.strip() or f"Exit code: {result.returncode}"
+            raise RuntimeError(f"Defuddle failed: {error_msg}")
+
+        try:
+            return json.loads(result.stdout)
+        except json.JSONDecodeError as e:
+            raise RuntimeError(f"Failed to parse JSON output: {e}")
+
     def fetch_batch(
         self,
         urls: List[str],
+        max_workers: Optional[int] = None,
+        per_host: Optional[int] = None,
+        host_delay: Optional[float] = None,
+        deadline: Optional[float] = None,
         **kwargs
-    ) -> List[Dict[str, Any]]:
-        """
-        批量获取多个 URL 的 Markdown 内容
-
-        Args:
-            urls: URL 列表
-            **kwargs: fetch() 方法的其他参数
-
-        Returns:
-            结果列表
-        """
-        results = []
-        for url in urls:
-            try:
-                result = self.fetch(url, **kwargs)
-                results.append(result)
-            except Exception as e:
-                results.append({
-                    "url": url,
-                    "error": str(e),
-                    "content": None,
-                })
-        return results
+    ) -> Iterator[Dict[str, Any]]:
+        """并发批量获取多个 URL 的 Markdown 内容，按完成顺序逐条产出；参数与结果见 common.batch_fetch.fetch_concurrently"""
+        return fetch_concurrently(
+            self.fetch,
+            urls,
+            max_workers=max_workers,
+            per_host=per_host,
+            host_delay=host_delay,
+            deadline=deadline,
+            **kwargs,
+        )
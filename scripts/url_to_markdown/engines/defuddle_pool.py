@@ -0,0 +1,301 @@
+#!/usr/bin/env python3
+"""
+Defuddle Node 工作进程池
+
+DefuddleEngine 原先每个 URL 启动两次 node（一次 --markdown 取正文，一次 --json
+取标题等元数据），页面也抓取两次。本模块维护常驻的 Node 工作进程
+（defuddle-node/worker.mjs），通过 stdin/stdout 上的逐行 JSON-RPC 通信，一次
+解析同时返回 Markdown 正文与元数据，省去 Node 冷启动与重复抓取。
+
+- 并发受限：最多 size 个工作进程，每个进程同一时间只处理一个请求，其余调用方排队
+- 健康检查：取用前确认进程存活，空闲超过 HEALTH_INTERVAL 秒的进程先 ping 一次
+- 定期回收：处理满 max_jobs 个请求的进程退出并在下次需要时重建，限制 jsdom 内存增长
+- 请求超时或协议异常的进程直接终止，不再复用
+
+环境变量:
+    UNION_SEARCH_DEFUDDLE_POOL      设为 0 关闭进程池，每个 URL 启动一次 CLI
+    UNION_SEARCH_DEFUDDLE_WORKERS   工作进程数（默认 2）
+    UNION_SEARCH_DEFUDDLE_MAX_JOBS  单个进程处理多少个请求后回收（默认 200）
+"""
+
+import atexit
+import itertools
+import json
+import os
+import queue
+import shutil
+import subprocess
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+
+def _env_number(name: str, default, cast):
+    try:
+        return cast(os.environ.get(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+DEFUDDLE_ROOT = Path(__file__).parent / "defuddle-node"
+WORKER_SCRIPT = DEFUDDLE_ROOT / "worker.mjs"
+DEFUDDLE_NODE_MODULE = DEFUDDLE_ROOT / "dist" / "node.js"
+
+POOL_SIZE: int = _env_number("UNION_SEARCH_DEFUDDLE_WORKERS", 2, int)
+MAX_JOBS: int = _env_number("UNION_SEARCH_DEFUDDLE_MAX_JOBS", 200, int)
+# 空闲超过该秒数的进程在取用前先做健康检查
+HEALTH_INTERVAL = 30.0
+PING_TIMEOUT = 5.0
+# 工作进程收到 EOF 后等待退出的时间（秒）
+_STOP_TIMEOUT = 2.0
+
+
+def pool_enabled() -> bool:
+    return os.environ.get("UNION_SEARCH_DEFUDDLE_POOL", "1").strip().lower() not in ("0", "false", "no", "off")
+
+
+def pool_available() -> bool:
+    """进程池可用：未关闭、已安装 Node.js 且 Defuddle 已构建。"""
+    return pool_enabled() and shutil.which("node") is not None and DEFUDDLE_NODE_MODULE.exists()
+
+
+class DefuddleWorkerError(RuntimeError):
+    """工作进程返回的解析错误（进程本身仍可复用）。"""
+
+
+class _CallTimeout(RuntimeError):
+    pass
+
+
+class _Worker:
+    """一个 Node 工作进程；后台线程读取 stdout，按行放入队列。"""
+
+    def __init__(self, script: Path):
+        self.process = subprocess.Popen(
+            ["node", str(script)],
+            cwd=str(script.parent),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            encoding="utf-8",
+            bufsize=1,
+        )
+        self.jobs = 0
+        self.last_used = time.monotonic()
+        self._ids = itertools.count(1)
+        self._lines: "queue.Queue[Optional[str]]" = queue.Queue()
+        threading.Thread(target=self._read, name="defuddle-worker-reader", daemon=True).start()
+
+    def _read(self) -> None:
+        for line in self.process.stdout:
+            self._lines.put(line)
+        self._lines.put(None)
+
+    def alive(self) -> bool:
+        return self.process.poll() is None
+
+    def call(self, method: str, params: Optional[Dict[str, Any]], timeout: float) -> Any:
+        """发送一个请求并等待对应响应；超时、进程退出或协议错误时抛出 RuntimeError。"""
+        request_id = next(self._ids)
+        message = {"jsonrpc": "2.0", "id": request_id, "method": method}
+        if params is not None:
+            message["params"] = params
+        try:
+            self.process.stdin.write(json.dumps(message, ensure_ascii=False) + "\n")
+            self.process.stdin.flush()
+        except (BrokenPipeError, OSError) as e:
+            raise RuntimeError(f"Defuddle worker exited: {e}")
+
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise _CallTimeout(f"Defuddle worker did not answer within {timeout:g} seconds")
+            try:
+                line = self._lines.get(timeout=remaining)
+            except queue.Empty:
+                continue
+            if line is None:
+                raise RuntimeError(f"Defuddle worker exited (code {self.process.poll()})")
+            try:
+                response = json.loads(line)
+            except json.JSONDecodeError:
+                raise RuntimeError(f"Defuddle worker sent invalid output: {line[:200]!r}")
+            if response.get("id") != request_id:
+                # 之前超时请求的迟到响应
+                continue
+            if "error" in response:
+                raise DefuddleWorkerError((response["error"] or {}).get("message") or "Defuddle failed")
+            return response.get("result")
+
+    def stop(self) -> None:
+        try:
+            self.process.stdin.close()
+            self.process.wait(timeout=_STOP_TIMEOUT)
+        except (OSError, subprocess.TimeoutExpired):
+            self.process.kill()
+            self.process.wait()
+
+
+class DefuddlePool:
+    """有界的 Defuddle 工作进程池，线程安全。"""
+
+    def __init__(self, size: int = POOL_SIZE, max_jobs: int = MAX_JOBS, script: Path = WORKER_SCRIPT):
+        self.size = max(1, size)
+        self.max_jobs = max(1, max_jobs)
+        self.script = Path(script)
+        self._idle: List[_Worker] = []
+        self._busy = 0
+        self._closed = False
+        self._cond = threading.Condition()
+        self.stats = {"jobs": 0, "killed": 0, "spawned": 0, "recycled": 0, "replaced": 0}
+
+    def warm(self) -> None:
+        """预先启动全部工作进程。"""
+        with self._cond:
+            missing = max(0, self.size - self._busy - len(self._idle))
+            # 先占用名额，避免与并发的 _acquire 一起超出 size
+            self._busy += missing
+        workers = []
+        try:
+            for _ in range(missing):
+                workers.append(self._spawn())
+        finally:
+            with self._cond:
+                self._busy -= missing
+                self._idle.extend(workers)
+                self._cond.notify_all()
+
+    def parse(self, url: str, markdown: bool = True, debug: bool = False, timeout: float = 60) -> Dict[str, Any]:
+        """
+        解析一个 URL，返回 Defuddle 结果（content 为 Markdown 时同时包含 title 等元数据）
+
+        Raises:
+            RuntimeError: 排队或解析超时、工作进程异常、Defuddle 解析失败
+        """
+        deadline = time.monotonic() + timeout
+        worker = self._acquire(deadline)
+        reusable = False
+        try:
+            params = {"url": url, "markdown": markdown, "debug": debug, "timeoutMs": int(timeout * 1000)}
+            # 留出比页面抓取超时稍长的时间，让工作进程自己报告抓取超时
+            result = worker.call("parse", params, max(0.1, deadline - time.monotonic()) + 1.0)
+            reusable = True
+            return result if isinstance(result, dict) else {}
+        except DefuddleWorkerError:
+            reusable = True
+            raise
+        except _CallTimeout:
+            raise RuntimeError(f"Defuddle request timed out after {timeout} seconds")
+        finally:
+            worker.jobs += 1
+            self._release(worker, reusable)
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._cond.notify_all()
+        for worker in idle:
+            worker.stop()
+
+    def status(self) -> Dict[str, Any]:
+        with self._cond:
+            return {"size": self.size, "idle": len(self._idle), "busy": self._busy, "max_jobs": self.max_jobs, **self.stats}
+
+    # ---- 内部 ---------------------------------------------------------------
+
+    def _spawn(self) -> _Worker:
+        worker = _Worker(self.script)
+        with self._cond:
+            self.stats["spawned"] += 1
+        return worker
+
+    def _acquire(self, deadline: float) -> _Worker:
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise RuntimeError("Defuddle pool is closed")
+                if self._idle:
+                    worker = self._idle.pop()
+                    self._busy += 1
+                    break
+                if self._busy < self.size:
+                    self._busy += 1
+                    worker = None
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise RuntimeError("Timed out waiting for a free Defuddle worker")
+                self._cond.wait(remaining)
+
+        try:
+            if worker is not None and not self._healthy(worker):
+                worker.stop()
+                with self._cond:
+                    self.stats["replaced"] += 1
+                worker = None
+            return worker or self._spawn()
+        except Exception:
+            with self._cond:
+                self._busy -= 1
+                self._cond.notify()
+            raise
+
+    def _healthy(self, worker: _Worker) -> bool:
+        if not worker.alive():
+            return False
+        if time.monotonic() - worker.last_used < HEALTH_INTERVAL:
+            return True
+        try:
+            worker.call("ping", None, PING_TIMEOUT)
+        except RuntimeError:
+            return False
+        return True
+
+    def _release(self, worker: _Worker, reusable: bool) -> None:
+        worker.last_used = time.monotonic()
+        recycle = reusable and worker.jobs >= self.max_jobs
+        with self._cond:
+            self._busy -= 1
+            self.stats["jobs"] += 1
+            if not reusable:
+                self.stats["killed"] += 1
+            elif recycle:
+                self.stats["recycled"] += 1
+            keep = reusable and not recycle and not self._closed and worker.alive()
+            if keep:
+                self._idle.append(worker)
+            self._cond.notify()
+        if keep:
+            return
+        if reusable:
+            worker.stop()
+        else:
+            # 超时或协议异常：进程状态未知，直接终止
+            worker.process.kill()
+            worker.process.wait()
+
+
+_POOL: Optional[DefuddlePool] = None
+_POOL_LOCK = threading.Lock()
+
+
+def get_defuddle_pool() -> Optional[DefuddlePool]:
+    """返回进程级共享进程池；关闭或缺少 Node.js / Defuddle 构建时返回 None。"""
+    global _POOL
+    if _POOL is None:
+        if not pool_available():
+            return None
+        with _POOL_LOCK:
+            if _POOL is None:
+                _POOL = DefuddlePool()
+                atexit.register(_POOL.close)
+    return _POOL
+
+
+def current_pool() -> Optional[DefuddlePool]:
+    """已创建的进程池（不创建新池），用于状态查询。"""
+    return _POOL
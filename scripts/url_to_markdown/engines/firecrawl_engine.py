@@ -10,7 +10,12 @@ import os
 import sys
 import json
 import logging
-from typing import Optional, Dict, Any, List
+from pathlib import Path
+from typing import Optional, Dict, Any, Iterator, List
+
+# 批量调度器位于 scripts/common
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from common.batch_fetch import fetch_concurrently
 
 # 配置日志
 logger = logging.getLogger(__name__)
@@ -88,12 +93,9 @@ class FirecrawlEngine:
         except Exception as e:
             raise RuntimeError(f"Firecrawl failed: {e}")
 
-    def fetch_batch(self, urls: List[str], **kwargs) -> List[Dict[str, Any]]:
-        """批量获取内容"""
-        results = []
-        for url in urls:
-            try:
-                results.append(self.fetch(url, **kwargs))
-            except Exception as e:
-                results.append({"url": url, "error": str(e), "success": False})
-        return results
+    def fetch_batch(self, urls: List[str], **kwargs) -> Iterator[Dict[str, Any]]:
+        """并发批量获取多个 URL 的 Markdown 内容，按完成顺序逐条产出；参数与结果见 common.batch_fetch.fetch_concurrently"""
+        for result in fetch_concurrently(self.fetch, urls, **kwargs):
+            if "error" in result:
+                result.setdefault("success", False)
+            yield result
@@ -7,9 +7,14 @@ Jina AI 是首选引擎，快速、稳定，免费版无需 API Key。
 
 import os
 import sys
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, Iterator, List
+from pathlib import Path
 from urllib.parse import urlparse
-import requests
+
+# 共享 HTTP 客户端位于 scripts/common
+sys.path.append(str(Path(__file__).resolve().parents[2]))
+from common import http_client
+from common.batch_fetch import fetch_concurrently
 
 # Jina Reader API 基础 URL
 JINA_READER_BASE_URL = "https://r.jina.ai"
@@ -119,7 +124,8 @@ class JinaEngine:
         headers = self._build_headers(extra_headers)
 
         # 发送请求
-        response = requests.get(
+        response = http_client.request(
+            "GET",
             f"{self.base_url}/{url}",
             headers=headers,
             timeout=request_timeout,
@@ -162,27 +168,19 @@ class JinaEngine:
     def fetch_batch(
         self,
         urls: List[str],
+        max_workers: Optional[int] = None,
+        per_host: Optional[int] = None,
+        host_delay: Optional[float] = None,
+        deadline: Optional[float] = None,
         **kwargs
-    ) -> List[Dict[str, Any]]:
-        """
-        批量获取多个 URL 的 Markdown 内容
-
-        Args:
-            urls: URL 列表
-            **kwargs: fetch() 方法的其他参数
-
-        Returns:
-            结果列表
-        """
-        results = []
-        for url in urls:
-            try:
-                result = self.fetch(url, **kwargs)
-                results.append(result)
-            except Exception as e:
-                results.append({
-                    "url": url,
-                    "error": str(e),
-                    "content": None,
-                })
-        return results
+    ) -> Iterator[Dict[str, Any]]:
+        """并发批量获取多个 URL 的 Markdown 内容，按完成顺序逐条产出；参数与结果见 common.batch_fetch.fetch_concurrently"""
+        return fetch_concurrently(
+            self.fetch,
+            urls,
+            max_workers=max_workers,
+            per_host=per_host,
+            host_delay=host_delay,
+            deadline=deadline,
+            **kwargs,
+        )
@@ -18,14 +18,19 @@ import sys
 import json
 import argparse
 import subprocess
-from datetime import datetime
 from pathlib import Path
-from typing import Optional, Dict, Any, List, Tuple
+from typing import Optional, Dict, Any, Iterator, List, Tuple
 from urllib.parse import urlparse
 
 import requests
 from dotenv import load_dotenv
 
+# 共享 HTTP 客户端位于 scripts/common
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from common import http_client
+from common.archive import archive_record
+from common.batch_fetch import fetch_concurrently
+
 # 版本信息
 __version__ = "2.0.0"
 __author__ = "Claude"
@@ -43,6 +48,15 @@ DEFUDDLE_ROOT = Path(__file__).parent / "engines" / "defuddle-node"
 DEFUDDLE_CLI = DEFUDDLE_ROOT / "dist" / "cli.js"
 
 
+def _defuddle_pool():
+    """常驻 Defuddle 工作进程池；作为包导入与直接运行脚本时都可用，不可用时返回 None"""
+    if __package__:
+        from .engines.defuddle_pool import get_defuddle_pool
+    else:
+        from engines.defuddle_pool import get_defuddle_pool
+    return get_defuddle_pool()
+
+
 class UrlToMarkdown:
     """
     双引擎 URL 转 Markdown 客户端
@@ -115,7 +129,8 @@ class UrlToMarkdown:
         """使用 Jina AI 获取 URL 对应的 Markdown 内容"""
         headers = self._build_jina_headers(extra_headers)
 
-        response = requests.get(
+        response = http_client.request(
+            "GET",
             f"{self.base_url}/{url}",
             headers=headers,
             timeout=timeout,
@@ -159,20 +174,48 @@ class UrlToMarkdown:
         return_json: bool,
         timeout: int,
     ) -> Dict[str, Any]:
-        """使用 Defuddle 获取 URL 对应的 Markdown 内容"""
+        """使用 Defuddle 获取 URL 对应的 Markdown 内容（单次解析同时得到正文与元数据）"""
+        pool = _defuddle_pool()
+        if pool is not None:
+            data = pool.parse(url, markdown=True, timeout=timeout)
+        else:
+            data = self._run_defuddle_cli(url, timeout)
+
+        if return_json:
+            return {
+                "url": url,
+                "title": data.get("title", ""),
+                "content": data.get("content", ""),
+                "description": data.get("description", ""),
+                "domain": data.get("domain", ""),
+                "favicon": data.get("favicon", ""),
+                "image": data.get("image", ""),
+                "author": data.get("author", ""),
+                "published": data.get("published", ""),
+                "meta_tags": data.get("metaTags", []),
+                "markdown": data.get("content", ""),
+            }
+
+        content = (data.get("content") or "").strip()
+        return {
+            "url": url,
+            "title": data.get("title", ""),
+            "content": content,
+            "markdown": content,
+            "description": data.get("description", ""),
+            "domain": data.get("domain", ""),
+        }
+
+    def _run_defuddle_cli(self, url: str, timeout: int) -> Dict[str, Any]:
+        """进程池不可用时启动一次 Defuddle CLI（--markdown --json）"""
         if not DEFUDDLE_CLI.exists():
             raise RuntimeError(
                 f"Defuddle CLI not found at {DEFUDDLE_CLI}. "
                 "Please ensure Defuddle is properly installed."
             )
 
-        cmd = ["node", str(DEFUDDLE_CLI), "parse", url]
-        cmd.append("--markdown")
-        if return_json:
-            cmd.append("--json")
-
         result = subprocess.run(
-            cmd,
+            ["node", str(DEFUDDLE_CLI), "parse", url, "--markdown", "--json"],
             capture_output=True,
             text=True,
             timeout=timeout,
@@ -182,52 +225,10 @@ class UrlToMarkdown:
             error_msg = result.stderr.strip() or f"Exit code: {result.returncode}"
             raise RuntimeError(f"Defuddle failed: {error_msg}")
 
-        if return_json:
-            try:
-                data = json.loads(result.stdout)
-                return {
-                    "url": url,
-                    "title": data.get("title", ""),
-                    "content": data.get("content", ""),
-                    "description": data.get("description", ""),
-                    "domain": data.get("domain", ""),
-                    "favicon": data.get("favicon", ""),
-                    "image": data.get("image", ""),
-                    "author": data.get("author", ""),
-                    "published": data.get("published", ""),
-                    "meta_tags": data.get("metaTags", []),
-                    "markdown": data.get("content", ""),
-                }
-            except json.JSONDecodeError as e:
-                raise RuntimeError(f"Failed to parse JSON output: {e}")
-        else:
-            # Markdown 输出 - 同时也获取 JSON 来提取元数据
-            cmd_with_json = ["node", str(DEFUDDLE_CLI), "parse", url, "--json"]
-            json_result = subprocess.run(
-                cmd_with_json,
-                capture_output=True,
-                text=True,
-                timeout=timeout,
-            )
-
-            metadata = {}
-            if json_result.returncode == 0:
-                try:
-                    metadata = json.loads(json_result.stdout)
-                except json.JSONDecodeError:
-                    pass
-
-            content = result.stdout.strip()
-            title = metadata.get("title", "")
-
-            return {
-                "url": url,
-                "title": title,
-                "content": content,
-                "markdown": content,
-                "description": metadata.get("description", ""),
-                "domain": metadata.get("domain", ""),
-            }
+        try:
+            return json.loads(result.stdout)
+        except json.JSONDecodeError as e:
+            raise RuntimeError(f"Failed to parse JSON output: {e}")
 
     def fetch(
         self,
@@ -309,30 +310,22 @@ class UrlToMarkdown:
     def fetch_batch(
         self,
         urls: List[str],
+        max_workers: Optional[int] = None,
+        per_host: Optional[int] = None,
+        host_delay: Optional[float] = None,
+        deadline: Optional[float] = None,
         **kwargs
-    ) -> List[Dict[str, Any]]:
-        """
-        批量获取多个 URL 的 Markdown 内容
-
-        Args:
-            urls: URL 列表
-            **kwargs: fetch() 方法的其他参数
-
-        Returns:
-            结果列表
-        """
-        results = []
-        for url in urls:
-            try:
-                result = self.fetch(url, **kwargs)
-                results.append(result)
-            except Exception as e:
-                results.append({
-                    "url": url,
-                    "error": str(e),
-                    "content": None,
-                })
-        return results
+    ) -> Iterator[Dict[str, Any]]:
+        """并发批量获取多个 URL 的 Markdown 内容，按完成顺序逐条产出（每个 URL 仍按引擎顺序降级）；参数与结果见 common.batch_fetch.fetch_concurrently"""
+        return fetch_concurrently(
+            self.fetch,
+            urls,
+            max_workers=max_workers,
+            per_host=per_host,
+            host_delay=host_delay,
+            deadline=deadline,
+            **kwargs,
+        )
 
 
 def fetch_url_as_markdown(
@@ -366,19 +359,8 @@ def fetch_url_as_markdown(
 
 
 def save_response(url: str, output_data: Dict[str, Any]) -> str:
-    """保存响应到文件"""
-    responses_dir = Path(__file__).parent / "responses"
-    responses_dir.mkdir(parents=True, exist_ok=True)
-
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    parsed = urlparse(url)
-    safe_name = parsed.netloc or "url"
-
-    filename = responses_dir / f"{timestamp}_{safe_name}.json"
-
-    with open(filename, "w", encoding="utf-8") as f:
-        json.dump(output_data, f, ensure_ascii=False, indent=2)
-    return str(filename)
+    """归档响应（后台线程写入 JSONL 分段），返回分段目录"""
+    return archive_record("url_to_markdown", {"host": urlparse(url).netloc or "url", **output_data})
 
 
 def format_result(result: Dict[str, Any], verbose: bool = False) -> str:
@@ -475,7 +457,7 @@ def main():
             print(format_result(result, verbose=args.verbose))
 
         if saved_file:
-            print(f"\n响应已保存：{saved_file}", file=sys.stderr)
+            print(f"\n响应已归档：{saved_file}", file=sys.stderr)
 
         # 提示使用的引擎
         if not args.json:
@@ -13,6 +13,10 @@ import requests
 from typing import Dict, List, Optional, Any, Tuple
 from pathlib import Path
 
+# 共享 HTTP 客户端位于 scripts/common
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from common import http_client
+
 
 def load_api_key() -> Optional[str]:
     """
@@ -273,7 +277,8 @@ class VolcengineSearchClient:
             requests.exceptions.RequestException: 请求失败
         """
         try:
-            response = requests.post(
+            response = http_client.request(
+                "POST",
                 self.base_url,
                 headers=self.headers,
                 json=payload,
@@ -1,11 +1,16 @@
 #!/usr/bin/env python3
 import argparse
-import http.client
 import json
 import os
 import re
 import sys
 from datetime import datetime
+from pathlib import Path
+
+# 共享 HTTP 客户端位于 scripts/common
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from common import http_client
+from common.json_extract import dump_result
 
 DEFAULT_HOST = "api.tikhub.io"
 DEFAULT_PATH = "/api/v1/weibo/web_v2/fetch_advanced_search"
@@ -16,7 +21,6 @@ def fetch_advanced_search(token, keyword, search_type="hot", include_type="pic",
                          timescope=None, page=1, host=DEFAULT_HOST, path=DEFAULT_PATH, timeout=30):
     """调用微博高级搜索 API (GET 请求)"""
     from urllib.parse import urlencode
-    conn = http.client.HTTPSConnection(host, timeout=timeout)
 
     params = {
         "q": keyword,
@@ -35,18 +39,16 @@ def fetch_advanced_search(token, keyword, search_type="hot", include_type="pic",
         "Accept": "application/json",
     }
 
-    conn.request("GET", full_path, headers=headers)
-    res = conn.getresponse()
-    raw = res.read()
-    conn.close()
+    res = http_client.request("GET", f"https://{host}{full_path}", headers=headers, timeout=timeout)
+    raw = res.content
 
     text = raw.decode("utf-8", errors="replace")
     try:
         data = json.loads(text)
     except json.JSONDecodeError:
-        return {"_http_status": res.status, "_http_reason": res.reason, "_raw": text}
+        return {"_http_status": res.status_code, "_http_reason": res.reason, "_raw": text}
 
-    data["_http_status"] = res.status
+    data["_http_status"] = res.status_code
     return data
 
 
@@ -271,10 +273,7 @@ def main():
         "items": filtered_items,
     }
 
-    if args.pretty:
-        print(json.dumps(output, indent=2, ensure_ascii=False))
-    else:
-        print(json.dumps(output, ensure_ascii=False))
+    dump_result(output, indent=2 if args.pretty else None)
     return 0
 
 
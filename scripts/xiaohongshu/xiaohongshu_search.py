@@ -3,7 +3,6 @@
 小红书搜索核心脚本 (生产级)
 集成所有测试功能,支持搜索、翻页、数据筛选和保存
 """
-import http.client
 import json
 import os
 from datetime import datetime
@@ -11,6 +10,13 @@ from urllib.parse import urlencode
 from typing import Dict, List, Optional, Any
 import re
 from dotenv import load_dotenv
+from pathlib import Path
+import sys
+
+# 共享 HTTP 客户端位于 scripts/common
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from common import http_client
+from common.archive import archive_record
 
 # 加载环境变量
 load_dotenv()
@@ -85,16 +91,13 @@ class XiaohongshuSearcher:
         query = urlencode(params, doseq=True)
         full_path = f"{self.path}?{query}" if query else self.path
 
-        conn = http.client.HTTPSConnection(self.host, timeout=self.timeout)
         headers = {
             "Authorization": f"Bearer {self.token}",
             "Accept": "application/json",
         }
 
-        conn.request("GET", full_path, headers=headers)
-        res = conn.getresponse()
-        raw = res.read()
-        conn.close()
+        res = http_client.request("GET", f"https://{self.host}{full_path}", headers=headers, timeout=self.timeout)
+        raw = res.content
 
         # 解析响应
         text = raw.decode("utf-8", errors="replace")
@@ -105,7 +108,7 @@ class XiaohongshuSearcher:
                 "success": False,
                 "error": "JSON解析失败",
                 "raw": text,
-                "_http_status": res.status
+                "_http_status": res.status_code
             }
 
         # 保存翻页参数
@@ -121,7 +124,7 @@ class XiaohongshuSearcher:
                 self.search_id = inner_data.get("searchId", "")
                 self.session_id = inner_data.get("sessionId", "")
 
-        data["_http_status"] = res.status
+        data["_http_status"] = res.status_code
         return data
 
     def extract_items(self, result: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -316,35 +319,24 @@ class XiaohongshuSearcher:
 def save_results(
     result: Dict[str, Any],
     core_info: Dict[str, Any],
-    save_dir: str = "responses"
+    save_dir: Optional[str] = None
 ) -> tuple[str, str]:
     """
-    保存结果到文件
+    归档结果（后台线程写入 JSONL 分段）
 
     Args:
         result: 完整的API响应
         core_info: 提取的核心信息
-        save_dir: 保存目录
+        save_dir: 归档目录，为空时使用默认归档目录
 
     Returns:
-        tuple: (完整响应文件路径, 核心信息文件路径)
+        tuple: (完整响应分段目录, 核心信息分段目录)
     """
-    os.makedirs(save_dir, exist_ok=True)
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    directory = Path(save_dir) if save_dir else None
     keyword = core_info.get("search_info", {}).get("keyword", "unknown")
 
-    # 1. 保存完整响应
-    full_filename = f"{timestamp}_xhs_search_{keyword}_full.json"
-    full_path = os.path.join(save_dir, full_filename)
-    with open(full_path, "w", encoding="utf-8") as f:
-        json.dump(result, f, ensure_ascii=False, indent=2)
-
-    # 2. 保存核心信息
-    core_filename = f"{timestamp}_xhs_search_{keyword}_core.json"
-    core_path = os.path.join(save_dir, core_filename)
-    with open(core_path, "w", encoding="utf-8") as f:
-        json.dump(core_info, f, ensure_ascii=False, indent=2)
-
+    full_path = archive_record("xiaohongshu_full", {"keyword": keyword, "response": result}, directory=directory)
+    core_path = archive_record("xiaohongshu_core", {"keyword": keyword, "core": core_info}, directory=directory)
     return full_path, core_path
 
 
@@ -398,7 +390,7 @@ def main():
 
     # 保存结果
     full_path, core_path = save_results(result, core_info)
-    print(f"\n💾 结果已保存:")
+    print(f"\n💾 结果已归档:")
     print(f"   - 完整响应: {full_path}")
     print(f"   - 核心信息: {core_path}")
 
@@ -6,7 +6,6 @@
 配置: 从环境变量或.env文件读取METASO_API_KEY
 """
 
-import http.client
 import json
 import sys
 import os
@@ -14,6 +13,10 @@ from pathlib import Path
 from typing import Optional, Dict, Any
 from dotenv import load_dotenv
 
+# 共享 HTTP 客户端位于 scripts/common
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from common import http_client
+
 # 加载环境变量
 load_dotenv()
 
@@ -69,18 +72,19 @@ def search_podcasts(
     }
 
     # 发送请求
-    conn = http.client.HTTPSConnection(base_url, timeout=timeout)
-    try:
-        conn.request("POST", "/api/v1/search", json.dumps(payload), headers)
-        res = conn.getresponse()
-        data = res.read()
+    res = http_client.request(
+        "POST",
+        f"https://{base_url}/api/v1/search",
+        data=json.dumps(payload),
+        headers=headers,
+        timeout=timeout
+    )
+    data = res.content
 
-        if res.status != 200:
-            raise Exception(f"API请求失败: HTTP {res.status} - {data.decode('utf-8')}")
+    if res.status_code != 200:
+        raise Exception(f"API请求失败: HTTP {res.status_code} - {data.decode('utf-8')}")
 
-        return json.loads(data.decode("utf-8"))
-    finally:
-        conn.close()
+    return json.loads(data.decode("utf-8"))
 
 
 def format_result(result: Dict[str, Any]) -> str:
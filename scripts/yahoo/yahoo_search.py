@@ -9,12 +9,16 @@ import os
 import sys
 import json
 import argparse
-import requests
 from typing import Optional, Dict, Any, List
 from secrets import token_urlsafe
 from urllib.parse import urlparse, parse_qs, unquote
 from lxml import html
 from dotenv import load_dotenv
+from pathlib import Path
+
+# 共享 HTTP 客户端位于 scripts/common
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from common.http_client import create_session
 
 # 加载环境变量
 script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -33,12 +37,10 @@ class YahooSearch:
             proxy: 代理地址 (如 http://127.0.0.1:7890)
         """
         self.proxy = proxy or os.getenv("YAHOO_PROXY")
-        self.session = requests.Session()
+        self.session = create_session(proxy=self.proxy)
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
         })
-        if self.proxy:
-            self.session.proxies = {'http': self.proxy, 'https': self.proxy}
 
     def _unwrap_yahoo_url(self, raw_url: str) -> str:
         """解码 Yahoo 包装的 URL"""
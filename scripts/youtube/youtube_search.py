@@ -11,11 +11,14 @@ import sys
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
-from urllib.parse import urlencode
-from urllib.request import Request, urlopen
-from urllib.error import HTTPError, URLError
 import re
 
+import requests
+
+# 共享 HTTP 客户端位于 scripts/common
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from common import http_client
+
 
 def load_env_file(path: str):
     """加载环境变量文件"""
@@ -69,26 +72,27 @@ def make_api_request(url: str, params: Dict) -> Dict:
     Returns:
         API 响应的 JSON 数据
     """
-    query_string = urlencode(params)
-    full_url = f"{url}?{query_string}"
-
-    req = Request(full_url)
-    req.add_header('User-Agent', 'Mozilla/5.0')
-
     try:
-        with urlopen(req, timeout=30) as response:
-            data = response.read()
-            return json.loads(data.decode('utf-8'))
-    except HTTPError as e:
-        error_body = e.read().decode('utf-8')
+        response = http_client.request(
+            "GET",
+            url,
+            params=params,
+            headers={'User-Agent': 'Mozilla/5.0'},
+            timeout=30
+        )
+    except requests.RequestException as e:
+        raise Exception(f"网络错误: {e}")
+
+    if response.status_code >= 400:
         try:
-            error_data = json.loads(error_body)
-            error_msg = error_data.get('error', {}).get('message', str(e))
+            error_data = response.json()
+            error_msg = error_data.get('error', {}).get('message', f"HTTP {response.status_code}")
         except:
-            error_msg = str(e)
+            error_msg = f"HTTP {response.status_code}"
         raise Exception(f"API 请求失败: {error_msg}")
-    except URLError as e:
-        raise Exception(f"网络错误: {e.reason}")
+
+    try:
+        return json.loads(response.content.decode('utf-8'))
     except Exception as e:
         raise Exception(f"请求失败: {str(e)}")
 
@@ -8,10 +8,8 @@
 """
 
 import os
-import json
 import sys
 from pathlib import Path
-from datetime import datetime
 from typing import Optional, Dict, Any, List
 from enum import Enum
 
@@ -19,6 +17,11 @@ import requests
 from loguru import logger
 from dotenv import load_dotenv
 
+# 共享 HTTP 客户端位于 scripts/common
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+from common.archive import archive_record
+from common.http_client import create_session
+
 
 # ============================================================================
 # 枚举定义
@@ -164,7 +167,7 @@ class ZhihuAPIClient:
             raise ValueError("未找到 TIKHUB_TOKEN，请在 .env 文件中配置")
 
         self.api_token = api_token
-        self.session = requests.Session()
+        self.session = create_session()
         self.session.headers.update({
             "Authorization": f"Bearer {api_token}",
             "Content-Type": "application/json"
@@ -323,23 +326,14 @@ class ZhihuSearchCore:
         keyword: str,
         output_dir: Optional[str] = None
     ):
-        """保存API响应到文件"""
+        """归档API响应（后台线程写入 JSONL 分段，output_dir 为空时使用默认归档目录）"""
         try:
-            if output_dir is None:
-                output_dir = Path(__file__).parent / "responses"
-            else:
-                output_dir = Path(output_dir)
-
-            output_dir.mkdir(parents=True, exist_ok=True)
-
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"{keyword}_{timestamp}.json"
-            filepath = output_dir / filename
-
-            with open(filepath, "w", encoding="utf-8") as f:
-                json.dump(response_data, f, ensure_ascii=False, indent=2)
-
-            logger.success(f"响应已保存: {filepath}")
+            filepath = archive_record(
+                "zhihu_responses",
+                {"keyword": keyword, "response": response_data},
+                directory=Path(output_dir) if output_dir else None
+            )
+            logger.success(f"响应已归档: {filepath}")
 
         except Exception as e:
             logger.warning(f"保存响应失败: {e}")